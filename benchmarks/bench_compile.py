@@ -0,0 +1,98 @@
+# SPDX-FileCopyrightText: 2024 Intel Corporation
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""Benchmarks the compilation time of kernels, in total and split into the
+stages of the compilation pipeline.
+"""
+
+import time
+
+import numba_dpex as dpex
+from numba_dpex.core.runtime import kernel_cache
+from numba_dpex.kernel_api_impl.spirv import codegen, spirv_generator
+
+from .common import KERNELS, get_queue, kernel_signature, pass_time, stage_timer
+
+_PROBLEM_SIZE = 1024
+
+
+class CompileTime:
+    """Measures the time to compile a kernel with a new dispatcher, i.e.,
+    without any in-memory cached specialization.
+    """
+
+    params = list(KERNELS)
+    param_names = ["kernel"]
+    number = 1
+    repeat = 10
+    timeout = 300
+
+    def setup(self, name):
+        pyfunc, launch = KERNELS[name]
+        index_space, args = launch(get_queue(), _PROBLEM_SIZE)
+        self.sig = kernel_signature(index_space, args)
+        self.dispatcher = dpex.kernel(pyfunc)
+
+    def time_compile(self, name):
+        self.dispatcher.compile(self.sig)
+
+
+class CompileStages:
+    """Tracks the time spent in every stage of the compilation of a kernel.
+
+    The stages are the Numba type inference, the finalization of the LLVM
+    module, the translation of the LLVM module to SPIR-V by llvm-spirv and the
+    build of the SYCL kernel bundle from the SPIR-V binary on the first
+    launch of the kernel.
+    """
+
+    params = list(KERNELS)
+    param_names = ["kernel"]
+    unit = "seconds"
+    timeout = 300
+
+    def setup(self, name):
+        pyfunc, launch = KERNELS[name]
+        queue = get_queue()
+        index_space, args = launch(queue, _PROBLEM_SIZE)
+        dispatcher = dpex.kernel(pyfunc)
+        sig = kernel_signature(index_space, args)
+
+        finalize_times = []
+        spirv_times = []
+        with stage_timer(codegen.SPIRVCodeLibrary, "finalize", finalize_times):
+            with stage_timer(spirv_generator.Module, "finalize", spirv_times):
+                dispatcher.compile(sig)
+
+        kcres = dispatcher.get_compile_result(sig)
+        self.typing_time = pass_time(kcres, "nopython_type_inference")
+        self.llvm_finalize_time = sum(finalize_times)
+        self.llvm_spirv_time = sum(spirv_times)
+
+        # Compiles call_kernel for the kernel and warms up the launch path.
+        dpex.call_kernel(dispatcher, index_space, *args)
+        queue.wait()
+
+        kernel_cache.purge_kernel_cache(queue)
+        start = time.perf_counter()
+        dpex.call_kernel(dispatcher, index_space, *args)
+        first_launch = time.perf_counter() - start
+
+        start = time.perf_counter()
+        dpex.call_kernel(dispatcher, index_space, *args)
+        cached_launch = time.perf_counter() - start
+
+        self.kernel_bundle_time = max(first_launch - cached_launch, 0.0)
+
+    def track_typing(self, name):
+        return self.typing_time
+
+    def track_llvm_finalize(self, name):
+        return self.llvm_finalize_time
+
+    def track_llvm_spirv(self, name):
+        return self.llvm_spirv_time
+
+    def track_kernel_bundle_build(self, name):
+        return self.kernel_bundle_time
@@ -0,0 +1,51 @@
+# SPDX-FileCopyrightText: 2024 Intel Corporation
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""Benchmarks the overhead of launching an already compiled kernel from
+CPython and from a dpjit function.
+"""
+
+import numba_dpex as dpex
+
+from .common import KERNELS, get_queue
+
+# The launches are done over a single work-group so that the measured time is
+# dominated by the dispatch overhead and not by the kernel execution.
+_PROBLEM_SIZE = 64
+
+# The number of launches done by the dpjit function per call.
+_LAUNCHES_PER_CALL = 100
+
+
+@dpex.dpjit
+def _launch_from_dpjit(kernel_fn, index_space, n, a, b, c):
+    for _ in range(n):
+        dpex.call_kernel(kernel_fn, index_space, a, b, c)
+
+
+class CallKernelLatency:
+    """Measures the latency of a synchronous ``call_kernel`` of a trivial
+    kernel.
+    """
+
+    params = ["cpython", "dpjit"]
+    param_names = ["caller"]
+
+    def setup(self, caller):
+        pyfunc, launch = KERNELS["vecadd"]
+        self.kernel = dpex.kernel(pyfunc)
+        self.index_space, self.args = launch(get_queue(), _PROBLEM_SIZE)
+
+        # Compiles the kernel and the launch functions.
+        dpex.call_kernel(self.kernel, self.index_space, *self.args)
+        _launch_from_dpjit(self.kernel, self.index_space, 1, *self.args)
+
+    def time_call_kernel(self, caller):
+        if caller == "cpython":
+            for _ in range(_LAUNCHES_PER_CALL):
+                dpex.call_kernel(self.kernel, self.index_space, *self.args)
+        else:
+            _launch_from_dpjit(
+                self.kernel, self.index_space, _LAUNCHES_PER_CALL, *self.args
+            )
@@ -0,0 +1,33 @@
+# SPDX-FileCopyrightText: 2024 Intel Corporation
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""Benchmarks the time to import numba_dpex in a new interpreter and to create
+the first kernel dispatcher, which loads the registries used by the compiler.
+"""
+
+
+class ImportTime:
+    """Measures the import time of numba_dpex."""
+
+    repeat = 10
+    timeout = 120
+
+    def timeraw_import_numba_dpex(self):
+        return "import numba_dpex"
+
+    def timeraw_import_kernel_api(self):
+        return "from numba_dpex import kernel_api"
+
+    def timeraw_first_kernel_dispatcher(self):
+        return """
+import numba_dpex as dpex
+
+
+def vecadd(item, a, b, c):
+    i = item.get_id(0)
+    c[i] = a[i] + b[i]
+
+
+dpex.kernel(vecadd)
+"""
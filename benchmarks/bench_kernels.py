@@ -0,0 +1,38 @@
+# SPDX-FileCopyrightText: 2024 Intel Corporation
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""Benchmarks the steady-state execution time of the example kernels."""
+
+import numba_dpex as dpex
+
+from .common import KERNELS, get_queue
+
+# The problem sizes of the kernels. The pairwise distance and the matmul
+# kernels work on n x n matrices.
+_PROBLEM_SIZES = {
+    "vecadd": 2**22,
+    "black_scholes": 2**20,
+    "pairwise_distance": 2**11,
+    "matmul": 2**10,
+    "sum_reduction": 2**22,
+}
+
+
+class KernelThroughput:
+    """Measures the time of a synchronous launch of a compiled kernel."""
+
+    params = list(KERNELS)
+    param_names = ["kernel"]
+    timeout = 300
+
+    def setup(self, name):
+        pyfunc, launch = KERNELS[name]
+        self.kernel = dpex.kernel(pyfunc)
+        self.index_space, self.args = launch(get_queue(), _PROBLEM_SIZES[name])
+
+        # Compiles the kernel and builds the kernel bundle.
+        dpex.call_kernel(self.kernel, self.index_space, *self.args)
+
+    def time_kernel(self, name):
+        dpex.call_kernel(self.kernel, self.index_space, *self.args)
@@ -0,0 +1,239 @@
+# SPDX-FileCopyrightText: 2024 Intel Corporation
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""Helpers shared by the benchmarks: device selection, the kernels that are
+benchmarked and utilities to time individual compilation stages.
+"""
+
+import os
+import time
+from contextlib import contextmanager
+from math import erf, exp, log, sqrt
+
+import dpctl
+import dpnp
+from numba import typeof, void
+
+import numba_dpex as dpex
+from numba_dpex import kernel_api as kapi
+from numba_dpex.core.types.kernel_api.index_space_ids import (
+    ItemType,
+    NdItemType,
+)
+
+# The filter string of the device the benchmarks run on. The OpenCL CPU
+# device is used by default as it is available on every CI machine.
+DEVICE_FILTER = os.environ.get("NUMBA_DPEX_BENCHMARK_DEVICE", "opencl:cpu")
+
+
+def get_queue() -> dpctl.SyclQueue:
+    """Returns a queue for the benchmark device, or for the default device if
+    the benchmark device is not available.
+    """
+    try:
+        return dpctl.SyclQueue(DEVICE_FILTER)
+    except dpctl.SyclQueueCreationError:
+        return dpctl.SyclQueue()
+
+
+@contextmanager
+def stage_timer(module, attr_name, timings: list):
+    """Replaces ``module.attr_name`` with a wrapper that appends the duration
+    of every call of the original function to ``timings``.
+    """
+    original = getattr(module, attr_name)
+    # Attributes of classes may be inherited, in which case the wrapper is
+    # removed afterwards instead of storing the inherited attribute.
+    is_own_attr = attr_name in vars(module)
+
+    def timed(*args, **kwargs):
+        start = time.perf_counter()
+        try:
+            return original(*args, **kwargs)
+        finally:
+            timings.append(time.perf_counter() - start)
+
+    setattr(module, attr_name, timed)
+    try:
+        yield timings
+    finally:
+        if is_own_attr:
+            setattr(module, attr_name, original)
+        else:
+            delattr(module, attr_name)
+
+
+def pass_time(compile_result, pass_name) -> float:
+    """Returns the run time of a Numba compiler pass recorded in the metadata
+    of a compile result, or zero if the pass did not run.
+    """
+    total = 0.0
+    pipeline_times = compile_result.metadata.get("pipeline_times", {})
+    for pipeline in pipeline_times.values():
+        for name, timing in pipeline.items():
+            # The keys have the form "<index>_<pass name>"
+            if name.split("_", 1)[-1] == pass_name:
+                total += timing.run
+    return total
+
+
+def vecadd(item: kapi.Item, a, b, c):
+    i = item.get_id(0)
+    c[i] = a[i] + b[i]
+
+
+def black_scholes(
+    item: kapi.Item, price, strike, t, rate, volatility, call, put
+):
+    mr = -rate
+    sig_sig_two = volatility * volatility * 2.0
+
+    i = item.get_id(0)
+
+    p = price[i]
+    s = strike[i]
+    tt = t[i]
+
+    a = log(p / s)
+    b = tt * mr
+
+    z = tt * sig_sig_two
+    c = 0.25 * z
+    y = 1.0 / sqrt(z)
+
+    w1 = (a - b + c) * y
+    w2 = (a - b - c) * y
+
+    d1 = 0.5 + 0.5 * erf(w1)
+    d2 = 0.5 + 0.5 * erf(w2)
+
+    se = exp(b) * s
+
+    r = p * d1 - se * d2
+
+    call[i] = r
+    put[i] = r - p + se
+
+
+def pairwise_distance(item: kapi.Item, data, distance):
+    i = item.get_id(0)
+    j = item.get_id(1)
+
+    d = 0.0
+    for k in range(data.shape[1]):
+        tmp = data[i, k] - data[j, k]
+        d += tmp * tmp
+
+    distance[i, j] = sqrt(d)
+
+
+def matmul(nditem: kapi.NdItem, a, b, c, slm_a, slm_b):
+    i = nditem.get_global_id(0)
+    j = nditem.get_global_id(1)
+    li = nditem.get_local_id(0)
+    lj = nditem.get_local_id(1)
+    block_size = slm_a.shape[0]
+    group = nditem.get_group()
+
+    acc = 0.0
+    for block in range(a.shape[1] // block_size):
+        slm_a[li, lj] = a[i, block * block_size + lj]
+        slm_b[li, lj] = b[block * block_size + li, j]
+        kapi.group_barrier(group)
+
+        for k in range(block_size):
+            acc += slm_a[li, k] * slm_b[k, lj]
+        kapi.group_barrier(group)
+
+    c[i, j] = acc
+
+
+def sum_reduction(nditem: kapi.NdItem, a, partial_sums, slm):
+    i = nditem.get_global_id(0)
+    li = nditem.get_local_id(0)
+    group = nditem.get_group()
+    group_size = nditem.get_local_range(0)
+
+    slm[li] = a[i]
+    kapi.group_barrier(group)
+
+    stride = group_size // 2
+    while stride > 0:
+        if li < stride:
+            slm[li] += slm[li + stride]
+        kapi.group_barrier(group)
+        stride = stride // 2
+
+    if li == 0:
+        partial_sums[group.get_group_id(0)] = slm[0]
+
+
+def _black_scholes_launch(queue, n):
+    dpnp.random.seed(777)
+    price = dpnp.random.uniform(10.0, 50.0, n, sycl_queue=queue)
+    strike = dpnp.random.uniform(10.0, 50.0, n, sycl_queue=queue)
+    t = dpnp.random.uniform(1.0, 2.0, n, sycl_queue=queue)
+    call = dpnp.empty(n, sycl_queue=queue)
+    put = dpnp.empty(n, sycl_queue=queue)
+    return dpex.Range(n), (price, strike, t, 0.1, 0.2, call, put)
+
+
+def _vecadd_launch(queue, n):
+    a = dpnp.ones(n, sycl_queue=queue)
+    b = dpnp.ones(n, sycl_queue=queue)
+    c = dpnp.empty(n, sycl_queue=queue)
+    return dpex.Range(n), (a, b, c)
+
+
+def _pairwise_distance_launch(queue, n):
+    data = dpnp.random.random((n, 3), sycl_queue=queue)
+    distance = dpnp.empty((n, n), sycl_queue=queue)
+    return dpex.Range(n, n), (data, distance)
+
+
+def _matmul_launch(queue, n):
+    block_size = 16
+    a = dpnp.ones((n, n), sycl_queue=queue)
+    b = dpnp.ones((n, n), sycl_queue=queue)
+    c = dpnp.empty((n, n), sycl_queue=queue)
+    slm_a = kapi.LocalAccessor((block_size, block_size), dtype=a.dtype)
+    slm_b = kapi.LocalAccessor((block_size, block_size), dtype=a.dtype)
+    index_space = dpex.NdRange(
+        dpex.Range(n, n), dpex.Range(block_size, block_size)
+    )
+    return index_space, (a, b, c, slm_a, slm_b)
+
+
+def _sum_reduction_launch(queue, n):
+    work_group_size = 64
+    a = dpnp.ones(n, sycl_queue=queue)
+    partial_sums = dpnp.empty(n // work_group_size, sycl_queue=queue)
+    slm = kapi.LocalAccessor(work_group_size, dtype=a.dtype)
+    index_space = dpex.NdRange(dpex.Range(n), dpex.Range(work_group_size))
+    return index_space, (a, partial_sums, slm)
+
+
+# The benchmarked kernels. Every entry maps a name to the kernel function and
+# to a function returning the index space and the arguments of a launch of
+# the kernel over a problem of size n on a queue. The problem size has to be
+# a multiple of 64.
+KERNELS = {
+    "vecadd": (vecadd, _vecadd_launch),
+    "black_scholes": (black_scholes, _black_scholes_launch),
+    "pairwise_distance": (pairwise_distance, _pairwise_distance_launch),
+    "matmul": (matmul, _matmul_launch),
+    "sum_reduction": (sum_reduction, _sum_reduction_launch),
+}
+
+
+def kernel_signature(index_space, args):
+    """Returns the Numba signature of a kernel launched over ``index_space``
+    with the arguments ``args``.
+    """
+    if isinstance(index_space, dpex.NdRange):
+        index_type = NdItemType(index_space.global_range.ndim)
+    else:
+        index_type = ItemType(index_space.ndim)
+
+    return void(index_type, *(typeof(arg) for arg in args))
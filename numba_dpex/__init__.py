@@ -4,52 +4,20 @@
 
 """
 The numba-dpex extension module adds data-parallel offload support to Numba.
+
+Importing the package only imports the numba-dpex types and the kernel_api.
+The compiler entry points, e.g., :func:`kernel`, :func:`dpjit` and
+:func:`call_kernel`, are imported on first access and the registries used by
+the compiler are loaded by :func:`numba_dpex.initialize.initialize` when the
+first dispatcher is created.
 """
-import glob
-import logging
-import os
-import platform as plt
+import importlib
 import re
 from typing import Tuple
 
 import dpctl
-import llvmlite.binding as ll
 from numba import __version__ as numba_version
 
-from .kernel_api_impl.spirv import target as spirv_kernel_target
-from .numba_patches import patch_ufuncs
-from .register_kernel_api_overloads import init_kernel_api_spirv_overloads
-
-
-def load_dpctl_sycl_interface():
-    """Permanently loads the ``DPCTLSyclInterface`` library provided by dpctl.
-    The ``DPCTLSyclInterface`` library provides C wrappers over SYCL functions
-    that are directly invoked from the LLVM modules generated by numba_dpex.
-    We load the library once at the time of initialization using llvmlite's
-    load_library_permanently function.
-    Raises:
-        ImportError: If the ``DPCTLSyclInterface`` library could not be loaded.
-    """
-
-    platform = plt.system()
-    if platform == "Windows":
-        paths = glob.glob(
-            os.path.join(
-                os.path.dirname(dpctl.__file__), "*DPCTLSyclInterface.dll"
-            )
-        )
-    else:
-        paths = glob.glob(
-            os.path.join(
-                os.path.dirname(dpctl.__file__), "*DPCTLSyclInterface.so"
-            )
-        )
-
-    if len(paths) == 1:
-        ll.load_library_permanently(paths[0])
-    else:
-        raise ImportError
-
 
 def parse_sem_version(version_string: str) -> Tuple[int, int, int]:
     """Parse sem version into tuple of three integers. If there is a suffix like
@@ -69,54 +37,85 @@ def parse_sem_version(version_string: str) -> Tuple[int, int, int]:
 numba_sem_version = parse_sem_version(numba_version)
 dpctl_sem_version = parse_sem_version(dpctl.__version__)
 
-# Monkey patches
-patch_ufuncs.patch()
-
 from numba import prange  # noqa E402
 
-import numba_dpex.core.dpjit_dispatcher  # noqa E402
-
-# Initialize the _dpexrt_python extension
-import numba_dpex.core.runtime  # noqa E402
-import numba_dpex.core.targets.dpjit_target  # noqa E402
-
 # Re-export types itself
 import numba_dpex.core.types as types  # noqa E402
-from numba_dpex.core import boxing  # noqa E402
+from numba_dpex._version import get_versions  # noqa E402
 from numba_dpex.core import config  # noqa E402
-from numba_dpex.core.overloads import ranges_overloads  # noqa E402
 
 # Re-export all type names
 from numba_dpex.core.types import *  # noqa E402
-from numba_dpex.dpctl_iface import _intrinsic  # noqa E402
-from numba_dpex.dpnp_iface import dpnpimpl  # noqa E402
 
 # Importing NdRange and Range into numba_dpex for
 # backward compatibility
 from numba_dpex.kernel_api import NdRange, Range  # noqa E402
 
-from .core.decorators import device_func, dpjit, kernel  # noqa E402
-from .core.kernel_launcher import call_kernel, call_kernel_async  # noqa E402
-from .core.targets import dpjit_target  # noqa E402
-
-load_dpctl_sycl_interface()
-del load_dpctl_sycl_interface
-
-
-from numba_dpex._version import get_versions  # noqa E402
-
 __version__ = get_versions()["version"]
 del get_versions
 
-# Initialize the kernel_api SPIRV overloads
-init_kernel_api_spirv_overloads()
-
-__all__ = types.__all__ + [
+# The names that are imported on first access. A name maps to the module
+# defining it and to its attribute name, or to None for the module itself.
+_LAZY_ATTRIBUTES = {
+    "BackgroundKernelCompiler": (
+        "numba_dpex.core.background_compiler",
+        "BackgroundKernelCompiler",
+    ),
+    "bind_kernel": ("numba_dpex.core.bound_kernel_launch", "bind_kernel"),
+    "boxing": ("numba_dpex.core.boxing", None),
+    "build_kernel_archive": ("numba_dpex.core.aot", "build_kernel_archive"),
+    "call_kernel": ("numba_dpex.core.kernel_launcher", "call_kernel"),
+    "call_kernel_async": (
+        "numba_dpex.core.kernel_launcher",
+        "call_kernel_async",
+    ),
+    "compile_kernel_async": (
+        "numba_dpex.core.background_compiler",
+        "compile_kernel_async",
+    ),
+    "device_func": ("numba_dpex.core.decorators", "device_func"),
+    "dpjit": ("numba_dpex.core.decorators", "dpjit"),
+    "dpjit_target": ("numba_dpex.core.targets.dpjit_target", None),
+    "dpnpimpl": ("numba_dpex.dpnp_iface.dpnpimpl", None),
+    "kernel": ("numba_dpex.core.decorators", "kernel"),
+    "KernelGraph": ("numba_dpex.core.kernel_graph", "KernelGraph"),
+    "load_kernel_archive": ("numba_dpex.core.aot", "load_kernel_archive"),
+    "ranges_overloads": ("numba_dpex.core.overloads.ranges_overloads", None),
+    "spirv_kernel_target": ("numba_dpex.kernel_api_impl.spirv.target", None),
+    "_intrinsic": ("numba_dpex.dpctl_iface._intrinsic", None),
+}
+
+
+def __getattr__(name):
+    try:
+        module_name, attr_name = _LAZY_ATTRIBUTES[name]
+    except KeyError:
+        raise AttributeError(
+            f"module {__name__!r} has no attribute {name!r}"
+        ) from None
+
+    module = importlib.import_module(module_name)
+    value = module if attr_name is None else getattr(module, attr_name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES))
+
+
+__all__ = types.__all__ + [  # noqa: F405
+    "BackgroundKernelCompiler",
+    "bind_kernel",
+    "build_kernel_archive",
     "call_kernel",
     "call_kernel_async",
+    "compile_kernel_async",
     "device_func",
     "dpjit",
     "kernel",
+    "KernelGraph",
+    "load_kernel_archive",
     "prange",
     "Range",
     "NdRange",
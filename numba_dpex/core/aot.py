@@ -0,0 +1,395 @@
+# SPDX-FileCopyrightText: 2024 Intel Corporation
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""Ahead-of-time packaging of compiled kernels into loadable archives.
+
+Every process that launches a :func:`numba_dpex.kernel` decorated function
+types and lowers the function and translates it to SPIR-V for every signature
+that it is launched with. An application that deploys the same kernels to many
+machines can instead compile them once with :func:`build_kernel_archive`, or
+with the command line tool of this module, and ship the resulting archive::
+
+    python -m numba_dpex.core.aot -o kernels.zip mypackage.kernels
+
+The command archives every compiled signature of the kernels defined in the
+given modules, i.e., the signatures of the specialized kernels that are
+compiled when the modules are imported.
+
+An archive is a zip file holding the SPIR-V binary of every kernel
+specialization and a JSON manifest. The manifest records the version of the
+archive format and of the kernel argument layout, and for every kernel the
+module and qualified name of the Python function, the hash of its bytecode,
+the compilation options, a device-independent form of the signature and the
+aspects of the device that the kernel was typed for.
+
+:func:`load_kernel_archive` registers the kernels of an archive. When a kernel
+dispatcher then needs a signature found in a loaded archive, it uses the
+archived :class:`SPIRVKernelModule` instead of typing and lowering the
+function. A kernel whose bytecode, options or device aspects differ from the
+archived ones is compiled as usual. Archives have to be loaded before the modules defining
+specialized kernels are imported, as these kernels are compiled on import.
+"""
+
+import argparse
+import importlib
+import json
+import os
+import sys
+import tempfile
+import threading
+import zipfile
+from typing import NamedTuple
+
+from numba.core import sigutils
+
+from numba_dpex.core.caching import (
+    _KERNEL_ARGS_ABI_VERSION,
+    _hash_function_code,
+    _stable_type_key,
+)
+from numba_dpex.core.types import USMNdArray
+from numba_dpex.core.utils.call_kernel_builder import SPIRVKernelModule
+
+# The version of the layout of an archive. Archives of another version are not
+# loaded.
+_ARCHIVE_FORMAT_VERSION = 2
+_MANIFEST_NAME = "manifest.json"
+
+
+def _archive_type_key(ty):
+    """Returns a process- and device-independent key for a Numba type."""
+    key = _stable_type_key(ty)
+    if isinstance(ty, USMNdArray):
+        # The SPIR-V binary of a kernel does not depend on the device, so the
+        # filter string of the device is not part of the key.
+        key = key[:-1]
+    return key
+
+
+def _signature_key(args) -> str:
+    """Returns the key of the argument types of a kernel signature."""
+    return repr(tuple(_archive_type_key(ty) for ty in args))
+
+
+def _device_aspects(args) -> dict:
+    """Returns the aspects of the device of a kernel signature that its typing
+    depends on, e.g., 64-bit atomics are only typed for devices supporting
+    them. Returns None if no argument is bound to a device.
+    """
+    for ty in args:
+        if isinstance(ty, USMNdArray):
+            return {
+                "atomic64": ty.queue.device_has_aspect_atomic64,
+                "fp64": ty.queue.device_has_aspect_fp64,
+            }
+    return None
+
+
+def _kernel_options(targetoptions) -> dict:
+    """Returns the options of a kernel dispatcher that change its SPIR-V."""
+    return {
+        "debug": bool(targetoptions.get("debug", False)),
+        "inline_threshold": targetoptions.get("inline_threshold"),
+    }
+
+
+class _ArchivedKernel(NamedTuple):
+    """A kernel specialization loaded from an archive."""
+
+    code_hash: tuple
+    options: dict
+    device_aspects: dict
+    kernel_module: SPIRVKernelModule
+
+
+class KernelArchiveRegistry:
+    """Maps the kernel specializations of the loaded archives to their
+    SPIR-V modules.
+    """
+
+    def __init__(self):
+        self._kernels = {}
+        self._lock = threading.Lock()
+
+    def add(self, module, qualname, signature_key, archived_kernel):
+        """Registers an archived kernel specialization."""
+        with self._lock:
+            self._kernels[(module, qualname, signature_key)] = archived_kernel
+
+    def lookup(self, py_func, targetoptions, args):
+        """Returns the archived SPIR-V module of a kernel specialization, or
+        None if no loaded archive has a matching one.
+
+        Args:
+            py_func: The Python function of the kernel.
+            targetoptions (dict): The target options of the kernel dispatcher.
+            args (tuple): The argument types of the signature.
+
+        Returns: A :class:`SPIRVKernelModule` or None.
+        """
+        if not self._kernels:
+            return None
+
+        key = (py_func.__module__, py_func.__qualname__, _signature_key(args))
+        with self._lock:
+            archived_kernel = self._kernels.get(key)
+        if (
+            archived_kernel is None
+            or archived_kernel.code_hash != _hash_function_code(py_func)
+            or archived_kernel.options != _kernel_options(targetoptions)
+            or archived_kernel.device_aspects != _device_aspects(args)
+        ):
+            return None
+        return archived_kernel.kernel_module
+
+    def clear(self):
+        """Removes all the registered kernels."""
+        with self._lock:
+            self._kernels.clear()
+
+    def __len__(self):
+        with self._lock:
+            return len(self._kernels)
+
+
+kernel_archive_registry = KernelArchiveRegistry()
+
+
+def _check_kernel_dispatcher(kernel_fn):
+    # pylint: disable=import-outside-toplevel
+    from numba_dpex.kernel_api_impl.spirv.dispatcher import (
+        SPIRVKernelDispatcher,
+    )
+    from numba_dpex.kernel_api_impl.spirv.target import CompilationMode
+
+    if (
+        not isinstance(kernel_fn, SPIRVKernelDispatcher)
+        or kernel_fn.targetoptions.get("_compilation_mode")
+        != CompilationMode.KERNEL
+    ):
+        raise TypeError(
+            "Only numba_dpex.kernel decorated functions can be archived."
+        )
+
+
+def _compile_signatures(kernel_fn, signatures):
+    """Compiles the signatures of a kernel and returns their compile results.
+
+    If ``signatures`` is None, the already compiled signatures are returned.
+    """
+    if signatures is None:
+        return list(kernel_fn.overloads.values())
+
+    if sigutils.is_signature(signatures):
+        signatures = [signatures]
+
+    kcres_list = []
+    for sig in signatures:
+        args, _ = sigutils.normalize_signature(sig)
+        args = tuple(args)
+        # A specialized kernel cannot compile, but has all its signatures.
+        if args not in kernel_fn.overloads:
+            kernel_fn.compile(sig)
+        kcres_list.append(kernel_fn.overloads[args])
+    return kcres_list
+
+
+def find_module_kernels(module) -> list:
+    """Returns the ``numba_dpex.kernel`` decorated functions defined in a
+    module.
+
+    Args:
+        module: A module object or the name of a module to import.
+
+    Returns:
+        list: The kernel dispatchers sorted by the names of their functions.
+    """
+    # pylint: disable=import-outside-toplevel
+    from numba_dpex.kernel_api_impl.spirv.dispatcher import (
+        SPIRVKernelDispatcher,
+    )
+    from numba_dpex.kernel_api_impl.spirv.target import CompilationMode
+
+    if isinstance(module, str):
+        module = importlib.import_module(module)
+
+    kernels = {}
+    for val in vars(module).values():
+        if (
+            isinstance(val, SPIRVKernelDispatcher)
+            and val.targetoptions.get("_compilation_mode")
+            == CompilationMode.KERNEL
+            and val.py_func.__module__ == module.__name__
+        ):
+            kernels[id(val)] = val
+    return sorted(kernels.values(), key=lambda val: val.py_func.__qualname__)
+
+
+def build_kernel_archive(path, kernels) -> int:
+    """Compiles kernels and writes their SPIR-V binaries to an archive.
+
+    Args:
+        path: The path of the archive to write.
+        kernels: An iterable of ``numba_dpex.kernel`` decorated functions or
+            of ``(kernel_fn, signatures)`` pairs. The signatures are given as
+            accepted by :func:`numba_dpex.kernel`, i.e., a signature or a list
+            of signatures. All the compiled signatures of a kernel given
+            without signatures are archived.
+
+    Returns:
+        int: The number of archived kernel specializations.
+
+    Raises:
+        TypeError: If a kernel is not a ``numba_dpex.kernel`` decorated
+            function.
+    """
+    # pylint: disable=import-outside-toplevel
+    import numba
+
+    import numba_dpex
+
+    entries = []
+    blobs = []
+    for item in kernels:
+        if isinstance(item, tuple):
+            kernel_fn, signatures = item
+        else:
+            kernel_fn, signatures = item, None
+        _check_kernel_dispatcher(kernel_fn)
+
+        py_func = kernel_fn.py_func
+        for kcres in _compile_signatures(kernel_fn, signatures):
+            kernel_module = kcres.kernel_device_ir_module
+            blob_name = f"kernels/{len(blobs)}.spv"
+            blobs.append((blob_name, kernel_module.kernel_bitcode))
+            entries.append(
+                {
+                    "module": py_func.__module__,
+                    "qualname": py_func.__qualname__,
+                    "code_hash": list(_hash_function_code(py_func)),
+                    "options": _kernel_options(kernel_fn.targetoptions),
+                    "signature": _signature_key(kcres.signature.args),
+                    "device_aspects": _device_aspects(kcres.signature.args),
+                    "signature_str": str(kcres.signature),
+                    "kernel_name": kernel_module.kernel_name,
+                    "blob": blob_name,
+                }
+            )
+
+    manifest = {
+        "format_version": _ARCHIVE_FORMAT_VERSION,
+        "kernel_args_abi_version": _KERNEL_ARGS_ABI_VERSION,
+        "numba_dpex_version": numba_dpex.__version__,
+        "numba_version": numba.__version__,
+        "kernels": entries,
+    }
+
+    # Write to a temporary file first, so that a partially written archive
+    # never replaces an existing one.
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+    try:
+        try:
+            f = os.fdopen(fd, "wb")
+        except BaseException:
+            os.close(fd)
+            raise
+        with f:
+            with zipfile.ZipFile(
+                f, "w", compression=zipfile.ZIP_DEFLATED
+            ) as archive:
+                archive.writestr(_MANIFEST_NAME, json.dumps(manifest, indent=1))
+                for blob_name, bitcode in blobs:
+                    archive.writestr(blob_name, bitcode)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+    return len(entries)
+
+
+def load_kernel_archive(path) -> int:
+    """Registers the kernels of an archive written by
+    :func:`build_kernel_archive`.
+
+    Args:
+        path: The path of the archive.
+
+    Returns:
+        int: The number of registered kernel specializations.
+
+    Raises:
+        ValueError: If the archive has another format version or was built
+            for another layout of the kernel arguments.
+    """
+    with zipfile.ZipFile(path, "r") as archive:
+        manifest = json.loads(archive.read(_MANIFEST_NAME))
+        if manifest.get("format_version") != _ARCHIVE_FORMAT_VERSION:
+            raise ValueError(
+                f"The kernel archive {path} has the unsupported format "
+                f"version {manifest.get('format_version')}."
+            )
+        if manifest.get("kernel_args_abi_version") != _KERNEL_ARGS_ABI_VERSION:
+            raise ValueError(
+                f"The kernel archive {path} was built by an incompatible "
+                f"version {manifest.get('numba_dpex_version')} of numba-dpex."
+            )
+
+        for entry in manifest["kernels"]:
+            kernel_module = SPIRVKernelModule(
+                kernel_name=entry["kernel_name"],
+                kernel_bitcode=archive.read(entry["blob"]),
+            )
+            kernel_archive_registry.add(
+                entry["module"],
+                entry["qualname"],
+                entry["signature"],
+                _ArchivedKernel(
+                    code_hash=tuple(entry["code_hash"]),
+                    options=entry["options"],
+                    device_aspects=entry["device_aspects"],
+                    kernel_module=kernel_module,
+                ),
+            )
+
+    return len(manifest["kernels"])
+
+
+def main(argv=None) -> int:
+    """Runs the command line tool that archives the kernels of modules."""
+    parser = argparse.ArgumentParser(
+        prog="python -m numba_dpex.core.aot",
+        description=(
+            "Archives the SPIR-V binaries of the compiled signatures of the "
+            "numba_dpex.kernel decorated functions defined in modules."
+        ),
+    )
+    parser.add_argument(
+        "modules", nargs="+", help="the names of the modules to import"
+    )
+    parser.add_argument(
+        "-o", "--output", required=True, help="the path of the archive"
+    )
+    args = parser.parse_args(argv)
+
+    kernels = []
+    for module in args.modules:
+        kernels.extend(find_module_kernels(module))
+
+    num_kernels = build_kernel_archive(args.output, kernels)
+    if num_kernels == 0:
+        print(
+            "No compiled kernel signatures were found in "
+            f"{', '.join(args.modules)}.",
+            file=sys.stderr,
+        )
+        return 1
+
+    print(f"Archived {num_kernels} kernel specializations to {args.output}.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,163 @@
+# SPDX-FileCopyrightText: 2024 Intel Corporation
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""Compiles kernel specializations on a pool of worker threads.
+
+Compiling a signature of a :func:`numba_dpex.kernel` decorated function types
+and lowers the kernel under Numba's global compiler lock, translates the LLVM
+IR to SPIR-V using the ``llvm-spirv`` tool, and on the first launch builds a
+SYCL kernel bundle from the SPIR-V. Only the first step needs the lock. A
+:class:`BackgroundKernelCompiler` compiles many (kernel, signature) pairs on
+worker threads that run ``llvm-spirv`` after releasing the lock and, when a
+queue is given, also build the kernel bundles for the queue. These steps of
+different kernels then run concurrently.
+
+Every compilation returns a :class:`concurrent.futures.Future`. Launching a
+kernel from CPython while its signatures are compiled in the background
+blocks until they are compiled instead of compiling them again.
+"""
+
+import os
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+
+import dpctl
+from numba.core import sigutils
+
+from numba_dpex.core.bound_kernel_launch import (
+    _build_kernel,
+    _kernel_launch_delete_kernel,
+)
+from numba_dpex.kernel_api_impl.spirv.dispatcher import SPIRVKernelDispatcher
+
+
+def _build_kernel_bundle(kernel_fn, kcres, queue):
+    """Builds the SYCL kernel for the queue's context and device and stores
+    it in the runtime kernel cache.
+    """
+    kernel_ref = _build_kernel(queue, kernel_fn, kcres)
+    if not kernel_ref:
+        raise RuntimeError(
+            f"Could not build the kernel {kernel_fn.py_func.__name__}."
+        )
+    # The runtime kernel cache keeps its own reference to the kernel.
+    _kernel_launch_delete_kernel(kernel_ref)
+
+
+def _compile(kernel_fn, args, queue):
+    """Compiles a signature of a kernel on a worker thread."""
+    # pylint: disable=protected-access
+    kcres = kernel_fn._compile_with_deferred_translation(args)
+
+    if queue is not None:
+        _build_kernel_bundle(kernel_fn, kcres, queue)
+
+    return kcres
+
+
+class BackgroundKernelCompiler:
+    """A pool of worker threads that compile kernel signatures.
+
+    Args:
+        max_workers (int, optional): The number of worker threads. Defaults
+            to the number of CPU cores.
+    """
+
+    def __init__(self, max_workers: int = None):
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers or os.cpu_count(),
+            thread_name_prefix="numba_dpex_compile",
+        )
+
+    def submit(self, kernel_fn, sig, queue: dpctl.SyclQueue = None) -> Future:
+        """Queues the compilation of a signature of a kernel.
+
+        Args:
+            kernel_fn: A :func:`numba_dpex.kernel` decorated function.
+            sig: The signature to compile, given as a tuple of argument types
+                or as a Numba signature, including the Item or NdItem type of
+                the first argument.
+            queue (dpctl.SyclQueue, optional): If given, the SYCL kernel
+                bundle is also built for the context and the device of the
+                queue, so that the first launch on the queue does not build
+                it.
+
+        Returns:
+            concurrent.futures.Future: A future of the compile result of the
+            signature. A failed compilation sets the exception of the future.
+
+        Raises:
+            TypeError: If the kernel function is not a ``numba_dpex.kernel``
+                decorated function.
+        """
+        if not isinstance(kernel_fn, SPIRVKernelDispatcher):
+            raise TypeError(
+                "The kernel function must be a numba_dpex.kernel decorated "
+                "function."
+            )
+
+        args, _ = sigutils.normalize_signature(sig)
+        args = tuple(args)
+        future = self._executor.submit(_compile, kernel_fn, args, queue)
+        kernel_fn._add_pending_compile(args, future)
+        return future
+
+    def submit_many(self, requests, queue: dpctl.SyclQueue = None) -> list:
+        """Queues the compilation of a list of ``(kernel_fn, sig)`` pairs.
+
+        Returns:
+            list[concurrent.futures.Future]: The futures in the order of the
+            requests.
+        """
+        return [
+            self.submit(kernel_fn, sig, queue) for kernel_fn, sig in requests
+        ]
+
+    def shutdown(self, wait: bool = True):
+        """Stops the worker threads once the queued compilations are done.
+
+        Args:
+            wait (bool, optional): Whether to block until the queued
+                compilations are done.
+        """
+        self._executor.shutdown(wait=wait)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.shutdown(wait=True)
+
+
+_default_compiler = None
+_default_compiler_lock = threading.Lock()
+
+
+def compile_kernel_async(
+    kernel_fn, sig, queue: dpctl.SyclQueue = None
+) -> Future:
+    """Queues the compilation of a signature of a kernel on a process-wide
+    :class:`BackgroundKernelCompiler` with one worker per CPU core.
+
+    Refer :meth:`BackgroundKernelCompiler.submit` for the arguments.
+
+    Examples:
+
+    .. code-block:: python
+
+        futures = [
+            dpex.compile_kernel_async(kernel_fn, sig, queue)
+            for kernel_fn, sig in specializations
+        ]
+        # ... other start-up work ...
+        for future in futures:
+            future.result()
+    """
+    global _default_compiler  # pylint: disable=global-statement
+
+    with _default_compiler_lock:
+        if _default_compiler is None:
+            _default_compiler = BackgroundKernelCompiler()
+
+    return _default_compiler.submit(kernel_fn, sig, queue)
@@ -0,0 +1,512 @@
+# SPDX-FileCopyrightText: 2024 Intel Corporation
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""Provides launch objects that bind a kernel function, an index space and a
+list of arguments once and submit the kernel repeatedly.
+
+A call to :func:`numba_dpex.call_kernel` types the arguments, looks up the
+kernel, builds the range and flattens every argument into the argument and
+type arrays passed to the ``DPCTLQueue_Submit*`` functions on every launch. A
+:class:`BoundKernelLaunch` does all of this once, so a launch only submits the
+kernel with the already built arrays. Arguments can be replaced between
+launches by values of the same type, in which case only the entries of the
+replaced argument in the argument array are rebuilt.
+"""
+
+import ctypes
+import warnings
+from inspect import signature
+from math import ceil, prod
+
+import dpctl
+import dpnp
+from dpctl._sycl_queue import kernel_arg_type as kargty
+from numba.core import event as ev
+from numba.core import types
+from numba.core.typing.typeof import Purpose, typeof
+
+from numba_dpex.core.exceptions import UnsupportedKernelArgumentError
+from numba_dpex.core.runtime import _dpexrt_python
+from numba_dpex.core.types import USMNdArray
+from numba_dpex.core.types.kernel_api.index_space_ids import (
+    ItemType,
+    NdItemType,
+)
+from numba_dpex.core.types.kernel_api.local_accessor import LocalAccessorType
+from numba_dpex.core.utils import call_kernel_builder as kl
+from numba_dpex.kernel_api import NdRange, Range
+from numba_dpex.kernel_api_impl.spirv.dispatcher import SPIRVKernelDispatcher
+
+_kernel_launch_build_kernel = ctypes.CFUNCTYPE(
+    ctypes.c_void_p,
+    ctypes.c_void_p,
+    ctypes.c_size_t,
+    ctypes.c_char_p,
+    ctypes.c_size_t,
+    ctypes.c_char_p,
+    ctypes.c_char_p,
+)(_dpexrt_python.DPEXRT_kernel_launch_build_kernel)
+_kernel_launch_delete_kernel = ctypes.CFUNCTYPE(None, ctypes.c_void_p)(
+    _dpexrt_python.DPEXRT_kernel_launch_delete_kernel
+)
+# The submit function creates Python objects, so it is called with the GIL.
+_kernel_launch_submit = ctypes.PYFUNCTYPE(
+    ctypes.py_object,
+    ctypes.c_void_p,
+    ctypes.c_void_p,
+    ctypes.c_void_p,
+    ctypes.c_void_p,
+    ctypes.c_size_t,
+    ctypes.c_void_p,
+    ctypes.c_void_p,
+    ctypes.c_size_t,
+    ctypes.c_void_p,
+    ctypes.c_size_t,
+    ctypes.c_int,
+)(_dpexrt_python.DPEXRT_kernel_launch_submit)
+
+_SCALAR_ARG_TYPES = {
+    types.boolean: (ctypes.c_uint8, kargty.dpctl_uint8),
+    types.int32: (ctypes.c_int32, kargty.dpctl_int32),
+    types.uint32: (ctypes.c_uint32, kargty.dpctl_uint32),
+    types.int64: (ctypes.c_int64, kargty.dpctl_int64),
+    types.uint64: (ctypes.c_uint64, kargty.dpctl_uint64),
+    types.float32: (ctypes.c_float, kargty.dpctl_float32),
+    types.float64: (ctypes.c_double, kargty.dpctl_float64),
+}
+
+
+def _build_kernel(queue, kernel_fn, kcres):
+    """Builds the SYCL kernel of a compiled kernel signature for the queue's
+    context and device.
+
+    Returns:
+        A reference to the SYCL kernel, or None if the build failed.
+    """
+    kernel_module: kl.SPIRVKernelModule = kcres.kernel_device_ir_module
+    build_options = kl.get_kernel_build_options(
+        kernel_fn.targetoptions.get("debug", False)
+    )
+    function = kernel_fn.py_func.__qualname__
+    with ev.trigger_event(
+        "numba_dpex:kernel_bundle_build",
+        data={
+            "name": f"build kernel bundle {function}",
+            "function": function,
+            "signature": "("
+            + ", ".join(str(ty) for ty in kcres.signature.args)
+            + ")",
+        },
+    ):
+        return _kernel_launch_build_kernel(
+            queue.addressof_ref(),
+            kl._spirv_binary_hash(kernel_module.kernel_bitcode)
+            & 0xFFFFFFFFFFFFFFFF,
+            kernel_module.kernel_bitcode,
+            len(kernel_module.kernel_bitcode),
+            build_options.encode() if build_options else None,
+            kernel_module.kernel_name.encode(),
+        )
+
+
+class _MDLocalAccessor(ctypes.Structure):
+    """Same structure as dpctl's ``MDLocalAccessor`` used to pass the shape
+    and the type of a local accessor to the ``DPCTLQueue_Submit*`` functions.
+    """
+
+    _fields_ = [
+        ("ndim", ctypes.c_size_t),
+        ("dpctl_type_id", ctypes.c_int32),
+        ("dim0", ctypes.c_size_t),
+        ("dim1", ctypes.c_size_t),
+        ("dim2", ctypes.c_size_t),
+    ]
+
+
+def _flatten_scalar(ty, val):
+    """Returns the flattened kernel arguments of a scalar of Numba type
+    ``ty`` as a list of ``(storage, typeid)`` pairs."""
+    try:
+        ctype, typeid = _SCALAR_ARG_TYPES[ty]
+    except KeyError as e:
+        raise NotImplementedError(
+            f"Kernel arguments of type {ty} are not supported."
+        ) from e
+    return [(ctype(val), typeid)]
+
+
+def _usm_ndarray(val):
+    """Returns the dpctl.tensor.usm_ndarray of a dpnp.ndarray or a
+    dpctl.tensor.usm_ndarray."""
+    return val.get_array() if isinstance(val, dpnp.ndarray) else val
+
+
+def _flatten_array(ty, val):
+    """Returns the flattened kernel arguments of a dpnp.ndarray or a
+    dpctl.tensor.usm_ndarray in the order of the USMArrayDeviceModel.
+
+    A C- or F-contiguous array is passed as only its data pointer and its
+    shape.
+    """
+    usm_ary = _usm_ndarray(val)
+    itemsize = usm_ary.itemsize
+    data = (ctypes.c_void_p(usm_ary._pointer), kargty.dpctl_void_ptr)
+    shape = [
+        (ctypes.c_int64(extent), kargty.dpctl_int64) for extent in usm_ary.shape
+    ]
+    if ty.layout in ("C", "F"):
+        return [data] + shape
+
+    args = [
+        (ctypes.c_int64(usm_ary.size), kargty.dpctl_int64),
+        (ctypes.c_int64(itemsize), kargty.dpctl_int64),
+        data,
+    ]
+    args.extend(shape)
+    # dpctl stores strides as number of elements and the kernel expects them
+    # as number of bytes.
+    args.extend(
+        (ctypes.c_int64(stride * itemsize), kargty.dpctl_int64)
+        for stride in usm_ary.strides
+    )
+    return args
+
+
+def _flatten_local_accessor(ty, val):
+    """Returns the flattened kernel arguments of a LocalAccessor in the order
+    of the USMArrayDeviceModel, passing a _MDLocalAccessor as the data."""
+    shape = val._shape
+    itemsize = ceil(ty.dtype.bitwidth / types.byte.bitwidth)
+
+    md = _MDLocalAccessor(
+        ndim=ty.ndim,
+        dpctl_type_id=_SCALAR_ARG_TYPES[ty.dtype][1].value,
+    )
+    for i, extent in enumerate(shape):
+        setattr(md, f"dim{i}", extent)
+
+    args = [
+        (ctypes.c_int64(prod(shape)), kargty.dpctl_int64),
+        (ctypes.c_int64(itemsize), kargty.dpctl_int64),
+        (md, kargty.dpctl_local_accessor),
+    ]
+    args.extend(
+        (ctypes.c_int64(extent), kargty.dpctl_int64) for extent in shape
+    )
+    args.extend((ctypes.c_int64(itemsize), kargty.dpctl_int64) for _ in shape)
+    return args
+
+
+def _flatten_arg(ty, val):
+    """Returns the flattened kernel arguments of a value of Numba type ``ty``
+    as a list of ``(storage, typeid)`` pairs in the order used by the
+    KernelFlattenedArgsBuilder.
+    """
+    if isinstance(ty, LocalAccessorType):
+        return _flatten_local_accessor(ty, val)
+    if isinstance(ty, USMNdArray):
+        return _flatten_array(ty, val)
+    if ty == types.complex64:
+        return _flatten_scalar(types.float32, val.real) + _flatten_scalar(
+            types.float32, val.imag
+        )
+    if ty == types.complex128:
+        return _flatten_scalar(types.float64, val.real) + _flatten_scalar(
+            types.float64, val.imag
+        )
+    return _flatten_scalar(ty, val)
+
+
+def _arg_address(storage, typeid):
+    """Returns the entry of the argument array for a flattened argument.
+
+    Pointers are passed by value and every other argument by the address of
+    its storage.
+    """
+    if typeid == kargty.dpctl_void_ptr:
+        return storage.value
+    return ctypes.addressof(storage)
+
+
+def _event_ref_array(events):
+    """Returns a ctypes array of the references of a list of dpctl.SyclEvent
+    objects, or None for an empty list, and its length."""
+    nevents = len(events)
+    if not nevents:
+        return None, 0
+    refs = (ctypes.c_void_p * nevents)(
+        *(event.addressof_ref() for event in events)
+    )
+    return refs, nevents
+
+
+def _typeof_kernel_arg(kernel_name, val):
+    """Returns the Numba type of a kernel argument the same way as the
+    kernel dispatcher does."""
+    ty = typeof(val, Purpose.argument)
+    if ty is None or (
+        isinstance(ty, types.Array) and not isinstance(ty, USMNdArray)
+    ):
+        raise UnsupportedKernelArgumentError(
+            type=str(type(val)), value=val, kernel_name=kernel_name
+        )
+    return ty
+
+
+class BoundKernelLaunch:
+    """A kernel function bound to an index space and a list of arguments
+    that can be submitted repeatedly.
+
+    Instances are created by :func:`bind_kernel`. The kernel is compiled and
+    built for the queue of the array arguments, and the range and the
+    flattened argument and type arrays are built when the launch object is
+    created. Calling the object submits the kernel and waits for it to
+    finish, :meth:`submit_async` submits the kernel and returns the events
+    tracking it.
+    """
+
+    _kernel_ref = None
+
+    def __init__(self, kernel_fn, index_space, kernel_args):
+        if not isinstance(kernel_fn, SPIRVKernelDispatcher):
+            raise TypeError(
+                "The kernel function must be a numba_dpex.kernel decorated "
+                "function."
+            )
+        if not isinstance(index_space, (Range, NdRange)):
+            raise TypeError("The index space must be a Range or an NdRange.")
+
+        kernel_name = kernel_fn.py_func.__name__
+        argtys = tuple(
+            _typeof_kernel_arg(kernel_name, val) for val in kernel_args
+        )
+
+        if isinstance(index_space, Range) and any(
+            isinstance(ty, LocalAccessorType) for ty in argtys
+        ):
+            raise TypeError(
+                "A RangeType kernel cannot have a LocalAccessor argument"
+            )
+
+        self._kernel_name = kernel_name
+        self._argtys = argtys
+        self._queue = self._get_queue(kernel_args)
+
+        # Compiling the kernel checks that all arrays are on the same queue.
+        kcres = kernel_fn.get_compile_result(
+            types.void(*self._kernel_argtys(kernel_fn, index_space, argtys))
+        )
+        kernel_ref = _build_kernel(self._queue, kernel_fn, kcres)
+        if not kernel_ref:
+            raise RuntimeError(f"Could not build the kernel {kernel_name}.")
+        self._kernel_ref = kernel_ref
+
+        self._set_index_space(index_space)
+
+        # The values of the arguments are kept alive by the launch object, as
+        # the argument array points into their storage and their data.
+        self._args = list(kernel_args)
+        self._arg_storage = []
+        self._arg_offsets = []
+        typeids = []
+        for ty, val in zip(argtys, kernel_args):
+            flattened = _flatten_arg(ty, val)
+            self._arg_offsets.append(len(typeids))
+            self._arg_storage.append(flattened)
+            typeids.extend(typeid.value for _, typeid in flattened)
+
+        self._nargs = len(typeids)
+        self._arg_array = (ctypes.c_void_p * self._nargs)(
+            *(
+                _arg_address(storage, typeid)
+                for flattened in self._arg_storage
+                for storage, typeid in flattened
+            )
+        )
+        self._argty_array = (ctypes.c_int * self._nargs)(*typeids)
+
+    @staticmethod
+    def _kernel_argtys(kernel_fn, index_space, argtys):
+        """Returns the kernel signature's argument types, adding the Item or
+        NdItem argument that is not passed by the caller."""
+        if len(signature(kernel_fn.py_func).parameters) > len(argtys):
+            if isinstance(index_space, Range):
+                ty_item = ItemType(index_space.ndim)
+            else:
+                ty_item = NdItemType(index_space.ndim)
+            return (ty_item, *argtys)
+
+        warnings.warn(
+            "Kernels without item/nd_item will be not supported in the future",
+            DeprecationWarning,
+        )
+        return argtys
+
+    def _get_queue(self, kernel_args):
+        """Returns the queue of the first array argument."""
+        for _, val in self._usm_array_args(kernel_args):
+            return val.sycl_queue
+        raise ValueError(
+            f"The kernel {self._kernel_name} is bound without an array "
+            "argument, so the queue to submit it to cannot be inferred."
+        )
+
+    def _usm_array_args(self, kernel_args=None):
+        """Yields the position and the value of every USM array argument."""
+        if kernel_args is None:
+            kernel_args = self._args
+        for i, (ty, val) in enumerate(zip(self._argtys, kernel_args)):
+            if isinstance(ty, USMNdArray) and not isinstance(
+                ty, LocalAccessorType
+            ):
+                yield i, val
+
+    def _set_index_space(self, index_space):
+        """Builds the range arrays in the SYCL order of the dimensions."""
+        if isinstance(index_space, Range):
+            global_range = list(index_space)
+            local_range = None
+        else:
+            global_range = list(index_space.global_range)
+            local_range = list(index_space.local_range)
+
+        # The index space follows the OpenCL order of the dimensions, the
+        # fastest changing dimension being the first one.
+        global_range.reverse()
+        self._ndim = len(global_range)
+        self._global_range = (ctypes.c_size_t * 3)(*global_range)
+        self._local_range = None
+        if local_range is not None:
+            local_range.reverse()
+            self._local_range = (ctypes.c_size_t * 3)(*local_range)
+
+    @property
+    def queue(self) -> dpctl.SyclQueue:
+        """The queue the kernel is submitted to."""
+        return self._queue
+
+    @property
+    def args(self) -> tuple:
+        """The currently bound kernel arguments."""
+        return tuple(self._args)
+
+    def set_arg(self, index: int, value):
+        """Replaces a bound kernel argument.
+
+        Only the entries of the replaced argument in the flattened argument
+        array are rebuilt.
+
+        Args:
+            index (int): The position of the argument.
+            value: The new value. It must have the same Numba type as the
+                replaced argument and an array must be allocated on the
+                queue of the launch object.
+
+        Raises:
+            TypeError: If the type of the value differs from the type of the
+                replaced argument.
+            ValueError: If an array is allocated on another queue.
+        """
+        ty = self._argtys[index]
+        new_ty = _typeof_kernel_arg(self._kernel_name, value)
+        if new_ty != ty:
+            raise TypeError(
+                f"Argument {index} of the kernel {self._kernel_name} is of "
+                f"type {ty} and cannot be replaced by a value of type "
+                f"{new_ty}. Bind the kernel again to change the type."
+            )
+        if (
+            isinstance(ty, USMNdArray)
+            and not isinstance(ty, LocalAccessorType)
+            and value.sycl_queue != self._queue
+        ):
+            raise ValueError(
+                f"Argument {index} of the kernel {self._kernel_name} must be "
+                "allocated on the queue of the bound kernel."
+            )
+
+        flattened = _flatten_arg(ty, value)
+        offset = self._arg_offsets[index]
+        for i, (storage, typeid) in enumerate(flattened):
+            self._arg_array[offset + i] = _arg_address(storage, typeid)
+        self._arg_storage[index] = flattened
+        self._args[index] = value
+
+    def _submit(self, dependent_events, wait):
+        dep_refs, ndeps = _event_ref_array(dependent_events)
+        return _kernel_launch_submit(
+            self._kernel_ref,
+            self._queue.addressof_ref(),
+            self._arg_array,
+            self._argty_array,
+            self._nargs,
+            self._global_range,
+            self._local_range,
+            self._ndim,
+            dep_refs,
+            ndeps,
+            wait,
+        )
+
+    def __call__(self, dependent_events=()) -> None:
+        """Submits the kernel and waits for it to finish.
+
+        Args:
+            dependent_events (list[dpctl.SyclEvent], optional): The events the
+                kernel execution depends on.
+        """
+        self._submit(dependent_events, 1)
+
+    def submit_async(
+        self, dependent_events=()
+    ) -> tuple[dpctl.SyclEvent, dpctl.SyclEvent]:
+        """Submits the kernel without waiting for it to finish.
+
+        The bound arguments are kept alive until the kernel is done, even if
+        they are replaced in the meantime.
+
+        Args:
+            dependent_events (list[dpctl.SyclEvent], optional): The events the
+                kernel execution depends on.
+
+        Returns:
+            A pair of the event of the host task keeping the arguments alive
+            and the event of the kernel.
+        """
+        device_event = self._submit(dependent_events, 0)
+        host_event = self._queue._submit_keep_args_alive(
+            tuple(self._args), [device_event]
+        )
+        return host_event, device_event
+
+    def __del__(self):
+        if self._kernel_ref:
+            _kernel_launch_delete_kernel(self._kernel_ref)
+            self._kernel_ref = None
+
+
+def bind_kernel(kernel_fn, index_space, *kernel_args) -> BoundKernelLaunch:
+    """Binds a kernel function to an index space and a list of arguments.
+
+    The kernel is compiled for the types of the arguments and built for the
+    queue of the array arguments once. The returned launch object submits the
+    kernel without repeating the typing, the kernel lookup and the flattening
+    of the arguments, which makes it suitable for the repeated launches of
+    iterative algorithms::
+
+        launch = dpex.bind_kernel(axpy, dpex.Range(n), x, y, 2.0)
+        for alpha in alphas:
+            launch.set_arg(2, alpha)
+            launch()
+
+    Args:
+        kernel_fn (SPIRVKernelDispatcher): A :func:`numba_dpex.kernel`
+            decorated function.
+        index_space (Range | NdRange): The index space of the kernel.
+        kernel_args : The arguments passed to the kernel function.
+
+    Returns:
+        BoundKernelLaunch: The launch object.
+    """
+    return BoundKernelLaunch(kernel_fn, index_space, kernel_args)
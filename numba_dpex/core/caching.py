@@ -0,0 +1,296 @@
+# SPDX-FileCopyrightText: 2024 Intel Corporation
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""On-disk caching support for functions compiled by numba-dpex.
+
+The module extends Numba's caching machinery (:mod:`numba.core.caching`) so
+that the SPIR-V binary generated for a ``numba_dpex.kernel`` decorated function
+and the host code of a ``numba_dpex.dpjit`` decorated function, including its
+offloaded parfor kernels, can be saved to and restored from the same cache
+directories that Numba uses for ``njit(cache=True)`` functions.
+"""
+
+import copy
+import hashlib
+from abc import abstractmethod
+
+from numba.core import sigutils, types, typing
+from numba.core.caching import Cache, CacheImpl, CompileResultCacheImpl
+from numba.core.compiler import Flags
+from numba.core.serialize import dumps
+
+from numba_dpex.core import config
+from numba_dpex.core.types import USMNdArray
+
+# The version of the layout of the flattened kernel arguments. Kernels cached
+# with another version expect different arguments and are not loaded.
+_KERNEL_ARGS_ABI_VERSION = 2
+
+
+def _stable_type_key(ty: types.Type):
+    """Returns a process-independent key for a Numba type.
+
+    The key of a :class:`numba_dpex.core.types.USMNdArray` type includes the
+    identity of the ``dpctl.SyclQueue`` on which the array was allocated and
+    that identity changes in every process. The compiled SPIR-V does not depend
+    on the queue and only the filter string of the queue's device is retained
+    in the returned key.
+    """
+    if isinstance(ty, USMNdArray):
+        return (
+            type(ty).__name__,
+            str(ty.dtype),
+            ty.ndim,
+            ty.layout,
+            ty.mutable,
+            ty.aligned,
+            ty.usm_type,
+            ty.addrspace,
+            ty.queue.sycl_device,
+        )
+    return str(ty)
+
+
+class _SPIRVKernelCacheImpl(CacheImpl):
+    """Implements the logic to serialize and rebuild a
+    ``_SPIRVKernelCompileResult`` of a ``numba_dpex.kernel`` function.
+
+    Only the information needed to launch a kernel and to link it with other
+    LLVM modules is stored: the final LLVM bitcode of the kernel's library, its
+    function descriptor and signature, and the SPIR-V binary.
+    """
+
+    def get_filename_base(self, fullname, abiflags):
+        # Use a distinct name so that the index of a kernel never clashes with
+        # the index of a njit function defined at the same location.
+        return super().get_filename_base(fullname, abiflags) + "-spirv"
+
+    def reduce(self, kcres):
+        """Returns a picklable tuple representing the compile result."""
+        libdata = kcres.library.serialize_using_bitcode()
+        # The typemap and calltypes are not needed after compilation and may
+        # not be picklable. The original descriptor is left untouched.
+        fndesc = copy.copy(kcres.fndesc)
+        fndesc.typemap = fndesc.calltypes = None
+        return (
+            libdata,
+            fndesc,
+            kcres.signature,
+            str(kcres.type_annotation),
+            kcres.kernel_device_ir_module,
+        )
+
+    def rebuild(self, target_context, payload):
+        """Rebuilds a ``_SPIRVKernelCompileResult`` from the payload returned
+        by :meth:`reduce`.
+        """
+        # pylint: disable=import-outside-toplevel
+        from numba_dpex.kernel_api_impl.spirv.dispatcher import (
+            _SPIRVKernelCompileResult,
+        )
+
+        libdata, fndesc, signature, typeann, kernel_module = payload
+        library = target_context.codegen().unserialize_library(libdata)
+
+        kcres_attrs = dict.fromkeys(_SPIRVKernelCompileResult._fields)
+        kcres_attrs.update(
+            typing_context=target_context.typing_context,
+            target_context=target_context,
+            entry_point=fndesc.qualname,
+            type_annotation=typeann,
+            signature=signature,
+            objectmode=False,
+            lifted=(),
+            fndesc=fndesc,
+            library=library,
+            reload_init=[],
+            referenced_envs=(),
+            kernel_device_ir_module=kernel_module,
+        )
+        return _SPIRVKernelCompileResult(**kcres_attrs)
+
+    def check_cachable(self, kcres):
+        """Only kernels that were compiled down to SPIR-V are cached."""
+        return kcres.kernel_device_ir_module is not None
+
+
+def _hash_function_code(py_func):
+    """Returns the hashes of the bytecode and the closure variables of a
+    function in the same way as Numba's ``Cache._index_key``.
+    """
+    codebytes = py_func.__code__.co_code
+    if py_func.__closure__ is not None:
+        cvars = tuple(x.cell_contents for x in py_func.__closure__)
+        cvarbytes = dumps(cvars)
+    else:
+        cvarbytes = b""
+
+    def hasher(x):
+        return hashlib.sha256(x).hexdigest()
+
+    return hasher(codebytes), hasher(cvarbytes)
+
+
+class _DpexCache(Cache):
+    """Base class for the on-disk caches of numba-dpex dispatchers.
+
+    Numba's default index key stores the signature as is. The types of
+    ``dpctl.tensor.usm_ndarray`` and ``dpnp.ndarray`` arguments include the
+    identity of a ``dpctl.SyclQueue`` that changes in every process, so the
+    index key uses a process-independent form of the signature instead. The
+    compilation options that are not part of the signature but affect the
+    generated code are added to the key by the subclasses.
+    """
+
+    @abstractmethod
+    def _compile_options_key(self):
+        """Returns a tuple of the compilation options stored in the key."""
+
+    def _index_key(self, sig, codegen):
+        """Computes the index key for the signature.
+
+        The key is made up of a process-independent form of the signature, the
+        code generator's magic tuple, the hashes of the function's bytecode and
+        closure variables, the compilation options and the version of the
+        kernel argument layout.
+        """
+        args, return_type = sig
+        stable_sig = (
+            tuple(_stable_type_key(arg) for arg in args),
+            _stable_type_key(return_type),
+        )
+        return (
+            stable_sig,
+            codegen.magic_tuple(),
+            _hash_function_code(self._py_func),
+            self._compile_options_key(),
+            _KERNEL_ARGS_ABI_VERSION,
+        )
+
+
+class SPIRVKernelCache(_DpexCache):
+    """An on-disk cache for the SPIR-V binaries of a ``numba_dpex.kernel``
+    decorated function.
+
+    Apart from the signature, the source code of the function and the code
+    generator, the index key of every cached kernel includes the compilation
+    options that affect the generated SPIR-V: the ``DPEX_OPT`` and
+    ``INLINE_THRESHOLD`` config values, the debug and fastmath flags, and the
+    arguments passed to ``llvm-spirv``. A cached entry is invalidated when the
+    source file of the function is modified.
+    """
+
+    _impl_class = _SPIRVKernelCacheImpl
+
+    def __init__(self, py_func, targetdescr, targetoptions):
+        self._targetdescr = targetdescr
+        self._targetoptions = targetoptions
+        super().__init__(py_func)
+
+    def _compile_options_key(self):
+        # pylint: disable=import-outside-toplevel
+        from numba_dpex.kernel_api_impl.spirv.spirv_generator import (
+            DEFAULT_LLVM_SPIRV_ARGS,
+        )
+
+        flags = Flags()
+        self._targetdescr.options.parse_as_flags(flags, self._targetoptions)
+
+        return (
+            config.DPEX_OPT,
+            flags.inline_threshold,  # pylint: disable=no-member
+            flags.debuginfo,
+            str(flags.fastmath),
+            DEFAULT_LLVM_SPIRV_ARGS,
+        )
+
+    def load_overload(self, sig, target_context):
+        """Loads a cached compile result for the signature.
+
+        Args:
+            sig (tuple): A pair of the argument types and the return type.
+            target_context: The SPIR-V target context used to rebuild the
+                compile result.
+
+        Returns: A ``_SPIRVKernelCompileResult`` or None on a cache miss.
+        """
+        kcres = super().load_overload(sig, target_context)
+        if kcres is None:
+            return None
+
+        # The stored signature has the types from the process that populated
+        # the cache. Replace it by the requested one so that the overload is
+        # registered under the current argument types.
+        args, _ = sig
+        return kcres._replace(signature=types.void(*args))
+
+    def _save_overload(self, sig, data):
+        # Adapted from Numba's Cache._save_overload as a
+        # _SPIRVKernelCompileResult has no codegen attribute.
+        if not self._enabled:
+            return
+        if not self._impl.check_cachable(data):
+            return
+        self._impl.locator.ensure_cache_path()
+        key = self._index_key(sig, data.target_context.codegen())
+        data = self._impl.reduce(data)
+        self._cache_file.save(key, data)
+
+
+class DpjitFunctionCache(_DpexCache):
+    """An on-disk cache for the compiled host code of a ``numba_dpex.dpjit``
+    decorated function.
+
+    The SPIR-V binaries of the parfor kernels offloaded by a dpjit function are
+    embedded as constants in the host LLVM module, so restoring the host code
+    also restores every kernel. The index key therefore includes the options
+    used to compile and build those kernels: the ``DPEX_OPT``,
+    ``INLINE_THRESHOLD``, ``BUILD_KERNEL_OPTIONS``, ``ASYNC_PARFOR_SUBMISSION``,
+    ``PARFOR_WORK_GROUP_SIZE``, ``PARFOR_REDUCTION_WORK_GROUP_SIZE`` and
+    ``PARFOR_REDUCTION_STRATEGY`` config values and the arguments passed to
+    ``llvm-spirv``.
+    """
+
+    _impl_class = CompileResultCacheImpl
+
+    def _compile_options_key(self):
+        # pylint: disable=import-outside-toplevel
+        from numba_dpex.kernel_api_impl.spirv.spirv_generator import (
+            DEFAULT_LLVM_SPIRV_ARGS,
+        )
+
+        return (
+            config.DPEX_OPT,
+            config.INLINE_THRESHOLD,
+            config.BUILD_KERNEL_OPTIONS,
+            config.ASYNC_PARFOR_SUBMISSION,
+            config.PARFOR_WORK_GROUP_SIZE,
+            config.PARFOR_REDUCTION_WORK_GROUP_SIZE,
+            config.PARFOR_REDUCTION_STRATEGY,
+            DEFAULT_LLVM_SPIRV_ARGS,
+        )
+
+    def _index_key(self, sig, codegen):
+        return super()._index_key(sigutils.normalize_signature(sig), codegen)
+
+    def load_overload(self, sig, target_context):
+        """Loads a cached compile result for the signature.
+
+        Args:
+            sig: The signature as passed to the dispatcher's ``compile``.
+            target_context: The dpjit target context used to rebuild the
+                compile result.
+
+        Returns: A ``CompileResult`` or None on a cache miss.
+        """
+        cres = super().load_overload(sig, target_context)
+        if cres is None:
+            return None
+
+        # Register the overload under the current argument types, see
+        # SPIRVKernelCache.load_overload.
+        args, _ = sigutils.normalize_signature(sig)
+        return cres._replace(
+            signature=typing.signature(cres.signature.return_type, *args)
+        )
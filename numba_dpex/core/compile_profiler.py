@@ -0,0 +1,356 @@
+# SPDX-FileCopyrightText: 2024 Intel Corporation
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""Profiles the time spent in the stages of the compilation of functions.
+
+The compiler broadcasts :mod:`numba.core.event` events for every stage of the
+compilation:
+
+- ``numba:compile`` and ``numba_dpex:compile`` for the compilation of a
+  ``dpjit`` function or a kernel for a signature,
+- ``numba:run_pass`` for every compiler pass, among them the type inference
+  and the lowering passes,
+- ``numba_dpex:parfor_kernel`` for the generation of the kernel of a parfor
+  node,
+- ``numba_dpex:llvm_optimize`` for the optimization of the final LLVM module
+  of a kernel,
+- ``numba_dpex:llvm_spirv`` for the translation of the LLVM module of a
+  kernel to SPIR-V,
+- ``numba_dpex:kernel_bundle_build`` for the build of a SYCL kernel bundle
+  from Python, e.g., by :func:`numba_dpex.bind_kernel`,
+- ``numba_dpex:first_launch`` for the first ``call_kernel`` call from CPython
+  with new argument types. The kernel bundle of a kernel launched by
+  ``call_kernel`` is built by the compiled launcher, so its build time is part
+  of this stage.
+
+A :class:`CompileProfiler` records these events while it is active. Every
+stage is attributed to the function and the signature of the innermost
+compilation that it is part of. The profile can be exported as a Chrome trace,
+viewable in ``chrome://tracing`` or Perfetto, and as a text summary of the time
+spent in every stage per function and signature.
+
+Setting the ``NUMBA_DPEX_COMPILE_PROFILE`` config flag to a path profiles the
+whole process, writes the Chrome trace to that path at exit and prints the
+summary to stderr.
+"""
+
+import atexit
+import json
+import os
+import sys
+import threading
+import time
+from collections import defaultdict
+
+from numba.core import event as ev
+
+# The event kinds and the stages that they are recorded as. The stage of a
+# numba:run_pass event depends on the pass.
+_EVENT_STAGES = {
+    "numba:compile": "compile",
+    "numba_dpex:compile": "compile",
+    "numba:run_pass": None,
+    "numba_dpex:parfor_kernel": "parfor_kernel",
+    "numba_dpex:llvm_optimize": "llvm_optimize",
+    "numba_dpex:llvm_spirv": "llvm_spirv",
+    "numba_dpex:kernel_bundle_build": "kernel_bundle_build",
+    "numba_dpex:first_launch": "first_launch",
+}
+
+_TYPING_PASSES = frozenset(
+    ["nopython_type_inference", "partial_type_inference"]
+)
+_LOWERING_PASSES = frozenset(
+    [
+        "native_lowering",
+        "native_parfor_lowering",
+        "dpjit_parfor_lowering",
+        "qual-name-disambiguation-lowering",
+    ]
+)
+
+STAGES = (
+    "compile",
+    "typing",
+    "lowering",
+    "passes",
+    "parfor_kernel",
+    "llvm_optimize",
+    "llvm_spirv",
+    "kernel_bundle_build",
+    "first_launch",
+)
+
+
+def _signature_str(args) -> str:
+    return "(" + ", ".join(str(ty) for ty in args) + ")"
+
+
+def _describe(event):
+    """Returns the stage, the name, the function and the signature of an
+    event. The function and the signature are None if the event does not
+    identify them.
+    """
+    data = event.data or {}
+    stage = _EVENT_STAGES[event.kind]
+
+    if stage == "compile":
+        function = data["dispatcher"].py_func.__qualname__
+        signature = _signature_str(data["args"])
+        return stage, f"compile {function}{signature}", function, signature
+
+    if event.kind == "numba:run_pass":
+        pass_name = data["name"].split(" [")[0]
+        if pass_name in _TYPING_PASSES:
+            stage = "typing"
+        elif pass_name in _LOWERING_PASSES:
+            stage = "lowering"
+        else:
+            stage = "passes"
+        return stage, data["name"], data["qualname"], data["args"]
+
+    return (
+        stage,
+        data.get("name", stage),
+        data.get("function"),
+        data.get("signature"),
+    )
+
+
+class _Span:
+    """The interval of an event on a thread."""
+
+    __slots__ = (
+        "kind",
+        "stage",
+        "name",
+        "function",
+        "signature",
+        "thread",
+        "start",
+        "end",
+        "nested_time",
+    )
+
+    def __init__(self, kind, stage, name, function, signature, thread, start):
+        self.kind = kind
+        self.stage = stage
+        self.name = name
+        self.function = function
+        self.signature = signature
+        self.thread = thread
+        self.start = start
+        self.end = start
+        self.nested_time = 0.0
+
+    @property
+    def duration(self) -> float:
+        return self.end - self.start
+
+    @property
+    def self_time(self) -> float:
+        """The duration of the span without the nested spans."""
+        return self.duration - self.nested_time
+
+
+class _ProfileListener(ev.Listener):
+    def __init__(self, profiler):
+        self._profiler = profiler
+
+    def on_start(self, event):
+        self._profiler._on_start(event)
+
+    def on_end(self, event):
+        self._profiler._on_end(event)
+
+
+class CompileProfiler:
+    """Records the stages of the compilations done while it is active.
+
+    Examples:
+
+    .. code-block:: python
+
+        from numba_dpex.core.compile_profiler import CompileProfiler
+
+        with CompileProfiler() as profiler:
+            dpex.call_kernel(vecadd, dpex.Range(N), a, b, c)
+
+        print(profiler.summary())
+        profiler.export_chrome_trace("compile_trace.json")
+    """
+
+    def __init__(self):
+        self._spans = []
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._listener = _ProfileListener(self)
+        self._origin = time.perf_counter()
+        self._active = False
+
+    def start(self):
+        """Starts recording the compilation events."""
+        if self._active:
+            return
+        # Drop the spans left open on any thread when the profiler was last
+        # stopped, as their end events were not received.
+        self._local = threading.local()
+        for kind in _EVENT_STAGES:
+            ev.register(kind, self._listener)
+        self._active = True
+
+    def stop(self):
+        """Stops recording the compilation events."""
+        if not self._active:
+            return
+        for kind in _EVENT_STAGES:
+            ev.unregister(kind, self._listener)
+        self._active = False
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.stop()
+
+    def _stack(self) -> list:
+        stack = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = self._local.stack = []
+        return stack
+
+    def _on_start(self, event):
+        stage, name, function, signature = _describe(event)
+        stack = self._stack()
+        # A stage is attributed to the compilation that it is part of.
+        if stack and stage != "compile":
+            function, signature = stack[-1].function, stack[-1].signature
+        stack.append(
+            _Span(
+                event.kind,
+                stage,
+                name,
+                function or name,
+                signature or "",
+                threading.get_ident(),
+                time.perf_counter(),
+            )
+        )
+
+    def _on_end(self, event):
+        stack = self._stack()
+        # The event started before the profiler was started.
+        if not stack or stack[-1].kind != event.kind:
+            return
+        span = stack.pop()
+        span.end = time.perf_counter()
+        if stack:
+            stack[-1].nested_time += span.duration
+        with self._lock:
+            self._spans.append(span)
+
+    @property
+    def spans(self) -> list:
+        """The recorded spans in the order in which they ended."""
+        with self._lock:
+            return list(self._spans)
+
+    def clear(self):
+        """Removes the recorded spans."""
+        with self._lock:
+            self._spans.clear()
+
+    def stage_times(self) -> dict:
+        """Returns the time in seconds spent in every stage per function and
+        signature.
+
+        The time of a stage excludes the time of the stages nested in it, so
+        the times of all the stages of a function and signature add up to the
+        time spent compiling it. The ``compile`` stage holds the time of a
+        compilation that is not spent in any other stage.
+
+        Returns:
+            dict: A dictionary mapping ``(function, signature)`` pairs to
+            dictionaries mapping stage names to times.
+        """
+        times = defaultdict(lambda: defaultdict(float))
+        for span in self.spans:
+            times[(span.function, span.signature)][span.stage] += span.self_time
+        return {key: dict(stages) for key, stages in times.items()}
+
+    def summary(self) -> str:
+        """Returns a text summary of the time spent in every stage per
+        function and signature, sorted by the total time.
+        """
+        times = self.stage_times()
+        totals = defaultdict(float)
+        lines = ["Compilation profile (seconds)"]
+
+        for (function, signature), stages in sorted(
+            times.items(), key=lambda item: -sum(item[1].values())
+        ):
+            lines.append("")
+            lines.append(
+                f"{function}{signature}  total {sum(stages.values()):.3f}"
+            )
+            for stage in STAGES:
+                if stage in stages:
+                    lines.append(f"    {stage:<22}{stages[stage]:10.3f}")
+                    totals[stage] += stages[stage]
+
+        lines.append("")
+        lines.append(f"All functions  total {sum(totals.values()):.3f}")
+        for stage in STAGES:
+            if stage in totals:
+                lines.append(f"    {stage:<22}{totals[stage]:10.3f}")
+        return "\n".join(lines)
+
+    def chrome_trace(self) -> dict:
+        """Returns the recorded spans in the Chrome trace event format."""
+        pid = os.getpid()
+        trace_events = [
+            {
+                "name": span.name,
+                "cat": span.stage,
+                "ph": "X",
+                "ts": (span.start - self._origin) * 1e6,
+                "dur": span.duration * 1e6,
+                "pid": pid,
+                "tid": span.thread,
+                "args": {
+                    "function": span.function,
+                    "signature": span.signature,
+                },
+            }
+            for span in sorted(self.spans, key=lambda span: span.start)
+        ]
+        return {"traceEvents": trace_events, "displayTimeUnit": "ms"}
+
+    def export_chrome_trace(self, path):
+        """Writes the recorded spans to a Chrome trace JSON file."""
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.chrome_trace(), f)
+
+
+_process_profiler = None
+
+
+def profile_process(path):
+    """Profiles all the compilations of the process and, at exit, writes the
+    Chrome trace to ``path`` and prints the summary to stderr.
+    """
+    global _process_profiler  # pylint: disable=global-statement
+
+    if _process_profiler is not None:
+        return
+    _process_profiler = CompileProfiler()
+    _process_profiler.start()
+
+    def _report():
+        _process_profiler.stop()
+        _process_profiler.export_chrome_trace(path)
+        print(_process_profiler.summary(), file=sys.stderr)
+
+    atexit.register(_report)
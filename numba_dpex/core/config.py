@@ -172,3 +172,147 @@ INLINE_THRESHOLD: Annotated[
     "default = 2",
     "ENVIRONMENT_FLAG: NUMBA_DPEX_INLINE_THRESHOLD",
 ] = _readenv("NUMBA_DPEX_INLINE_THRESHOLD", int, 2)
+
+SPIRV_TRANSLATOR: Annotated[
+    str,
+    'Selects how the llvm-spirv tool is invoked. With "pipe" the LLVM bitcode '
+    "is passed to llvm-spirv through its standard input and the SPIR-V is read "
+    'from its standard output. With "file" temporary files are used for both. '
+    'A failed "pipe" translation is always retried using temporary files.',
+    'default = "pipe"',
+    "ENVIRONMENT_FLAG: NUMBA_DPEX_SPIRV_TRANSLATOR",
+] = _readenv("NUMBA_DPEX_SPIRV_TRANSLATOR", str, "pipe")
+
+KERNEL_CACHE_CAPACITY: Annotated[
+    int,
+    "The maximum number of SYCL kernels kept in the runtime kernel cache. The "
+    "least recently used kernels are evicted once the capacity is exceeded. A "
+    "value of 0 makes the cache unbounded.",
+    "default = 1024",
+    "ENVIRONMENT_FLAG: NUMBA_DPEX_KERNEL_CACHE_CAPACITY",
+] = _readenv("NUMBA_DPEX_KERNEL_CACHE_CAPACITY", int, 1024)
+
+KERNEL_CALL_SITE_CACHE: Annotated[
+    int,
+    "When set to a non-zero value, every kernel launch in the generated host "
+    "code remembers the first entry of the runtime kernel cache that it "
+    "resolves. Later launches on the same SYCL context and device use the "
+    "kernel of the entry without looking up the cache, until a kernel is "
+    "evicted from the cache. The remembered entries do not keep the kernels "
+    "alive, so the capacity of the kernel cache and purging it still release "
+    "them.",
+    "default = 1",
+    "ENVIRONMENT_FLAG: NUMBA_DPEX_KERNEL_CALL_SITE_CACHE",
+] = _readenv("NUMBA_DPEX_KERNEL_CALL_SITE_CACHE", int, 1)
+
+USM_POOL: Annotated[
+    int,
+    "When set to a non-zero value, the USM memory of the arrays allocated "
+    "inside dpjit functions is taken from a caching pool. Memory released by "
+    "an array is kept in the pool and reused by later allocations of a "
+    "similar size, the same usm type and the same SYCL context and device "
+    "instead of being returned to the SYCL runtime.",
+    "default = 0",
+    "ENVIRONMENT_FLAG: NUMBA_DPEX_USM_POOL",
+] = _readenv("NUMBA_DPEX_USM_POOL", int, 0)
+
+USM_POOL_LIMIT: Annotated[
+    int,
+    "The maximum number of bytes of free memory kept in the USM pool. Memory "
+    "released while the pool holds more free memory is returned to the SYCL "
+    "runtime.",
+    "default = 1073741824",
+    "ENVIRONMENT_FLAG: NUMBA_DPEX_USM_POOL_LIMIT",
+] = _readenv("NUMBA_DPEX_USM_POOL_LIMIT", int, 2**30)
+
+QUEUE_AGNOSTIC_SPECIALIZATION: Annotated[
+    int,
+    "When set to a non-zero value, the Numba type of a dpctl.SyclQueue and of "
+    "arrays allocated on it depends only on the queue's device and not on the "
+    "queue object. Functions and kernels are then compiled once per device "
+    "instead of once per queue, and the queue is taken at run time from the "
+    "arguments. Arrays allocated on different queues of the same device are "
+    "no longer rejected by the compute follows data check.",
+    "default = 0",
+    "ENVIRONMENT_FLAG: NUMBA_DPEX_QUEUE_AGNOSTIC_SPECIALIZATION",
+] = _readenv("NUMBA_DPEX_QUEUE_AGNOSTIC_SPECIALIZATION", int, 0)
+
+ASYNC_PARFOR_SUBMISSION: Annotated[
+    int,
+    "When set to a non-zero value, the kernels generated for the parfor nodes "
+    "of a dpjit function are submitted without waiting for their completion. "
+    "Every kernel depends on the previously submitted one and the host waits "
+    "for the kernels only before host code that may access array data or "
+    "before returning from the function.",
+    "default = 1",
+    "ENVIRONMENT_FLAG: NUMBA_DPEX_ASYNC_PARFOR_SUBMISSION",
+] = _readenv("NUMBA_DPEX_ASYNC_PARFOR_SUBMISSION", int, 1)
+
+DEFERRED_MEMINFO_RELEASE: Annotated[
+    int,
+    "When set to a non-zero value, the arguments of an asynchronous kernel "
+    "launch are kept alive by a list of pending releases that is polled when "
+    "launching kernels and allocating arrays, instead of by a SYCL host task "
+    "submitted for every launch. The host event returned by "
+    "call_kernel_async then completes with the kernel.",
+    "default = 1",
+    "ENVIRONMENT_FLAG: NUMBA_DPEX_DEFERRED_MEMINFO_RELEASE",
+] = _readenv("NUMBA_DPEX_DEFERRED_MEMINFO_RELEASE", int, 1)
+
+PARFOR_WORK_GROUP_SIZE: Annotated[
+    int,
+    "The number of work-items per work-group of the nd-range kernels generated "
+    "for parfor nodes without reductions. A value of 0 selects 256 work-items. "
+    "The size is capped by the maximum work-group size of the device and "
+    "rounded down to a multiple of its preferred sub-group size. A negative "
+    "value submits the kernels as range kernels and leaves the choice of the "
+    "work-group size to the SYCL runtime.",
+    "default = 0",
+    "ENVIRONMENT_FLAG: NUMBA_DPEX_PARFOR_WORK_GROUP_SIZE",
+] = _readenv("NUMBA_DPEX_PARFOR_WORK_GROUP_SIZE", int, 0)
+
+PARFOR_REDUCTION_WORK_GROUP_SIZE: Annotated[
+    int,
+    "The number of work-items per work-group of the kernels generated for "
+    "parfor nodes with reductions. A value of 0 selects 256 work-items. The "
+    "size is capped by the maximum work-group size of the device and rounded "
+    "down to a power of two.",
+    "default = 0",
+    "ENVIRONMENT_FLAG: NUMBA_DPEX_PARFOR_REDUCTION_WORK_GROUP_SIZE",
+] = _readenv("NUMBA_DPEX_PARFOR_REDUCTION_WORK_GROUP_SIZE", int, 0)
+
+PARFOR_REDUCTION_STRATEGY: Annotated[
+    str,
+    "Selects how the partial results of the work-groups of a parfor reduction "
+    'are combined. With "tree" a second kernel reduces the partial results '
+    'with a single work-group. With "atomic" every work-group atomically '
+    "adds its partial result to the final result, which avoids the second "
+    "kernel but makes floating-point results depend on the order in which "
+    'the work-groups finish. "atomic" only applies to sum reductions of '
+    'types supported by atomic operations on the device, otherwise "tree" '
+    "is used.",
+    'default = "tree"',
+    "ENVIRONMENT_FLAG: NUMBA_DPEX_PARFOR_REDUCTION_STRATEGY",
+] = _readenv("NUMBA_DPEX_PARFOR_REDUCTION_STRATEGY", str, "tree")
+
+PARFOR_KERNEL_CACHE: Annotated[
+    int,
+    "Controls the reuse of the kernels generated for parfor nodes whose loop "
+    "bodies are structurally identical and whose parameters have the same "
+    "types. With 0 every parfor node is compiled to its own kernel. With 1 "
+    "the compiled kernels are reused within a process. With 2 they are also "
+    "saved to and loaded from the numba cache directory, so they are reused "
+    "across processes.",
+    "default = 1",
+    "ENVIRONMENT_FLAG: NUMBA_DPEX_PARFOR_KERNEL_CACHE",
+] = _readenv("NUMBA_DPEX_PARFOR_KERNEL_CACHE", int, 1)
+
+COMPILE_PROFILE: Annotated[
+    str,
+    "The path of a Chrome trace file. If set, the time spent in every stage "
+    "of the compilation of dpjit functions and kernels is recorded for the "
+    "whole process. At exit the trace is written to the path and a summary "
+    "of the time per function, signature and stage is printed to stderr.",
+    'default = ""',
+    "ENVIRONMENT_FLAG: NUMBA_DPEX_COMPILE_PROFILE",
+] = _readenv("NUMBA_DPEX_COMPILE_PROFILE", str, "")
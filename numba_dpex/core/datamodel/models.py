@@ -121,6 +121,30 @@ class USMArrayDeviceModel(StructModel):
         """
         return get_flattened_member_count(self)
 
+    @property
+    def has_contiguous_kernel_args(self):
+        """True if an array is passed to a kernel as only its data pointer and
+        its shape.
+
+        The nitems, itemsize and strides members of a C- or F-contiguous array
+        follow from its shape and its dtype, so they are rebuilt inside the
+        kernel wrapper instead of being passed as kernel arguments. A local
+        accessor is always passed with all its members.
+        """
+        return not isinstance(
+            self.fe_type, LocalAccessorType
+        ) and self.fe_type.layout in ("C", "F")
+
+    @property
+    def kernel_arg_count(self):
+        """
+        Return the number of kernel arguments that an instance of a
+        USMArrayDeviceModel is flattened into when passed to a kernel.
+        """
+        if self.has_contiguous_kernel_args:
+            return 1 + self.fe_type.ndim
+        return self.flattened_field_count
+
 
 class USMArrayHostModel(StructModel):
     """Data model for the USMNdArray type when used in a host-only function.
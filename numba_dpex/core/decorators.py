@@ -82,6 +82,11 @@ def kernel(function_or_signature=None, **options):
               mode. *(Default = False)*
             - **inline_threshold** (int): Specifies the level of inlining that
               the compiler should attempt. *(Default = 2)*
+            - **cache** (bool): Whether the SPIR-V binary generated for every
+              specialization of the kernel should be saved into an on-disk
+              cache and reused in subsequent processes. The cache directory is
+              selected the same way as for ``numba.njit(cache=True)``.
+              *(Default = False)*
     Returns:
         An instance of
         :class:`numba_dpex.kernel_api_impl.spirv.dispatcher.KernelDispatcher`.
@@ -165,6 +170,8 @@ def kernel(function_or_signature=None, **options):
             f"{user_compilation_mode} is going to be ignored."
         )
     options["_compilation_mode"] = CompilationMode.KERNEL
+    # The cache option is not a target option and is handled by the dispatcher
+    cache = options.pop("cache", False)
 
     # TODO: The options need to be evaluated and checked here like it is
     # done in numba.core.decorators.jit
@@ -182,6 +189,9 @@ def kernel(function_or_signature=None, **options):
             targetoptions=options,
         )
 
+        if cache:
+            disp.enable_caching()
+
         if len(sigs) > 0:
             with typeinfer.register_dispatcher(disp):
                 for sig in sigs:
@@ -9,8 +9,10 @@ from numba.core.target_extension import (
     target_registry,
 )
 
+from numba_dpex.core.caching import DpjitFunctionCache
 from numba_dpex.core.pipelines import dpjit_compiler
 from numba_dpex.core.targets.dpjit_target import DPEX_TARGET_NAME
+from numba_dpex.initialize import initialize
 
 from .descriptor import dpex_target
 
@@ -57,6 +59,9 @@ class DpjitDispatcher(dispatcher.Dispatcher):
         targetoptions={},
         pipeline_class=dpjit_compiler.DpjitCompiler,
     ):
+        # Load the registries before the target contexts are created.
+        initialize()
+
         super().__init__(
             py_func=py_func,
             locals=locals,
@@ -71,5 +76,11 @@ class DpjitDispatcher(dispatcher.Dispatcher):
             pipeline_class,
         )
 
+    def enable_caching(self):
+        """Enables the on-disk caching of the compiled host code along with
+        the SPIR-V binaries of all parfor kernels embedded in it.
+        """
+        self._cache = DpjitFunctionCache(self.py_func)
+
 
 dispatcher_registry[target_registry[DPEX_TARGET_NAME]] = DpjitDispatcher
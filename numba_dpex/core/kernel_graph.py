@@ -0,0 +1,240 @@
+# SPDX-FileCopyrightText: 2024 Intel Corporation
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""Provides a graph of kernel launches and memory copies whose dependencies
+are inferred from the arrays that they access.
+
+With :func:`numba_dpex.call_kernel_async` the caller passes the events that a
+launch depends on by hand. A :class:`KernelGraph` instead records the byte
+range of every array accessed by a node and makes a node depend on every
+earlier node whose accesses conflict with its own, i.e., that access
+overlapping memory with at least one of the two accesses being a write.
+Nodes without such a conflict are submitted without dependencies between
+them and can run concurrently.
+
+The kernel launches of a graph are :class:`BoundKernelLaunch` objects, so a
+graph can be submitted repeatedly without typing or packing the arguments
+again.
+"""
+
+import ctypes
+from typing import NamedTuple
+
+import dpctl
+
+from numba_dpex.core.bound_kernel_launch import (
+    BoundKernelLaunch,
+    _event_ref_array,
+    _usm_ndarray,
+)
+from numba_dpex.core.runtime import _dpexrt_python
+
+# The memcpy function creates Python objects, so it is called with the GIL.
+_kernel_launch_memcpy = ctypes.PYFUNCTYPE(
+    ctypes.py_object,
+    ctypes.c_void_p,
+    ctypes.c_void_p,
+    ctypes.c_void_p,
+    ctypes.c_size_t,
+    ctypes.c_void_p,
+    ctypes.c_size_t,
+)(_dpexrt_python.DPEXRT_kernel_launch_memcpy)
+
+
+class _Access(NamedTuple):
+    """The range of bytes ``[start, end)`` accessed by a node."""
+
+    start: int
+    end: int
+    write: bool
+
+    def conflicts_with(self, other: "_Access") -> bool:
+        """Returns True if the two accesses have to be ordered."""
+        return (
+            (self.write or other.write)
+            and self.start < other.end
+            and other.start < self.end
+        )
+
+
+def _array_access(val, write) -> _Access:
+    """Returns the access of the bytes spanned by the elements of an array."""
+    usm_ary = _usm_ndarray(val)
+    start = end = usm_ary._pointer
+    if usm_ary.size == 0:
+        return _Access(start, end, write)
+
+    itemsize = usm_ary.itemsize
+    for extent, stride in zip(usm_ary.shape, usm_ary.strides):
+        offset = (extent - 1) * stride * itemsize
+        if offset < 0:
+            start += offset
+        else:
+            end += offset
+
+    return _Access(start, end + itemsize, write)
+
+
+class _MemcpyNode:
+    """A copy between two contiguous USM arrays."""
+
+    def __init__(self, dst, src):
+        dst_ary = _usm_ndarray(dst)
+        src_ary = _usm_ndarray(src)
+        if dst_ary.nbytes != src_ary.nbytes:
+            raise ValueError(
+                "The source and the destination of a copy must have the same "
+                "number of bytes."
+            )
+        if not (dst_ary.flags.c_contiguous and src_ary.flags.c_contiguous):
+            raise ValueError(
+                "The source and the destination of a copy must be "
+                "C-contiguous."
+            )
+
+        self.dst = dst
+        self.src = src
+        self.queue = dst.sycl_queue
+        self._dst_ptr = dst_ary._pointer
+        self._src_ptr = src_ary._pointer
+        self._nbytes = dst_ary.nbytes
+
+    def _submit(self, dependent_events, wait):
+        dep_refs, ndeps = _event_ref_array(dependent_events)
+        event = _kernel_launch_memcpy(
+            self.queue.addressof_ref(),
+            self._dst_ptr,
+            self._src_ptr,
+            self._nbytes,
+            dep_refs,
+            ndeps,
+        )
+        if wait:
+            event.wait()
+        return event
+
+
+class KernelGraph:
+    """A directed acyclic graph of kernel launches and memory copies.
+
+    Nodes are added in program order. A node depends on the earlier nodes
+    that read memory it writes or write memory it accesses. All the array
+    arguments of a kernel are assumed to be written by the kernel, unless
+    their positions are passed as ``read_only``.
+
+    Replacing an array argument of a launch returned by :meth:`add_kernel`
+    does not update the dependencies of the graph.
+    """
+
+    def __init__(self):
+        self._nodes = []
+        self._predecessors = []
+        self._accesses = []
+        self._leaves = []
+
+    def _add_node(self, node, accesses):
+        index = len(self._nodes)
+        predecessors = sorted(
+            {
+                other_index
+                for other_index, other in self._accesses
+                for access in accesses
+                if access.conflicts_with(other)
+            }
+        )
+
+        self._nodes.append(node)
+        self._predecessors.append(predecessors)
+        self._accesses.extend((index, access) for access in accesses)
+
+        predecessor_set = set(predecessors)
+        self._leaves = [
+            leaf for leaf in self._leaves if leaf not in predecessor_set
+        ]
+        self._leaves.append(index)
+
+    def add_kernel(
+        self, kernel_fn, index_space, *kernel_args, read_only=()
+    ) -> BoundKernelLaunch:
+        """Adds a kernel launch to the graph.
+
+        Args:
+            kernel_fn: A :func:`numba_dpex.kernel` decorated function.
+            index_space (Range | NdRange): The index space of the kernel.
+            kernel_args : The arguments passed to the kernel function.
+            read_only (tuple[int], optional): The positions of the array
+                arguments that the kernel only reads.
+
+        Returns:
+            BoundKernelLaunch: The launch object of the node.
+        """
+        launch = BoundKernelLaunch(kernel_fn, index_space, kernel_args)
+        accesses = [
+            _array_access(val, i not in read_only)
+            for i, val in launch._usm_array_args()
+        ]
+        self._add_node(launch, accesses)
+        return launch
+
+    def add_memcpy(self, dst, src):
+        """Adds a copy of the data of an array into another array to the
+        graph.
+
+        The copy is submitted to the queue of the destination array.
+
+        Args:
+            dst: The C-contiguous destination array.
+            src: The C-contiguous source array of the same number of bytes.
+
+        Raises:
+            ValueError: If the arrays are not C-contiguous or have different
+                numbers of bytes.
+        """
+        node = _MemcpyNode(dst, src)
+        self._add_node(
+            node,
+            [_array_access(src, False), _array_access(dst, True)],
+        )
+
+    @property
+    def num_nodes(self) -> int:
+        """The number of nodes of the graph."""
+        return len(self._nodes)
+
+    @property
+    def predecessors(self) -> tuple:
+        """The positions of the nodes that every node depends on."""
+        return tuple(tuple(preds) for preds in self._predecessors)
+
+    def submit(self, dependent_events=()) -> dpctl.SyclEvent:
+        """Submits all the nodes of the graph without waiting for them.
+
+        Args:
+            dependent_events (list[dpctl.SyclEvent], optional): The events
+                that the nodes without predecessors depend on.
+
+        Returns:
+            dpctl.SyclEvent: An event that completes once all the nodes are
+            complete. The arrays used by the graph are kept alive until then.
+
+        Raises:
+            ValueError: If the graph has no nodes.
+        """
+        if not self._nodes:
+            raise ValueError("Cannot submit an empty kernel graph.")
+
+        dependent_events = list(dependent_events)
+        events = []
+        for node, predecessors in zip(self._nodes, self._predecessors):
+            if predecessors:
+                deps = [events[i] for i in predecessors]
+            else:
+                deps = dependent_events
+            events.append(node._submit(deps, 0))
+
+        # The host task depends on the nodes that no other node depends on,
+        # so its event completes once the whole graph is complete.
+        return self._nodes[0].queue._submit_keep_args_alive(
+            (self,), [events[i] for i in self._leaves]
+        )
@@ -6,19 +6,27 @@
 from either CPython or a numba_dpex.dpjit decorated function.
 """
 
+import contextlib
 import warnings
 from inspect import signature
 from typing import NamedTuple, Union
 
 import dpctl
+import dpnp
+import numpy as np
+from dpctl.tensor import usm_ndarray
 from llvmlite import ir as llvmir
-from numba.core import cgutils, types
+from numba.core import cgutils
+from numba.core import event as ev
+from numba.core import types
 from numba.core.cpu import CPUContext
 from numba.core.types.containers import Tuple, UniTuple
 from numba.core.types.functions import Dispatcher
+from numba.core.typing.typeof import Purpose, typeof
 from numba.extending import intrinsic
 
-from numba_dpex import dpjit
+from numba_dpex.core import config
+from numba_dpex.core.dpjit_dispatcher import DpjitDispatcher
 from numba_dpex.core.targets.dpjit_target import DPEX_TARGET_NAME
 from numba_dpex.core.types import DpctlSyclEvent, NdRangeType, RangeType
 from numba_dpex.core.types.kernel_api.index_space_ids import (
@@ -29,6 +37,7 @@ from numba_dpex.core.types.kernel_api.local_accessor import LocalAccessorType
 from numba_dpex.core.utils import call_kernel_builder as kl
 from numba_dpex.dpctl_iface import libsyclinterface_bindings as sycl
 from numba_dpex.dpctl_iface.wrappers import wrap_event_reference
+from numba_dpex.kernel_api import NdRange, Range
 from numba_dpex.kernel_api_impl.spirv.dispatcher import (
     SPIRVKernelDispatcher,
     _SPIRVKernelCompileResult,
@@ -129,8 +138,10 @@ def _submit_kernel(  # pylint: disable=too-many-arguments
 
     If sync set to False, it acquires memory infos from kernel arguments to
     prevent garbage collection on them. Then it schedules host task to release
-    that arguments and unblock garbage collection. Tuple of host task and device
-    tasks are returned.
+    that arguments and unblock garbage collection, or defers their release to
+    the runtime's list of pending releases if the
+    ``NUMBA_DPEX_DEFERRED_MEMINFO_RELEASE`` config flag is set. Tuple of host
+    task and device tasks are returned.
     """
     # signature of this intrinsic
     ty_return = types.void
@@ -251,7 +262,144 @@ def _submit_kernel(  # pylint: disable=too-many-arguments
     return sig, codegen
 
 
-@dpjit
+# The maximum number of argument fingerprints kept by a kernel launch
+# dispatcher before its fingerprint cache is cleared.
+_MAX_LAUNCH_FINGERPRINTS = 1024
+
+# The array classes whose Numba type only depends on the attributes used by
+# _arg_fingerprint. Subclasses are typed through typeof.
+_ARRAY_CLASSES = (dpnp.ndarray, usm_ndarray)
+
+
+def _arg_fingerprint(val):
+    """Returns a hashable fingerprint of an argument of a kernel launch
+    function such that arguments with equal fingerprints have the same Numba
+    type, or None if the type of the argument can only be found by typeof.
+    """
+    cls = type(val)
+    if cls in _ARRAY_CLASSES:
+        flags = val.flags
+        # The queue itself is part of the fingerprint, as equal queues have
+        # the same DpctlSyclQueue type in every specialization mode.
+        return (
+            cls,
+            val.dtype,
+            val.ndim,
+            flags.c_contiguous,
+            flags.f_contiguous,
+            val.usm_type,
+            val.sycl_queue,
+        )
+    if cls is Range:
+        return (cls, val.ndim)
+    if cls is NdRange:
+        return (cls, val.global_range.ndim)
+    if cls is int:
+        # Numba types integers that do not fit into an int64 as uint64.
+        return cls if -(2**63) <= val < 2**63 else None
+    if cls in (bool, float, complex, dpctl.SyclEvent):
+        return cls
+    if isinstance(val, (np.number, np.bool_)):
+        return cls
+    if isinstance(val, SPIRVKernelDispatcher):
+        return val
+    if cls is tuple:
+        fingerprints = tuple(_arg_fingerprint(item) for item in val)
+        if None in fingerprints:
+            return None
+        return (cls, fingerprints)
+    if cls is list and val:
+        # Numba types a list by its first item.
+        fingerprint = _arg_fingerprint(val[0])
+        return None if fingerprint is None else (cls, fingerprint)
+    return None
+
+
+def _first_launch_event(kernel_fn):
+    """Returns the context manager of the event broadcast while a kernel is
+    launched for the first time with new argument types. The launch compiles
+    the kernel and the launch function if needed and, in the launch function,
+    builds the SYCL kernel bundle.
+    """
+    if not isinstance(kernel_fn, SPIRVKernelDispatcher):
+        return contextlib.nullcontext()
+
+    function = kernel_fn.py_func.__qualname__
+    return ev.trigger_event(
+        "numba_dpex:first_launch",
+        data={"name": f"first launch {function}", "function": function},
+    )
+
+
+class _KernelLaunchDispatcher(DpjitDispatcher):
+    """A dpjit dispatcher for the kernel launch functions with a fast path for
+    calls from CPython.
+
+    A call to a regular dispatcher resolves the Numba type of every argument,
+    which for an array includes creating the type of its queue. The launch
+    dispatcher instead maps a cheap fingerprint of the arguments to the entry
+    point of the compiled overload and calls the entry point directly. The
+    compiled wrapper then only unboxes the arguments. Calls with arguments
+    that cannot be fingerprinted and the first call for a fingerprint go
+    through the regular dispatch.
+
+    Calls from dpjit functions are not affected.
+    """
+
+    def __init__(self, py_func, locals=None, targetoptions=None):
+        super().__init__(
+            py_func,
+            locals=locals or {},
+            targetoptions=targetoptions or {"nopython": True, "parallel": True},
+        )
+        self._num_fixed_args = len(self._compiler.pysig.parameters) - 1
+        self._launch_entry_points = {}
+
+    def _fold_args(self, args):
+        """Packs the trailing positional arguments into a tuple, as done by
+        the regular dispatch for a function with a variable number of
+        arguments."""
+        num_fixed_args = self._num_fixed_args
+        return args[:num_fixed_args] + (args[num_fixed_args:],)
+
+    def __call__(self, *args, **kws):
+        if kws or len(args) < self._num_fixed_args:
+            return super().__call__(*args, **kws)
+
+        folded_args = self._fold_args(args)
+        fingerprint = (
+            config.QUEUE_AGNOSTIC_SPECIALIZATION,
+            _arg_fingerprint(folded_args),
+        )
+        if fingerprint[1] is not None:
+            entry_point = self._launch_entry_points.get(fingerprint)
+            if entry_point is not None:
+                return entry_point(*folded_args)
+
+        # The launch function is compiled with the global compiler lock held,
+        # so the background compilations of the kernel are waited for first.
+        if isinstance(args[0], SPIRVKernelDispatcher):
+            args[0].wait_for_background_compilation()
+
+        if fingerprint[1] is None:
+            return super().__call__(*args)
+
+        with _first_launch_event(args[0]):
+            result = super().__call__(*args)
+
+        # The call compiled the overload for the exact argument types if it
+        # did not exist yet.
+        argtys = tuple(typeof(arg, Purpose.argument) for arg in folded_args)
+        cres = self.overloads.get(argtys)
+        if cres is not None:
+            if len(self._launch_entry_points) >= _MAX_LAUNCH_FINGERPRINTS:
+                self._launch_entry_points.clear()
+            self._launch_entry_points[fingerprint] = cres.entry_point
+
+        return result
+
+
+@_KernelLaunchDispatcher
 def call_kernel(kernel_fn, index_space, *kernel_args) -> None:
     """Compiles and synchronously executes a kernel function.
 
@@ -274,7 +422,7 @@ def call_kernel(kernel_fn, index_space, *kernel_args) -> None:
     )
 
 
-@dpjit
+@_KernelLaunchDispatcher
 def call_kernel_async(
     kernel_fn,
     index_space,
@@ -306,7 +454,11 @@ def call_kernel_async(
         associated with the kernel execution indicates the execution status of
         the submitted kernel function. The host task manages the lifetime of any
         PyObject passed in as a kernel argument and automatically decrements the
-        reference count of the object on kernel execution completion.
+        reference count of the object on kernel execution completion. When the
+        ``NUMBA_DPEX_DEFERRED_MEMINFO_RELEASE`` config flag is set, no host
+        task is submitted: the first event completes with the kernel and the
+        arguments are released by the runtime at a later safe point (refer
+        :mod:`numba_dpex.core.runtime.deferred_release`).
     """
     return _submit_kernel_async(  # pylint: disable=E1120
         kernel_fn,
@@ -23,14 +23,19 @@ from numba_dpex.core.decorators import kernel
 from numba_dpex.core.parfors.parfor_sentinel_replace_pass import (
     ParforBodyArguments,
 )
-from numba_dpex.core.types.kernel_api.index_space_ids import ItemType
+from numba_dpex.core.types.kernel_api.index_space_ids import (
+    ItemType,
+    NdItemType,
+)
 from numba_dpex.core.utils.call_kernel_builder import SPIRVKernelModule
 from numba_dpex.kernel_api_impl.spirv.dispatcher import (
     SPIRVKernelDispatcher,
     _SPIRVKernelCompileResult,
 )
 
+from .kernel_templates.nd_range_kernel_template import NdRangeKernelTemplate
 from .kernel_templates.range_kernel_template import RangeKernelTemplate
+from .parfor_kernel_cache import parfor_kernel_cache, parfor_kernel_key
 
 
 class ParforKernel:
@@ -42,6 +47,7 @@ class ParforKernel:
         local_accessors=None,
         work_group_size=None,
         kernel_module=None,
+        work_group_range=None,
     ):
         self.signature = signature
         self.kernel_args = kernel_args
@@ -49,6 +55,9 @@ class ParforKernel:
         self.local_accessors = local_accessors
         self.work_group_size = work_group_size
         self.kernel_module = kernel_module
+        # The work-group range of a kernel submitted as an nd-range kernel
+        # whose trailing arguments are the extents of the iteration space.
+        self.work_group_range = work_group_range
 
 
 def _legalize_names_with_typemap(names, typemap):
@@ -134,10 +143,16 @@ def create_kernel_for_parfor(
     loop_ranges,
     races,
     parfor_outputs,
+    work_group_range=None,
 ) -> ParforKernel:
     """
     Creates a numba_dpex.kernel function for a parfor node.
 
+    If a ``work_group_range`` is provided, the kernel is generated to be
+    submitted as an nd-range kernel with that work-group range. The extents
+    of the iteration space are then expected as additional trailing kernel
+    arguments of type intp.
+
     There are two parts to this function:
 
         1) Code to iterate across the iteration space as defined by
@@ -222,47 +237,50 @@ def create_kernel_for_parfor(
     # Change parfor body to replace illegal loop index vars with legal ones.
     replace_var_names(loop_body, ind_dict)
 
-    loop_body_var_table = get_name_var_table(loop_body)
-    sentinel_name = get_unused_var_name("__sentinel__", loop_body_var_table)
-
     if config.DEBUG_ARRAY_OPT >= 1:
         print("legal parfor_params = ", parfor_params, type(parfor_params))
 
     # Determine the unique names of the kernel functions.
     kernel_name = "__dpex_parfor_kernel_%s" % (parfor_node.id)
 
-    kernel_template = RangeKernelTemplate(
-        kernel_name=kernel_name,
-        kernel_params=parfor_params,
-        kernel_rank=parfor_dim,
-        ivar_names=legal_loop_indices,
-        sentinel_name=sentinel_name,
-        loop_ranges=loop_ranges,
-        param_dict=param_dict,
-    )
-
-    kernel_dispatcher: SPIRVKernelDispatcher = kernel(
-        kernel_template.py_func,
-        _parfor_body_args=ParforBodyArguments(
-            loop_body=loop_body,
-            param_dict=param_dict,
-            legal_loop_indices=legal_loop_indices,
-        ),
-    )
-
     # The first argument to a range kernel is a kernel_api.NdItem object. The
     # ``NdItem`` object is used by the kernel_api.spirv backend to generate the
     # correct SPIR-V indexing instructions. Since, the argument is not something
     # available originally in the kernel_param_types, we add it at this point to
     # make sure the kernel signature matches the actual generated code.
-    ty_item = ItemType(parfor_dim)
+    if work_group_range is None:
+        ty_item = ItemType(parfor_dim)
+    else:
+        ty_item = NdItemType(parfor_dim)
+        param_types = param_types + [types.intp] * parfor_dim
+        func_arg_types = func_arg_types + [types.intp] * parfor_dim
     kernel_param_types = (ty_item, *param_types)
     kernel_sig = signature(types.none, *kernel_param_types)
 
-    kcres: _SPIRVKernelCompileResult = kernel_dispatcher.get_compile_result(
-        types.void(*kernel_param_types)  # kernel signature
+    # Parfor nodes with structurally identical loop bodies and parameter
+    # types share a single kernel.
+    cache_key = parfor_kernel_key(
+        loop_body,
+        typemap,
+        lowerer.fndesc.calltypes,
+        parfor_params,
+        legal_loop_indices,
+        kernel_param_types,
+        nd_range=work_group_range is not None,
     )
-    kernel_module: SPIRVKernelModule = kcres.kernel_device_ir_module
+    kernel_module = parfor_kernel_cache.get(cache_key)
+    if kernel_module is None:
+        kernel_module = _compile_kernel_for_parfor(
+            kernel_name,
+            parfor_params,
+            kernel_param_types,
+            legal_loop_indices,
+            loop_body,
+            loop_ranges,
+            param_dict,
+            work_group_range,
+        )
+        parfor_kernel_cache.put(cache_key, kernel_module)
 
     if config.DEBUG_ARRAY_OPT:
         print("kernel_sig = ", kernel_sig)
@@ -272,7 +290,70 @@ def create_kernel_for_parfor(
         kernel_args=parfor_args,
         kernel_arg_types=func_arg_types,
         kernel_module=kernel_module,
+        work_group_range=work_group_range,
+    )
+
+
+def _compile_kernel_for_parfor(
+    kernel_name,
+    parfor_params,
+    kernel_param_types,
+    legal_loop_indices,
+    loop_body,
+    loop_ranges,
+    param_dict,
+    work_group_range,
+) -> SPIRVKernelModule:
+    """Generates the kernel function of a parfor node from a kernel template
+    and compiles it to SPIR-V.
+    """
+    parfor_dim = len(legal_loop_indices)
+    loop_body_var_table = get_name_var_table(loop_body)
+    sentinel_name = get_unused_var_name("__sentinel__", loop_body_var_table)
+
+    if work_group_range is None:
+        kernel_template = RangeKernelTemplate(
+            kernel_name=kernel_name,
+            kernel_params=parfor_params,
+            kernel_rank=parfor_dim,
+            ivar_names=legal_loop_indices,
+            sentinel_name=sentinel_name,
+            loop_ranges=loop_ranges,
+            param_dict=param_dict,
+        )
+    else:
+        extent_names = []
+        for _ in range(parfor_dim):
+            extent_name = get_unused_var_name(
+                "__dpex_extent", loop_body_var_table
+            )
+            loop_body_var_table[extent_name] = None
+            extent_names.append(extent_name)
+
+        kernel_template = NdRangeKernelTemplate(
+            kernel_name=kernel_name,
+            kernel_params=parfor_params,
+            kernel_rank=parfor_dim,
+            ivar_names=legal_loop_indices,
+            sentinel_name=sentinel_name,
+            loop_ranges=loop_ranges,
+            param_dict=param_dict,
+            extent_names=extent_names,
+        )
+
+    kernel_dispatcher: SPIRVKernelDispatcher = kernel(
+        kernel_template.py_func,
+        _parfor_body_args=ParforBodyArguments(
+            loop_body=loop_body,
+            param_dict=param_dict,
+            legal_loop_indices=legal_loop_indices,
+        ),
+    )
+
+    kcres: _SPIRVKernelCompileResult = kernel_dispatcher.get_compile_result(
+        types.void(*kernel_param_types)  # kernel signature
     )
+    return kcres.kernel_device_ir_module
 
 
 def update_sentinel(kernel_ir, sentinel_name, kernel_body, new_label):
@@ -0,0 +1,95 @@
+# SPDX-FileCopyrightText: 2024 Intel Corporation
+#
+# SPDX-License-Identifier: Apache-2.0
+
+from .range_kernel_template import RangeKernelTemplate
+
+
+class NdRangeKernelTemplate(RangeKernelTemplate):
+    """A template class to generate a numba_dpex.kernel decorated function
+    representing a basic range kernel that is submitted as an nd-range kernel.
+
+    The global range of the nd-range is the iteration space of the parfor
+    rounded up to a multiple of the work-group size. The extents of the
+    iteration space are passed as additional trailing kernel arguments and
+    the work-items outside of the iteration space skip the parfor body.
+    """
+
+    def __init__(
+        self,
+        kernel_name,
+        kernel_params,
+        kernel_rank,
+        ivar_names,
+        sentinel_name,
+        loop_ranges,
+        param_dict,
+        extent_names,
+    ) -> None:
+        """Creates a new NdRangeKernelTemplate instance and stores the stub
+        string and the Numba typed IR for the kernel function.
+
+        Args:
+            kernel_name (str): The name of the kernel function
+            kernel_params (list): A list of names of the kernel arguments
+            kernel_rank (int): The dimensionality of the range.
+            ivar_names (list): A list of the index variables generated by Numba
+            for every kernel range dimension.
+            sentinel_name (str): A textual marker inserted into the kernel
+            function to help Numba identify where to transform the stub
+            kernel's IR.
+            loop_ranges (list): The start, stop and step information of each
+            range dimension.
+            param_dict (dict): Dictionary to lookup variable names for loop
+            range attributes.
+            extent_names (list): The names of the kernel arguments storing the
+            extent of every dimension of the iteration space.
+        """
+        self._extent_names = extent_names
+        super().__init__(
+            kernel_name=kernel_name,
+            kernel_params=kernel_params,
+            kernel_rank=kernel_rank,
+            ivar_names=ivar_names,
+            sentinel_name=sentinel_name,
+            loop_ranges=loop_ranges,
+            param_dict=param_dict,
+        )
+
+    def _generate_kernel_stub_as_string(self):
+        """Generates a stub dpex kernel for the parfor as a string.
+
+        Returns:
+            str: A string representing a stub kernel function for the parfor.
+        """
+        kernel_txt = ""
+
+        # Create the dpex kernel function.
+        kernel_txt += "def " + self._kernel_name
+        kernel_txt += (
+            "(nd_item, "
+            + (", ".join(self._kernel_params + self._extent_names))
+            + "):\n"
+        )
+
+        for dim in range(self._kernel_rank):
+            kernel_txt += (
+                f"    {self._ivar_names[dim]} = nd_item.get_global_id({dim})\n"
+            )
+
+        # Skip the work-items added to round up the global range.
+        in_range_conds = [
+            f"{self._ivar_names[dim]} < {self._extent_names[dim]}"
+            for dim in range(self._kernel_rank)
+        ]
+        kernel_txt += "    if " + " and ".join(in_range_conds) + ":\n"
+
+        # Add the sentinel assignment so that we can find the loop body position
+        # in the IR.
+        kernel_txt += "        "
+        kernel_txt += self._sentinel_name + " = 0\n"
+
+        # A kernel function does not return anything
+        kernel_txt += "    return None\n"
+
+        return kernel_txt
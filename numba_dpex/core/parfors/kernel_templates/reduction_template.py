@@ -12,6 +12,43 @@ import numba_dpex.kernel_api as kapi
 from .kernel_template_iface import KernelTemplateInterface
 
 
+def _redop_symbol(redop):
+    """Returns the in-place operator of a reduction operation."""
+    if redop == operator.iadd:
+        return "+="
+    if redop == operator.imul:
+        return "*="
+    raise NotImplementedError
+
+
+def _local_tree_reduction_txt(local_sums, redops):
+    """Returns the kernel code reducing the values stored by the work-items of
+    a work-group into local memory.
+
+    The work-group size has to be a power of two. After the reduction, the
+    first element of every local memory array holds the result of the
+    work-group.
+
+    Args:
+        local_sums (list): The names of the local accessors, one for every
+            reduction variable.
+        redops (list): The reduction operation of every reduction variable.
+    """
+    txt = (
+        "    stride = local_size // 2\n"
+        + "    while stride > 0:\n"
+        + "        kapi.group_barrier(group)\n"
+        + "        if local_id < stride:\n"
+    )
+    for local_sum, redop in zip(local_sums, redops):
+        txt += (
+            f"            {local_sum}[local_id] {_redop_symbol(redop)} "
+            f"{local_sum}[local_id + stride]\n"
+        )
+    txt += "        stride >>= 1\n"
+    return txt
+
+
 class TreeReduceIntermediateKernelTemplate(KernelTemplateInterface):
     """The class to build reduction main kernel_txt template and
     compiled Numba functionIR."""
@@ -31,6 +68,8 @@ class TreeReduceIntermediateKernelTemplate(KernelTemplateInterface):
         redvars_dict,
         local_accessors_dict,
         typemap,
+        extent_names,
+        use_atomic=False,
     ) -> None:
         self._kernel_name = kernel_name
         self._kernel_params = kernel_params
@@ -45,50 +84,40 @@ class TreeReduceIntermediateKernelTemplate(KernelTemplateInterface):
         self._redvars_dict = redvars_dict
         self._local_accessors_dict = local_accessors_dict
         self._typemap = typemap
+        self._extent_names = extent_names
+        self._use_atomic = use_atomic
 
         self._kernel_txt = self._generate_kernel_stub_as_string()
         self._py_func = self._generate_kernel_ir()
 
     def _generate_kernel_stub_as_string(self):
-        """Generate reduction main kernel template"""
+        """Generate reduction main kernel template.
+
+        The kernel is submitted over the iteration space rounded up to a
+        multiple of the work-group range. The work-items beyond the iteration
+        space only contribute the initial value of the reduction variables.
+        Every work-group reduces the values of its work-items in local memory
+        over their linear ids and either stores the result into the partial
+        sums array at its linear group id or, if ``use_atomic`` is set,
+        atomically adds it to the final sum.
+        """
 
         gufunc_txt = ""
         gufunc_txt += "def " + self._kernel_name
         gufunc_txt += "(nd_item, " + (", ".join(self._kernel_params)) + "):\n"
-        global_id_dim = 0
-        for_loop_dim = self._parfor_dim
 
         if self._parfor_dim > 3:
             raise NotImplementedError
-        else:
-            global_id_dim = self._parfor_dim
 
         gufunc_txt += "    group = nd_item.get_group()\n"
-        for dim in range(global_id_dim):
-            dstr = str(dim)
-            gufunc_txt += (
-                f"    {self._ivar_names[dim]} = nd_item.get_global_id({dstr})\n"
-            )
-            gufunc_txt += f"    local_id{dim} = nd_item.get_local_id({dstr})\n"
+        for dim in range(self._parfor_dim):
             gufunc_txt += (
-                f"    local_size{dim} = group.get_local_range({dstr})\n"
+                f"    {self._ivar_names[dim]} = nd_item.get_global_id({dim})\n"
             )
-            gufunc_txt += f"    group_id{dim} = group.get_group_id({dstr})\n"
-
-        for dim in range(global_id_dim, for_loop_dim):
-            for indent in range(1 + (dim - global_id_dim)):
-                gufunc_txt += "    "
+        gufunc_txt += "    local_id = nd_item.get_local_linear_id()\n"
+        gufunc_txt += "    local_size = nd_item.get_local_linear_range()\n"
+        gufunc_txt += "    group_id = group.get_group_linear_id()\n"
 
-            start, stop, step = self._loop_ranges[dim]
-            st = str(self._param_dict.get(str(start), start))
-            en = str(self._param_dict.get(str(stop), stop))
-            gufunc_txt += (
-                f"for {self._ivar_names[dim]} in range({st}, {en} + 1):\n"
-            )
-
-        for dim in range(global_id_dim, for_loop_dim):
-            for indent in range(1 + (dim - global_id_dim)):
-                gufunc_txt += "    "
         # Add the sentinel assignment so that we can find the loop body position
         # in the IR.
         for redvar in self._redvars:
@@ -97,54 +126,45 @@ class TreeReduceIntermediateKernelTemplate(KernelTemplateInterface):
             gufunc_txt += legal_redvar + " = "
             gufunc_txt += f"{self._parfor_reddict[redvar].init_val} \n"
 
-        gufunc_txt += "    "
-        gufunc_txt += self._sentinel_name + " = 0\n"
+        # Skip the work-items added to round up the global range.
+        in_range_conds = [
+            f"{self._ivar_names[dim]} < {self._extent_names[dim]}"
+            for dim in range(self._parfor_dim)
+        ]
+        gufunc_txt += "    if " + " and ".join(in_range_conds) + ":\n"
+        gufunc_txt += "        " + self._sentinel_name + " = 0\n"
 
-        # Generate local_sum[local_id0] = redvar, for each reduction variable
+        # Generate local_sum[local_id] = redvar, for each reduction variable
         for redvar in self._redvars:
             legal_redvar = self._redvars_dict[redvar]
             gufunc_txt += (
                 "    "
-                + f"local_sums_{legal_redvar}[local_id0] = {legal_redvar}\n"
+                + f"local_sums_{legal_redvar}[local_id] = {legal_redvar}\n"
             )
 
-        gufunc_txt += (
-            "    stride0 = local_size0 // 2\n"
-            + "    while stride0 > 0:\n"
-            + "        kapi.group_barrier(group)\n"
-            + "        if local_id0 < stride0:\n"
+        gufunc_txt += _local_tree_reduction_txt(
+            [f"local_sums_{self._redvars_dict[rv]}" for rv in self._redvars],
+            [self._parfor_reddict[rv].redop for rv in self._redvars],
         )
 
-        for redvar in self._redvars:
-            redop = self._parfor_reddict[redvar].redop
-            redvar_legal = self._redvars_dict[redvar]
-            if redop == operator.iadd:
-                gufunc_txt += (
-                    "            "
-                    f"local_sums_{redvar_legal}[local_id0] "
-                    f"+= local_sums_{redvar_legal}[local_id0 + stride0]\n"
-                )
-            elif redop == operator.imul:
-                gufunc_txt += (
-                    "            "
-                    f"local_sums_{redvar_legal}[local_id0] "
-                    f"*= local_sums_{redvar_legal}[local_id0 + stride0]\n"
-                )
-            else:
-                raise NotImplementedError
-
-        gufunc_txt += "        stride0 >>= 1\n"
-        gufunc_txt += "    if local_id0 == 0:\n"
+        gufunc_txt += "    if local_id == 0:\n"
         for redvar in self._redvars:
             for i, arg in enumerate(self._parfor_args):
                 if arg == redvar:
                     partial_sum_var = self._kernel_params[i]
                     redvar_legal = self._redvars_dict[redvar]
-                    gufunc_txt += (
-                        "        "
-                        f"{partial_sum_var}[group_id0] = "
-                        f"local_sums_{redvar_legal}[0]\n"
-                    )
+                    if self._use_atomic:
+                        gufunc_txt += (
+                            "        "
+                            f"kapi.AtomicRef({partial_sum_var}, 0).fetch_add("
+                            f"local_sums_{redvar_legal}[0])\n"
+                        )
+                    else:
+                        gufunc_txt += (
+                            "        "
+                            f"{partial_sum_var}[group_id] = "
+                            f"local_sums_{redvar_legal}[0]\n"
+                        )
 
         gufunc_txt += "    return None\n"
 
@@ -187,116 +207,91 @@ class TreeReduceIntermediateKernelTemplate(KernelTemplateInterface):
         sys.stdout.flush()
 
 
-class RemainderReduceIntermediateKernelTemplate(KernelTemplateInterface):
-    """The class to build reduction remainder kernel_txt template and
-    compiled Numba functionIR.
+class TreeReduceFinalKernelTemplate(KernelTemplateInterface):
+    """The class to build the kernel_txt template and compiled Numba
+    functionIR of the kernel combining the partial results of the work-groups
+    of a reduction main kernel.
+
+    The kernel is submitted as a single work-group. Every work-item combines a
+    strided subset of the partial results, after which the work-group reduces
+    the values of its work-items in local memory and stores the result into
+    the final sum.
     """
 
     def __init__(
         self,
         kernel_name,
-        kernel_params,
-        sentinel_name,
         redvars,
         parfor_reddict,
-        redvars_dict,
-        typemap,
-        legal_loop_indices,
-        global_size_var_name,
-        global_size_mod_var_name,
-        partial_sum_size_var_name,
         partial_sum_var_name,
         final_sum_var_name,
-        reductionKernelVar,
+        local_sums_var_name,
+        partial_sum_size_var_name,
     ) -> None:
         self._kernel_name = kernel_name
-        self._kernel_params = kernel_params
-        self._sentinel_name = sentinel_name
         self._redvars = redvars
         self._parfor_reddict = parfor_reddict
-        self._redvars_dict = redvars_dict
-        self._typemap = typemap
-        self._legal_loop_indices = legal_loop_indices
-        self._global_size_var_name = global_size_var_name
-        self._global_size_mod_var_name = global_size_mod_var_name
-        self._partial_sum_size_var_name = partial_sum_size_var_name
         self._partial_sum_var_name = partial_sum_var_name
         self._final_sum_var_name = final_sum_var_name
-        self._reductionKernelVar = reductionKernelVar
+        self._local_sums_var_name = local_sums_var_name
+        self._partial_sum_size_var_name = partial_sum_size_var_name
 
         self._kernel_txt = self._generate_kernel_stub_as_string()
         self._py_func = self._generate_kernel_ir()
 
     def _generate_kernel_stub_as_string(self):
-        """Generate reduction remainder kernel template"""
+        """Generate reduction final kernel template"""
+
+        params = []
+        for i in range(len(self._redvars)):
+            params.append(self._partial_sum_var_name[i])
+            params.append(self._final_sum_var_name[i])
+            params.append(self._local_sums_var_name[i])
+        params.append(self._partial_sum_size_var_name)
 
         gufunc_txt = ""
         gufunc_txt += "def " + self._kernel_name
-        gufunc_txt += "(" + (", ".join(self._kernel_params))
+        gufunc_txt += "(nd_item, " + (", ".join(params)) + "):\n"
+        gufunc_txt += "    group = nd_item.get_group()\n"
+        gufunc_txt += "    local_id = nd_item.get_local_id(0)\n"
+        gufunc_txt += "    local_size = group.get_local_range(0)\n"
 
+        # The final sums are initialized with the initial value of the
+        # reduction. All the work-items read it before the first barrier and
+        # it is only written after the last one.
         for i in range(len(self._redvars)):
-            gufunc_txt += (
-                ", "
-                + f"{self._global_size_var_name[i]}, "
-                + f"{self._global_size_mod_var_name[i]}, "
-            )
-            gufunc_txt += (
-                f"{self._partial_sum_size_var_name[i]}, "
-                + f"{self._final_sum_var_name[i]}"
-            )
-
-        gufunc_txt += "):\n"
-
-        gufunc_txt += "    "
+            gufunc_txt += f"    acc{i} = {self._final_sum_var_name[i]}[0]\n"
 
         gufunc_txt += (
-            "for j" + f" in range({self._partial_sum_size_var_name[0]}):\n"
+            "    j = local_id\n"
+            + f"    while j < {self._partial_sum_size_var_name}:\n"
         )
-
         for i, redvar in enumerate(self._redvars):
             redop = self._parfor_reddict[redvar].redop
-            if redop == operator.iadd:
-                gufunc_txt += f"        {self._final_sum_var_name[i]}[0] += \
-                    {self._partial_sum_var_name[i]}[j]\n"
-            elif redop == operator.imul:
-                gufunc_txt += f"        {self._final_sum_var_name[i]}[0] *= \
-                    {self._partial_sum_var_name[i]}[j]\n"
-            else:
-                raise NotImplementedError
-
-        gufunc_txt += (
-            f"    for j in range ({self._global_size_mod_var_name[0]}) :\n"
-        )
+            gufunc_txt += (
+                f"        acc{i} {_redop_symbol(redop)} "
+                f"{self._partial_sum_var_name[i]}[j]\n"
+            )
+        gufunc_txt += "        j += local_size\n"
 
-        for redvar in self._redvars:
-            rtyp = str(self._typemap[redvar])
-            legal_redvar = self._redvars_dict[redvar]
-            gufunc_txt += "        "
-            gufunc_txt += legal_redvar + " = "
+        for i in range(len(self._redvars)):
             gufunc_txt += (
-                f"dpnp.{rtyp}({self._parfor_reddict[redvar].init_val})\n"
+                f"    {self._local_sums_var_name[i]}[local_id] = acc{i}\n"
             )
 
-        gufunc_txt += (
-            "        "
-            + self._legal_loop_indices[0]
-            + " = "
-            + f"{self._global_size_var_name[0]} + j\n"
+        gufunc_txt += _local_tree_reduction_txt(
+            self._local_sums_var_name,
+            [self._parfor_reddict[rv].redop for rv in self._redvars],
         )
 
-        gufunc_txt += "        " + self._sentinel_name + " = 0\n"
+        gufunc_txt += "    if local_id == 0:\n"
+        for i in range(len(self._redvars)):
+            gufunc_txt += (
+                f"        {self._final_sum_var_name[i]}[0] = "
+                f"{self._local_sums_var_name[i]}[0]\n"
+            )
 
-        for i, redvar in enumerate(self._redvars):
-            legal_redvar = self._redvars_dict[redvar]
-            redop = self._parfor_reddict[redvar].redop
-            if redop == operator.iadd:
-                gufunc_txt += f"        {self._final_sum_var_name[i]}[0] +=  \
-                    {legal_redvar}\n"
-            elif redop == operator.imul:
-                gufunc_txt += f"        {self._final_sum_var_name[i]}[0] *=  \
-                    {legal_redvar}\n"
-            else:
-                raise NotImplementedError
+        gufunc_txt += "    return None\n"
 
         return gufunc_txt
 
@@ -316,7 +311,7 @@ class RemainderReduceIntermediateKernelTemplate(KernelTemplateInterface):
     @property
     def py_func(self):
         """Returns the python function generated for a
-            TreeReduceIntermediateKernelTemplate.
+            TreeReduceFinalKernelTemplate.
         Returns: The python function object for the compiled kernel_txt string.
         """
         return self._py_func
@@ -324,7 +319,7 @@ class RemainderReduceIntermediateKernelTemplate(KernelTemplateInterface):
     @property
     def kernel_string(self):
         """Returns the function string generated for a
-            RemainderReduceIntermediateKernelTemplate.
+            TreeReduceFinalKernelTemplate.
 
         Returns:
             str: A string representing a stub reduction kernel function
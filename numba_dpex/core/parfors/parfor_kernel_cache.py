@@ -0,0 +1,352 @@
+# SPDX-FileCopyrightText: 2024 Intel Corporation
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""A cache of the SPIR-V kernels generated for parfor nodes.
+
+Every parfor node offloaded by a dpjit function is compiled to a kernel of its
+own, even when its loop body is identical to the body of a parfor node that
+was already compiled, e.g., the same elementwise expression used in several
+functions. The cache maps a canonical form of the legalized loop body, the
+types of the kernel parameters and the rank of the iteration space to the
+compiled :class:`SPIRVKernelModule`, so that such parfor nodes share a single
+kernel.
+
+The canonical form numbers the variables in the order in which they first
+appear and the basic blocks in the order of their labels, so it does not
+depend on the names that Numba gave to the variables of a particular
+function. The globals used by the loop body are identified by their module and
+name, and Python functions also by the hash of their bytecode. A loop body that
+uses a value without a process-independent identity is not cached.
+
+The ``NUMBA_DPEX_PARFOR_KERNEL_CACHE`` config flag selects whether the kernels
+are only reused within a process or also saved to the numba cache directory.
+"""
+
+import hashlib
+import os
+import pickle
+import tempfile
+import threading
+import types as pytypes
+from enum import Enum
+
+import numpy as np
+from numba.core import config as numba_config
+from numba.core import ir, types
+from numba.misc.appdirs import AppDirs
+from numba.parfors import parfor
+
+from numba_dpex.core import config
+from numba_dpex.core.caching import (
+    _KERNEL_ARGS_ABI_VERSION,
+    _hash_function_code,
+    _stable_type_key,
+)
+from numba_dpex.core.utils.call_kernel_builder import SPIRVKernelModule
+
+_CACHE_SUBDIR = "numba_dpex_parfor_kernels"
+
+
+class _NotCachableError(Exception):
+    """Raised when a loop body uses a value that cannot be part of a key."""
+
+
+def _function_key(py_func):
+    """Returns a key for a Python function that changes with its code."""
+    return (
+        py_func.__module__,
+        py_func.__qualname__,
+        _hash_function_code(py_func),
+    )
+
+
+def _value_key(val):
+    """Returns a process-independent key for a value used by a loop body."""
+    if val is None or isinstance(val, (bool, int, float, complex, str, bytes)):
+        return (type(val).__name__, repr(val))
+    if isinstance(val, tuple):
+        return ("tuple", tuple(_value_key(item) for item in val))
+    if isinstance(val, slice):
+        return ("slice", _value_key((val.start, val.stop, val.step)))
+    if isinstance(val, (np.generic, np.dtype)):
+        return (type(val).__name__, repr(val))
+    if isinstance(val, np.ndarray):
+        return (
+            "ndarray",
+            str(val.dtype),
+            val.shape,
+            hashlib.sha256(np.ascontiguousarray(val).tobytes()).hexdigest(),
+        )
+    if isinstance(val, Enum):
+        return (type(val).__module__, type(val).__qualname__, val.name)
+    if isinstance(val, types.Type):
+        return ("type", _type_key(val))
+    if isinstance(val, pytypes.ModuleType):
+        return ("module", val.__name__)
+    if isinstance(val, np.ufunc):
+        return ("ufunc", val.__name__)
+    if isinstance(val, pytypes.FunctionType):
+        return ("function", _function_key(val))
+    py_func = getattr(val, "py_func", None)
+    if isinstance(py_func, pytypes.FunctionType):
+        # A Numba dispatcher
+        return ("dispatcher", type(val).__name__, _function_key(py_func))
+
+    module = getattr(val, "__module__", None)
+    qualname = getattr(val, "__qualname__", None)
+    if module is None or qualname is None or "<locals>" in qualname:
+        raise _NotCachableError(val)
+    return ("global", module, qualname)
+
+
+def _type_key(ty):
+    """Returns a process-independent key for a Numba type."""
+    if ty is None:
+        return None
+    if isinstance(ty, types.Dispatcher):
+        return ("dispatcher", _function_key(ty.dispatcher.py_func))
+    key = _stable_type_key(ty)
+    # The string form of some types includes the address of an object.
+    if " at 0x" in repr(key):
+        raise _NotCachableError(ty)
+    return key
+
+
+class _CanonicalLoopBody:
+    """Builds the canonical form of the blocks of a parfor loop body."""
+
+    def __init__(self, typemap, calltypes, var_names):
+        self._typemap = typemap
+        self._calltypes = calltypes
+        self._var_ids = {}
+        self._labels = {}
+        for name in var_names:
+            self._var_ids.setdefault(name, len(self._var_ids))
+
+    def _label(self, label):
+        if label not in self._labels:
+            raise _NotCachableError(label)
+        return ("label", self._labels[label])
+
+    def _signature(self, node):
+        sig = self._calltypes.get(node)
+        if sig is None:
+            return None
+        return (
+            tuple(_type_key(arg) for arg in sig.args),
+            _type_key(sig.return_type),
+        )
+
+    def _attrs(self, node):
+        return tuple(
+            (name, self.value(attr))
+            for name, attr in sorted(vars(node).items())
+            if name not in ("loc", "scope")
+        )
+
+    def value(self, val):
+        """Returns the canonical form of a value of the IR."""
+        if isinstance(val, ir.Var):
+            var_id = self._var_ids.setdefault(val.name, len(self._var_ids))
+            return ("var", var_id, _type_key(self._typemap.get(val.name)))
+        if isinstance(val, ir.Expr):
+            kws = tuple(
+                (name, self.value(kw))
+                for name, kw in sorted(val._kws.items())
+                if name != "loc"
+            )
+            return ("expr", val.op, kws, self._signature(val))
+        if isinstance(val, ir.Const):
+            return ("const", _value_key(val.value))
+        if val is ir.UNDEFINED:
+            return ("undefined",)
+        if isinstance(val, ir.Arg):
+            return ("arg", val.index)
+        if isinstance(val, (ir.Global, ir.FreeVar)):
+            return ("global", val.name, _value_key(val.value))
+        if isinstance(val, (list, tuple)):
+            return tuple(self.value(item) for item in val)
+        if isinstance(val, dict):
+            return tuple(
+                (self.value(k), self.value(v)) for k, v in sorted(val.items())
+            )
+        return _value_key(val)
+
+    def inst(self, inst):
+        """Returns the canonical form of an instruction of the IR."""
+        if isinstance(inst, parfor.Parfor):
+            raise _NotCachableError(inst)
+        if isinstance(inst, ir.Jump):
+            return ("jump", self._label(inst.target))
+        if isinstance(inst, ir.Branch):
+            return (
+                "branch",
+                self.value(inst.cond),
+                self._label(inst.truebr),
+                self._label(inst.falsebr),
+            )
+        return (
+            type(inst).__name__,
+            self._attrs(inst),
+            self._signature(inst),
+        )
+
+    def blocks(self, blocks):
+        """Returns the canonical form of a dictionary of basic blocks."""
+        labels = sorted(blocks)
+        self._labels = {label: i for i, label in enumerate(labels)}
+        return tuple(
+            tuple(self.inst(inst) for inst in blocks[label].body)
+            for label in labels
+        )
+
+
+def parfor_kernel_key(
+    loop_body,
+    typemap,
+    calltypes,
+    kernel_params,
+    loop_indices,
+    kernel_param_types,
+    nd_range,
+):
+    """Returns the key of the kernel generated for a parfor node, or None if
+    the kernel cannot be cached.
+
+    Args:
+        loop_body (dict): The legalized basic blocks of the loop body.
+        typemap (dict): The types of the variables of the loop body.
+        calltypes (dict): The signatures of the calls of the loop body.
+        kernel_params (list): The legal names of the kernel parameters.
+        loop_indices (list): The legal names of the loop index variables.
+        kernel_param_types (tuple): The argument types of the kernel,
+            including the Item or NdItem type that sets the loop rank.
+        nd_range (bool): True if the kernel is submitted as an nd-range
+            kernel.
+
+    Returns: A hexadecimal string or None.
+    """
+    # pylint: disable=import-outside-toplevel
+    import numba
+
+    import numba_dpex
+    from numba_dpex.kernel_api_impl.spirv.spirv_generator import (
+        DEFAULT_LLVM_SPIRV_ARGS,
+    )
+
+    canonical_body = _CanonicalLoopBody(
+        typemap, calltypes, list(kernel_params) + list(loop_indices)
+    )
+    try:
+        key = (
+            "nd_range" if nd_range else "range",
+            tuple(_type_key(ty) for ty in kernel_param_types),
+            canonical_body.blocks(loop_body),
+            config.DPEX_OPT,
+            config.INLINE_THRESHOLD,
+            config.DEBUGINFO_DEFAULT,
+            DEFAULT_LLVM_SPIRV_ARGS,
+            _KERNEL_ARGS_ABI_VERSION,
+            numba_dpex.__version__,
+            numba.__version__,
+        )
+    except _NotCachableError:
+        return None
+
+    return hashlib.sha256(repr(key).encode()).hexdigest()
+
+
+class ParforKernelCache:
+    """Maps the keys returned by :func:`parfor_kernel_key` to compiled
+    kernels.
+    """
+
+    def __init__(self):
+        self._kernels = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def _cache_dir():
+        if numba_config.CACHE_DIR:
+            root = numba_config.CACHE_DIR
+        else:
+            root = AppDirs(appname="numba", appauthor=False).user_cache_dir
+        return os.path.join(root, _CACHE_SUBDIR)
+
+    def _load(self, key):
+        path = os.path.join(self._cache_dir(), key + ".pkl")
+        try:
+            with open(path, "rb") as f:
+                kernel_name, kernel_bitcode = pickle.load(f)
+        except (OSError, EOFError, ValueError, TypeError, pickle.PickleError):
+            return None
+        return SPIRVKernelModule(
+            kernel_name=kernel_name, kernel_bitcode=kernel_bitcode
+        )
+
+    def _save(self, key, kernel_module):
+        cache_dir = self._cache_dir()
+        try:
+            os.makedirs(cache_dir, exist_ok=True)
+            # Write to a temporary file first, so that a concurrent process
+            # never loads a partially written kernel.
+            fd, tmp_path = tempfile.mkstemp(dir=cache_dir, suffix=".tmp")
+            with os.fdopen(fd, "wb") as f:
+                pickle.dump(
+                    (kernel_module.kernel_name, kernel_module.kernel_bitcode),
+                    f,
+                    protocol=pickle.HIGHEST_PROTOCOL,
+                )
+            os.replace(tmp_path, os.path.join(cache_dir, key + ".pkl"))
+        except OSError:
+            pass
+
+    def get(self, key):
+        """Returns the kernel stored for the key, or None.
+
+        A key of None is never found.
+        """
+        if key is None or not config.PARFOR_KERNEL_CACHE:
+            return None
+
+        with self._lock:
+            kernel_module = self._kernels.get(key)
+        if kernel_module is None and config.PARFOR_KERNEL_CACHE >= 2:
+            kernel_module = self._load(key)
+            if kernel_module is not None:
+                with self._lock:
+                    self._kernels[key] = kernel_module
+
+        with self._lock:
+            if kernel_module is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        return kernel_module
+
+    def put(self, key, kernel_module):
+        """Stores a compiled kernel under the key. A key of None is ignored."""
+        if key is None or not config.PARFOR_KERNEL_CACHE:
+            return
+
+        with self._lock:
+            self._kernels[key] = kernel_module
+        if config.PARFOR_KERNEL_CACHE >= 2:
+            self._save(key, kernel_module)
+
+    def clear(self):
+        """Removes the kernels kept in memory and resets the counters."""
+        with self._lock:
+            self._kernels.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def __len__(self):
+        with self._lock:
+            return len(self._kernels)
+
+
+parfor_kernel_cache = ParforKernelCache()
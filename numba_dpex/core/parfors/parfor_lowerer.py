@@ -5,11 +5,15 @@
 import copy
 
 from llvmlite import ir as llvmir
-from numba.core import cgutils, ir, types
+from numba.core import cgutils
+from numba.core import event as ev
+from numba.core import ir, types
 from numba.parfors.parfor import (
+    Parfor,
     find_potential_aliases_parfor,
     get_parfor_outputs,
 )
+from numba.parfors.parfor_lowering import ParforLower
 
 from numba_dpex.core import config
 from numba_dpex.core.datamodel.models import (
@@ -18,16 +22,23 @@ from numba_dpex.core.datamodel.models import (
 from numba_dpex.core.parfors.reduction_helper import (
     ReductionHelper,
     ReductionKernelVariables,
+    use_atomic_final_combine,
 )
+from numba_dpex.core.runtime.context import DpexRTContext
 from numba_dpex.core.utils.call_kernel_builder import KernelLaunchIRBuilder
 from numba_dpex.dpctl_iface import libsyclinterface_bindings as sycl
 
 from ..exceptions import UnsupportedParforError
 from ..types.dpnp_ndarray_type import DpnpNdArray
+from ..types.usm_ndarray_type import USMNdArray
 from .kernel_builder import ParforKernel, create_kernel_for_parfor
 from .reduction_kernel_builder import (
+    create_reduction_final_kernel_for_parfor,
     create_reduction_main_kernel_for_parfor,
-    create_reduction_remainder_kernel_for_parfor,
+)
+from .work_group_size import (
+    get_parfor_reduction_work_group_range,
+    get_parfor_work_group_range,
 )
 
 
@@ -76,6 +87,150 @@ def _load_range(lowerer, value):
         return lowerer.context.get_constant(types.uintp, value)
 
 
+def _contains_array(ty):
+    """Returns True if a value of the Numba type ``ty`` holds an array whose
+    data can be accessed by host code.
+    """
+    if ty is None:
+        return False
+    if isinstance(ty, types.ArrayCompatible):
+        return True
+    if isinstance(ty, types.BaseTuple):
+        return any(_contains_array(member_ty) for member_ty in ty.types)
+    if isinstance(ty, types.BoundFunction):
+        return _contains_array(ty.this)
+    if isinstance(ty, (types.List, types.Set)):
+        return _contains_array(ty.dtype)
+    # Array iterators such as ArrayIterator and NumpyFlatType
+    return _contains_array(getattr(ty, "array_type", None))
+
+
+_EXIT_STMTS = (
+    ir.Return,
+    ir.Raise,
+    ir.StaticRaise,
+    ir.TryRaise,
+    ir.StaticTryRaise,
+    ir.DynamicRaise,
+    ir.DynamicTryRaise,
+)
+
+
+def _needs_parfor_event_wait(inst, typemap):
+    """Returns True if the host code generated for a Numba IR instruction may
+    access the data of an array or leaves the function, so that all
+    previously submitted parfor kernels have to complete before it executes.
+
+    Instructions that only alias an array, read its metadata or release it are
+    not synchronization points, as every parfor kernel keeps its array
+    arguments alive until it completes.
+    """
+    if isinstance(inst, (Parfor, ir.Del)):
+        return False
+    if isinstance(inst, _EXIT_STMTS):
+        return True
+    if isinstance(inst, ir.Assign):
+        value = inst.value
+        if isinstance(value, (ir.Var, ir.Arg, ir.Const, ir.Global, ir.FreeVar)):
+            return False
+        if isinstance(value, ir.Expr) and value.op == "getattr":
+            return False
+        if isinstance(value, ir.Expr) and value.op == "yield":
+            return True
+        used_vars = value.list_vars() if isinstance(value, ir.Expr) else []
+    else:
+        used_vars = inst.list_vars()
+
+    return any(_contains_array(typemap.get(var.name)) for var in used_vars)
+
+
+def _parfor_kernel_event(lowerer, parfor):
+    """Returns the context manager of the event broadcast while the kernels of
+    a parfor node are generated and compiled.
+    """
+    return ev.trigger_event(
+        "numba_dpex:parfor_kernel",
+        data={
+            "name": f"parfor kernel {parfor.id} "
+            f"[{lowerer.fndesc.qualname}, {parfor.loc.short()}]",
+        },
+    )
+
+
+def _wait_for_pending_parfor_event(lowerer):
+    """Waits for the last parfor kernel submitted by the function being lowered
+    if it was not waited for already.
+    """
+    pending_event_ptr = getattr(lowerer, "pending_parfor_event_ptr", None)
+    if pending_event_ptr is None:
+        return
+
+    builder = lowerer.builder
+    event_ref = builder.load(pending_event_ptr)
+    with builder.if_then(cgutils.is_not_null(builder, event_ref)):
+        sycl.dpctl_event_wait(builder, event_ref)
+        sycl.dpctl_event_delete(builder, event_ref)
+        builder.store(cgutils.get_null_value(event_ref.type), pending_event_ptr)
+
+
+def _wait_for_pending_fills(lowerer, inst):
+    """Waits for the pending asynchronous fills of the arrays used by a Numba
+    IR instruction, e.g., of the arrays created by ``dpnp.zeros``, so that the
+    host code generated for the instruction sees the filled data.
+    """
+    if isinstance(inst, ir.Assign):
+        used_vars = inst.value.list_vars()
+    else:
+        used_vars = inst.list_vars()
+
+    dpexrt = DpexRTContext(lowerer.context)
+    for name in dict.fromkeys(var.name for var in used_vars):
+        ty = lowerer.fndesc.typemap.get(name)
+        if not _contains_array(ty):
+            continue
+        val = lowerer.loadvar(name)
+        for _, meminfo in lowerer.context.nrt.get_meminfos(
+            lowerer.builder, ty, val
+        ):
+            dpexrt.meminfo_wait(lowerer.builder, meminfo)
+
+
+class DpjitParforLower(ParforLower):
+    """Lowers a dpjit function submitting its parfor kernels asynchronously.
+
+    Every parfor kernel is submitted with the event of the previously submitted
+    parfor kernel as its dependent event, and the event of the last submitted
+    kernel is kept in a stack slot of the function. The host waits on that
+    event only before executing an instruction that may access array data on
+    the host or leave the function. Consecutive parfors thereby execute on the
+    device without a host round trip in between them.
+
+    Errors raised by Numba generated code, e.g., a division by zero, return to
+    the caller without waiting for the pending kernel. The kernel arguments are
+    still kept alive until the kernel completes.
+
+    Arrays created by ``dpnp.zeros``, ``dpnp.ones``, ``dpnp.full`` and their
+    ``_like`` variants are filled asynchronously as well. The parfor kernels
+    using such an array depend on its fill, and the host waits for the fill
+    only before an instruction that may access the array's data. Arrays
+    returned from the function are not waited for, as the fill is waited for
+    when the array is boxed or when its memory is released.
+    """
+
+    def pre_lower(self):
+        super().pre_lower()
+        self.pending_parfor_event_ptr = cgutils.alloca_once(
+            self.builder, cgutils.voidptr_t
+        )
+
+    def lower_inst(self, inst):
+        if _needs_parfor_event_wait(inst, self.fndesc.typemap):
+            _wait_for_pending_parfor_event(self)
+            if not isinstance(inst, _EXIT_STMTS):
+                _wait_for_pending_fills(self, inst)
+        super().lower_inst(inst)
+
+
 class ParforLowerImpl:
     """Provides a custom lowerer for parfor nodes that generates a SYCL kernel
     for a parfor and submits it to a queue.
@@ -85,7 +240,20 @@ class ParforLowerImpl:
         self,
         lowerer,
         loop_ranges,
+        work_group_range=None,
     ):
+        """Returns the global and local range over which to submit the kernel
+        generated for a parfor, along with the extents of the iteration space
+        that are passed to nd-range kernels.
+
+        Without a ``work_group_range`` the kernel is submitted as a range
+        kernel over the loop ranges of the parfor and the local range is
+        empty. Otherwise, the extent of every work-group dimension is the
+        smaller of the requested extent and the extent of the loop range, and
+        the global range is the loop range rounded up to a multiple of the
+        work-group range. The work-items that the rounding adds skip the
+        parfor body in the kernel.
+        """
         # Create a global range over which to submit the kernel based on the
         # loop_ranges of the parfor
         global_range = []
@@ -103,13 +271,36 @@ class ParforLowerImpl:
                     "non-unit strides are not yet supported."
                 )
             global_range.append(stop)
-        # For now the local_range is always an empty list as numba_dpex always
-        # submits kernels generated for parfor nodes as range kernels.
-        # The provision is kept here if in future there is newer functionality
-        # to submit these kernels as ndrange.
+
+        if work_group_range is None:
+            return global_range, [], []
+
+        builder = lowerer.builder
+        one = lowerer.context.get_constant(types.intp, 1)
+        zero = lowerer.context.get_constant(types.intp, 0)
+
+        extents = global_range
+        global_range = []
         local_range = []
+        for extent, wg_extent in zip(extents, work_group_range):
+            wg_extent = lowerer.context.get_constant(types.intp, wg_extent)
+            local_extent = builder.select(
+                builder.icmp_signed("<", extent, wg_extent),
+                builder.select(
+                    builder.icmp_signed("<", extent, one), one, extent
+                ),
+                wg_extent,
+            )
+            rem = builder.srem(extent, local_extent)
+            padding = builder.select(
+                builder.icmp_signed("==", rem, zero),
+                zero,
+                builder.sub(local_extent, rem),
+            )
+            global_range.append(builder.add(extent, padding))
+            local_range.append(local_extent)
 
-        return global_range, local_range
+        return global_range, local_range, extents
 
     def _reduction_ranges(
         self,
@@ -117,32 +308,24 @@ class ParforLowerImpl:
         reductionHelper=None,
     ):
         # Create a global range over which to submit the kernel based on the
-        # loop_ranges of the parfor
-        global_range = []
-
-        stop = reductionHelper.global_size_var
-        stop = _load_range(lowerer, stop)
-        global_range.append(stop)
+        # loop_ranges of the parfor rounded up to whole work-groups
+        global_range = [
+            _load_range(lowerer, global_size_var)
+            for global_size_var in reductionHelper.global_size_vars
+        ]
 
-        local_range = []
-        local_range.append(
-            _load_range(lowerer, reductionHelper.work_group_size)
-        )
+        local_range = [
+            _load_range(lowerer, wg_extent)
+            for wg_extent in reductionHelper.work_group_range
+        ]
 
         return global_range, local_range
 
-    def _remainder_ranges(self, lowerer):
-        # Create a global range over which to submit the kernel based on the
-        # loop_ranges of the parfor
-        global_range = []
-
-        stop = _load_range(lowerer, 1)
-
-        global_range.append(stop)
-
-        local_range = []
+    def _final_reduction_ranges(self, lowerer, reductionHelper):
+        # The partial results are combined by a single work-group
+        work_group_size = _load_range(lowerer, reductionHelper.work_group_size)
 
-        return global_range, local_range
+        return [work_group_size], [work_group_size]
 
     def _submit_parfor_kernel(
         self,
@@ -151,10 +334,14 @@ class ParforLowerImpl:
         global_range,
         local_range,
         debug=False,
+        extra_kernel_args=(),
     ):
         """
         Adds a call to submit a kernel function into the function body of the
         current Numba JIT compiled function.
+
+        The LLVM values in ``extra_kernel_args`` are passed to the kernel after
+        the arguments named in ``kernel_fn.kernel_args``.
         """
         kl_builder = KernelLaunchIRBuilder(
             lowerer.context, lowerer.builder, kernel_dmm
@@ -179,13 +366,19 @@ class ParforLowerImpl:
                 kernel_args.append(la._getvalue())
             else:
                 kernel_args.append(_getvar(lowerer, arg))
+        kernel_args.extend(extra_kernel_args)
 
         kl_builder.set_range(global_range, local_range)
         kl_builder.set_arguments(
             kernel_fn.kernel_arg_types, kernel_args=kernel_args
         )
         kl_builder.set_queue_from_arguments()
-        kl_builder.set_dependent_events([])
+
+        # The kernel depends on the previously submitted parfor kernel and on
+        # the pending fills of its array arguments.
+        pending_event_ptr = getattr(lowerer, "pending_parfor_event_ptr", None)
+        kl_builder.set_dependent_events_from_meminfos(pending_event_ptr)
+
         kl_builder.set_kernel_from_spirv(
             kernel_fn.kernel_module,
             debug=debug,
@@ -193,8 +386,21 @@ class ParforLowerImpl:
 
         event_ref = kl_builder.submit()
 
-        sycl.dpctl_event_wait(lowerer.builder, event_ref)
-        sycl.dpctl_event_delete(lowerer.builder, event_ref)
+        if pending_event_ptr is None:
+            sycl.dpctl_event_wait(lowerer.builder, event_ref)
+            sycl.dpctl_event_delete(lowerer.builder, event_ref)
+        else:
+            # Keeps the arguments alive until the kernel completes, as the host
+            # may release them before waiting for the kernel.
+            host_event_ref = kl_builder.acquire_meminfo_and_submit_release()
+            sycl.dpctl_event_delete(lowerer.builder, host_event_ref)
+
+            previous_event_ref = lowerer.builder.load(pending_event_ptr)
+            with lowerer.builder.if_then(
+                cgutils.is_not_null(lowerer.builder, previous_event_ref)
+            ):
+                sycl.dpctl_event_delete(lowerer.builder, previous_event_ref)
+            lowerer.builder.store(event_ref, pending_event_ptr)
 
         return kl_builder.arguments.sycl_queue_ref
 
@@ -226,6 +432,18 @@ class ParforLowerImpl:
 
         inputArrayType = typemap[inputArrayName]
 
+        # SYCL ranges can have at most three dimensions.
+        if len(parfor.loop_nests) > 3:
+            raise UnsupportedParforError(
+                "Reductions over more than three dimensions are not yet "
+                "supported."
+            )
+
+        work_group_range = get_parfor_reduction_work_group_range(
+            inputArrayType.device, len(parfor.loop_nests)
+        )
+        use_atomic = use_atomic_final_combine(parfor, typemap, inputArrayType)
+
         reductionHelperList = []
         for i in range(nredvars):
             reductionHelper = ReductionHelper()
@@ -234,6 +452,8 @@ class ParforLowerImpl:
                 lowerer,
                 parfor_redvars[i],
                 inputArrayType,
+                work_group_range,
+                use_atomic=use_atomic,
             )
             reductionHelperList.append(reductionHelper)
 
@@ -245,11 +465,6 @@ class ParforLowerImpl:
             reductionHelperList=reductionHelperList,
         )
 
-        if len(parfor.loop_nests) > 1:
-            raise UnsupportedParforError(
-                "Reduction with nested loop is not yet supported."
-            )
-
         parfor_kernel = create_reduction_main_kernel_for_parfor(
             loop_ranges,
             parfor,
@@ -262,7 +477,7 @@ class ParforLowerImpl:
             lowerer, reductionHelperList[0]
         )
 
-        self._submit_parfor_kernel(
+        queue_ref = self._submit_parfor_kernel(
             lowerer,
             parfor_kernel,
             global_range,
@@ -270,25 +485,31 @@ class ParforLowerImpl:
             debug=flags.debuginfo,
         )
 
-        parfor_kernel = create_reduction_remainder_kernel_for_parfor(
-            parfor,
-            typemap,
-            reductionKernelVar,
-            parfor_reddict,
-            reductionHelperList,
-        )
+        if not reductionKernelVar.use_atomic:
+            parfor_kernel = create_reduction_final_kernel_for_parfor(
+                parfor,
+                typemap,
+                reductionKernelVar,
+                parfor_reddict,
+                reductionHelperList,
+            )
 
-        global_range, local_range = self._remainder_ranges(lowerer)
+            global_range, local_range = self._final_reduction_ranges(
+                lowerer, reductionHelperList[0]
+            )
 
-        # TODO: find better way to pass queue
-        queue_ref = self._submit_parfor_kernel(
-            lowerer,
-            parfor_kernel,
-            global_range,
-            local_range,
-            debug=flags.debuginfo,
-        )
+            # TODO: find better way to pass queue
+            queue_ref = self._submit_parfor_kernel(
+                lowerer,
+                parfor_kernel,
+                global_range,
+                local_range,
+                debug=flags.debuginfo,
+            )
 
+        # The final sum is read on the host by a copy that does not depend on
+        # the reduction kernels.
+        _wait_for_pending_parfor_event(lowerer)
         reductionKernelVar.copy_final_sum_to_host(queue_ref)
 
     def _lower_parfor_as_kernel(self, lowerer, parfor):
@@ -372,33 +593,46 @@ class ParforLowerImpl:
 
         nredvars = len(parfor_redvars)
         if nredvars > 0:
-            self._reduction_codegen(
-                parfor,
-                typemap,
-                nredvars,
-                parfor_redvars,
-                parfor_reddict,
-                lowerer,
-                parfor_output_arrays,
-                loop_ranges,
-                flags,
-                alias_map,
-            )
-        else:
-            try:
-                parfor_kernel = create_kernel_for_parfor(
-                    lowerer,
+            with _parfor_kernel_event(lowerer, parfor):
+                self._reduction_codegen(
                     parfor,
                     typemap,
-                    loop_ranges,
-                    parfor.races,
+                    nredvars,
+                    parfor_redvars,
+                    parfor_reddict,
+                    lowerer,
                     parfor_output_arrays,
+                    loop_ranges,
+                    flags,
+                    alias_map,
                 )
+        else:
+            work_group_range = None
+            for param in parfor.params:
+                if isinstance(typemap[param], USMNdArray):
+                    work_group_range = get_parfor_work_group_range(
+                        typemap[param].device, len(loop_ranges)
+                    )
+                    break
+
+            try:
+                with _parfor_kernel_event(lowerer, parfor):
+                    parfor_kernel = create_kernel_for_parfor(
+                        lowerer,
+                        parfor,
+                        typemap,
+                        loop_ranges,
+                        parfor.races,
+                        parfor_output_arrays,
+                        work_group_range=work_group_range,
+                    )
             except Exception:
                 # FIXME: Make the exception more informative
                 raise UnsupportedParforError
 
-            global_range, local_range = self._loop_ranges(lowerer, loop_ranges)
+            global_range, local_range, extents = self._loop_ranges(
+                lowerer, loop_ranges, parfor_kernel.work_group_range
+            )
 
             # Finally submit the kernel
             self._submit_parfor_kernel(
@@ -407,6 +641,7 @@ class ParforLowerImpl:
                 global_range,
                 local_range,
                 debug=flags.debuginfo,
+                extra_kernel_args=extents,
             )
 
         # Restore the original typemap of the function that was replaced
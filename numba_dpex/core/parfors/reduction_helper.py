@@ -3,6 +3,7 @@
 # SPDX-License-Identifier: Apache-2.0
 
 import copy
+import math
 import operator
 
 import dpnp
@@ -17,10 +18,51 @@ from numba.core.ir_utils import (
 from numba.parfors import parfor
 from numba.parfors.parfor_lowering_utils import ParforLoweringBuilder
 
+from numba_dpex.core import config
 from numba_dpex.core.utils.cgutils_extra import get_llvm_type
 from numba_dpex.dpctl_iface import libsyclinterface_bindings as sycl
 
 from ..types.dpnp_ndarray_type import DpnpNdArray
+from .work_group_size import _get_device
+
+# The element types for which the device supports atomic additions. The
+# 64-bit types additionally require the atomic64 aspect.
+_ATOMIC_32BIT_TYPES = (types.int32, types.uint32, types.float32)
+_ATOMIC_64BIT_TYPES = (types.int64, types.uint64, types.float64)
+
+
+def use_atomic_final_combine(parfor, typemap, inputArrayType) -> bool:
+    """Returns True if the partial results of the work-groups of a parfor
+    reduction are to be combined atomically into the final result.
+
+    That is the case if the ``PARFOR_REDUCTION_STRATEGY`` config value is
+    ``"atomic"``, every reduction of the parfor is a sum of scalars and the
+    device supports atomic additions of the element type of the reduction
+    arrays.
+    """
+    if config.PARFOR_REDUCTION_STRATEGY != "atomic":
+        return False
+
+    device = _get_device(inputArrayType.device)
+    if device is None:
+        return False
+
+    # The reduction arrays of scalar reductions have the element type of the
+    # input array, see ReductionHelper._redtyp_to_redarraytype.
+    dtype = inputArrayType.dtype
+    if dtype in _ATOMIC_64BIT_TYPES:
+        if not device.has_aspect_atomic64:
+            return False
+    elif dtype not in _ATOMIC_32BIT_TYPES:
+        return False
+
+    for redvar in parfor.redvars:
+        if parfor.reddict[redvar].redop != operator.iadd:
+            return False
+        if not isinstance(typemap[redvar], types.Number):
+            return False
+
+    return True
 
 
 class ReductionHelper:
@@ -32,8 +74,10 @@ class ReductionHelper:
         lowerer,
         red_name,
         inputArrayType,
+        work_group_range,
+        use_atomic=False,
     ):
-        # reduction arrays outer dimension equal to thread count
+        # reduction arrays outer dimension equal to work-group count
         scope = parfor.init_block.scope
         loc = parfor.init_block.loc
         pfbdr = ParforLoweringBuilder(lowerer=lowerer, scope=scope, loc=loc)
@@ -46,59 +90,73 @@ class ReductionHelper:
         reddtype = redarrvar_typ.dtype
         redarrdim = redarrvar_typ.ndim
 
-        # allocate partial sum
-        work_group_size = 8
-        # writing work_group_size inot IR
-        work_group_size_var = pfbdr.assign(
-            rhs=ir.Const(work_group_size, loc),
-            typ=types.literal(work_group_size),
-            name="work_group_size",
-        )
+        def binop(op, lhs, rhs, name):
+            ir_expr = ir.Expr.binop(op, lhs, rhs, loc)
+            pfbdr._calltypes[ir_expr] = numba.core.typing.signature(
+                types.intp, types.intp, types.intp
+            )
+            return pfbdr.assign(rhs=ir_expr, typ=types.intp, name=name)
+
+        # The iterations that do not fill a whole work-group are executed by
+        # the last work-groups, whose extra work-items only contribute the
+        # initial value of the reduction. For every dimension d:
+        # num_groups_d = (tot_work_d + wg_d - 1) // wg_d # noqa: E800
+        # global_size_d = num_groups_d * wg_d # noqa: E800
+        # The partial sums array stores one value for every work-group.
+        self.total_work_vars = []
+        self.global_size_vars = []
+        self.partial_sum_size_var = None
+        for dim, wg_extent in enumerate(work_group_range):
+            # writing the work-group extent into IR
+            wg_extent_var = pfbdr.assign(
+                rhs=ir.Const(wg_extent, loc),
+                typ=types.literal(wg_extent),
+                name=f"work_group_size{dim}",
+            )
+            wg_extent_m1_var = pfbdr.assign(
+                rhs=ir.Const(wg_extent - 1, loc),
+                typ=types.literal(wg_extent - 1),
+                name=f"work_group_size{dim}_m1",
+            )
 
-        # get total_work from parfor loop range
-        # FIXME: right way is to use (stop - start) if start != 0
-        total_work_var = pfbdr.assign(
-            rhs=parfor.loop_nests[0].stop,
-            typ=types.intp,
-            name="tot_work",
-        )
+            # get total_work from parfor loop range
+            # FIXME: right way is to use (stop - start) if start != 0
+            stop = parfor.loop_nests[dim].stop
+            if not isinstance(stop, ir.Var):
+                stop = ir.Const(stop, loc)
+            total_work_var = pfbdr.assign(
+                rhs=stop, typ=types.intp, name=f"tot_work{dim}"
+            )
 
-        # global_size_mod = tot_work%work_group_size # noqa: E800 help understanding
-        ir_expr = ir.Expr.binop(
-            operator.mod, total_work_var, work_group_size_var, loc
-        )
-        pfbdr._calltypes[ir_expr] = numba.core.typing.signature(
-            types.intp, types.intp, types.intp
-        )
-        self.global_size_mod_var = pfbdr.assign(
-            rhs=ir_expr, typ=types.intp, name="global_size_mod"
-        )
+            tmp_var = binop(
+                operator.add,
+                total_work_var,
+                wg_extent_m1_var,
+                f"tot_work{dim}_padded",
+            )
+            num_groups_var = binop(
+                operator.floordiv, tmp_var, wg_extent_var, f"num_groups{dim}"
+            )
+            global_size_var = binop(
+                operator.mul,
+                num_groups_var,
+                wg_extent_var,
+                f"global_size{dim}",
+            )
 
-        # Calculates global_size_var as total_work - global_size_mod
-        ir_expr = ir.Expr.binop(
-            operator.sub, total_work_var, self.global_size_mod_var, loc
-        )
-        pfbdr._calltypes[ir_expr] = numba.core.typing.signature(
-            types.intp, types.intp, types.intp
-        )
-        self.global_size_var = pfbdr.assign(
-            rhs=ir_expr, typ=types.intp, name="global_size"
-        )
+            if self.partial_sum_size_var is None:
+                self.partial_sum_size_var = num_groups_var
+            else:
+                self.partial_sum_size_var = binop(
+                    operator.mul,
+                    self.partial_sum_size_var,
+                    num_groups_var,
+                    "partial_sum_size",
+                )
+
+            self.total_work_vars.append(total_work_var)
+            self.global_size_vars.append(global_size_var)
 
-        # Calculates partial_sum_size_var as
-        # global_size_var_assign // work_group_size_var_assign
-        ir_expr = ir.Expr.binop(
-            operator.floordiv,
-            self.global_size_var,
-            work_group_size_var,
-            loc,
-        )
-        pfbdr._calltypes[ir_expr] = numba.core.typing.signature(
-            types.intp, types.intp, types.intp
-        )
-        self.partial_sum_size_var = pfbdr.assign(
-            rhs=ir_expr, typ=types.intp, name="partial_sum_size"
-        )
         # Dpnp object
         fillFunc = None
         parfor_reddict = parfor.reddict
@@ -125,9 +183,6 @@ class ReductionHelper:
             kws=kws,
         )
 
-        sizeVar = pfbdr.make_tuple_variable(
-            [self.partial_sum_size_var], name="tuple_sizeVar"
-        )
         cval = pfbdr._typingctx.resolve_value_type(reddtype)
         dt = pfbdr.make_const_variable(cval=cval, typ=types.DType(reddtype))
 
@@ -143,16 +198,6 @@ class ReductionHelper:
             cval=inputArrayType.usm_type,
             typ=types.literal(inputArrayType.usm_type),
         )
-        empty_call = pfbdr.call(
-            glbl_np_empty, args=[sizeVar, dt, orderTyVar, deviceVar, usmTyVar]
-        )
-
-        self.partial_sum_var = pfbdr.assign(
-            rhs=empty_call,
-            typ=redarrvar_typ,
-            name="partial_sum",
-        )
-
         # final sum with size of 1
         final_sum_size = 1
         # writing work_group_size into IR
@@ -173,7 +218,28 @@ class ReductionHelper:
             typ=redarrvar_typ,
             name="final_sum",
         )
-        self.work_group_size = work_group_size
+
+        if use_atomic:
+            # The work-groups atomically combine their partial results
+            # directly into the final sum.
+            self.partial_sum_var = self.final_sum_var
+        else:
+            sizeVar = pfbdr.make_tuple_variable(
+                [self.partial_sum_size_var], name="tuple_sizeVar"
+            )
+            empty_call = pfbdr.call(
+                glbl_np_empty,
+                args=[sizeVar, dt, orderTyVar, deviceVar, usmTyVar],
+            )
+            self.partial_sum_var = pfbdr.assign(
+                rhs=empty_call,
+                typ=redarrvar_typ,
+                name="partial_sum",
+            )
+
+        self.work_group_range = tuple(work_group_range)
+        self.work_group_size = math.prod(work_group_range)
+        self.use_atomic = use_atomic
         self.redvars_to_redarrs_dict = {}
         self.redvars_to_redarrs_dict[red_name] = []
         self.redvars_to_redarrs_dict[red_name].append(self.partial_sum_var.name)
@@ -334,6 +400,10 @@ class ReductionKernelVariables:
         self._param_types = param_types
         self._lowerer = lowerer
         self._work_group_size = reductionHelperList[0].work_group_size
+        self._use_atomic = reductionHelperList[0].use_atomic
+        self._total_work_names = [
+            var.name for var in reductionHelperList[0].total_work_vars
+        ]
 
     @property
     def parfor_reddict(self):
@@ -395,6 +465,14 @@ class ReductionKernelVariables:
     def work_group_size(self):
         return self._work_group_size
 
+    @property
+    def use_atomic(self):
+        return self._use_atomic
+
+    @property
+    def total_work_names(self):
+        return self._total_work_names
+
     def copy_final_sum_to_host(self, queue_ref):
         lowerer = self.lowerer
         builder = lowerer.builder
@@ -28,7 +28,7 @@ from numba_dpex.kernel_api_impl.spirv.dispatcher import (
 
 from .kernel_builder import ParforKernel, _to_scalar_from_0d
 from .kernel_templates.reduction_template import (
-    RemainderReduceIntermediateKernelTemplate,
+    TreeReduceFinalKernelTemplate,
     TreeReduceIntermediateKernelTemplate,
 )
 
@@ -84,12 +84,25 @@ def create_reduction_main_kernel_for_parfor(
         local_accessors_dict[k] = la_var
         idx = reductionKernelVar.parfor_params.index(k)
         arr_ty = reductionKernelVar.param_types[idx]
-        la_ty = LocalAccessorType(parfor_dim, arr_ty.dtype)
+        # The work-items of a work-group are reduced over their linear ids.
+        la_ty = LocalAccessorType(1, arr_ty.dtype)
 
         parfor_params.append(la_var)
         parfor_legalized_params.append(la_var)
         parfor_param_types.append(la_ty)
 
+    # The extents of the iteration space are passed as the last arguments, as
+    # the kernel is submitted over a global range rounded up to a multiple
+    # of the work-group range.
+    extent_names = reductionKernelVar.total_work_names
+    extent_legal_names_dict = legalize_names(extent_names)
+    extent_legal_names = [extent_legal_names_dict[v] for v in extent_names]
+    parfor_params.extend(extent_names)
+    parfor_legalized_params.extend(extent_legal_names)
+    parfor_param_types.extend(
+        _to_scalar_from_0d(typemap[name]) for name in extent_names
+    )
+
     kernel_template = TreeReduceIntermediateKernelTemplate(
         kernel_name=kernel_name,
         kernel_params=parfor_legalized_params,
@@ -104,6 +117,8 @@ def create_reduction_main_kernel_for_parfor(
         redvars_dict=reductionKernelVar.redvars_legal_dict,
         local_accessors_dict=local_accessors_dict,
         typemap=typemap,
+        extent_names=extent_legal_names,
+        use_atomic=reductionKernelVar.use_atomic,
     )
 
     for i, name in enumerate(reductionKernelVar.parfor_params):
@@ -151,7 +166,7 @@ def create_reduction_main_kernel_for_parfor(
     )
 
 
-def create_reduction_remainder_kernel_for_parfor(
+def create_reduction_final_kernel_for_parfor(
     parfor_node,
     typemap,
     reductionKernelVar,
@@ -159,149 +174,69 @@ def create_reduction_remainder_kernel_for_parfor(
     reductionHelperList,
 ):
     """
-    Creates a numba_dpex.kernel function for a reduction remainder kernel.
+    Creates a numba_dpex.kernel function combining the partial results of the
+    work-groups of a reduction main kernel into the final results.
     """
-
-    loc = parfor_node.init_block.loc
-
-    for race in parfor_node.races:
-        msg = (
-            "Variable %s used in parallel loop may be written "
-            "to simultaneously by multiple workers and may result "
-            "in non-deterministic or unintended results." % race
-        )
-        warnings.warn(NumbaParallelSafetyWarning(msg, loc))
-
-    loop_body_var_table = get_name_var_table(reductionKernelVar.loop_body)
-    sentinel_name = get_unused_var_name("__sentinel__", loop_body_var_table)
-
-    global_size_var_name = []
-    global_size_mod_var_name = []
     partial_sum_var_name = []
-    partial_sum_size_var_name = []
     final_sum_var_name = []
+    local_sums_var_name = []
+    kernel_args = []
+    kernel_arg_types = []
 
-    for i, _ in enumerate(reductionKernelVar.parfor_redvars):
+    for i, redvar in enumerate(reductionKernelVar.parfor_redvars):
         reductionHelper = reductionHelperList[i]
-        name = reductionHelper.partial_sum_var.name
-        partial_sum_var_name.append(name)
-
-        name = reductionHelper.global_size_var.name
-        global_size_var_name.append(name)
+        partial_sum_var_name.append(reductionHelper.partial_sum_var.name)
+        final_sum_var_name.append(reductionHelper.final_sum_var.name)
 
-        name = reductionHelper.global_size_mod_var.name
-        global_size_mod_var_name.append(name)
+        partial_sum_ty = _to_scalar_from_0d(
+            typemap[reductionHelper.partial_sum_var.name]
+        )
+        final_sum_ty = _to_scalar_from_0d(
+            typemap[reductionHelper.final_sum_var.name]
+        )
+        la_var = "local_sums_" + reductionKernelVar.redvars_legal_dict[redvar]
+        local_sums_var_name.append(la_var)
 
-        name = reductionHelper.partial_sum_size_var.name
-        partial_sum_size_var_name.append(name)
+        kernel_args.extend(
+            [partial_sum_var_name[-1], final_sum_var_name[-1], la_var]
+        )
+        kernel_arg_types.extend(
+            [
+                partial_sum_ty,
+                final_sum_ty,
+                LocalAccessorType(1, partial_sum_ty.dtype),
+            ]
+        )
 
-        name = reductionHelper.final_sum_var.name
-        final_sum_var_name.append(name)
+    partial_sum_size_var_name = reductionHelperList[0].partial_sum_size_var.name
+    kernel_args.append(partial_sum_size_var_name)
+    kernel_arg_types.append(
+        _to_scalar_from_0d(typemap[partial_sum_size_var_name])
+    )
 
-    kernel_name = "__dpex_redection_parfor_%s_remainder" % (parfor_node.id)
+    kernel_name = "__dpex_reduction_parfor_%s_final" % (parfor_node.id)
 
     partial_sum_var_dict = legalize_names(partial_sum_var_name)
-    global_size_var_dict = legalize_names(global_size_var_name)
-    global_size_mod_var_dict = legalize_names(global_size_mod_var_name)
-    partial_sum_size_var_dict = legalize_names(partial_sum_size_var_name)
     final_sum_var_dict = legalize_names(final_sum_var_name)
+    partial_sum_size_var_dict = legalize_names([partial_sum_size_var_name])
 
-    partial_sum_var_legal_name = [
-        partial_sum_var_dict[v] for v in partial_sum_var_dict
-    ]
-
-    global_size_var_legal_name = [
-        global_size_var_dict[v] for v in global_size_var_dict
-    ]
-    global_size_mod_var_legal_name = [
-        global_size_mod_var_dict[v] for v in global_size_mod_var_dict
-    ]
-    partial_sum_size_var_legal_name = [
-        partial_sum_size_var_dict[v] for v in partial_sum_size_var_dict
-    ]
-    final_sum_var_legal_name = [
-        final_sum_var_dict[v] for v in final_sum_var_dict
-    ]
-
-    kernel_template = RemainderReduceIntermediateKernelTemplate(
+    kernel_template = TreeReduceFinalKernelTemplate(
         kernel_name=kernel_name,
-        kernel_params=reductionKernelVar.parfor_legalized_params,
-        sentinel_name=sentinel_name,
-        legal_loop_indices=reductionKernelVar.legal_loop_indices,
-        redvars_dict=reductionKernelVar.redvars_legal_dict,
         redvars=reductionKernelVar.parfor_redvars,
         parfor_reddict=parfor_reddict,
-        typemap=typemap,
-        global_size_var_name=global_size_var_legal_name,
-        global_size_mod_var_name=global_size_mod_var_legal_name,
-        partial_sum_size_var_name=partial_sum_size_var_legal_name,
-        partial_sum_var_name=partial_sum_var_legal_name,
-        final_sum_var_name=final_sum_var_legal_name,
-        reductionKernelVar=reductionKernelVar,
-    )
-
-    for i, _ in enumerate(reductionKernelVar.parfor_redvars):
-        if reductionHelperList[i].global_size_var is not None:
-            reductionKernelVar.parfor_params.append(global_size_var_name[i])
-            reductionKernelVar.parfor_legalized_params.append(
-                global_size_var_legal_name[i]
-            )
-            reductionKernelVar.param_types.append(
-                _to_scalar_from_0d(typemap[global_size_var_name[i]])
-            )
-            reductionKernelVar.func_arg_types.append(
-                _to_scalar_from_0d(typemap[global_size_var_name[i]])
-            )
-
-        if reductionHelperList[i].global_size_mod_var is not None:
-            reductionKernelVar.parfor_params.append(global_size_mod_var_name[i])
-            reductionKernelVar.parfor_legalized_params.append(
-                global_size_mod_var_legal_name[i]
-            )
-
-            reductionKernelVar.param_types.append(
-                _to_scalar_from_0d(typemap[global_size_mod_var_name[i]])
-            )
-            reductionKernelVar.func_arg_types.append(
-                _to_scalar_from_0d(typemap[global_size_mod_var_name[i]])
-            )
-
-        if reductionHelperList[i].partial_sum_size_var is not None:
-            reductionKernelVar.parfor_params.append(
-                partial_sum_size_var_name[i]
-            )
-            reductionKernelVar.parfor_legalized_params.append(
-                partial_sum_size_var_legal_name[i]
-            )
-            reductionKernelVar.param_types.append(
-                _to_scalar_from_0d(typemap[partial_sum_size_var_name[i]])
-            )
-            reductionKernelVar.func_arg_types.append(
-                _to_scalar_from_0d(typemap[partial_sum_size_var_name[i]])
-            )
-        if reductionHelperList[i].final_sum_var is not None:
-            reductionKernelVar.parfor_params.append(final_sum_var_name[i])
-            reductionKernelVar.parfor_legalized_params.append(
-                final_sum_var_legal_name[i]
-            )
-            reductionKernelVar.param_types.append(
-                _to_scalar_from_0d(typemap[final_sum_var_name[i]])
-            )
-            reductionKernelVar.func_arg_types.append(
-                _to_scalar_from_0d(typemap[final_sum_var_name[i]])
-            )
-
-    kernel_dispatcher: SPIRVKernelDispatcher = kernel(
-        kernel_template.py_func,
-        _parfor_body_args=ParforBodyArguments(
-            loop_body=reductionKernelVar.loop_body,
-            param_dict=reductionKernelVar.param_dict,
-            legal_loop_indices=reductionKernelVar.legal_loop_indices,
-        ),
+        partial_sum_var_name=[
+            partial_sum_var_dict[v] for v in partial_sum_var_name
+        ],
+        final_sum_var_name=[final_sum_var_dict[v] for v in final_sum_var_name],
+        local_sums_var_name=local_sums_var_name,
+        partial_sum_size_var_name=partial_sum_size_var_dict[
+            partial_sum_size_var_name
+        ],
     )
 
-    kernel_param_types = reductionKernelVar.param_types
+    kernel_dispatcher: SPIRVKernelDispatcher = kernel(kernel_template.py_func)
 
+    kernel_param_types = (NdItemType(1), *kernel_arg_types)
     kernel_sig = signature(types.none, *kernel_param_types)
 
     kcres: _SPIRVKernelCompileResult = kernel_dispatcher.get_compile_result(
@@ -311,7 +246,9 @@ def create_reduction_remainder_kernel_for_parfor(
 
     return ParforKernel(
         signature=kernel_sig,
-        kernel_args=reductionKernelVar.parfor_params,
-        kernel_arg_types=reductionKernelVar.func_arg_types,
+        kernel_args=kernel_args,
+        kernel_arg_types=kernel_arg_types,
+        local_accessors=set(local_sums_var_name),
+        work_group_size=reductionKernelVar.work_group_size,
         kernel_module=kernel_module,
     )
@@ -0,0 +1,186 @@
+# SPDX-FileCopyrightText: 2024 Intel Corporation
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""Selects the work-group sizes of the nd-range kernels generated for parfor
+nodes from the properties of the device on which the kernels execute.
+"""
+
+import math
+from functools import lru_cache
+
+import dpctl
+
+from numba_dpex.core import config
+
+# The number of work-items of a work-group used when the config does not
+# specify one. Large enough to hide the memory latency of memory-bound
+# kernels and small enough to let several work-groups share a compute unit.
+_DEFAULT_WORK_GROUP_SIZE = 256
+
+# The work-group size of reduction kernels when the device is not available
+# at compile time. Small enough to be supported by every device.
+_FALLBACK_REDUCTION_WORK_GROUP_SIZE = 64
+
+# The extent of the innermost dimension of a multi-dimensional work-group
+# when the preferred sub-group size is smaller.
+_MIN_INNER_EXTENT = 32
+
+
+@lru_cache(maxsize=None)
+def _get_device(device_filter):
+    try:
+        return dpctl.SyclDevice(device_filter)
+    except dpctl.SyclDeviceCreationError:
+        return None
+
+
+def get_preferred_sub_group_size(device: dpctl.SyclDevice) -> int:
+    """Returns the largest sub-group size supported by the device, or 1 if
+    the device does not report any sub-group size.
+    """
+    sub_group_sizes = list(device.sub_group_sizes)
+    return max(sub_group_sizes) if sub_group_sizes else 1
+
+
+def _round_down_to_multiple(value, multiple):
+    if value < multiple:
+        return value
+    return value - value % multiple
+
+
+def _round_down_to_power_of_two(value):
+    return 1 << (value.bit_length() - 1)
+
+
+def _distribute(work_group_size, ndim, max_work_item_sizes, sub_group_size):
+    """Distributes the work-items of a work-group over ``ndim`` dimensions.
+
+    The innermost, i.e., last, dimension is indexed by consecutive work-items
+    of a sub-group, so it gets at least a full sub-group to keep the memory
+    accesses of a sub-group contiguous. The remaining work-items are spread
+    evenly over the outer dimensions.
+    """
+    if ndim == 1:
+        return (min(work_group_size, max_work_item_sizes[0]),)
+
+    inner = min(
+        work_group_size,
+        max_work_item_sizes[-1],
+        max(sub_group_size, _MIN_INNER_EXTENT),
+    )
+    remaining = max(1, work_group_size // inner)
+
+    if ndim == 2:
+        return (min(remaining, max_work_item_sizes[0]), inner)
+
+    middle = min(2 ** (int(math.log2(remaining)) // 2), max_work_item_sizes[1])
+    outer = min(max(1, remaining // middle), max_work_item_sizes[0])
+    return (outer, middle, inner)
+
+
+def get_parfor_work_group_range(device_filter: str, ndim: int):
+    """Returns the work-group range of the nd-range kernels generated for
+    parfor nodes without reductions.
+
+    The total number of work-items of a work-group is given by the
+    ``PARFOR_WORK_GROUP_SIZE`` config value, or defaults to 256. It is capped
+    by the maximum work-group size of the device and, when possible, rounded
+    down to a multiple of the preferred sub-group size.
+
+    Args:
+        device_filter (str): The filter string of the device on which the
+            kernels are executed.
+        ndim (int): The number of dimensions of the kernel range.
+
+    Returns:
+        A tuple with the extent of every dimension of the work-group, or None
+        if the kernels are to be submitted as range kernels. That is the case
+        if the config value is negative, if the range has more than three
+        dimensions or if the device is not available at compile time.
+    """
+    if config.PARFOR_WORK_GROUP_SIZE < 0 or ndim > 3:
+        return None
+
+    device = _get_device(device_filter)
+    if device is None:
+        return None
+
+    work_group_size = config.PARFOR_WORK_GROUP_SIZE or _DEFAULT_WORK_GROUP_SIZE
+    work_group_size = min(work_group_size, device.max_work_group_size)
+
+    sub_group_size = get_preferred_sub_group_size(device)
+    work_group_size = _round_down_to_multiple(work_group_size, sub_group_size)
+
+    max_work_item_sizes = getattr(device, f"max_work_item_sizes{ndim}d")
+
+    return _distribute(
+        work_group_size, ndim, max_work_item_sizes, sub_group_size
+    )
+
+
+def get_parfor_reduction_work_group_size(device_filter: str) -> int:
+    """Returns the number of work-items of the work-groups of the kernels
+    generated for parfor nodes with reductions.
+
+    The size is given by the ``PARFOR_REDUCTION_WORK_GROUP_SIZE`` config
+    value, or defaults to 256. It is capped by the maximum work-group size of
+    the device and rounded down to a power of two, as required by the tree
+    reduction done by every work-group.
+
+    Args:
+        device_filter (str): The filter string of the device on which the
+            kernels are executed.
+
+    Returns:
+        int: The work-group size.
+    """
+    work_group_size = config.PARFOR_REDUCTION_WORK_GROUP_SIZE
+
+    device = _get_device(device_filter)
+    if device is None:
+        if work_group_size <= 0:
+            work_group_size = _FALLBACK_REDUCTION_WORK_GROUP_SIZE
+    else:
+        if work_group_size <= 0:
+            work_group_size = _DEFAULT_WORK_GROUP_SIZE
+        work_group_size = min(work_group_size, device.max_work_group_size)
+
+    return _round_down_to_power_of_two(work_group_size)
+
+
+def get_parfor_reduction_work_group_range(device_filter: str, ndim: int):
+    """Returns the work-group range of the kernels generated for parfor nodes
+    with reductions.
+
+    The work-items given by :func:`get_parfor_reduction_work_group_size` are
+    distributed over the dimensions in the same way as for the kernels without
+    reductions. Every extent is a power of two, so that the work-items of a
+    work-group can be reduced with a tree reduction over their linear ids.
+
+    Args:
+        device_filter (str): The filter string of the device on which the
+            kernels are executed.
+        ndim (int): The number of dimensions of the kernel range, at most 3.
+
+    Returns:
+        A tuple with the extent of every dimension of the work-group.
+    """
+    work_group_size = get_parfor_reduction_work_group_size(device_filter)
+    if ndim == 1:
+        return (work_group_size,)
+
+    device = _get_device(device_filter)
+    if device is None:
+        max_work_item_sizes = (work_group_size,) * ndim
+        sub_group_size = 1
+    else:
+        max_work_item_sizes = getattr(device, f"max_work_item_sizes{ndim}d")
+        sub_group_size = get_preferred_sub_group_size(device)
+
+    return tuple(
+        _round_down_to_power_of_two(extent)
+        for extent in _distribute(
+            work_group_size, ndim, max_work_item_sizes, sub_group_size
+        )
+    )
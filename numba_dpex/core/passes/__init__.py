@@ -3,9 +3,10 @@
 # SPDX-License-Identifier: Apache-2.0
 
 from .parfor_legalize_cfd_pass import ParforLegalizeCFDPass
-from .passes import DumpParforDiagnostics, NoPythonBackend
+from .passes import DpjitParforLowering, DumpParforDiagnostics, NoPythonBackend
 
 __all__ = [
+    "DpjitParforLowering",
     "DumpParforDiagnostics",
     "ParforLegalizeCFDPass",
     "NoPythonBackend",
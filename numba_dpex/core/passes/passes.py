@@ -11,9 +11,11 @@ from numba.core.compiler_machinery import (
     register_pass,
 )
 from numba.core.ir_utils import remove_dels
-from numba.core.typed_passes import NativeLowering
+from numba.core.typed_passes import NativeLowering, NativeParforLowering
+from numba.parfors.parfor_lowering import ParforLower
 
 from numba_dpex.core import config
+from numba_dpex.core.parfors.parfor_lowerer import DpjitParforLower
 
 
 @register_pass(mutates_CFG=True, analysis_only=False)
@@ -97,3 +99,19 @@ class QualNameDisambiguationLowering(NativeLowering):
         ret = NativeLowering.run_pass(self, state)
         state.func_id.func_qualname = qual_name
         return ret
+
+
+@register_pass(mutates_CFG=True, analysis_only=False)
+class DpjitParforLowering(NativeParforLowering):
+    """Lowering pass for dpjit functions that submits the kernels generated for
+    parfor nodes asynchronously if the ``ASYNC_PARFOR_SUBMISSION`` config flag
+    is set.
+    """
+
+    _name = "dpjit_parfor_lowering"
+
+    @property
+    def lowering_class(self):
+        if config.ASYNC_PARFOR_SUBMISSION:
+            return DpjitParforLower
+        return ParforLower
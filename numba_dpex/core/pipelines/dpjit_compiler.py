@@ -8,7 +8,6 @@ from numba.core.typed_passes import (
     AnnotateTypes,
     InlineOverloads,
     IRLegalization,
-    NativeParforLowering,
     NopythonRewrites,
     NoPythonSupportedFeatureValidation,
     NopythonTypeInference,
@@ -22,6 +21,7 @@ from numba_dpex.core.exceptions import UnsupportedCompilationModeError
 from numba_dpex.core.parfors.parfor_diagnostics import ExtendedParforDiagnostics
 from numba_dpex.core.parfors.parfor_pass import ParforPass
 from numba_dpex.core.passes import (
+    DpjitParforLowering,
     DumpParforDiagnostics,
     NoPythonBackend,
     ParforLegalizeCFDPass,
@@ -80,7 +80,7 @@ class _DpjitPassBuilder(object):
 
         # lower
         pm.add_pass(
-            NativeParforLowering, "lowerer with support for parfor nodes"
+            DpjitParforLowering, "lowerer with support for parfor nodes"
         )
         pm.add_pass(NoPythonBackend, "nopython mode backend")
         pm.add_pass(DumpParforDiagnostics, "dump parfor diagnostics")
@@ -13,3 +13,10 @@ for (
     c_address,
 ) in c_helpers.items():
     ll.add_symbol(py_name, c_address)
+
+# Applies the configured capacity of the runtime kernel cache and the
+# configuration of the USM pool, and drains the deferred meminfo releases at
+# exit.
+from . import deferred_release  # noqa: E402
+from . import kernel_cache  # noqa: E402
+from . import usm_pool  # noqa: E402
@@ -26,6 +26,7 @@
 
 #include "experimental/kernel_caching.h"
 #include "experimental/nrt_reserve_meminfo.h"
+#include "experimental/usm_pool.h"
 #include "numba/core/runtime/nrt_external.h"
 
 // forward declarations
@@ -35,16 +36,28 @@ static void *usm_device_malloc(size_t size, void *opaque_data);
 static void *usm_shared_malloc(size_t size, void *opaque_data);
 static void *usm_host_malloc(size_t size, void *opaque_data);
 static void usm_free(void *data, void *opaque_data);
+static void *pooled_usm_device_malloc(size_t size, void *opaque_data);
+static void *pooled_usm_shared_malloc(size_t size, void *opaque_data);
+static void *pooled_usm_host_malloc(size_t size, void *opaque_data);
+static void pooled_usm_free(void *data, void *opaque_data);
 static NRT_ExternalAllocator *
 NRT_ExternalAllocator_new_for_usm(DPCTLSyclQueueRef qref, size_t usm_type);
+static void NRT_ExternalAllocator_use_usm_pool(NRT_ExternalAllocator *allocator,
+                                               size_t usm_type);
 static void *DPEXRTQueue_CreateFromFilterString(const char *device);
 static MemInfoDtorInfo *MemInfoDtorInfo_new(NRT_MemInfo *mi, PyObject *owner);
 static NRT_MemInfo *DPEXRT_MemInfo_fill(NRT_MemInfo *mi,
                                         size_t itemsize,
                                         bool dest_is_float,
+                                        bool dest_is_complex,
                                         bool value_is_float,
                                         int64_t value,
+                                        int64_t imag_value,
                                         const DPCTLSyclQueueRef qref);
+static void DPEXRT_MemInfo_wait(NRT_MemInfo *mi);
+static size_t DPEXRT_MemInfo_get_events(NRT_MemInfo **mis,
+                                        size_t nmis,
+                                        DPCTLSyclEventRef *events);
 static NRT_MemInfo *NRT_MemInfo_new_from_usmndarray(NRT_api_functions *nrt,
                                                     PyObject *ndarrobj,
                                                     void *data,
@@ -127,6 +140,38 @@ static void usm_free(void *data, void *opaque_data)
     DPCTLfree_with_queue(data, qref);
 }
 
+/** An NRT_external_malloc_func implementation allocating device USM memory
+ *  from the USM pool.
+ */
+static void *pooled_usm_device_malloc(size_t size, void *opaque_data)
+{
+    return DPEXRT_usm_pool_malloc(size, 1, (DPCTLSyclQueueRef)opaque_data);
+}
+
+/** An NRT_external_malloc_func implementation allocating shared USM memory
+ *  from the USM pool.
+ */
+static void *pooled_usm_shared_malloc(size_t size, void *opaque_data)
+{
+    return DPEXRT_usm_pool_malloc(size, 2, (DPCTLSyclQueueRef)opaque_data);
+}
+
+/** An NRT_external_malloc_func implementation allocating host USM memory
+ *  from the USM pool.
+ */
+static void *pooled_usm_host_malloc(size_t size, void *opaque_data)
+{
+    return DPEXRT_usm_pool_malloc(size, 3, (DPCTLSyclQueueRef)opaque_data);
+}
+
+/** An NRT_external_free_func implementation returning memory to the USM pool.
+ *
+ */
+static void pooled_usm_free(void *data, void *opaque_data)
+{
+    DPEXRT_usm_pool_free(data, (DPCTLSyclQueueRef)opaque_data);
+}
+
 /*----------------------------------------------------------------------------*/
 /*--------- Functions for dpctl libsyclinterface/sycl gluing         ---------*/
 /*----------------------------------------------------------------------------*/
@@ -249,6 +294,162 @@ static void DpexrtQueue_SubmitNDRange(const void *KRef,
         __FILE__, __LINE__));
 }
 
+/*----------------------------------------------------------------------------*/
+/*---------------------- Functions for bound kernel launches -----------------*/
+/*----------------------------------------------------------------------------*/
+
+/*!
+ * @brief Returns the kernel built from a SPIR-V binary for the context and
+ * the device of a queue, taking it from the kernel cache if it was already
+ * built.
+ *
+ * @param    QRef           The queue whose context and device are used.
+ * @param    il_hash        The hash of the SPIR-V binary.
+ * @param    il             The SPIR-V binary.
+ * @param    il_length      The length of the SPIR-V binary in bytes.
+ * @param    compile_opts   The build options or NULL.
+ * @param    kernel_name    The name of the kernel in the SPIR-V binary.
+ * @return   {return}       A new kernel reference to be deleted by
+ *                          DPEXRT_kernel_launch_delete_kernel, or NULL if the
+ *                          kernel could not be built.
+ */
+static void *DPEXRT_kernel_launch_build_kernel(const void *QRef,
+                                               size_t il_hash,
+                                               const char *il,
+                                               size_t il_length,
+                                               const char *compile_opts,
+                                               const char *kernel_name)
+{
+    DPCTLSyclQueueRef qref = (DPCTLSyclQueueRef)QRef;
+
+    // DPEXRT_build_or_get_kernel steals the references to the context and
+    // the device.
+    return (void *)DPEXRT_build_or_get_kernel(
+        DPCTLQueue_GetContext(qref), DPCTLQueue_GetDevice(qref), il_hash, il,
+        il_length, compile_opts, kernel_name);
+}
+
+/*!
+ * @brief Deletes a kernel reference returned by
+ * DPEXRT_kernel_launch_build_kernel.
+ *
+ * @param    KRef           The kernel reference.
+ */
+static void DPEXRT_kernel_launch_delete_kernel(void *KRef)
+{
+    DPCTLKernel_Delete((DPCTLSyclKernelRef)KRef);
+}
+
+/*!
+ * @brief Submits a kernel with already flattened arguments to a queue.
+ *
+ * The kernel is submitted as a range kernel if LRange is NULL, otherwise as
+ * an nd-range kernel. The argument and type arrays are only read during the
+ * call, so they can be updated and reused for the next submission.
+ *
+ * @param    KRef           The kernel reference.
+ * @param    QRef           The queue reference.
+ * @param    Args           The pointers to the flattened arguments.
+ * @param    ArgTypes       The DPCTLKernelArgType of every argument.
+ * @param    NArgs          The number of flattened arguments.
+ * @param    GRange         The global range.
+ * @param    LRange         The local range or NULL.
+ * @param    Ndims          The number of dimensions of the ranges.
+ * @param    DepEvents      The event references the kernel depends on.
+ * @param    NDepEvents     The number of dependent events.
+ * @param    Wait           If not zero, waits for the kernel to finish.
+ * @return   {return}       None if Wait is set, otherwise a new
+ *                          dpctl.SyclEvent of the kernel. NULL with a
+ *                          RuntimeError set if the submission failed.
+ */
+static PyObject *DPEXRT_kernel_launch_submit(const void *KRef,
+                                             const void *QRef,
+                                             void **Args,
+                                             const DPCTLKernelArgType *ArgTypes,
+                                             size_t NArgs,
+                                             const size_t *GRange,
+                                             const size_t *LRange,
+                                             size_t Ndims,
+                                             const void *DepEvents,
+                                             size_t NDepEvents,
+                                             int Wait)
+{
+    DPCTLSyclEventRef eref = NULL;
+    PyObject *event_obj = NULL;
+
+    if (LRange == NULL) {
+        eref = DPCTLQueue_SubmitRange(
+            (DPCTLSyclKernelRef)KRef, (DPCTLSyclQueueRef)QRef, Args,
+            (DPCTLKernelArgType *)ArgTypes, NArgs, GRange, Ndims,
+            (DPCTLSyclEventRef *)DepEvents, NDepEvents);
+    }
+    else {
+        eref = DPCTLQueue_SubmitNDRange(
+            (DPCTLSyclKernelRef)KRef, (DPCTLSyclQueueRef)QRef, Args,
+            (DPCTLKernelArgType *)ArgTypes, NArgs, GRange, LRange, Ndims,
+            (DPCTLSyclEventRef *)DepEvents, NDepEvents);
+    }
+
+    if (eref == NULL) {
+        PyErr_SetString(PyExc_RuntimeError, "Kernel submission failed.");
+        return NULL;
+    }
+
+    if (Wait) {
+        // The kernel may run for a long time, so other Python threads are
+        // allowed to run while waiting.
+        PyThreadState *thread_state = PyEval_SaveThread();
+        DPCTLEvent_Wait(eref);
+        PyEval_RestoreThread(thread_state);
+        DPCTLEvent_Delete(eref);
+        Py_RETURN_NONE;
+    }
+
+    // SyclEvent_Make copies the event reference.
+    event_obj = (PyObject *)SyclEvent_Make(eref);
+    DPCTLEvent_Delete(eref);
+
+    return event_obj;
+}
+
+/*!
+ * @brief Copies memory between two USM allocations once the dependent events
+ * are complete.
+ *
+ * @param    QRef           The queue the copy is submitted to.
+ * @param    Dst            The destination pointer.
+ * @param    Src            The source pointer.
+ * @param    NBytes         The number of bytes to copy.
+ * @param    DepEvents      The event references the copy depends on.
+ * @param    NDepEvents     The number of dependent events.
+ * @return   {return}       A new dpctl.SyclEvent of the copy, or NULL with a
+ *                          RuntimeError set if the submission failed.
+ */
+static PyObject *DPEXRT_kernel_launch_memcpy(const void *QRef,
+                                             void *Dst,
+                                             const void *Src,
+                                             size_t NBytes,
+                                             const void *DepEvents,
+                                             size_t NDepEvents)
+{
+    DPCTLSyclEventRef eref = NULL;
+    PyObject *event_obj = NULL;
+
+    eref =
+        DPCTLQueue_MemcpyWithEvents((DPCTLSyclQueueRef)QRef, Dst, Src, NBytes,
+                                    (DPCTLSyclEventRef *)DepEvents, NDepEvents);
+    if (eref == NULL) {
+        PyErr_SetString(PyExc_RuntimeError, "Memory copy submission failed.");
+        return NULL;
+    }
+
+    // SyclEvent_Make copies the event reference.
+    event_obj = (PyObject *)SyclEvent_Make(eref);
+    DPCTLEvent_Delete(eref);
+
+    return event_obj;
+}
+
 /*----------------------------------------------------------------------------*/
 /*---------------------- Functions for NRT_MemInfo allocation ----------------*/
 /*----------------------------------------------------------------------------*/
@@ -313,6 +514,35 @@ error:
     return NULL;
 }
 
+/*!
+ * @brief Makes an NRT_ExternalAllocator created by
+ *        NRT_ExternalAllocator_new_for_usm allocate and free its memory using
+ *        the USM pool.
+ *
+ * @param    allocator      An NRT_ExternalAllocator object.
+ * @param    usm_type       The type of usm allocator the allocator was created
+ *                          for.
+ */
+static void NRT_ExternalAllocator_use_usm_pool(NRT_ExternalAllocator *allocator,
+                                               size_t usm_type)
+{
+    switch (usm_type) {
+    case 1:
+        allocator->malloc = pooled_usm_device_malloc;
+        break;
+    case 2:
+        allocator->malloc = pooled_usm_shared_malloc;
+        break;
+    case 3:
+        allocator->malloc = pooled_usm_host_malloc;
+        break;
+    default:
+        return;
+    }
+
+    allocator->free = pooled_usm_free;
+}
+
 /*!
  * @brief  Destructor function for a MemInfo object allocated inside DPEXRT. The
  * destructor is called by Numba using the NRT_MemInfo_release function.
@@ -354,6 +584,13 @@ static void usmndarray_meminfo_dtor(void *ptr, size_t size, void *info)
         return;
     }
 
+    // Wait for any pending asynchronous write of the data, e.g., a fill,
+    // before the data is freed.
+    if (mi_dtor_info->event) {
+        DPCTLEvent_Wait(mi_dtor_info->event);
+        DPCTLEvent_Delete(mi_dtor_info->event);
+    }
+
     // If there is no owner PyObject, free the data by calling the
     // external_allocator->free
     if (!(mi_dtor_info->owner))
@@ -409,6 +646,7 @@ static MemInfoDtorInfo *MemInfoDtorInfo_new(NRT_MemInfo *mi, PyObject *owner)
     }
     mi_dtor_info->mi = mi;
     mi_dtor_info->owner = owner;
+    mi_dtor_info->event = NULL;
 
     return mi_dtor_info;
 }
@@ -527,6 +765,10 @@ static NRT_MemInfo *DPEXRT_MemInfo_alloc(NRT_api_functions *nrt,
     DPEXRT_DEBUG(drt_debug_print(
         "DPEXRT-DEBUG: Inside DPEXRT_MemInfo_alloc  %s, line %d\n", __FILE__,
         __LINE__));
+
+    // An allocation is a safe point to release the meminfos of completed
+    // asynchronous launches, so that their memory can be reused.
+    DPEXRT_nrt_release_deferred_meminfos(0);
     // Allocate a new NRT_MemInfo object
     if (!(mi = (NRT_MemInfo *)nrt->allocate(0))) {
         DPEXRT_DEBUG(drt_debug_print(
@@ -538,6 +780,11 @@ static NRT_MemInfo *DPEXRT_MemInfo_alloc(NRT_api_functions *nrt,
     if (!(ext_alloca = NRT_ExternalAllocator_new_for_usm(qref, usm_type)))
         goto error;
 
+    // Serve the allocation from the USM pool if it is enabled. The memory
+    // is returned to the pool when the MemInfo is destroyed.
+    if (DPEXRT_usm_pool_is_enabled())
+        NRT_ExternalAllocator_use_usm_pool(ext_alloca, usm_type);
+
     if (!(midtor_info = MemInfoDtorInfo_new(mi, NULL)))
         goto error;
 
@@ -574,163 +821,295 @@ error:
 }
 
 /**
- * @brief Interface for the core.runtime.context.DpexRTContext.meminfo_alloc.
+ * @brief A union for bit conversion from the input int64_t value to a
+ * uintX_t bit-pattern with appropriate type conversion when the input value
+ * represents a float.
+ */
+typedef union
+{
+    float f_; /**< The float to be represented. */
+    double d_;
+    int8_t i8_;
+    int16_t i16_;
+    int32_t i32_;
+    int64_t i64_;
+    uint8_t ui8_;
+    uint16_t ui16_;
+    uint32_t ui32_; /**< The bit representation. */
+    uint64_t ui64_; /**< The bit representation. */
+} bitcaster_t;
+
+/*!
+ * @brief Converts a double to the bit pattern of the nearest IEEE 754 half
+ * precision value, rounding ties to even.
+ *
+ * @param    value          The value to convert.
+ * @return   {return}       The bits of the half precision value.
+ */
+static uint16_t double_to_half_bits(double value)
+{
+    bitcaster_t bc;
+    uint16_t sign = 0, half = 0;
+    int64_t exp = 0;
+    uint64_t mantissa = 0, rem = 0, halfway = 0;
+    int shift = 0;
+
+    bc.d_ = value;
+    sign = (uint16_t)((bc.ui64_ >> 48) & 0x8000);
+    exp = (int64_t)((bc.ui64_ >> 52) & 0x7ff);
+    mantissa = bc.ui64_ & 0xfffffffffffffULL;
+
+    // Infinity and NaN
+    if (exp == 0x7ff)
+        return sign | 0x7c00 | (mantissa ? 0x200 : 0);
+
+    // The biased exponent of the half precision value
+    exp = exp - 1023 + 15;
+    if (exp >= 0x1f)
+        return sign | 0x7c00;
+
+    if (exp <= 0) {
+        // The value is a subnormal half precision value or rounds to zero.
+        if (exp < -10)
+            return sign;
+        mantissa |= (uint64_t)1 << 52;
+        shift = (int)(43 - exp);
+        half = (uint16_t)(mantissa >> shift);
+    }
+    else {
+        shift = 42;
+        half = (uint16_t)((exp << 10) | (mantissa >> shift));
+    }
+
+    // A carry out of the mantissa correctly increments the exponent.
+    rem = mantissa & (((uint64_t)1 << shift) - 1);
+    halfway = (uint64_t)1 << (shift - 1);
+    if (rem > halfway || (rem == halfway && (half & 1)))
+        half++;
+
+    return sign | half;
+}
+
+/*!
+ * @brief Returns the bit pattern of a value converted to a real element type.
+ *
+ * @param    itemsize       The size of the element type, 1, 2, 4 or 8 bytes.
+ * @param    dest_is_float  True if the element type is a floating point type.
+ * @param    value_is_float True if value stores the bits of a double.
+ * @param    value          The value, either an integer or the bits of a
+ *                          double.
+ * @return   {return}       The bit pattern of the converted value in the
+ *                          lower itemsize bytes.
+ */
+static uint64_t fill_pattern(size_t itemsize,
+                             bool dest_is_float,
+                             bool value_is_float,
+                             int64_t value)
+{
+    bitcaster_t bc, in;
+
+    in.i64_ = value;
+    bc.ui64_ = 0;
+
+    switch (itemsize) {
+    case 8:
+        if (dest_is_float)
+            bc.d_ = value_is_float ? in.d_ : (double)value;
+        else
+            bc.i64_ = value_is_float ? (int64_t)in.d_ : value;
+        return bc.ui64_;
+    case 4:
+        if (dest_is_float)
+            bc.f_ = value_is_float ? (float)in.d_ : (float)value;
+        else
+            bc.i32_ = value_is_float ? (int32_t)in.d_ : (int32_t)value;
+        return bc.ui32_;
+    case 2:
+        if (dest_is_float)
+            bc.ui16_ =
+                double_to_half_bits(value_is_float ? in.d_ : (double)value);
+        else
+            bc.i16_ = value_is_float ? (int16_t)in.d_ : (int16_t)value;
+        return bc.ui16_;
+    default:
+        bc.i8_ = value_is_float ? (int8_t)in.d_ : (int8_t)value;
+        return bc.ui8_;
+    }
+}
+
+/*!
+ * @brief Returns the MemInfoDtorInfo of a MemInfo object created by DPEXRT, or
+ * NULL if the MemInfo object was not created by DPEXRT.
+ */
+static MemInfoDtorInfo *MemInfo_get_dtor_info(NRT_MemInfo *mi)
+{
+    if (mi == NULL || mi->dtor != usmndarray_meminfo_dtor)
+        return NULL;
+
+    return (MemInfoDtorInfo *)mi->dtor_info;
+}
+
+/*!
+ * @brief Waits for the last asynchronous operation that the runtime submitted
+ * to write the data of a MemInfo object, if it was not waited for already.
+ *
+ * @param    mi             An NRT_MemInfo object, may be NULL.
+ */
+static void DPEXRT_MemInfo_wait(NRT_MemInfo *mi)
+{
+    MemInfoDtorInfo *mi_dtor_info = NULL;
+
+    if (!(mi_dtor_info = MemInfo_get_dtor_info(mi)) || !mi_dtor_info->event)
+        return;
+
+    DPCTLEvent_Wait(mi_dtor_info->event);
+    DPCTLEvent_Delete(mi_dtor_info->event);
+    mi_dtor_info->event = NULL;
+}
+
+/*!
+ * @brief Writes the events of the asynchronous operations that the runtime
+ * submitted to write the data of MemInfo objects and that were not waited for
+ * yet. The events can be used as the dependent events of a kernel accessing
+ * the data. They remain owned by the MemInfo objects.
+ *
+ * @param    mis            An array of NRT_MemInfo objects, entries may be
+ *                          NULL.
+ * @param    nmis           The number of NRT_MemInfo objects.
+ * @param    events         An output array of at least nmis events.
+ * @return   {return}       The number of events written to events.
+ */
+static size_t DPEXRT_MemInfo_get_events(NRT_MemInfo **mis,
+                                        size_t nmis,
+                                        DPCTLSyclEventRef *events)
+{
+    MemInfoDtorInfo *mi_dtor_info = NULL;
+    size_t nevents = 0;
+
+    for (size_t i = 0; i < nmis; ++i) {
+        if ((mi_dtor_info = MemInfo_get_dtor_info(mis[i])) &&
+            mi_dtor_info->event)
+        {
+            events[nevents++] = mi_dtor_info->event;
+        }
+    }
+
+    return nevents;
+}
+
+/**
+ * @brief Interface for the core.runtime.context.DpexRTContext.meminfo_fill.
  * This function takes an allocated memory as NRT_MemInfo and fills it with
- * the value specified by `value`.
+ * the value specified by `value` and `imag_value`.
+ *
+ * The fill is submitted asynchronously and its event is stored in the
+ * MemInfoDtorInfo of the MemInfo. Use DPEXRT_MemInfo_wait to wait for the
+ * fill or DPEXRT_MemInfo_get_events to make a kernel depend on it.
  *
  * @param mi                An NRT_MemInfo object, should be found from memory
  *                          allocation.
  * @param itemsize          The itemsize, the size of each item in the array.
- * @param dest_is_float     True if the destination array's dtype is float.
- * @param value_is_float    True if the value to be filled is float.
- * @param value             The value to be used to fill an array.
+ * @param dest_is_float     True if the destination array's dtype is float or
+ *                          complex.
+ * @param dest_is_complex   True if the destination array's dtype is complex.
+ * @param value_is_float    True if the values to be filled are floats, stored
+ *                          as the bits of doubles.
+ * @param value             The value, or the real part of the value, to be
+ *                          used to fill an array.
+ * @param imag_value        The imaginary part of the value to be used to fill
+ *                          an array. Only used for complex arrays.
  * @param qref              The queue on which the memory was allocated.
- * @return NRT_MemInfo*     A new NRT_MemInfo object, NULL if no NRT_MemInfo
- *                          object could be created.
+ * @return NRT_MemInfo*     The NRT_MemInfo object, NULL if the fill could not
+ *                          be submitted.
  */
 static NRT_MemInfo *DPEXRT_MemInfo_fill(NRT_MemInfo *mi,
                                         size_t itemsize,
                                         bool dest_is_float,
+                                        bool dest_is_complex,
                                         bool value_is_float,
                                         int64_t value,
+                                        int64_t imag_value,
                                         const DPCTLSyclQueueRef qref)
 {
     DPCTLSyclEventRef eref = NULL;
-    size_t count = 0, size = 0, exp = 0;
-
-    /**
-     * @brief A union for bit conversion from the input int64_t value
-     * to a uintX_t bit-pattern with appropriate type conversion when the
-     * input value represents a float.
-     */
-    typedef union
-    {
-        float f_; /**< The float to be represented. */
-        double d_;
-        int8_t i8_;
-        int16_t i16_;
-        int32_t i32_;
-        int64_t i64_;
-        uint8_t ui8_;
-        uint16_t ui16_;
-        uint32_t ui32_; /**< The bit representation. */
-        uint64_t ui64_; /**< The bit representation. */
-    } bitcaster_t;
-
-    bitcaster_t bc;
-    size = mi->size;
-    while (itemsize >>= 1)
-        exp++;
-    count = (unsigned int)(size >> exp);
-
-    DPEXRT_DEBUG(drt_debug_print(
-        "DPEXRT-DEBUG: mi->size = %u, itemsize = %u, count = %u, "
-        "value = %u, Inside DPEXRT_MemInfo_fill %s, line %d\n",
-        mi->size, itemsize << exp, count, value, __FILE__, __LINE__));
+    MemInfoDtorInfo *mi_dtor_info = NULL;
+    size_t count = 0;
+    uint64_t real_bits = 0, imag_bits = 0;
+    uint64_t pattern[2] = {0, 0};
 
-    if (mi->data == NULL) {
+    if (mi->data == NULL || itemsize == 0) {
         DPEXRT_DEBUG(drt_debug_print("DPEXRT-DEBUG: mi->data is NULL, "
                                      "Inside DPEXRT_MemInfo_fill %s, line %d\n",
                                      __FILE__, __LINE__));
         goto error;
     }
+    count = mi->size / itemsize;
 
-    switch (exp) {
-    case 3:
-    {
-        if (dest_is_float && value_is_float) {
-            double *p = (double *)(&value);
-            bc.d_ = *p;
-        }
-        else if (dest_is_float && !value_is_float) {
-            // To stop warning: dereferencing type-punned pointer
-            // will break strict-aliasing rules [-Wstrict-aliasing]
-            double cd = (double)value;
-            bc.d_ = *((double *)(&cd));
-        }
-        else if (!dest_is_float && value_is_float) {
-            double *p = (double *)&value;
-            bc.i64_ = (int64_t)*p;
-        }
-        else {
-            bc.i64_ = value;
-        }
-
-        if (!(eref = DPCTLQueue_Fill64(qref, mi->data, bc.ui64_, count)))
+    DPEXRT_DEBUG(drt_debug_print(
+        "DPEXRT-DEBUG: mi->size = %zu, itemsize = %zu, count = %zu, "
+        "Inside DPEXRT_MemInfo_fill %s, line %d\n",
+        mi->size, itemsize, count, __FILE__, __LINE__));
+
+    // A previous write of the data has to complete before the fill.
+    DPEXRT_MemInfo_wait(mi);
+
+    if (dest_is_complex) {
+        real_bits = fill_pattern(itemsize / 2, true, value_is_float, value);
+        imag_bits =
+            fill_pattern(itemsize / 2, true, value_is_float, imag_value);
+
+        switch (itemsize) {
+        case 16:
+            pattern[0] = real_bits;
+            pattern[1] = imag_bits;
+            eref = DPCTLQueue_Fill128(qref, mi->data, pattern, count);
+            break;
+        case 8:
+            eref = DPCTLQueue_Fill64(qref, mi->data,
+                                     real_bits | (imag_bits << 32), count);
+            break;
+        default:
             goto error;
-        break;
-    }
-    case 2:
-    {
-        if (dest_is_float && value_is_float) {
-            double *p = (double *)(&value);
-            bc.f_ = (float)*p;
-        }
-        else if (dest_is_float && !value_is_float) {
-            // To stop warning: dereferencing type-punned pointer
-            // will break strict-aliasing rules [-Wstrict-aliasing]
-            float cf = (float)value;
-            bc.f_ = *((float *)(&cf));
         }
-        else if (!dest_is_float && value_is_float) {
-            double *p = (double *)&value;
-            bc.i32_ = (int32_t)*p;
-        }
-        else {
-            bc.i32_ = (int32_t)value;
-        }
-
-        if (!(eref = DPCTLQueue_Fill32(qref, mi->data, bc.ui32_, count)))
-            goto error;
-        break;
     }
-    case 1:
-    {
-        if (dest_is_float)
+    else {
+        real_bits =
+            fill_pattern(itemsize, dest_is_float, value_is_float, value);
+
+        switch (itemsize) {
+        case 8:
+            eref = DPCTLQueue_Fill64(qref, mi->data, real_bits, count);
+            break;
+        case 4:
+            eref =
+                DPCTLQueue_Fill32(qref, mi->data, (uint32_t)real_bits, count);
+            break;
+        case 2:
+            eref =
+                DPCTLQueue_Fill16(qref, mi->data, (uint16_t)real_bits, count);
+            break;
+        case 1:
+            eref = DPCTLQueue_Fill8(qref, mi->data, (uint8_t)real_bits, count);
+            break;
+        default:
             goto error;
-
-        if (value_is_float) {
-            double *p = (double *)&value;
-            bc.i16_ = (int16_t)*p;
-        }
-        else {
-            bc.i16_ = (int16_t)value;
         }
-
-        if (!(eref = DPCTLQueue_Fill16(qref, mi->data, bc.ui16_, count)))
-            goto error;
-        break;
     }
-    case 0:
-    {
-        if (dest_is_float)
-            goto error;
 
-        if (value_is_float) {
-            double *p = (double *)&value;
-            bc.i8_ = (int8_t)*p;
-        }
-        else {
-            bc.i8_ = (int8_t)value;
-        }
+    if (eref == NULL)
+        goto error;
 
-        if (!(eref = DPCTLQueue_Fill8(qref, mi->data, bc.ui8_, count)))
-            goto error;
-        break;
+    if ((mi_dtor_info = MemInfo_get_dtor_info(mi))) {
+        mi_dtor_info->event = eref;
     }
-    default:
-        goto error;
+    else {
+        DPCTLEvent_Wait(eref);
+        DPCTLEvent_Delete(eref);
     }
 
-    DPCTLEvent_Wait(eref);
-    DPCTLEvent_Delete(eref);
-
     return mi;
 
 error:
-    DPCTLQueue_Delete(qref);
-    DPCTLEvent_Delete(eref);
-
     return NULL;
 }
 
@@ -1101,6 +1480,10 @@ DPEXRT_sycl_usm_ndarray_to_python_acqref(usmarystruct_t *arystruct,
         return MOD_ERROR_VAL;
     }
 
+    // The data is handed over to Python, so any pending asynchronous write of
+    // the data has to complete first.
+    DPEXRT_MemInfo_wait(arystruct->meminfo);
+
     // If the arystruct has a parent attribute, try to box the parent and
     // return it.
     if (arystruct->parent) {
@@ -1514,6 +1897,8 @@ static PyObject *build_c_helpers_dict(void)
     _declpointer("DpexrtQueue_SubmitNDRange", &DpexrtQueue_SubmitNDRange);
     _declpointer("DPEXRT_MemInfo_alloc", &DPEXRT_MemInfo_alloc);
     _declpointer("DPEXRT_MemInfo_fill", &DPEXRT_MemInfo_fill);
+    _declpointer("DPEXRT_MemInfo_wait", &DPEXRT_MemInfo_wait);
+    _declpointer("DPEXRT_MemInfo_get_events", &DPEXRT_MemInfo_get_events);
     _declpointer("NRT_ExternalAllocator_new_for_usm",
                  &NRT_ExternalAllocator_new_for_usm);
     _declpointer("DPEXRT_sycl_queue_from_python",
@@ -1525,8 +1910,37 @@ static PyObject *build_c_helpers_dict(void)
     _declpointer("DPEXRT_sycl_event_init", &DPEXRT_sycl_event_init);
     _declpointer("DPEXRT_nrt_acquire_meminfo_and_schedule_release",
                  &DPEXRT_nrt_acquire_meminfo_and_schedule_release);
+    _declpointer("DPEXRT_nrt_acquire_meminfo_and_defer_release",
+                 &DPEXRT_nrt_acquire_meminfo_and_defer_release);
+    _declpointer("DPEXRT_nrt_release_deferred_meminfos",
+                 &DPEXRT_nrt_release_deferred_meminfos);
     _declpointer("DPEXRT_build_or_get_kernel", &DPEXRT_build_or_get_kernel);
+    _declpointer("DPEXRT_get_call_site_kernel", &DPEXRT_get_call_site_kernel);
+    _declpointer("DPEXRT_release_call_site_kernel",
+                 &DPEXRT_release_call_site_kernel);
+    _declpointer("DPEXRT_kernel_call_site_hits", &DPEXRT_kernel_call_site_hits);
+    _declpointer("DPEXRT_kernel_launch_build_kernel",
+                 &DPEXRT_kernel_launch_build_kernel);
+    _declpointer("DPEXRT_kernel_launch_delete_kernel",
+                 &DPEXRT_kernel_launch_delete_kernel);
+    _declpointer("DPEXRT_kernel_launch_submit", &DPEXRT_kernel_launch_submit);
+    _declpointer("DPEXRT_kernel_launch_memcpy", &DPEXRT_kernel_launch_memcpy);
     _declpointer("DPEXRT_kernel_cache_size", &DPEXRT_kernel_cache_size);
+    _declpointer("DPEXRT_kernel_cache_capacity", &DPEXRT_kernel_cache_capacity);
+    _declpointer("DPEXRT_kernel_cache_set_capacity",
+                 &DPEXRT_kernel_cache_set_capacity);
+    _declpointer("DPEXRT_kernel_cache_get_stats",
+                 &DPEXRT_kernel_cache_get_stats);
+    _declpointer("DPEXRT_kernel_cache_reset_stats",
+                 &DPEXRT_kernel_cache_reset_stats);
+    _declpointer("DPEXRT_kernel_cache_purge", &DPEXRT_kernel_cache_purge);
+    _declpointer("DPEXRT_usm_pool_is_enabled", &DPEXRT_usm_pool_is_enabled);
+    _declpointer("DPEXRT_usm_pool_set_enabled", &DPEXRT_usm_pool_set_enabled);
+    _declpointer("DPEXRT_usm_pool_limit", &DPEXRT_usm_pool_limit);
+    _declpointer("DPEXRT_usm_pool_set_limit", &DPEXRT_usm_pool_set_limit);
+    _declpointer("DPEXRT_usm_pool_get_stats", &DPEXRT_usm_pool_get_stats);
+    _declpointer("DPEXRT_usm_pool_reset_stats", &DPEXRT_usm_pool_reset_stats);
+    _declpointer("DPEXRT_usm_pool_trim", &DPEXRT_usm_pool_trim);
 
 #undef _declpointer
     return dct;
@@ -1594,13 +2008,65 @@ MOD_INIT(_dpexrt_python)
                        PyLong_FromVoidPtr(&DPEXRT_MemInfo_alloc));
     PyModule_AddObject(m, "DPEXRT_MemInfo_fill",
                        PyLong_FromVoidPtr(&DPEXRT_MemInfo_fill));
+    PyModule_AddObject(m, "DPEXRT_MemInfo_wait",
+                       PyLong_FromVoidPtr(&DPEXRT_MemInfo_wait));
+    PyModule_AddObject(m, "DPEXRT_MemInfo_get_events",
+                       PyLong_FromVoidPtr(&DPEXRT_MemInfo_get_events));
     PyModule_AddObject(
         m, "DPEXRT_nrt_acquire_meminfo_and_schedule_release",
         PyLong_FromVoidPtr(&DPEXRT_nrt_acquire_meminfo_and_schedule_release));
+    PyModule_AddObject(
+        m, "DPEXRT_nrt_acquire_meminfo_and_defer_release",
+        PyLong_FromVoidPtr(&DPEXRT_nrt_acquire_meminfo_and_defer_release));
+    PyModule_AddObject(
+        m, "DPEXRT_nrt_release_deferred_meminfos",
+        PyLong_FromVoidPtr(&DPEXRT_nrt_release_deferred_meminfos));
+    PyModule_AddObject(m, "DPEXRT_nrt_num_deferred_releases",
+                       PyLong_FromVoidPtr(&DPEXRT_nrt_num_deferred_releases));
+    PyModule_AddObject(m, "DPEXRT_nrt_release_host_tasks",
+                       PyLong_FromVoidPtr(&DPEXRT_nrt_release_host_tasks));
     PyModule_AddObject(m, "DPEXRT_build_or_get_kernel",
                        PyLong_FromVoidPtr(&DPEXRT_build_or_get_kernel));
+    PyModule_AddObject(m, "DPEXRT_get_call_site_kernel",
+                       PyLong_FromVoidPtr(&DPEXRT_get_call_site_kernel));
+    PyModule_AddObject(m, "DPEXRT_release_call_site_kernel",
+                       PyLong_FromVoidPtr(&DPEXRT_release_call_site_kernel));
+    PyModule_AddObject(m, "DPEXRT_kernel_call_site_hits",
+                       PyLong_FromVoidPtr(&DPEXRT_kernel_call_site_hits));
+    PyModule_AddObject(m, "DPEXRT_kernel_launch_build_kernel",
+                       PyLong_FromVoidPtr(&DPEXRT_kernel_launch_build_kernel));
+    PyModule_AddObject(m, "DPEXRT_kernel_launch_delete_kernel",
+                       PyLong_FromVoidPtr(&DPEXRT_kernel_launch_delete_kernel));
+    PyModule_AddObject(m, "DPEXRT_kernel_launch_submit",
+                       PyLong_FromVoidPtr(&DPEXRT_kernel_launch_submit));
+    PyModule_AddObject(m, "DPEXRT_kernel_launch_memcpy",
+                       PyLong_FromVoidPtr(&DPEXRT_kernel_launch_memcpy));
     PyModule_AddObject(m, "DPEXRT_kernel_cache_size",
                        PyLong_FromVoidPtr(&DPEXRT_kernel_cache_size));
+    PyModule_AddObject(m, "DPEXRT_kernel_cache_capacity",
+                       PyLong_FromVoidPtr(&DPEXRT_kernel_cache_capacity));
+    PyModule_AddObject(m, "DPEXRT_kernel_cache_set_capacity",
+                       PyLong_FromVoidPtr(&DPEXRT_kernel_cache_set_capacity));
+    PyModule_AddObject(m, "DPEXRT_kernel_cache_get_stats",
+                       PyLong_FromVoidPtr(&DPEXRT_kernel_cache_get_stats));
+    PyModule_AddObject(m, "DPEXRT_kernel_cache_reset_stats",
+                       PyLong_FromVoidPtr(&DPEXRT_kernel_cache_reset_stats));
+    PyModule_AddObject(m, "DPEXRT_kernel_cache_purge",
+                       PyLong_FromVoidPtr(&DPEXRT_kernel_cache_purge));
+    PyModule_AddObject(m, "DPEXRT_usm_pool_is_enabled",
+                       PyLong_FromVoidPtr(&DPEXRT_usm_pool_is_enabled));
+    PyModule_AddObject(m, "DPEXRT_usm_pool_set_enabled",
+                       PyLong_FromVoidPtr(&DPEXRT_usm_pool_set_enabled));
+    PyModule_AddObject(m, "DPEXRT_usm_pool_limit",
+                       PyLong_FromVoidPtr(&DPEXRT_usm_pool_limit));
+    PyModule_AddObject(m, "DPEXRT_usm_pool_set_limit",
+                       PyLong_FromVoidPtr(&DPEXRT_usm_pool_set_limit));
+    PyModule_AddObject(m, "DPEXRT_usm_pool_get_stats",
+                       PyLong_FromVoidPtr(&DPEXRT_usm_pool_get_stats));
+    PyModule_AddObject(m, "DPEXRT_usm_pool_reset_stats",
+                       PyLong_FromVoidPtr(&DPEXRT_usm_pool_reset_stats));
+    PyModule_AddObject(m, "DPEXRT_usm_pool_trim",
+                       PyLong_FromVoidPtr(&DPEXRT_usm_pool_trim));
 
     PyModule_AddObject(m, "c_helpers", build_c_helpers_dict());
     return MOD_SUCCESS_VAL(m);
@@ -15,6 +15,8 @@
 #include "numba/_pymodule.h"
 #include "numba/core/runtime/nrt.h"
 
+#include "dpctl_sycl_interface.h"
+
 /*
  * The MemInfo structure.
  * NOTE: copy from numba/core/runtime/nrt.c
@@ -36,11 +38,16 @@ struct MemInfo
  * The struct is stored in the dtor_info attribute of a MemInfo object and
  * used by the destructor to free the MemInfo and DecRef the Pyobject.
  *
+ * The event is the event of the last asynchronous operation that the runtime
+ * submitted to write the data of the MemInfo, e.g., a fill, or NULL. The data
+ * must not be read or freed before the event completes.
+ *
  */
 typedef struct
 {
     PyObject *owner;
     NRT_MemInfo *mi;
+    DPCTLSyclEventRef event;
 } MemInfoDtorInfo;
 
 typedef struct
@@ -0,0 +1,68 @@
+# SPDX-FileCopyrightText: 2024 Intel Corporation
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""Helpers for the Python modules that call the functions of the
+``_dpexrt_python`` runtime library through ctypes.
+"""
+
+import ctypes
+
+from dpctl import SyclContext, SyclDevice, SyclQueue
+
+from . import _dpexrt_python
+
+_size_t_p = ctypes.POINTER(ctypes.c_size_t)
+
+
+def runtime_function(name: str, restype, *argtypes):
+    """Returns a ctypes function calling the runtime function ``name``.
+
+    Args:
+        name (str): The name of the function in ``_dpexrt_python``.
+        restype: The ctypes type of the result, None for ``void``.
+        argtypes: The ctypes types of the arguments.
+    """
+    return ctypes.CFUNCTYPE(restype, *argtypes)(getattr(_dpexrt_python, name))
+
+
+def runtime_counters(name: str, count: int):
+    """Returns a function calling the runtime function ``name``, that writes
+    ``count`` ``size_t`` values through its pointer arguments, and returning
+    the written values as a tuple.
+    """
+    func = runtime_function(name, None, *([_size_t_p] * count))
+
+    def read():
+        values = [ctypes.c_size_t() for _ in range(count)]
+        func(*(ctypes.byref(value) for value in values))
+        return tuple(value.value for value in values)
+
+    return read
+
+
+def context_device_refs(
+    queue: SyclQueue = None,
+    context: SyclContext = None,
+    device: SyclDevice = None,
+) -> tuple:
+    """Returns the DPCTL references of the SYCL context and device selecting
+    the runtime state to drop, e.g., cached kernels or pooled memory.
+
+    The context and device of a queue are used if a queue is passed. A None
+    reference matches any context or device.
+
+    Raises:
+        ValueError: If a queue is passed along with a context or a device.
+    """
+    if queue is not None:
+        if context is not None or device is not None:
+            raise ValueError(
+                "A queue cannot be combined with a context or a device."
+            )
+        context = queue.sycl_context
+        device = queue.sycl_device
+
+    ctx_ref = context.addressof_ref() if context is not None else None
+    dev_ref = device.addressof_ref() if device is not None else None
+    return ctx_ref, dev_ref
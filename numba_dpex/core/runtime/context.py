@@ -43,8 +43,10 @@ class DpexRTContext(object):
         meminfo,
         itemsize,
         dest_is_float,
+        dest_is_complex,
         value_is_float,
         value,
+        imag_value,
         queue_ref,
     ):
         """
@@ -56,8 +58,10 @@ class DpexRTContext(object):
             meminfo,
             itemsize,
             dest_is_float,
+            dest_is_complex,
             value_is_float,
             value,
+            imag_value,
             queue_ref,
         )
 
@@ -106,11 +110,18 @@ class DpexRTContext(object):
         meminfo,
         itemsize,
         dest_is_float,
+        dest_is_complex,
         value_is_float,
         value,
+        imag_value,
         queue_ref,
     ):
-        """Fills an allocated `MemInfo` with the value specified.
+        """Submits a fill of an allocated `MemInfo` with the value specified.
+
+        The fill is asynchronous. Its event is stored in the `MemInfo` and is
+        waited for by :func:`~context.DpexRTContext.meminfo_wait`, when the
+        data is boxed into a Python object or when the `MemInfo` is
+        destroyed.
 
         The result of the call is checked and if it is `NULL`, i.e. the fill
         operation failed, then a `MemoryError` is raised. If the fill operation
@@ -125,12 +136,17 @@ class DpexRTContext(object):
                 usm allocator.
             dest_is_float (`llvmlite.ir.values.Constant`): An LLVM Constant
                 value specifying if the destination array type is floating
-                point.
+                point or complex.
+            dest_is_complex (`llvmlite.ir.values.Constant`): An LLVM Constant
+                value specifying if the destination array type is complex.
             value_is_float (`llvmlite.ir.values.Constant`): An LLVM Constant
                 value specifying if the input value is a floating point.
-            value (`llvmlite.ir.values.Constant`): An LLVM Constant value
-                specifying if the input value that will be used to fill
-                the array.
+            value (`llvmlite.ir.values.Value`): An LLVM int64 value storing
+                either the integer value or the bits of the double value,
+                or of its real part, that will be used to fill the array.
+            imag_value (`llvmlite.ir.values.Value`): An LLVM int64 value
+                storing the imaginary part of the value, only used if the
+                destination array type is complex.
             queue_ref (`llvmlite.ir.instructions.ExtractValue`): An LLVM ExtractValue
                 instruction object to extract the pointer to the queue from the
                 DpctlSyclQueue type, i.e. %".74" = extractvalue {i8*, i8*} %".73", 1.
@@ -145,7 +161,7 @@ class DpexRTContext(object):
         b = llvmir.IntType(1)
         fnty = llvmir.FunctionType(
             cgutils.voidptr_t,
-            [cgutils.voidptr_t, u64, b, b, u64, cgutils.voidptr_t],
+            [cgutils.voidptr_t, u64, b, b, b, u64, u64, cgutils.voidptr_t],
         )
         fn = cgutils.get_or_insert_function(mod, fnty, "DPEXRT_MemInfo_fill")
         fn.return_value.add_attribute("noalias")
@@ -156,14 +172,65 @@ class DpexRTContext(object):
                 meminfo,
                 itemsize,
                 dest_is_float,
+                dest_is_complex,
                 value_is_float,
                 value,
+                imag_value,
                 queue_ref,
             ],
         )
 
         return ret
 
+    def meminfo_wait(self, builder, meminfo):
+        """Waits for the pending asynchronous write of the data of a `MemInfo`
+        submitted by the runtime, e.g. a fill, if there is one.
+
+        Args:
+            builder (`llvmlite.ir.builder.IRBuilder`): LLVM IR builder.
+            meminfo (`llvmlite.ir.values.Value`): A pointer to the `MemInfo`,
+                may be null.
+        """
+        mod = builder.module
+        fnty = llvmir.FunctionType(llvmir.VoidType(), [cgutils.voidptr_t])
+        fn = cgutils.get_or_insert_function(mod, fnty, "DPEXRT_MemInfo_wait")
+
+        builder.call(fn, [builder.bitcast(meminfo, cgutils.voidptr_t)])
+
+    def meminfo_get_events(self, builder, meminfos, num_meminfos, events):
+        """Stores the events of the pending asynchronous writes of the data of
+        an array of `MemInfo` pointers into an array of event references.
+
+        The events remain owned by the `MemInfo` objects.
+
+        Args:
+            builder (`llvmlite.ir.builder.IRBuilder`): LLVM IR builder.
+            meminfos (`llvmlite.ir.values.Value`): A pointer to an array of
+                `MemInfo` pointers.
+            num_meminfos (`llvmlite.ir.values.Value`): The number of `MemInfo`
+                pointers in the array.
+            events (`llvmlite.ir.values.Value`): A pointer to an array of at
+                least ``num_meminfos`` event references.
+
+        Returns:
+            ret (`llvmlite.ir.instructions.CallInstr`): The number of events
+                stored into ``events``.
+        """
+        mod = builder.module
+        fnty = llvmir.FunctionType(
+            cgutils.intp_t,
+            [
+                cgutils.voidptr_t.as_pointer(),
+                cgutils.intp_t,
+                cgutils.voidptr_t.as_pointer(),
+            ],
+        )
+        fn = cgutils.get_or_insert_function(
+            mod, fnty, "DPEXRT_MemInfo_get_events"
+        )
+
+        return builder.call(fn, [meminfos, num_meminfos, events])
+
     def arraystruct_from_python(self, pyapi, obj, ptr):
         """Generates a call to DPEXRT_sycl_usm_ndarray_from_python C function
         defined in the _DPREXRT_python Python extension.
@@ -478,6 +545,46 @@ class DpexRTContext(object):
 
         return ret
 
+    def acquire_meminfo_and_defer_release(
+        self, builder: llvmir.IRBuilder, args
+    ):
+        """Inserts LLVM IR to call nrt_acquire_meminfo_and_defer_release.
+
+        .. code-block:: c
+
+            DPCTLSyclEventRef
+            DPEXRT_nrt_acquire_meminfo_and_defer_release(
+                NRT_api_functions *nrt,
+                DPCTLSyclQueueRef QRef,
+                NRT_MemInfo **meminfo_array,
+                size_t meminfo_array_size,
+                DPCTLSyclEventRef *depERefs,
+                size_t nDepERefs,
+                int *status,
+            );
+
+        """
+        mod = builder.module
+
+        func_ty = llvmir.FunctionType(
+            cgutils.voidptr_t,
+            [
+                cgutils.voidptr_t,
+                cgutils.voidptr_t,
+                cgutils.voidptr_t.as_pointer(),
+                llvmir.IntType(64),
+                cgutils.voidptr_t.as_pointer(),
+                llvmir.IntType(64),
+                llvmir.IntType(64).as_pointer(),
+            ],
+        )
+        fn = cgutils.get_or_insert_function(
+            mod, func_ty, "DPEXRT_nrt_acquire_meminfo_and_defer_release"
+        )
+        ret = builder.call(fn, args)
+
+        return ret
+
     def build_or_get_kernel(self, builder: llvmir.IRBuilder, args):
         """Inserts LLVM IR to call build_or_get_kernel.
 
@@ -516,6 +623,65 @@ class DpexRTContext(object):
 
         return ret
 
+    def get_call_site_kernel(self, builder: llvmir.IRBuilder, args):
+        """Inserts LLVM IR to call get_call_site_kernel.
+
+        .. code-block:: c
+
+            DPCTLSyclKernelRef
+            DPEXRT_get_call_site_kernel(
+                void **slot,
+                const DPCTLSyclQueueRef qref,
+                size_t il_hash,
+                const char *il,
+                size_t il_length,
+                const char *compile_opts,
+                const char *kernel_name,
+                void *pin,
+            );
+
+        """
+        mod = builder.module
+
+        func_ty = llvmir.FunctionType(
+            cgutils.voidptr_t,
+            [
+                cgutils.voidptr_t.as_pointer(),
+                cgutils.voidptr_t,
+                llvmir.IntType(64),
+                cgutils.voidptr_t,
+                llvmir.IntType(64),
+                cgutils.voidptr_t,
+                cgutils.voidptr_t,
+                cgutils.voidptr_t,
+            ],
+        )
+        fn = cgutils.get_or_insert_function(
+            mod, func_ty, "DPEXRT_get_call_site_kernel"
+        )
+        ret = builder.call(fn, args)
+
+        return ret
+
+    def release_call_site_kernel(self, builder: llvmir.IRBuilder, args):
+        """Inserts LLVM IR to call release_call_site_kernel.
+
+        .. code-block:: c
+
+            void DPEXRT_release_call_site_kernel(void *pin);
+
+        """
+        mod = builder.module
+
+        func_ty = llvmir.FunctionType(
+            llvmir.VoidType(),
+            [cgutils.voidptr_t],
+        )
+        fn = cgutils.get_or_insert_function(
+            mod, func_ty, "DPEXRT_release_call_site_kernel"
+        )
+        builder.call(fn, args)
+
     def kernel_cache_size(self, builder: llvmir.IRBuilder):
         """Inserts LLVM IR to call kernel_cache_size.
 
@@ -0,0 +1,71 @@
+# SPDX-FileCopyrightText: 2024 Intel Corporation
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""Python API to inspect and drain the runtime list of deferred meminfo
+releases.
+
+An asynchronous kernel launch keeps the meminfos of its array arguments alive
+until the kernel is complete. When the ``NUMBA_DPEX_DEFERRED_MEMINFO_RELEASE``
+config flag is set, the runtime does so without submitting a SYCL host task
+for every launch: the meminfos are added to a list of pending releases that
+is polled at safe points, i.e., every asynchronous launch and every array
+allocation done by the runtime. The pending releases of launches that are
+complete are released at these points. Once the list holds a fixed number of
+pending releases, they are handed over to a single host task.
+
+Memory kept alive by a pending release is only released at the next safe
+point. :func:`release_deferred_meminfos` releases it explicitly, and all the
+pending releases are waited for and released when the interpreter exits.
+"""
+
+import atexit
+import ctypes
+from typing import NamedTuple
+
+from ._runtime_api import runtime_function
+
+_release_deferred_meminfos = runtime_function(
+    "DPEXRT_nrt_release_deferred_meminfos", ctypes.c_size_t, ctypes.c_int
+)
+_num_deferred_releases = runtime_function(
+    "DPEXRT_nrt_num_deferred_releases", ctypes.c_size_t
+)
+_release_host_tasks = runtime_function(
+    "DPEXRT_nrt_release_host_tasks", ctypes.c_size_t
+)
+
+
+class DeferredReleaseInfo(NamedTuple):
+    """A snapshot of the state of the deferred meminfo releases."""
+
+    pending: int
+    host_tasks: int
+
+
+def deferred_release_info() -> DeferredReleaseInfo:
+    """Returns the number of pending deferred releases and the number of host
+    tasks submitted by the runtime to release meminfos, either one per launch
+    or one per batch of deferred releases.
+    """
+    return DeferredReleaseInfo(
+        pending=_num_deferred_releases(),
+        host_tasks=_release_host_tasks(),
+    )
+
+
+def release_deferred_meminfos(wait: bool = False) -> int:
+    """Releases the meminfos of the pending deferred releases whose kernels
+    are complete.
+
+    Args:
+        wait (bool, optional): If True, waits for the kernels of all the
+            pending releases and releases all of them.
+
+    Returns:
+        int: The number of released launches.
+    """
+    return _release_deferred_meminfos(1 if wait else 0)
+
+
+atexit.register(release_deferred_meminfos, True)
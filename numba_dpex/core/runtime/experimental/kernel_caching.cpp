@@ -3,6 +3,12 @@
 // SPDX-License-Identifier: Apache-2.0
 
 #include "kernel_caching.h"
+#include <atomic>
+#include <future>
+#include <list>
+#include <memory>
+#include <mutex>
+#include <new>
 #include <unordered_map>
 
 extern "C"
@@ -47,30 +53,304 @@ template <> struct equal_to<CacheKey>
 };
 } // namespace std
 
-// TODO: add cache cleaning
-// https://github.com/IntelPython/numba-dpex/issues/1240
-std::unordered_map<CacheKey, DPCTLSyclKernelRef> sycl_kernel_cache =
-    std::unordered_map<CacheKey, DPCTLSyclKernelRef>();
+namespace
+{
+/*!
+ * @brief A kernel built for a context and a device. The entry owns the
+ * references to the context, the device and the kernel, and releases them
+ * once it is neither cached nor in use by a kernel launch.
+ */
+struct CachedKernel
+{
+    DPCTLSyclContextRef ctx;
+    DPCTLSyclDeviceRef dev;
+    DPCTLSyclKernelRef kernel;
+
+    CachedKernel(DPCTLSyclContextRef ctx,
+                 DPCTLSyclDeviceRef dev,
+                 DPCTLSyclKernelRef kernel)
+        : ctx(ctx), dev(dev), kernel(kernel)
+    {
+    }
+
+    CachedKernel(const CachedKernel &) = delete;
+    CachedKernel &operator=(const CachedKernel &) = delete;
 
-template <class M, class Key, class F>
-typename M::mapped_type &get_else_compute(M &m, Key const &k, F f)
+    ~CachedKernel()
+    {
+        DPCTLKernel_Delete(kernel);
+        DPCTLDevice_Delete(dev);
+        DPCTLContext_Delete(ctx);
+    }
+};
+
+using CachedKernelPtr = std::shared_ptr<const CachedKernel>;
+
+/*!
+ * @brief A least recently used cache of SYCL kernels.
+ *
+ * The cache holds a reference to every cached entry. The reference is dropped
+ * when the entry is evicted, either because the number of entries exceeds the
+ * capacity of the cache or because the entry was purged explicitly, and the
+ * kernel is released once no kernel launch uses it anymore. Every eviction
+ * increments the generation of the cache. The entries that are still cached
+ * at process exit are not released.
+ */
+class KernelLRUCache
 {
-    typedef typename M::mapped_type V;
-    std::pair<typename M::iterator, bool> r =
-        m.insert(typename M::value_type(k, V()));
-    V &v = r.first->second;
-    if (r.second) {
+    using Entry = std::pair<CacheKey, CachedKernelPtr>;
+    using EntryList = std::list<Entry>;
+
+    // Entries ordered from the most recently used to the least recently used.
+    // The context and the device references of a key are owned by its entry.
+    EntryList entries_;
+    std::unordered_map<CacheKey, EntryList::iterator> index_;
+    // The entries being built, keyed by keys whose context and device
+    // references are owned by the building thread.
+    std::unordered_map<CacheKey, std::shared_future<CachedKernelPtr>> building_;
+    // A capacity of zero means that the cache is unbounded.
+    size_t capacity_ = DPEXRT_KERNEL_CACHE_DEFAULT_CAPACITY;
+    size_t hits_ = 0;
+    size_t misses_ = 0;
+    size_t evictions_ = 0;
+    std::atomic<size_t> generation_{0};
+    std::mutex mutex_;
+
+    EntryList::iterator evict(EntryList::iterator it)
+    {
+        generation_.fetch_add(1, std::memory_order_release);
+        index_.erase(it->first);
+        ++evictions_;
+        return entries_.erase(it);
+    }
+
+    void shrink_to_capacity()
+    {
+        while (capacity_ != 0 && entries_.size() > capacity_) {
+            DPEXRT_DEBUG(
+                drt_debug_print("DPEXRT-DEBUG: evicting cached kernel.\n"););
+            evict(std::prev(entries_.end()));
+        }
+    }
+
+public:
+    /*!
+     * @brief Returns the cached entry for the key, calling ``build`` to create
+     * the kernel if the key is not cached. The references to the context and
+     * device in the key are stolen. Returns an empty pointer if the kernel
+     * could not be built.
+     *
+     * The kernel is built without holding the lock of the cache, so that the
+     * kernels of different keys are built concurrently. The threads that need
+     * a key while it is built wait for the building thread.
+     */
+    template <class F> CachedKernelPtr get_else_compute(CacheKey key, F build)
+    {
+        std::unique_lock<std::mutex> lock(mutex_);
+
+        auto found = index_.find(key);
+        if (found != index_.end()) {
+            DPEXRT_DEBUG(
+                drt_debug_print("DPEXRT-DEBUG: using cached kernel.\n"););
+            ++hits_;
+            entries_.splice(entries_.begin(), entries_, found->second);
+            DPCTLDevice_Delete(std::get<DPCTLSyclDeviceRef>(key));
+            DPCTLContext_Delete(std::get<DPCTLSyclContextRef>(key));
+            return found->second->second;
+        }
+
+        auto pending = building_.find(key);
+        if (pending != building_.end()) {
+            DPEXRT_DEBUG(
+                drt_debug_print(
+                    "DPEXRT-DEBUG: waiting for kernel being built.\n"););
+            ++hits_;
+            std::shared_future<CachedKernelPtr> built = pending->second;
+            lock.unlock();
+            DPCTLDevice_Delete(std::get<DPCTLSyclDeviceRef>(key));
+            DPCTLContext_Delete(std::get<DPCTLSyclContextRef>(key));
+            return built.get();
+        }
+
         DPEXRT_DEBUG(drt_debug_print("DPEXRT-DEBUG: building kernel.\n"););
-        f(v);
+        ++misses_;
+        std::promise<CachedKernelPtr> promise;
+        building_.emplace(key, promise.get_future().share());
+        lock.unlock();
+
+        CachedKernelPtr entry;
+        DPCTLSyclKernelRef k_ref = build();
+        if (k_ref != nullptr) {
+            entry = std::make_shared<const CachedKernel>(
+                std::get<DPCTLSyclContextRef>(key),
+                std::get<DPCTLSyclDeviceRef>(key), k_ref);
+        }
+
+        lock.lock();
+        building_.erase(key);
+        if (entry) {
+            entries_.emplace_front(key, entry);
+            index_.emplace(key, entries_.begin());
+            shrink_to_capacity();
+        }
+        lock.unlock();
+
+        if (!entry) {
+            DPCTLDevice_Delete(std::get<DPCTLSyclDeviceRef>(key));
+            DPCTLContext_Delete(std::get<DPCTLSyclContextRef>(key));
+        }
+        promise.set_value(entry);
+
+        return entry;
+    }
+
+    /*!
+     * @brief Returns the number of evictions since the start of the process.
+     * An entry obtained from the cache is still cached if the generation did
+     * not change since it was obtained.
+     */
+    size_t generation() const
+    {
+        return generation_.load(std::memory_order_acquire);
     }
-    else {
-        DPEXRT_DEBUG(drt_debug_print("DPEXRT-DEBUG: using cached kernel.\n"););
-        DPCTLDevice_Delete(std::get<DPCTLSyclDeviceRef>(k));
-        DPCTLContext_Delete(std::get<DPCTLSyclContextRef>(k));
+
+    size_t size()
+    {
+        std::lock_guard<std::mutex> lock(mutex_);
+        return entries_.size();
+    }
+
+    size_t capacity()
+    {
+        std::lock_guard<std::mutex> lock(mutex_);
+        return capacity_;
     }
-    return v;
+
+    void set_capacity(size_t capacity)
+    {
+        std::lock_guard<std::mutex> lock(mutex_);
+        capacity_ = capacity;
+        shrink_to_capacity();
+    }
+
+    void get_stats(size_t *hits, size_t *misses, size_t *evictions)
+    {
+        std::lock_guard<std::mutex> lock(mutex_);
+        *hits = hits_;
+        *misses = misses_;
+        *evictions = evictions_;
+    }
+
+    void reset_stats()
+    {
+        std::lock_guard<std::mutex> lock(mutex_);
+        hits_ = misses_ = evictions_ = 0;
+    }
+
+    /*!
+     * @brief Evicts all entries matching the context and the device. A NULL
+     * context or device matches every context or device.
+     */
+    size_t purge(const DPCTLSyclContextRef ctx, const DPCTLSyclDeviceRef dev)
+    {
+        std::lock_guard<std::mutex> lock(mutex_);
+        size_t purged = 0;
+
+        for (auto it = entries_.begin(); it != entries_.end();) {
+            const CacheKey &key = it->first;
+            if ((ctx == nullptr ||
+                 DPCTLContext_AreEq(ctx, std::get<DPCTLSyclContextRef>(key))) &&
+                (dev == nullptr ||
+                 DPCTLDevice_AreEq(dev, std::get<DPCTLSyclDeviceRef>(key))))
+            {
+                it = evict(it);
+                ++purged;
+            }
+            else {
+                ++it;
+            }
+        }
+
+        return purged;
+    }
+};
+
+KernelLRUCache sycl_kernel_cache;
+
+/*!
+ * @brief The kernel launch call site of the generated host code that a slot
+ * points to. The call site remembers the first entry of the kernel cache that
+ * it resolved along with the generation of the cache at that time. It does not
+ * keep the entry alive, so evicting or purging the entry releases the kernel.
+ * A call site is allocated by the first launch and is never released, like
+ * the compiled code of the call site itself.
+ */
+struct CallSite
+{
+    std::mutex mutex;
+    std::weak_ptr<const CachedKernel> entry;
+    size_t generation = 0;
+};
+
+// The pin of a call site kernel is a buffer of two pointers in the frame of
+// the generated host code holding a reference to the cache entry.
+static_assert(sizeof(CachedKernelPtr) == 2 * sizeof(void *),
+              "The kernel pin must hold a std::shared_ptr.");
+static_assert(alignof(CachedKernelPtr) <= alignof(void *),
+              "The kernel pin must hold a std::shared_ptr.");
+
+std::atomic<size_t> call_site_hits{0};
+
+CachedKernelPtr get_cached_kernel(const DPCTLSyclContextRef ctx,
+                                  const DPCTLSyclDeviceRef dev,
+                                  size_t il_hash,
+                                  const char *il,
+                                  size_t il_length,
+                                  const char *compile_opts,
+                                  const char *kernel_name)
+{
+    CacheKey key = std::make_tuple(ctx, dev, il_hash);
+
+    DPEXRT_DEBUG(auto ctx_hash = std::hash<DPCTLSyclContextRef>{}(ctx);
+                 auto dev_hash = std::hash<DPCTLSyclDeviceRef>{}(dev);
+                 drt_debug_print("DPEXRT-DEBUG: key hashes: %d %d %d.\n",
+                                 ctx_hash, dev_hash, il_hash););
+
+    auto entry = sycl_kernel_cache.get_else_compute(
+        key, [ctx, dev, il, il_length, compile_opts, kernel_name]() {
+            auto kb_ref = DPCTLKernelBundle_CreateFromSpirv(
+                ctx, dev, il, il_length, compile_opts);
+            auto k_ref = DPCTLKernelBundle_GetKernel(kb_ref, kernel_name);
+            DPCTLKernelBundle_Delete(kb_ref);
+            return k_ref;
+        });
+
+    DPEXRT_DEBUG(drt_debug_print("DPEXRT-DEBUG: kernel hash size: %d.\n",
+                                 sycl_kernel_cache.size()););
+
+    return entry;
 }
 
+CallSite *get_call_site(void **slot)
+{
+    auto call_site =
+        static_cast<CallSite *>(__atomic_load_n(slot, __ATOMIC_ACQUIRE));
+    if (call_site != nullptr)
+        return call_site;
+
+    auto new_call_site = new CallSite();
+    void *expected = nullptr;
+    if (__atomic_compare_exchange_n(slot, &expected,
+                                    static_cast<void *>(new_call_site), false,
+                                    __ATOMIC_ACQ_REL, __ATOMIC_ACQUIRE))
+    {
+        return new_call_site;
+    }
+    delete new_call_site;
+    return static_cast<CallSite *>(expected);
+}
+} // namespace
+
 extern "C"
 {
     DPCTLSyclKernelRef DPEXRT_build_or_get_kernel(const DPCTLSyclContextRef ctx,
@@ -84,28 +364,106 @@ extern "C"
         DPEXRT_DEBUG(
             drt_debug_print("DPEXRT-DEBUG: in build or get kernel.\n"););
 
-        CacheKey key = std::make_tuple(ctx, dev, il_hash);
+        auto entry = get_cached_kernel(ctx, dev, il_hash, il, il_length,
+                                       compile_opts, kernel_name);
+
+        return entry ? DPCTLKernel_Copy(entry->kernel) : nullptr;
+    }
+
+    DPCTLSyclKernelRef DPEXRT_get_call_site_kernel(void **slot,
+                                                   const DPCTLSyclQueueRef qref,
+                                                   size_t il_hash,
+                                                   const char *il,
+                                                   size_t il_length,
+                                                   const char *compile_opts,
+                                                   const char *kernel_name,
+                                                   void *pin)
+    {
+        using dpctl::syclinterface::unwrap;
+
+        CallSite *call_site = get_call_site(slot);
+        CachedKernelPtr entry;
+        bool stale = true;
 
-        DPEXRT_DEBUG(auto ctx_hash = std::hash<DPCTLSyclContextRef>{}(ctx);
-                     auto dev_hash = std::hash<DPCTLSyclDeviceRef>{}(dev);
-                     drt_debug_print("DPEXRT-DEBUG: key hashes: %d %d %d.\n",
-                                     ctx_hash, dev_hash, il_hash););
+        {
+            std::lock_guard<std::mutex> lock(call_site->mutex);
+            // An eviction since the call site resolved its entry may have
+            // removed the entry from the cache.
+            if (call_site->generation == sycl_kernel_cache.generation()) {
+                entry = call_site->entry.lock();
+                stale = !entry;
+            }
+        }
 
-        auto k_ref = get_else_compute(
-            sycl_kernel_cache, key,
-            [ctx, dev, il, il_length, compile_opts,
-             kernel_name](DPCTLSyclKernelRef &k_ref) {
-                auto kb_ref = DPCTLKernelBundle_CreateFromSpirv(
-                    ctx, dev, il, il_length, compile_opts);
-                k_ref = DPCTLKernelBundle_GetKernel(kb_ref, kernel_name);
-                DPCTLKernelBundle_Delete(kb_ref);
-            });
+        // The comparison of the SYCL objects neither allocates new dpctl
+        // references nor takes the lock of the kernel cache.
+        if (entry) {
+            const sycl::queue *q = unwrap<sycl::queue>(qref);
+            if (q->get_context() == *unwrap<sycl::context>(entry->ctx) &&
+                q->get_device() == *unwrap<sycl::device>(entry->dev))
+            {
+                call_site_hits.fetch_add(1, std::memory_order_relaxed);
+                new (pin) CachedKernelPtr(std::move(entry));
+                return static_cast<CachedKernelPtr *>(pin)->get()->kernel;
+            }
+        }
 
-        DPEXRT_DEBUG(drt_debug_print("DPEXRT-DEBUG: kernel hash size: %d.\n",
-                                     sycl_kernel_cache.size()););
+        // The generation is read before the lookup, so that an eviction
+        // during the lookup leaves the call site stale.
+        size_t generation = sycl_kernel_cache.generation();
+        entry = get_cached_kernel(DPCTLQueue_GetContext(qref),
+                                  DPCTLQueue_GetDevice(qref), il_hash, il,
+                                  il_length, compile_opts, kernel_name);
+
+        // The call site keeps the first entry that it resolves until the
+        // entry is evicted. The launches on other contexts or devices look up
+        // the kernel cache.
+        if (stale && entry) {
+            std::lock_guard<std::mutex> lock(call_site->mutex);
+            call_site->entry = entry;
+            call_site->generation = generation;
+        }
+
+        DPCTLSyclKernelRef k_ref = entry ? entry->kernel : nullptr;
+        new (pin) CachedKernelPtr(std::move(entry));
+        return k_ref;
+    }
 
-        return DPCTLKernel_Copy(k_ref);
+    void DPEXRT_release_call_site_kernel(void *pin)
+    {
+        static_cast<CachedKernelPtr *>(pin)->~CachedKernelPtr();
     }
 
+    size_t DPEXRT_kernel_call_site_hits() { return call_site_hits.load(); }
+
     size_t DPEXRT_kernel_cache_size() { return sycl_kernel_cache.size(); }
+
+    size_t DPEXRT_kernel_cache_capacity()
+    {
+        return sycl_kernel_cache.capacity();
+    }
+
+    void DPEXRT_kernel_cache_set_capacity(size_t capacity)
+    {
+        sycl_kernel_cache.set_capacity(capacity);
+    }
+
+    void DPEXRT_kernel_cache_get_stats(size_t *hits,
+                                       size_t *misses,
+                                       size_t *evictions)
+    {
+        sycl_kernel_cache.get_stats(hits, misses, evictions);
+    }
+
+    void DPEXRT_kernel_cache_reset_stats()
+    {
+        sycl_kernel_cache.reset_stats();
+        call_site_hits.store(0);
+    }
+
+    size_t DPEXRT_kernel_cache_purge(const DPCTLSyclContextRef ctx,
+                                     const DPCTLSyclDeviceRef dev)
+    {
+        return sycl_kernel_cache.purge(ctx, dev);
+    }
 }
@@ -14,6 +14,12 @@
 #include "dpctl_capi.h"
 #include "dpctl_sycl_interface.h"
 
+/*!
+ * @brief The default maximum number of kernels kept in the kernel cache. A
+ * capacity of zero means the cache is unbounded.
+ */
+#define DPEXRT_KERNEL_CACHE_DEFAULT_CAPACITY 1024
+
 #ifdef __cplusplus
 extern "C"
 {
@@ -43,12 +49,111 @@ extern "C"
                                                   const char *compile_opts,
                                                   const char *kernel_name);
 
+    /*!
+     * @brief returns the kernel for the SPIRV file at a kernel launch call
+     * site of the generated host code. The call site remembers the first
+     * kernel cache entry that it resolves. If no kernel was evicted from the
+     * kernel cache since then and the queue's context and device match the
+     * ones of the entry, the entry's kernel is returned without looking up the
+     * kernel cache. Otherwise the kernel is taken from the kernel cache as done
+     * by DPEXRT_build_or_get_kernel. The call site does not keep its entry
+     * alive, so evicting or purging the entry releases the kernel. The
+     * reference to the queue is not stolen.
+     *
+     * @param    slot           Pointer to the call site's slot, initially
+     *                          holding NULL,
+     * @param    qref           Queue reference,
+     * @param    il_hash        Hash of the SPIRV binary data,
+     * @param    il             SPIRV binary data,
+     * @param    il_length      SPIRV binary data size,
+     * @param    compile_opts   compile options,
+     * @param    kernel_name    kernel name inside SPIRV binary data to return
+     *                          reference to,
+     * @param    pin            Buffer of two pointers that keeps the returned
+     *                          kernel alive until it is passed to
+     *                          DPEXRT_release_call_site_kernel.
+     *
+     * @return   {return}       Kernel reference to the compiled SPIR-V, owned
+     *                          by the pin.
+     */
+    DPCTLSyclKernelRef DPEXRT_get_call_site_kernel(void **slot,
+                                                   const DPCTLSyclQueueRef qref,
+                                                   size_t il_hash,
+                                                   const char *il,
+                                                   size_t il_length,
+                                                   const char *compile_opts,
+                                                   const char *kernel_name,
+                                                   void *pin);
+
+    /*!
+     * @brief releases the kernel pinned by DPEXRT_get_call_site_kernel. The
+     * kernel reference returned along with the pin must not be used after.
+     *
+     * @param    pin            The pin passed to DPEXRT_get_call_site_kernel.
+     */
+    void DPEXRT_release_call_site_kernel(void *pin);
+
+    /*!
+     * @brief returns the number of launches that used the kernel kept at their
+     * call site since the start of the process or the last call to
+     * DPEXRT_kernel_cache_reset_stats.
+     */
+    size_t DPEXRT_kernel_call_site_hits();
+
     /*!
      * @brief returns cache size. Intended for test purposes only
      *
      * @return   {return}       Kernel cache size.
      */
     size_t DPEXRT_kernel_cache_size();
+
+    /*!
+     * @brief returns the maximum number of kernels kept in the cache. Zero
+     * means the cache is unbounded.
+     *
+     * @return   {return}       Kernel cache capacity.
+     */
+    size_t DPEXRT_kernel_cache_capacity();
+
+    /*!
+     * @brief sets the maximum number of kernels kept in the cache. If the
+     * cache holds more kernels than the new capacity the least recently used
+     * kernels are evicted.
+     *
+     * @param    capacity       New capacity, zero makes the cache unbounded.
+     */
+    void DPEXRT_kernel_cache_set_capacity(size_t capacity);
+
+    /*!
+     * @brief writes the number of cache hits, misses and evictions since the
+     * start of the process or the last call to
+     * DPEXRT_kernel_cache_reset_stats.
+     *
+     * @param    hits           Output number of cache hits,
+     * @param    misses         Output number of cache misses,
+     * @param    evictions      Output number of evicted kernels.
+     */
+    void DPEXRT_kernel_cache_get_stats(size_t *hits,
+                                       size_t *misses,
+                                       size_t *evictions);
+
+    /*!
+     * @brief resets the hit, miss and eviction counters and the number of
+     * call site hits to zero.
+     */
+    void DPEXRT_kernel_cache_reset_stats();
+
+    /*!
+     * @brief evicts all kernels cached for the context and the device. The
+     * references are not stolen.
+     *
+     * @param    ctx            Context reference, NULL matches any context,
+     * @param    dev            Device reference, NULL matches any device.
+     *
+     * @return   {return}       Number of evicted kernels.
+     */
+    size_t DPEXRT_kernel_cache_purge(const DPCTLSyclContextRef ctx,
+                                     const DPCTLSyclDeviceRef dev);
 #ifdef __cplusplus
 }
 #endif
@@ -7,6 +7,118 @@
 #include "_dbg_printer.h"
 #include "syclinterface/dpctl_sycl_type_casters.hpp"
 #include <CL/sycl.hpp>
+#include <atomic>
+#include <list>
+#include <mutex>
+#include <vector>
+
+namespace
+{
+/*!
+ * @brief Meminfos acquired for a kernel launch and released once the events
+ * of the launch are complete.
+ */
+struct DeferredRelease
+{
+    NRT_api_functions *nrt;
+    sycl::context ctx;
+    std::vector<sycl::event> events;
+    std::vector<NRT_MemInfo *> meminfos;
+};
+
+std::mutex deferred_releases_mutex;
+std::list<DeferredRelease> deferred_releases;
+// The size of deferred_releases, read without the lock by the safe points to
+// skip polling when nothing is pending.
+std::atomic<size_t> num_deferred_releases{0};
+std::atomic<size_t> release_host_tasks{0};
+
+bool is_complete(const std::vector<sycl::event> &events)
+{
+    for (const auto &ev : events) {
+        if (ev.get_info<sycl::info::event::command_execution_status>() !=
+            sycl::info::event_command_status::complete)
+            return false;
+    }
+    return true;
+}
+
+void release_meminfos(NRT_api_functions *nrt,
+                      const std::vector<NRT_MemInfo *> &meminfos)
+{
+    for (auto mi : meminfos) {
+        nrt->release(mi);
+    }
+}
+
+/*!
+ * @brief Moves the pending releases whose events are complete, or all of
+ * them if wait is set, out of deferred_releases. The caller holds the lock.
+ */
+std::list<DeferredRelease> take_completed_releases(bool wait)
+{
+    std::list<DeferredRelease> completed;
+    for (auto it = deferred_releases.begin(); it != deferred_releases.end();) {
+        auto next = std::next(it);
+        if (wait || is_complete(it->events))
+            completed.splice(completed.end(), deferred_releases, it);
+        it = next;
+    }
+    num_deferred_releases = deferred_releases.size();
+    return completed;
+}
+
+/*!
+ * @brief Releases the meminfos of taken releases, waiting for their events
+ * if wait is set. Must be called without the lock, as a released meminfo may
+ * run a destructor that ends up in the runtime again.
+ */
+size_t run_releases(std::list<DeferredRelease> &releases, bool wait)
+{
+    for (auto &entry : releases) {
+        if (wait)
+            sycl::event::wait(entry.events);
+        release_meminfos(entry.nrt, entry.meminfos);
+    }
+    return releases.size();
+}
+
+/*!
+ * @brief Submits one host task that releases all the pending releases of
+ * the context of a queue once their events are complete.
+ */
+sycl::event submit_batched_release(sycl::queue *q)
+{
+    std::vector<DeferredRelease> batch;
+    {
+        std::lock_guard<std::mutex> lock(deferred_releases_mutex);
+        const auto ctx = q->get_context();
+        for (auto it = deferred_releases.begin();
+             it != deferred_releases.end();)
+        {
+            auto next = std::next(it);
+            if (it->ctx == ctx) {
+                batch.push_back(std::move(*it));
+                deferred_releases.erase(it);
+            }
+            it = next;
+        }
+        num_deferred_releases = deferred_releases.size();
+    }
+
+    ++release_host_tasks;
+    return q->submit([&](sycl::handler &cgh) {
+        for (const auto &entry : batch) {
+            cgh.depends_on(entry.events);
+        }
+        cgh.host_task([batch]() {
+            for (const auto &entry : batch) {
+                release_meminfos(entry.nrt, entry.meminfos);
+            }
+        });
+    });
+}
+} // namespace
 
 extern "C"
 {
@@ -37,6 +149,7 @@ extern "C"
         DPEXRT_DEBUG(drt_debug_print("DPEXRT-DEBUG: acquired meminfo.\n"););
 
         try {
+            ++release_host_tasks;
             sycl::event ht_ev = q->submit([&](sycl::handler &cgh) {
                 for (size_t ev_id = 0; ev_id < nDepERefs; ++ev_id) {
                     cgh.depends_on(*(unwrap<sycl::event>(depERefs[ev_id])));
@@ -68,4 +181,90 @@ extern "C"
         *status = result_other_abnormal;
         return nullptr;
     }
+
+    DPCTLSyclEventRef
+    DPEXRT_nrt_acquire_meminfo_and_defer_release(NRT_api_functions *nrt,
+                                                 DPCTLSyclQueueRef QRef,
+                                                 NRT_MemInfo **meminfo_array,
+                                                 size_t meminfo_array_size,
+                                                 DPCTLSyclEventRef *depERefs,
+                                                 size_t nDepERefs,
+                                                 int *status)
+    {
+        DPEXRT_DEBUG(
+            drt_debug_print("DPEXRT-DEBUG: deferring nrt meminfo release.\n"););
+
+        using dpctl::syclinterface::unwrap;
+        using dpctl::syclinterface::wrap;
+
+        sycl::queue *q = unwrap<sycl::queue>(QRef);
+
+        try {
+            DeferredRelease entry{nrt, q->get_context(), {}, {}};
+            entry.events.reserve(nDepERefs);
+            for (size_t ev_id = 0; ev_id < nDepERefs; ++ev_id) {
+                entry.events.push_back(*(unwrap<sycl::event>(depERefs[ev_id])));
+            }
+            entry.meminfos.assign(meminfo_array,
+                                  meminfo_array + meminfo_array_size);
+
+            // The returned event completes with the launch. A single
+            // dependent event is returned as is to avoid a barrier.
+            sycl::event ev = (entry.events.size() == 1)
+                                 ? entry.events.front()
+                                 : q->ext_oneapi_submit_barrier(entry.events);
+
+            for (size_t i = 0; i < meminfo_array_size; ++i) {
+                nrt->acquire(meminfo_array[i]);
+            }
+
+            std::list<DeferredRelease> completed;
+            bool batch = false;
+            {
+                std::lock_guard<std::mutex> lock(deferred_releases_mutex);
+                completed = take_completed_releases(false);
+                if (!entry.meminfos.empty())
+                    deferred_releases.push_back(std::move(entry));
+                num_deferred_releases = deferred_releases.size();
+                batch = deferred_releases.size() >=
+                        DPEXRT_DEFERRED_RELEASE_BATCH_SIZE;
+            }
+            run_releases(completed, false);
+
+            // Too many launches are still running, e.g., when a long stream
+            // of kernels is submitted without any synchronization. Their
+            // meminfos are released by a single host task instead of
+            // growing the list.
+            if (batch)
+                submit_batched_release(q);
+
+            constexpr int result_ok = 0;
+
+            *status = result_ok;
+            auto e_ptr = new sycl::event(ev);
+            return wrap<sycl::event>(e_ptr);
+        } catch (const std::exception &e) {
+            constexpr int result_std_exception = 1;
+
+            *status = result_std_exception;
+            return nullptr;
+        }
+    }
+
+    size_t DPEXRT_nrt_release_deferred_meminfos(int wait)
+    {
+        if (num_deferred_releases == 0)
+            return 0;
+
+        std::list<DeferredRelease> completed;
+        {
+            std::lock_guard<std::mutex> lock(deferred_releases_mutex);
+            completed = take_completed_releases(wait != 0);
+        }
+        return run_releases(completed, wait != 0);
+    }
+
+    size_t DPEXRT_nrt_num_deferred_releases() { return num_deferred_releases; }
+
+    size_t DPEXRT_nrt_release_host_tasks() { return release_host_tasks; }
 }
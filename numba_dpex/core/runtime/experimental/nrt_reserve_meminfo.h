@@ -15,6 +15,12 @@
 #include "dpctl_capi.h"
 #include "numba/core/runtime/nrt_external.h"
 
+/*!
+ * @brief The number of pending deferred releases at which the pending
+ * releases of a SYCL context are handed over to a single host task.
+ */
+#define DPEXRT_DEFERRED_RELEASE_BATCH_SIZE 256
+
 #ifdef __cplusplus
 extern "C"
 {
@@ -41,6 +47,58 @@ extern "C"
                                                     DPCTLSyclEventRef *depERefs,
                                                     size_t nDepERefs,
                                                     int *status);
+
+    /*!
+     * @brief Acquires meminfos and defers their release until the dependent
+     * events are complete, without submitting a host task.
+     *
+     * The meminfos are added to a list of pending releases that is polled at
+     * safe points: every call of this function, every allocation done by
+     * DPEXRT_MemInfo_alloc and every call of
+     * DPEXRT_nrt_release_deferred_meminfos. When the list holds
+     * DPEXRT_DEFERRED_RELEASE_BATCH_SIZE pending releases, the releases of
+     * the queue's context are handed over to a single host task.
+     *
+     * @param    nrt            NRT public API functions,
+     * @param    QRef           Queue reference,
+     * @param    meminfo_array  Array of meminfo pointers to perform actions on,
+     * @param    meminfo_array_size Length of meminfo_array,
+     * @param    depERefs       Array of events the release waits for,
+     * @param    nDepERefs      Length of depERefs,
+     * @param    status         Variable to write status to. Same style as
+     * dpctl,
+     * @return   {return}       Event reference that completes with the
+     * dependent events.
+     */
+    DPCTLSyclEventRef
+    DPEXRT_nrt_acquire_meminfo_and_defer_release(NRT_api_functions *nrt,
+                                                 DPCTLSyclQueueRef QRef,
+                                                 NRT_MemInfo **meminfo_array,
+                                                 size_t meminfo_array_size,
+                                                 DPCTLSyclEventRef *depERefs,
+                                                 size_t nDepERefs,
+                                                 int *status);
+
+    /*!
+     * @brief Releases the meminfos of the pending deferred releases whose
+     * events are complete.
+     *
+     * @param    wait           If not zero, waits for the events of all the
+     * pending releases and releases all of them.
+     * @return   {return}       The number of released launches.
+     */
+    size_t DPEXRT_nrt_release_deferred_meminfos(int wait);
+
+    /*!
+     * @brief Returns the number of pending deferred releases.
+     */
+    size_t DPEXRT_nrt_num_deferred_releases();
+
+    /*!
+     * @brief Returns the number of host tasks submitted to release meminfos,
+     * including the batched releases of the deferred releases.
+     */
+    size_t DPEXRT_nrt_release_host_tasks();
 #ifdef __cplusplus
 }
 #endif
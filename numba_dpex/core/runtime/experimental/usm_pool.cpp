@@ -0,0 +1,369 @@
+// SPDX-FileCopyrightText: 2024 Intel Corporation
+//
+// SPDX-License-Identifier: Apache-2.0
+
+#include "usm_pool.h"
+#include <cstdint>
+#include <list>
+#include <map>
+#include <mutex>
+#include <unordered_map>
+#include <vector>
+
+extern "C"
+{
+#include "dpctl_capi.h"
+#include "dpctl_sycl_interface.h"
+
+#include "_dbg_printer.h"
+}
+
+namespace
+{
+// The size of the smallest block handed out by the pool.
+constexpr size_t MIN_BLOCK_SIZE = 256;
+
+// The number of size classes between two consecutive powers of two.
+constexpr size_t SIZE_CLASSES_PER_POWER_OF_TWO = 4;
+
+/*!
+ * @brief Returns the size of the blocks of the size class of an allocation.
+ *
+ * Sizes up to MIN_BLOCK_SIZE share a single class. Larger sizes are rounded
+ * up to a multiple of a quarter of the largest power of two not greater than
+ * the size, so that a block wastes at most a quarter of its size.
+ */
+size_t block_size_for(size_t size)
+{
+    if (size <= MIN_BLOCK_SIZE)
+        return MIN_BLOCK_SIZE;
+
+    size_t power_of_two = MIN_BLOCK_SIZE;
+    while (power_of_two <= size / 2)
+        power_of_two *= 2;
+
+    size_t step = power_of_two / SIZE_CLASSES_PER_POWER_OF_TWO;
+    if (size > SIZE_MAX - step)
+        return size;
+
+    return (size + step - 1) / step * step;
+}
+
+void *usm_malloc(size_t size, size_t usm_type, const DPCTLSyclQueueRef qref)
+{
+    switch (usm_type) {
+    case 1:
+        return reinterpret_cast<void *>(DPCTLmalloc_device(size, qref));
+    case 2:
+        return reinterpret_cast<void *>(DPCTLmalloc_shared(size, qref));
+    case 3:
+        return reinterpret_cast<void *>(DPCTLmalloc_host(size, qref));
+    default:
+        DPEXRT_DEBUG(drt_debug_print("DPEXRT-ERROR: Encountered an unknown usm "
+                                     "allocation type (%zu) at %s, line %d\n",
+                                     usm_type, __FILE__, __LINE__));
+        return nullptr;
+    }
+}
+
+/*!
+ * @brief The free blocks kept for a SYCL context and device. USM memory
+ * belongs to a context and a device and not to a queue, so every queue of the
+ * same context and device shares the blocks.
+ */
+struct DevicePool
+{
+    DPCTLSyclContextRef ctx;
+    DPCTLSyclDeviceRef dev;
+    // The free blocks of every usm type, indexed by the usm type minus one,
+    // keyed by the block size.
+    std::map<size_t, std::vector<void *>> free_blocks[3];
+};
+
+struct Block
+{
+    DevicePool *pool;
+    size_t usm_type;
+    size_t size;
+};
+
+/*!
+ * @brief A caching pool of USM blocks organized in size classes.
+ *
+ * Blocks returned to the pool are kept for later allocations of the same
+ * size class, the same usm type and the same context and device, as long as
+ * the total size of the free blocks does not exceed the limit of the pool.
+ * Blocks are handed out again without any synchronization, i.e., exactly at
+ * the point the memory would otherwise have been released with sycl::free.
+ * The pool owns the context and device references of its device pools and
+ * the free blocks, none of which are released at process exit.
+ */
+class USMPool
+{
+    // A list keeps the addresses of the device pools stable.
+    std::list<DevicePool> pools_;
+    std::unordered_map<void *, Block> in_use_;
+    bool enabled_ = false;
+    size_t limit_ = DPEXRT_USM_POOL_DEFAULT_LIMIT;
+    size_t hits_ = 0;
+    size_t misses_ = 0;
+    size_t bytes_in_use_ = 0;
+    size_t bytes_cached_ = 0;
+    size_t peak_bytes_ = 0;
+    std::mutex mutex_;
+
+    DevicePool &get_pool(const DPCTLSyclQueueRef qref)
+    {
+        DPCTLSyclContextRef ctx = DPCTLQueue_GetContext(qref);
+        DPCTLSyclDeviceRef dev = DPCTLQueue_GetDevice(qref);
+
+        for (auto &pool : pools_) {
+            if (DPCTLContext_AreEq(pool.ctx, ctx) &&
+                DPCTLDevice_AreEq(pool.dev, dev))
+            {
+                DPCTLContext_Delete(ctx);
+                DPCTLDevice_Delete(dev);
+                return pool;
+            }
+        }
+
+        pools_.emplace_back();
+        pools_.back().ctx = ctx;
+        pools_.back().dev = dev;
+        return pools_.back();
+    }
+
+    size_t release_free_blocks(DevicePool &pool)
+    {
+        size_t released = 0;
+
+        for (auto &blocks_by_size : pool.free_blocks) {
+            for (auto &entry : blocks_by_size) {
+                for (void *data : entry.second) {
+                    DPCTLfree_with_context(
+                        reinterpret_cast<DPCTLSyclUSMRef>(data), pool.ctx);
+                    released += entry.first;
+                }
+            }
+            blocks_by_size.clear();
+        }
+        bytes_cached_ -= released;
+
+        return released;
+    }
+
+    void shrink_to_limit()
+    {
+        for (auto &pool : pools_) {
+            for (auto &blocks_by_size : pool.free_blocks) {
+                // Releases the largest blocks first.
+                for (auto it = blocks_by_size.rbegin();
+                     it != blocks_by_size.rend() && bytes_cached_ > limit_;
+                     ++it)
+                {
+                    auto &blocks = it->second;
+                    while (!blocks.empty() && bytes_cached_ > limit_) {
+                        DPCTLfree_with_context(
+                            reinterpret_cast<DPCTLSyclUSMRef>(blocks.back()),
+                            pool.ctx);
+                        blocks.pop_back();
+                        bytes_cached_ -= it->first;
+                    }
+                }
+            }
+        }
+    }
+
+public:
+    void *malloc(size_t size, size_t usm_type, const DPCTLSyclQueueRef qref)
+    {
+        if (usm_type < 1 || usm_type > 3)
+            return usm_malloc(size, usm_type, qref);
+
+        size_t block_size = block_size_for(size);
+        std::lock_guard<std::mutex> lock(mutex_);
+        DevicePool &pool = get_pool(qref);
+        auto &blocks = pool.free_blocks[usm_type - 1][block_size];
+        void *data = nullptr;
+
+        if (!blocks.empty()) {
+            DPEXRT_DEBUG(
+                drt_debug_print(
+                    "DPEXRT-DEBUG: reusing a pooled usm block of %zu bytes.\n",
+                    block_size););
+            ++hits_;
+            data = blocks.back();
+            blocks.pop_back();
+            bytes_cached_ -= block_size;
+        }
+        else {
+            DPEXRT_DEBUG(
+                drt_debug_print(
+                    "DPEXRT-DEBUG: allocating a usm block of %zu bytes.\n",
+                    block_size););
+            ++misses_;
+            data = usm_malloc(block_size, usm_type, qref);
+            // The device may be out of memory because of the free blocks of
+            // the pool, in which case they are released and the allocation
+            // is retried.
+            if (data == nullptr && release_free_blocks(pool) > 0)
+                data = usm_malloc(block_size, usm_type, qref);
+            if (data == nullptr)
+                return nullptr;
+        }
+
+        in_use_.emplace(data, Block{&pool, usm_type, block_size});
+        bytes_in_use_ += block_size;
+        if (bytes_in_use_ + bytes_cached_ > peak_bytes_)
+            peak_bytes_ = bytes_in_use_ + bytes_cached_;
+
+        return data;
+    }
+
+    void free(void *data, const DPCTLSyclQueueRef qref)
+    {
+        std::lock_guard<std::mutex> lock(mutex_);
+
+        auto found = in_use_.find(data);
+        if (found == in_use_.end()) {
+            DPCTLfree_with_queue(reinterpret_cast<DPCTLSyclUSMRef>(data), qref);
+            return;
+        }
+
+        Block block = found->second;
+        in_use_.erase(found);
+        bytes_in_use_ -= block.size;
+
+        if (!enabled_ || bytes_cached_ + block.size > limit_) {
+            DPCTLfree_with_context(reinterpret_cast<DPCTLSyclUSMRef>(data),
+                                   block.pool->ctx);
+            return;
+        }
+
+        block.pool->free_blocks[block.usm_type - 1][block.size].push_back(data);
+        bytes_cached_ += block.size;
+    }
+
+    bool enabled()
+    {
+        std::lock_guard<std::mutex> lock(mutex_);
+        return enabled_;
+    }
+
+    void set_enabled(bool enabled)
+    {
+        std::lock_guard<std::mutex> lock(mutex_);
+        enabled_ = enabled;
+    }
+
+    size_t limit()
+    {
+        std::lock_guard<std::mutex> lock(mutex_);
+        return limit_;
+    }
+
+    void set_limit(size_t limit)
+    {
+        std::lock_guard<std::mutex> lock(mutex_);
+        limit_ = limit;
+        shrink_to_limit();
+    }
+
+    void get_stats(size_t *hits,
+                   size_t *misses,
+                   size_t *bytes_in_use,
+                   size_t *bytes_cached,
+                   size_t *peak_bytes)
+    {
+        std::lock_guard<std::mutex> lock(mutex_);
+        *hits = hits_;
+        *misses = misses_;
+        *bytes_in_use = bytes_in_use_;
+        *bytes_cached = bytes_cached_;
+        *peak_bytes = peak_bytes_;
+    }
+
+    void reset_stats()
+    {
+        std::lock_guard<std::mutex> lock(mutex_);
+        hits_ = misses_ = 0;
+        peak_bytes_ = bytes_in_use_ + bytes_cached_;
+    }
+
+    /*!
+     * @brief Releases the free blocks of the device pools matching the
+     * context and the device. A NULL context or device matches every context
+     * or device.
+     */
+    size_t trim(const DPCTLSyclContextRef ctx, const DPCTLSyclDeviceRef dev)
+    {
+        std::lock_guard<std::mutex> lock(mutex_);
+        size_t released = 0;
+
+        for (auto &pool : pools_) {
+            if ((ctx == nullptr || DPCTLContext_AreEq(ctx, pool.ctx)) &&
+                (dev == nullptr || DPCTLDevice_AreEq(dev, pool.dev)))
+            {
+                released += release_free_blocks(pool);
+            }
+        }
+
+        return released;
+    }
+};
+
+// The pool is never destroyed, as blocks may be returned to it by MemInfo
+// objects released during the interpreter shutdown.
+USMPool &usm_pool()
+{
+    static USMPool *pool = new USMPool();
+    return *pool;
+}
+} // namespace
+
+extern "C"
+{
+    void *DPEXRT_usm_pool_malloc(size_t size,
+                                 size_t usm_type,
+                                 const DPCTLSyclQueueRef qref)
+    {
+        return usm_pool().malloc(size, usm_type, qref);
+    }
+
+    void DPEXRT_usm_pool_free(void *data, const DPCTLSyclQueueRef qref)
+    {
+        usm_pool().free(data, qref);
+    }
+
+    int DPEXRT_usm_pool_is_enabled() { return usm_pool().enabled(); }
+
+    void DPEXRT_usm_pool_set_enabled(int enabled)
+    {
+        usm_pool().set_enabled(enabled != 0);
+    }
+
+    size_t DPEXRT_usm_pool_limit() { return usm_pool().limit(); }
+
+    void DPEXRT_usm_pool_set_limit(size_t limit)
+    {
+        usm_pool().set_limit(limit);
+    }
+
+    void DPEXRT_usm_pool_get_stats(size_t *hits,
+                                   size_t *misses,
+                                   size_t *bytes_in_use,
+                                   size_t *bytes_cached,
+                                   size_t *peak_bytes)
+    {
+        usm_pool().get_stats(hits, misses, bytes_in_use, bytes_cached,
+                             peak_bytes);
+    }
+
+    void DPEXRT_usm_pool_reset_stats() { usm_pool().reset_stats(); }
+
+    size_t DPEXRT_usm_pool_trim(const DPCTLSyclContextRef ctx,
+                                const DPCTLSyclDeviceRef dev)
+    {
+        return usm_pool().trim(ctx, dev);
+    }
+}
@@ -0,0 +1,128 @@
+// SPDX-FileCopyrightText: 2024 Intel Corporation
+//
+// SPDX-License-Identifier: Apache-2.0
+
+//===----------------------------------------------------------------------===//
+///
+/// \file
+/// Defines dpex run time functions of a caching pool for the USM allocations
+/// of the NRT_MemInfo objects created by DPEXRT_MemInfo_alloc.
+///
+//===----------------------------------------------------------------------===//
+
+#pragma once
+
+#include "dpctl_capi.h"
+#include "dpctl_sycl_interface.h"
+
+/*!
+ * @brief The default maximum number of bytes of free memory kept in the USM
+ * pool: 1 GiB.
+ */
+#define DPEXRT_USM_POOL_DEFAULT_LIMIT ((size_t)1 << 30)
+
+#ifdef __cplusplus
+extern "C"
+{
+#endif
+    /*!
+     * @brief returns a block of USM memory of at least size bytes from the
+     * pool of the queue's context and device. A free block of the same size
+     * class is reused if there is one, otherwise a new block is allocated on
+     * the queue. The reference to the queue is not stolen.
+     *
+     * @param    size           Number of bytes to allocate,
+     * @param    usm_type       Type of the USM memory, as defined in the
+     *                          DPCTLSyclUSMType enum: 1 device, 2 shared and
+     *                          3 host,
+     * @param    qref           Queue reference.
+     *
+     * @return   {return}       Pointer to the memory, NULL if the allocation
+     *                          failed.
+     */
+    void *DPEXRT_usm_pool_malloc(size_t size,
+                                 size_t usm_type,
+                                 const DPCTLSyclQueueRef qref);
+
+    /*!
+     * @brief returns memory allocated by DPEXRT_usm_pool_malloc to the pool.
+     * The memory is released if the pool is disabled or if keeping it would
+     * make the free memory of the pool exceed the limit. Memory that was not
+     * allocated by the pool is released using the queue.
+     *
+     * @param    data           Pointer to the memory,
+     * @param    qref           Queue reference, not stolen.
+     */
+    void DPEXRT_usm_pool_free(void *data, const DPCTLSyclQueueRef qref);
+
+    /*!
+     * @brief returns a non-zero value if DPEXRT_MemInfo_alloc allocates its
+     * memory from the pool.
+     */
+    int DPEXRT_usm_pool_is_enabled();
+
+    /*!
+     * @brief enables or disables the pool. Disabling the pool does not release
+     * the free memory that it holds.
+     *
+     * @param    enabled        Non-zero to enable the pool.
+     */
+    void DPEXRT_usm_pool_set_enabled(int enabled);
+
+    /*!
+     * @brief returns the maximum number of bytes of free memory kept in the
+     * pool.
+     */
+    size_t DPEXRT_usm_pool_limit();
+
+    /*!
+     * @brief sets the maximum number of bytes of free memory kept in the pool.
+     * If the pool holds more free memory than the new limit, free blocks are
+     * released until the limit is met.
+     *
+     * @param    limit          New limit in bytes.
+     */
+    void DPEXRT_usm_pool_set_limit(size_t limit);
+
+    /*!
+     * @brief writes the statistics of the pool.
+     *
+     * @param    hits           Output number of allocations served with a
+     *                          free block of the pool,
+     * @param    misses         Output number of allocations that allocated a
+     *                          new block,
+     * @param    bytes_in_use   Output number of bytes in blocks handed out by
+     *                          the pool and not yet returned,
+     * @param    bytes_cached   Output number of bytes in free blocks kept by
+     *                          the pool,
+     * @param    peak_bytes     Output highest number of bytes held by the
+     *                          pool, i.e., in use and cached, since the start
+     *                          of the process or the last call to
+     *                          DPEXRT_usm_pool_reset_stats.
+     */
+    void DPEXRT_usm_pool_get_stats(size_t *hits,
+                                   size_t *misses,
+                                   size_t *bytes_in_use,
+                                   size_t *bytes_cached,
+                                   size_t *peak_bytes);
+
+    /*!
+     * @brief resets the hit and miss counters to zero and the peak number of
+     * bytes to the number of bytes currently held by the pool.
+     */
+    void DPEXRT_usm_pool_reset_stats();
+
+    /*!
+     * @brief releases the free blocks kept for the context and the device. The
+     * references are not stolen.
+     *
+     * @param    ctx            Context reference, NULL matches any context,
+     * @param    dev            Device reference, NULL matches any device.
+     *
+     * @return   {return}       Number of released bytes.
+     */
+    size_t DPEXRT_usm_pool_trim(const DPCTLSyclContextRef ctx,
+                                const DPCTLSyclDeviceRef dev);
+#ifdef __cplusplus
+}
+#endif
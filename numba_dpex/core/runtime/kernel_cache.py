@@ -0,0 +1,142 @@
+# SPDX-FileCopyrightText: 2024 Intel Corporation
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""Python API to inspect and control the runtime cache of SYCL kernels.
+
+Every kernel launched from a compiled function is built from its SPIR-V binary
+by the ``DPEXRT_build_or_get_kernel`` runtime function the first time it is
+launched on a device. The built kernels are kept in a least recently used cache
+keyed by the SYCL context, the SYCL device and the hash of the SPIR-V binary.
+The maximum number of cached kernels is controlled by the
+``NUMBA_DPEX_KERNEL_CACHE_CAPACITY`` config flag and can be changed at run time
+using :func:`set_kernel_cache_capacity`.
+
+Unless the ``NUMBA_DPEX_KERNEL_CALL_SITE_CACHE`` config flag is disabled, every
+kernel launch in the generated host code also remembers the first cache entry
+that it resolves and reuses its kernel for the later launches on the same SYCL
+context and device without looking up the cache. These launches are counted as
+call site hits. Every eviction invalidates the remembered entries, so the next
+launch at each call site looks up the cache again, and evicting or purging a
+kernel releases it once the launches in flight are submitted.
+"""
+
+import ctypes
+from typing import NamedTuple
+
+from dpctl import SyclContext, SyclDevice, SyclQueue
+
+from numba_dpex.core import config
+
+from ._runtime_api import (
+    context_device_refs,
+    runtime_counters,
+    runtime_function,
+)
+
+_kernel_cache_size = runtime_function(
+    "DPEXRT_kernel_cache_size", ctypes.c_size_t
+)
+_kernel_cache_capacity = runtime_function(
+    "DPEXRT_kernel_cache_capacity", ctypes.c_size_t
+)
+_kernel_cache_set_capacity = runtime_function(
+    "DPEXRT_kernel_cache_set_capacity", None, ctypes.c_size_t
+)
+# Reads the hit, miss and eviction counters.
+_kernel_cache_get_stats = runtime_counters("DPEXRT_kernel_cache_get_stats", 3)
+_kernel_call_site_hits = runtime_function(
+    "DPEXRT_kernel_call_site_hits", ctypes.c_size_t
+)
+_kernel_cache_reset_stats = runtime_function(
+    "DPEXRT_kernel_cache_reset_stats", None
+)
+_kernel_cache_purge = runtime_function(
+    "DPEXRT_kernel_cache_purge",
+    ctypes.c_size_t,
+    ctypes.c_void_p,
+    ctypes.c_void_p,
+)
+
+
+class KernelCacheInfo(NamedTuple):
+    """A snapshot of the state of the runtime kernel cache."""
+
+    size: int
+    capacity: int
+    hits: int
+    misses: int
+    evictions: int
+    call_site_hits: int
+
+
+def kernel_cache_info() -> KernelCacheInfo:
+    """Returns the current size, the capacity and the hit, miss and eviction
+    counters of the kernel cache, along with the number of launches that used
+    the kernel kept at their call site.
+    """
+    hits, misses, evictions = _kernel_cache_get_stats()
+    return KernelCacheInfo(
+        size=_kernel_cache_size(),
+        capacity=_kernel_cache_capacity(),
+        hits=hits,
+        misses=misses,
+        evictions=evictions,
+        call_site_hits=_kernel_call_site_hits(),
+    )
+
+
+def set_kernel_cache_capacity(capacity: int):
+    """Sets the maximum number of kernels kept in the kernel cache.
+
+    The least recently used kernels are evicted if the cache holds more
+    kernels than the new capacity.
+
+    Args:
+        capacity (int): The new capacity. Zero makes the cache unbounded.
+
+    Raises:
+        ValueError: If the capacity is negative.
+    """
+    if capacity < 0:
+        raise ValueError("The kernel cache capacity cannot be negative.")
+    _kernel_cache_set_capacity(capacity)
+
+
+def reset_kernel_cache_stats():
+    """Resets the hit, miss and eviction counters of the kernel cache and the
+    number of call site hits.
+    """
+    _kernel_cache_reset_stats()
+
+
+def purge_kernel_cache(
+    queue: SyclQueue = None,
+    *,
+    context: SyclContext = None,
+    device: SyclDevice = None,
+) -> int:
+    """Evicts kernels from the kernel cache.
+
+    If a queue is passed, all kernels built for the queue's context and device
+    are evicted. Otherwise the kernels are selected by the context and the
+    device arguments, a missing argument matching any context or device. When
+    called without arguments the whole cache is cleared.
+
+    Args:
+        queue (dpctl.SyclQueue, optional): The queue whose kernels are evicted.
+        context (dpctl.SyclContext, optional): The context whose kernels are
+            evicted. Cannot be combined with ``queue``.
+        device (dpctl.SyclDevice, optional): The device whose kernels are
+            evicted. Cannot be combined with ``queue``.
+
+    Returns:
+        int: The number of evicted kernels.
+
+    Raises:
+        ValueError: If a queue is passed along with a context or a device.
+    """
+    return _kernel_cache_purge(*context_device_refs(queue, context, device))
+
+
+set_kernel_cache_capacity(config.KERNEL_CACHE_CAPACITY)
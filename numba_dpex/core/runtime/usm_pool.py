@@ -0,0 +1,149 @@
+# SPDX-FileCopyrightText: 2024 Intel Corporation
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""Python API to inspect and control the runtime pool of USM allocations.
+
+When the pool is enabled, the ``DPEXRT_MemInfo_alloc`` runtime function that
+allocates the data of the arrays created inside dpjit functions takes the
+memory from a caching pool instead of calling ``sycl::malloc_*``. Allocations
+are rounded up to size classes with four classes per power of two, and the
+memory of a released array is kept in the pool for later allocations of the
+same size class, the same usm type and the same SYCL context and device.
+
+The pool is enabled by the ``NUMBA_DPEX_USM_POOL`` config flag and the
+maximum number of bytes of free memory that it keeps is set by the
+``NUMBA_DPEX_USM_POOL_LIMIT`` config flag. Both can be changed at run time
+using :func:`set_usm_pool_enabled` and :func:`set_usm_pool_limit`.
+"""
+
+import ctypes
+from typing import NamedTuple
+
+from dpctl import SyclContext, SyclDevice, SyclQueue
+
+from numba_dpex.core import config
+
+from ._runtime_api import (
+    context_device_refs,
+    runtime_counters,
+    runtime_function,
+)
+
+_usm_pool_is_enabled = runtime_function(
+    "DPEXRT_usm_pool_is_enabled", ctypes.c_int
+)
+_usm_pool_set_enabled = runtime_function(
+    "DPEXRT_usm_pool_set_enabled", None, ctypes.c_int
+)
+_usm_pool_limit = runtime_function("DPEXRT_usm_pool_limit", ctypes.c_size_t)
+_usm_pool_set_limit = runtime_function(
+    "DPEXRT_usm_pool_set_limit", None, ctypes.c_size_t
+)
+# Reads the hit and miss counters, the number of bytes in use, the number of
+# cached bytes and the peak number of bytes.
+_usm_pool_get_stats = runtime_counters("DPEXRT_usm_pool_get_stats", 5)
+_usm_pool_reset_stats = runtime_function("DPEXRT_usm_pool_reset_stats", None)
+_usm_pool_trim = runtime_function(
+    "DPEXRT_usm_pool_trim", ctypes.c_size_t, ctypes.c_void_p, ctypes.c_void_p
+)
+
+
+class UsmPoolInfo(NamedTuple):
+    """A snapshot of the state of the runtime USM pool."""
+
+    enabled: bool
+    limit: int
+    hits: int
+    misses: int
+    bytes_in_use: int
+    bytes_cached: int
+    peak_bytes: int
+
+
+def usm_pool_info() -> UsmPoolInfo:
+    """Returns the configuration of the USM pool, its hit and miss counters,
+    the number of bytes handed out and not yet returned, the number of bytes
+    of free memory kept by the pool and the highest number of bytes held by
+    the pool.
+    """
+    hits, misses, bytes_in_use, bytes_cached, peak_bytes = _usm_pool_get_stats()
+    return UsmPoolInfo(
+        enabled=bool(_usm_pool_is_enabled()),
+        limit=_usm_pool_limit(),
+        hits=hits,
+        misses=misses,
+        bytes_in_use=bytes_in_use,
+        bytes_cached=bytes_cached,
+        peak_bytes=peak_bytes,
+    )
+
+
+def set_usm_pool_enabled(enabled: bool):
+    """Enables or disables the USM pool for the allocations done after the
+    call.
+
+    Memory allocated from the pool while it was enabled is released instead
+    of being kept once the pool is disabled. Disabling the pool does not
+    release the free memory that it holds, see :func:`trim_usm_pool`.
+
+    Args:
+        enabled (bool): Whether the pool is enabled.
+    """
+    _usm_pool_set_enabled(1 if enabled else 0)
+
+
+def set_usm_pool_limit(limit: int):
+    """Sets the maximum number of bytes of free memory kept in the USM pool.
+
+    Free memory is released if the pool holds more than the new limit.
+
+    Args:
+        limit (int): The new limit in bytes.
+
+    Raises:
+        ValueError: If the limit is negative.
+    """
+    if limit < 0:
+        raise ValueError("The USM pool limit cannot be negative.")
+    _usm_pool_set_limit(limit)
+
+
+def reset_usm_pool_stats():
+    """Resets the hit and miss counters of the USM pool and sets the peak
+    number of bytes to the number of bytes currently held by the pool.
+    """
+    _usm_pool_reset_stats()
+
+
+def trim_usm_pool(
+    queue: SyclQueue = None,
+    *,
+    context: SyclContext = None,
+    device: SyclDevice = None,
+) -> int:
+    """Releases the free memory kept in the USM pool.
+
+    If a queue is passed, the memory kept for the queue's context and device
+    is released. Otherwise the memory is selected by the context and the
+    device arguments, a missing argument matching any context or device. When
+    called without arguments all the free memory of the pool is released.
+
+    Args:
+        queue (dpctl.SyclQueue, optional): The queue whose memory is released.
+        context (dpctl.SyclContext, optional): The context whose memory is
+            released. Cannot be combined with ``queue``.
+        device (dpctl.SyclDevice, optional): The device whose memory is
+            released. Cannot be combined with ``queue``.
+
+    Returns:
+        int: The number of released bytes.
+
+    Raises:
+        ValueError: If a queue is passed along with a context or a device.
+    """
+    return _usm_pool_trim(*context_device_refs(queue, context, device))
+
+
+set_usm_pool_limit(config.USM_POOL_LIMIT)
+set_usm_pool_enabled(config.USM_POOL)
@@ -9,6 +9,7 @@ from numba import types
 from numba.core import cgutils
 from numba.extending import NativeValue, box, unbox
 
+from numba_dpex.core import config
 from numba_dpex.core.exceptions import UnreachableError
 from numba_dpex.core.runtime import context as dpexrt
 
@@ -26,10 +27,16 @@ class DpctlSyclQueue(types.Type):
         self._device_has_aspect_atomic64 = (
             sycl_queue.sycl_device.has_aspect_atomic64
         )
-        try:
-            self._unique_id = hash(sycl_queue)
-        except Exception:
-            self._unique_id = self.rand_digit_str(16)
+        self._device_has_aspect_fp64 = sycl_queue.sycl_device.has_aspect_fp64
+        if config.QUEUE_AGNOSTIC_SPECIALIZATION:
+            # The queue is always read at run time from the array or queue
+            # argument, so the compiled code only depends on the device.
+            self._unique_id = (self._device, self._device_has_aspect_atomic64)
+        else:
+            try:
+                self._unique_id = hash(sycl_queue)
+            except Exception:
+                self._unique_id = self.rand_digit_str(16)
         super(DpctlSyclQueue, self).__init__(
             name=f"DpctlSyclQueue on {self._device}"
         )
@@ -53,6 +60,10 @@ class DpctlSyclQueue(types.Type):
     def device_has_aspect_atomic64(self):
         return self._device_has_aspect_atomic64
 
+    @property
+    def device_has_aspect_fp64(self):
+        return self._device_has_aspect_fp64
+
     @property
     def key(self):
         """Returns a Python object used as the key to cache an instance of
@@ -63,8 +74,14 @@ class DpctlSyclQueue(types.Type):
         different dpctl.SyclQueue instances are inferred as separate instances
         of the DpctlSyclQueue type.
 
+        If ``config.QUEUE_AGNOSTIC_SPECIALIZATION`` is set, the key is built
+        from the device filter string and the device aspects that affect code
+        generation instead. All queues on the same device are then inferred as
+        the same type and share a single compiled overload.
+
         Returns:
-            int: hash of the self._sycl_queue Python object.
+            The hash of the self._sycl_queue Python object or a tuple of the
+            device filter string and aspects.
         """
         return self._unique_id
 
@@ -4,6 +4,7 @@
 
 """Module that contains numba style wrapper around sycl kernel submit."""
 
+import hashlib
 import warnings
 from dataclasses import dataclass
 from functools import cached_property
@@ -46,6 +47,44 @@ class SPIRVKernelModule(NamedTuple):
     kernel_bitcode: bytes
 
 
+def _spirv_binary_hash(kernel_bitcode: bytes) -> int:
+    """Returns a 64-bit hash of a SPIR-V binary used as the key of the
+    runtime's kernel bundle cache.
+
+    Unlike the built-in ``hash`` the value does not depend on the process, so
+    the constant stays valid when the host code embedding it is loaded from an
+    on-disk cache.
+    """
+    digest = hashlib.blake2b(kernel_bitcode, digest_size=8).digest()
+    return int.from_bytes(digest, "little", signed=True)
+
+
+def get_kernel_build_options(debug=False) -> str:
+    """Returns the options used to build a kernel from its SPIR-V binary.
+
+    The ``NUMBA_DPEX_BUILD_KERNEL_OPTIONS`` config flag takes precedence over
+    the options disabling the device optimizations of a debug kernel.
+    """
+    build_kernel_options = ""
+    if debug:
+        build_kernel_options = (
+            OPEN_CL_OPT_DISABLE_FLAG + " " + L0_OPT_DISABLE_FLAG
+        )
+    if config.BUILD_KERNEL_OPTIONS:
+        # User settings are higher priority than kernel configuration
+        build_kernel_options = config.BUILD_KERNEL_OPTIONS
+        if debug and not (
+            OPEN_CL_OPT_DISABLE_FLAG in build_kernel_options
+            and L0_OPT_DISABLE_FLAG in build_kernel_options
+        ):
+            warnings.warn(
+                "Debugging without device optimization may lead to "
+                "unexpected behavior"
+            )
+
+    return build_kernel_options
+
+
 @dataclass
 class _KernelLaunchIRArguments:  # pylint: disable=too-many-instance-attributes
     """List of kernel launch arguments used in sycl.dpctl_queue_submit_range and
@@ -314,26 +353,7 @@ class KernelLaunchIRBuilder:
             self.builder.module, kernel_module.kernel_name
         )
 
-        context_ref = sycl.dpctl_queue_get_context(self.builder, queue_ref)
-        device_ref = sycl.dpctl_queue_get_device(self.builder, queue_ref)
-
-        build_kernel_options = ""
-        if debug:
-            build_kernel_options = (
-                OPEN_CL_OPT_DISABLE_FLAG + " " + L0_OPT_DISABLE_FLAG
-            )
-        if config.BUILD_KERNEL_OPTIONS:
-            # User settings are higher priority than kernel configuration
-            build_kernel_options = config.BUILD_KERNEL_OPTIONS
-            if debug and not (
-                OPEN_CL_OPT_DISABLE_FLAG in build_kernel_options
-                and L0_OPT_DISABLE_FLAG in build_kernel_options
-            ):
-                warnings.warn(
-                    "Debugging without device optimization may lead to "
-                    "unexpected behavior"
-                )
-
+        build_kernel_options = get_kernel_build_options(debug)
         if build_kernel_options != "":
             spv_compiler_options = self.context.insert_const_string(
                 self.builder.module, build_kernel_options
@@ -343,28 +363,73 @@ class KernelLaunchIRBuilder:
                 cgutils_extra.create_null_ptr(self.builder, self.context)
             )
 
+        kernel_args = [
+            llvmir.Constant(
+                llvmir.IntType(64),
+                _spirv_binary_hash(kernel_module.kernel_bitcode),
+            ),
+            kernel_bc_byte_str,
+            llvmir.Constant(
+                llvmir.IntType(64), len(kernel_module.kernel_bitcode)
+            ),
+            spv_compiler_options,
+            kernel_name,
+        ]
+
+        if config.KERNEL_CALL_SITE_CACHE:
+            self._set_kernel_from_call_site_slot(queue_ref, kernel_args)
+            return
+
+        context_ref = sycl.dpctl_queue_get_context(self.builder, queue_ref)
+        device_ref = sycl.dpctl_queue_get_device(self.builder, queue_ref)
+
         # build_or_get_kernel steals reference to context and device cause it
         # needs to keep them alive for keys.
         kernel_ref = self.dpexrt.build_or_get_kernel(
-            self.builder,
-            [
-                context_ref,
-                device_ref,
-                llvmir.Constant(
-                    llvmir.IntType(64), hash(kernel_module.kernel_bitcode)
-                ),
-                kernel_bc_byte_str,
-                llvmir.Constant(
-                    llvmir.IntType(64), len(kernel_module.kernel_bitcode)
-                ),
-                spv_compiler_options,
-                kernel_name,
-            ],
+            self.builder, [context_ref, device_ref] + kernel_args
         )
 
         self._cleanups.append(self._clean_kernel_ref)
         self.set_kernel(kernel_ref)
 
+    def _set_kernel_from_call_site_slot(self, queue_ref, kernel_args):
+        """Sets the kernel remembered by a global slot of the current call
+        site.
+
+        The slot is a private global variable of the LLVM module pointing to
+        the first kernel cache entry resolved at the call site. As long as no
+        kernel was evicted from the cache and the queue's context and device
+        match the entry, a launch only compares them and skips the kernel
+        cache lookup as well as the creation and deletion of the context,
+        device and kernel references. The kernel is kept alive by a pin on the
+        stack, which is released after the submission.
+        """
+        module = self.builder.module
+        slot = cgutils.add_global_variable(
+            module,
+            cgutils.voidptr_t,
+            module.get_unique_name("dpex_kernel_slot"),
+        )
+        slot.linkage = "private"
+        slot.initializer = cgutils.voidptr_t(None)
+
+        pin = self.builder.bitcast(
+            cgutils.alloca_once(
+                self.builder, llvmir.ArrayType(cgutils.voidptr_t, 2)
+            ),
+            cgutils.voidptr_t,
+        )
+        kernel_ref = self.dpexrt.get_call_site_kernel(
+            self.builder, [slot, queue_ref] + kernel_args + [pin]
+        )
+
+        def _release_pinned_kernel_ref():
+            self.dpexrt.release_call_site_kernel(self.builder, [pin])
+            self.arguments.sycl_kernel_ref = None
+
+        self._cleanups.append(_release_pinned_kernel_ref)
+        self.set_kernel(kernel_ref)
+
     def _clean_kernel_ref(self):
         sycl.dpctl_kernel_delete(self.builder, self.arguments.sycl_kernel_ref)
         self.arguments.sycl_kernel_ref = None
@@ -528,6 +593,40 @@ class KernelLaunchIRBuilder:
             types.uintp, len(dep_events)
         )
 
+    def set_dependent_events_from_meminfos(
+        self, event_ref_ptr: llvmir.Instruction = None
+    ):
+        """Sets the events of the pending asynchronous writes of the data of
+        the kernel arguments, e.g., the fills of the arrays created by
+        ``dpnp.zeros``, as the dependent events. The event stored at
+        ``event_ref_ptr`` is added as well if it is not a null pointer. Must
+        be called after the arguments are set.
+        """
+        total_meminfos, meminfo_list = self._allocate_meminfo_array()
+        dep_events = self._allocate_array(types.voidptr, total_meminfos + 1)
+        num_dep_events = self.context.get_constant(types.uintp, 0)
+
+        if event_ref_ptr is not None:
+            event_ref = self.builder.load(event_ref_ptr)
+            self.builder.store(event_ref, dep_events)
+            num_dep_events = self.builder.select(
+                cgutils.is_null(self.builder, event_ref),
+                num_dep_events,
+                self.context.get_constant(types.uintp, 1),
+            )
+
+        num_meminfo_events = self.dpexrt.meminfo_get_events(
+            self.builder,
+            meminfo_list,
+            self.context.get_constant(types.uintp, total_meminfos),
+            self.builder.gep(dep_events, [num_dep_events]),
+        )
+
+        self.arguments.dep_events = dep_events
+        self.arguments.dep_events_len = self.builder.add(
+            num_dep_events, num_meminfo_events
+        )
+
     def set_dependent_events_from_tuple(
         self,
         ty_dependent_events: UniTuple,
@@ -604,7 +703,12 @@ class KernelLaunchIRBuilder:
         self,
     ) -> llvmir.Instruction:
         """Schedule sycl host task to release nrt meminfo of the arguments used
-        to run job. Use it to keep arguments alive during kernel execution."""
+        to run job. Use it to keep arguments alive during kernel execution.
+
+        If the ``NUMBA_DPEX_DEFERRED_MEMINFO_RELEASE`` config flag is set, the
+        release is instead added to the runtime's list of pending releases and
+        the returned event completes with the kernel.
+        """
         queue_ref = self.arguments.sycl_queue_ref
         event_ref = self.cached_arguments.device_event_ref
 
@@ -616,7 +720,14 @@ class KernelLaunchIRBuilder:
         status_ptr = cgutils.alloca_once(
             self.builder, self.context.get_value_type(types.uint64)
         )
-        host_eref = self.dpexrt.acquire_meminfo_and_schedule_release(
+        if config.DEFERRED_MEMINFO_RELEASE:
+            acquire_and_release = self.dpexrt.acquire_meminfo_and_defer_release
+        else:
+            acquire_and_release = (
+                self.dpexrt.acquire_meminfo_and_schedule_release
+            )
+
+        host_eref = acquire_and_release(
             self.builder,
             [
                 self.context.nrt.get_nrt_api(self.builder),
@@ -640,7 +751,7 @@ class KernelLaunchIRBuilder:
         for arg_type in kernel_argtys:
             if isinstance(arg_type, USMNdArray):
                 datamodel = self.kernel_dmm.lookup(arg_type)
-                num_flattened_kernel_args += datamodel.flattened_field_count
+                num_flattened_kernel_args += datamodel.kernel_arg_count
             elif arg_type in [types.complex64, types.complex128]:
                 num_flattened_kernel_args += 2
             else:
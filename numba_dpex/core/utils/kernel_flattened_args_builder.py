@@ -344,27 +344,32 @@ class KernelFlattenedArgsBuilder:
     def _build_array_arg(self, arg_type, llvm_array_val):
         """Creates a list of LLVM Values for an unpacked USMNdArray kernel
         argument.
+
+        A C- or F-contiguous array is passed as only its data pointer and its
+        shape, the other members are rebuilt by the kernel wrapper.
         """
         kernel_arg_list = []
 
         kernel_data_model = self._kernel_dmm.lookup(arg_type)
         host_data_model = self._context.data_model_manager.lookup(arg_type)
+        contiguous = kernel_data_model.has_contiguous_kernel_args
 
-        kernel_arg_list.extend(
-            self._build_collections_attr_arg(
-                llvm_val=llvm_array_val,
-                attr_index=host_data_model.get_field_position("nitems"),
-                attr_type=kernel_data_model.get_member_fe_type("nitems"),
+        if not contiguous:
+            kernel_arg_list.extend(
+                self._build_collections_attr_arg(
+                    llvm_val=llvm_array_val,
+                    attr_index=host_data_model.get_field_position("nitems"),
+                    attr_type=kernel_data_model.get_member_fe_type("nitems"),
+                )
             )
-        )
-        # Argument itemsize
-        kernel_arg_list.extend(
-            self._build_collections_attr_arg(
-                llvm_val=llvm_array_val,
-                attr_index=host_data_model.get_field_position("itemsize"),
-                attr_type=kernel_data_model.get_member_fe_type("itemsize"),
+            # Argument itemsize
+            kernel_arg_list.extend(
+                self._build_collections_attr_arg(
+                    llvm_val=llvm_array_val,
+                    attr_index=host_data_model.get_field_position("itemsize"),
+                    attr_type=kernel_data_model.get_member_fe_type("itemsize"),
+                )
             )
-        )
         # Argument data
         data_attr_pos = host_data_model.get_field_position("data")
         data_attr_ty = kernel_data_model.get_member_fe_type("data")
@@ -385,12 +390,13 @@ class KernelFlattenedArgsBuilder:
             )
         )
         # Arguments for strides
-        kernel_arg_list.extend(
-            self._build_unituple_member_arg(
-                llvm_val=llvm_array_val,
-                attr_pos=host_data_model.get_field_position("strides"),
-                ndims=kernel_data_model.get_member_fe_type("strides").count,
+        if not contiguous:
+            kernel_arg_list.extend(
+                self._build_unituple_member_arg(
+                    llvm_val=llvm_array_val,
+                    attr_pos=host_data_model.get_field_position("strides"),
+                    ndims=kernel_data_model.get_member_fe_type("strides").count,
+                )
             )
-        )
 
         return kernel_arg_list
@@ -7,7 +7,6 @@ from collections import namedtuple
 from dpctl import get_device_cached_queue
 from llvmlite import ir as llvmir
 from llvmlite.ir import Constant
-from llvmlite.ir.types import DoubleType, FloatType
 from numba import types
 from numba.core import cgutils
 from numba.core import config as numba_config
@@ -21,6 +20,7 @@ from numba.np.arrayobj import (
     populate_array,
 )
 
+from numba_dpex.core import config
 from numba_dpex.core.runtime import context as dpexrt
 from numba_dpex.core.types import DpnpNdArray
 from numba_dpex.core.types.dpctl_types import DpctlSyclQueue
@@ -374,10 +374,24 @@ def alloc_empty_arrayobj(context, builder, sig, queue_ref, args, is_like=False):
     return ary
 
 
-def fill_arrayobj(context, builder, ary, arrtype, queue_ref, fill_value):
+def fill_arrayobj(
+    context,
+    builder,
+    ary,
+    arrtype,
+    queue_ref,
+    fill_value,
+    fill_value_ty=types.intp,
+):
     """Fill a numba.np.arrayobj.make_array.<locals>.ArrayStruct
         with a specified value.
 
+    The fill is submitted asynchronously to the queue and its event is stored
+    in the array's MemInfo. Parfor kernels using the array depend on the
+    event and the host waits for it before accessing the data of the array or
+    releasing it. If ``NUMBA_DPEX_ASYNC_PARFOR_SUBMISSION`` is disabled, the
+    fill is waited for right away.
+
     Args:
         context (numba.core.base.BaseContext): One of the class derived
             from numba's BaseContext, e.g. CPUContext
@@ -390,6 +404,8 @@ def fill_arrayobj(context, builder, ary, arrtype, queue_ref, fill_value):
             `ones()`, `empty()`, and their corresponding `_like()` methods.
         fill_value (llvmlite.ir.values.Argument): An LLVMLite IR `Argument`
             object that specifies the values to be filled in.
+        fill_value_ty (numba.types.Type, optional): The Numba type of
+            ``fill_value``. Defaults to ``types.intp``.
 
     Returns:
         tuple(numba.np.arrayobj.make_array.<locals>.ArrayStruct,
@@ -399,32 +415,56 @@ def fill_arrayobj(context, builder, ary, arrtype, queue_ref, fill_value):
     """
 
     itemsize = context.get_constant(types.intp, get_itemsize(context, arrtype))
+    i64 = llvmir.IntType(64)
 
-    if isinstance(fill_value.type, DoubleType) or isinstance(
-        fill_value.type, FloatType
-    ):
-        value_is_float = context.get_constant(types.boolean, 1)
-    else:
-        value_is_float = context.get_constant(types.boolean, 0)
-
-    if isinstance(arrtype.dtype, types.scalars.Float):
-        dest_is_float = context.get_constant(types.boolean, 1)
+    if isinstance(arrtype.dtype, types.Boolean):
+        fill_value = context.cast(
+            builder, fill_value, fill_value_ty, types.boolean
+        )
+        fill_value_ty = types.boolean
+
+    # The runtime receives the value as the 64-bit pattern of either an int64
+    # or a float64 and converts it to the dtype of the array, complex values
+    # being passed as their real and imaginary parts.
+    if isinstance(fill_value_ty, types.Complex):
+        cplx = context.make_complex(builder, fill_value_ty, value=fill_value)
+        real = context.cast(
+            builder, cplx.real, fill_value_ty.underlying_float, types.float64
+        )
+        imag = context.cast(
+            builder, cplx.imag, fill_value_ty.underlying_float, types.float64
+        )
+        value = builder.bitcast(real, i64)
+        imag_value = builder.bitcast(imag, i64)
+        value_is_float = True
+    elif isinstance(fill_value_ty, types.Float):
+        real = context.cast(builder, fill_value, fill_value_ty, types.float64)
+        value = builder.bitcast(real, i64)
+        imag_value = Constant(i64, 0)
+        value_is_float = True
     else:
-        dest_is_float = context.get_constant(types.boolean, 0)
+        value = context.cast(builder, fill_value, fill_value_ty, types.int64)
+        imag_value = Constant(i64, 0)
+        value_is_float = False
 
-    # Do a bitcast of the input to a 64-bit int.
-    value = builder.bitcast(fill_value, llvmir.IntType(64))
+    dest_is_complex = isinstance(arrtype.dtype, types.Complex)
+    dest_is_float = dest_is_complex or isinstance(arrtype.dtype, types.Float)
 
     dpexrtCtx = dpexrt.DpexRTContext(context)
     dpexrtCtx.meminfo_fill(
         builder,
         ary.meminfo,
         itemsize,
-        dest_is_float,
-        value_is_float,
+        context.get_constant(types.boolean, dest_is_float),
+        context.get_constant(types.boolean, dest_is_complex),
+        context.get_constant(types.boolean, value_is_float),
         value,
+        imag_value,
         queue_ref,
     )
+    if not config.ASYNC_PARFOR_SUBMISSION:
+        dpexrtCtx.meminfo_wait(builder, ary.meminfo)
+
     return ary, arrtype
 
 
@@ -730,6 +770,7 @@ def impl_dpnp_full(
             sig.return_type,
             qref_payload.queue_ref,
             fill_value,
+            sig.args[1],
         )
 
         return ary._getvalue()
@@ -1075,6 +1116,7 @@ def impl_dpnp_full_like(
             sig.return_type,
             qref_payload.queue_ref,
             fill_value,
+            sig.args[1],
         )
 
         return ary._getvalue()
@@ -101,6 +101,29 @@ def run_pipeline(host_arr, n_itr):
     return dt, None, None
 
 
+def run_graph(host_arr, n_itr):
+    t0 = time.time()
+    q = dpctl.SyclQueue()
+
+    a_host = dpnp.asarray(host_arr, usm_type="host", sycl_queue=q)
+
+    batch_shape = (n_itr,) + a_host.shape
+    device_alloc = dpnp.empty(batch_shape, usm_type="device", sycl_queue=q)
+
+    # Every kernel depends on the copy into its slice of the device
+    # allocation, the graph infers the dependencies from the arrays.
+    graph = dpex.KernelGraph()
+    for offset in range(n_itr):
+        _a = device_alloc[offset]
+        graph.add_memcpy(_a, a_host)
+        graph.add_kernel(async_kernel, dpex.Range(len(_a)), _a)
+
+    graph.submit().wait()
+    dt = time.time() - t0
+
+    return dt, None, None
+
+
 def main():
     parser = argparse.ArgumentParser(description="Process some integers.")
     parser.add_argument(
@@ -117,7 +140,7 @@ def main():
         "--algo",
         type=str,
         default="pipeline",
-        choices=["pipeline", "serial"],
+        choices=["pipeline", "serial", "graph"],
         help="algo",
     )
 
@@ -135,6 +158,7 @@ def main():
     algo_func = {
         "pipeline": run_pipeline,
         "serial": run_serial,
+        "graph": run_graph,
     }.get(args.algo)
 
     for _ in range(args.reps):
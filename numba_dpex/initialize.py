@@ -0,0 +1,108 @@
+# SPDX-FileCopyrightText: 2024 Intel Corporation
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""Initializes the parts of numba-dpex that are only needed to compile
+functions.
+
+Importing numba_dpex only imports the types and the typeof implementations of
+numba-dpex. The DPCTLSyclInterface library, the patches of the dpnp ufuncs, the
+dpnp ufunc registries, the dpjit target and the kernel_api SPIR-V overloads are
+loaded by :func:`initialize` when the first ``numba_dpex.kernel`` or
+``numba_dpex.dpjit`` dispatcher is created, i.e., before the first compilation,
+so that processes that only use the kernel_api simulator do not pay for them.
+"""
+
+import glob
+import os
+import platform as plt
+import threading
+
+import dpctl
+import llvmlite.binding as ll
+
+_lock = threading.RLock()
+_initialized = False
+_initializing = False
+
+
+def load_dpctl_sycl_interface():
+    """Permanently loads the ``DPCTLSyclInterface`` library provided by dpctl.
+    The ``DPCTLSyclInterface`` library provides C wrappers over SYCL functions
+    that are directly invoked from the LLVM modules generated by numba_dpex.
+    We load the library once at the time of initialization using llvmlite's
+    load_library_permanently function.
+    Raises:
+        ImportError: If the ``DPCTLSyclInterface`` library could not be loaded.
+    """
+
+    platform = plt.system()
+    if platform == "Windows":
+        paths = glob.glob(
+            os.path.join(
+                os.path.dirname(dpctl.__file__), "*DPCTLSyclInterface.dll"
+            )
+        )
+    else:
+        paths = glob.glob(
+            os.path.join(
+                os.path.dirname(dpctl.__file__), "*DPCTLSyclInterface.so"
+            )
+        )
+
+    if len(paths) == 1:
+        ll.load_library_permanently(paths[0])
+    else:
+        raise ImportError
+
+
+def initialize():
+    """Loads the libraries, patches and registries used by the compiler.
+
+    The function is called by every new dispatcher before it creates the
+    target contexts and only does work on its first call. Calls from other
+    threads wait until the first call is done.
+    """
+    global _initialized, _initializing  # pylint: disable=global-statement
+
+    if _initialized:
+        return
+
+    with _lock:
+        # The modules imported below may create dispatchers, which call this
+        # function again from the same thread.
+        if _initialized or _initializing:
+            return
+        _initializing = True
+        try:
+            _initialize()
+            _initialized = True
+        finally:
+            _initializing = False
+
+
+def _initialize():
+    # pylint: disable=import-outside-toplevel,unused-import
+    from numba_dpex.core import compile_profiler, config
+    from numba_dpex.numba_patches import patch_ufuncs
+
+    # Monkey patches
+    patch_ufuncs.patch()
+
+    import numba_dpex.core.dpjit_dispatcher  # noqa: F401
+    import numba_dpex.core.targets.dpjit_target  # noqa: F401
+    from numba_dpex.core import boxing  # noqa: F401
+    from numba_dpex.core.overloads import ranges_overloads  # noqa: F401
+    from numba_dpex.dpctl_iface import _intrinsic  # noqa: F401
+    from numba_dpex.dpnp_iface import dpnpimpl  # noqa: F401
+    from numba_dpex.register_kernel_api_overloads import (
+        init_kernel_api_spirv_overloads,
+    )
+
+    if config.COMPILE_PROFILE:
+        compile_profiler.profile_process(config.COMPILE_PROFILE)
+
+    load_dpctl_sycl_interface()
+
+    # Initialize the kernel_api SPIRV overloads
+    init_kernel_api_spirv_overloads()
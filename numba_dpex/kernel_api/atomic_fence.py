@@ -17,8 +17,10 @@ def atomic_fence(
     work-items.
 
     .. important::
-        The function is a no-op during CPython execution and only available in
-        JIT compiled mode of execution.
+        The function is a no-op during CPython execution, where the work-items
+        of a kernel are simulated by threads that observe every memory access
+        in program order. It only has an effect in JIT compiled mode of
+        execution.
 
     Args:
         memory_order (MemoryOrder): The memory synchronization order.
@@ -6,8 +6,15 @@
 prototyping numba_dpex kernel functions before they are JIT compiled.
 """
 
+import threading
+
+from .launcher import _in_vectorized_execution
 from .memory_enums import AddressSpace, MemoryOrder, MemoryScope
 
+# Serializes the read-modify-write operations of all AtomicRef objects, as the
+# work-items of a nd-range kernel are executed as concurrent threads.
+_ATOMIC_LOCK = threading.Lock()
+
 
 class AtomicRef:
     """Analogue to the :sycl_atomic_ref:`sycl::atomic_ref <>` class.
@@ -32,6 +39,10 @@ class AtomicRef:
         optional ``memory_order``, ``memory_scope``, and ``address_space``
         arguments that are ignored in Python execution.
         """
+        if _in_vectorized_execution():
+            raise NotImplementedError(
+                "AtomicRef cannot be used in a vectorized kernel execution."
+            )
         self._memory_order = memory_order
         self._memory_scope = memory_scope
         self._address_space = address_space
@@ -73,9 +84,10 @@ class AtomicRef:
 
         Returns: The original value of the object referenced by the AtomicRef.
         """
-        old = self._ref[self._index].copy()
-        self._ref[self._index] += val
-        return old
+        with _ATOMIC_LOCK:
+            old = self._ref[self._index].copy()
+            self._ref[self._index] += val
+            return old
 
     def fetch_sub(self, val):
         """Subtracts the operand ``val`` to the object referenced by the
@@ -88,9 +100,10 @@ class AtomicRef:
 
         Returns: The original value of the object referenced by the AtomicRef.
         """
-        old = self._ref[self._index].copy()
-        self._ref[self._index] -= val
-        return old
+        with _ATOMIC_LOCK:
+            old = self._ref[self._index].copy()
+            self._ref[self._index] -= val
+            return old
 
     def fetch_min(self, val):
         """Calculates the minimum value of the operand ``val`` and the object
@@ -103,9 +116,10 @@ class AtomicRef:
 
         Returns: The original value of the object referenced by the AtomicRef.
         """
-        old = self._ref[self._index].copy()
-        self._ref[self._index] = min(old, val)
-        return old
+        with _ATOMIC_LOCK:
+            old = self._ref[self._index].copy()
+            self._ref[self._index] = min(old, val)
+            return old
 
     def fetch_max(self, val):
         """Calculates the maximum value of the operand ``val`` and the object
@@ -118,9 +132,10 @@ class AtomicRef:
 
         Returns: The original value of the object referenced by the AtomicRef.
         """
-        old = self._ref[self._index].copy()
-        self._ref[self._index] = max(old, val)
-        return old
+        with _ATOMIC_LOCK:
+            old = self._ref[self._index].copy()
+            self._ref[self._index] = max(old, val)
+            return old
 
     def fetch_and(self, val):
         """Calculates the bitwise AND of the operand ``val`` and the object
@@ -133,9 +148,10 @@ class AtomicRef:
 
         Returns: The original value of the object referenced by the AtomicRef.
         """
-        old = self._ref[self._index].copy()
-        self._ref[self._index] &= val
-        return old
+        with _ATOMIC_LOCK:
+            old = self._ref[self._index].copy()
+            self._ref[self._index] &= val
+            return old
 
     def fetch_or(self, val):
         """Calculates the bitwise OR of the operand ``val`` and the object
@@ -148,9 +164,10 @@ class AtomicRef:
 
         Returns: The original value of the object referenced by the AtomicRef.
         """
-        old = self._ref[self._index].copy()
-        self._ref[self._index] |= val
-        return old
+        with _ATOMIC_LOCK:
+            old = self._ref[self._index].copy()
+            self._ref[self._index] |= val
+            return old
 
     def fetch_xor(self, val):
         """Calculates the bitwise XOR of the operand ``val`` and the object
@@ -164,9 +181,10 @@ class AtomicRef:
         Returns: The original value of the object referenced by the AtomicRef.
 
         """
-        old = self._ref[self._index].copy()
-        self._ref[self._index] ^= val
-        return old
+        with _ATOMIC_LOCK:
+            old = self._ref[self._index].copy()
+            self._ref[self._index] ^= val
+            return old
 
     def load(self):
         """Loads the value of the object referenced by the AtomicRef.
@@ -194,9 +212,10 @@ class AtomicRef:
 
         Returns: The original value of the object referenced by the AtomicRef.
         """
-        old = self._ref[self._index].copy()
-        self._ref[self._index] = val
-        return old
+        with _ATOMIC_LOCK:
+            old = self._ref[self._index].copy()
+            self._ref[self._index] = val
+            return old
 
     def compare_exchange(self, expected, desired, expected_idx=0):
         """Compares the value of the object referenced by the AtomicRef
@@ -216,8 +235,9 @@ class AtomicRef:
         Returns: ``True`` if the comparison operation and replacement operation
             were successful.
         """
-        if self._ref[self._index] == expected[expected_idx]:
-            self._ref[self._index] = desired
-            return True
-        expected[expected_idx] = self._ref[self._index]
-        return False
+        with _ATOMIC_LOCK:
+            if self._ref[self._index] == expected[expected_idx]:
+                self._ref[self._index] = desired
+                return True
+            expected[expected_idx] = self._ref[self._index]
+            return False
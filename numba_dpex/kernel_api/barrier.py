@@ -5,13 +5,82 @@
 """Python functions that simulate SYCL's group_barrier function.
 """
 
+import threading
+
 from .index_space_ids import Group
 from .memory_enums import MemoryScope
 
 
+class _WorkGroupAborted(Exception):
+    """Raised inside a waiting work-item when another work-item of the same
+    work-group failed.
+    """
+
+
+class _WorkGroupBarrier:
+    """A reusable barrier for the work-items of a simulated work-group.
+
+    Unlike ``threading.Barrier`` the barrier keeps track of the work-items that
+    have returned from the kernel function. A work-group where some work-items
+    returned while others wait at a barrier can never make progress, and the
+    waiting work-items are released with an error instead of deadlocking.
+    """
+
+    def __init__(self, num_work_items):
+        self._cond = threading.Condition()
+        self._num_work_items = num_work_items
+        self._num_waiting = 0
+        self._num_finished = 0
+        self._generation = 0
+        self._error = None
+
+    def _break(self, error):
+        self._error = error
+        self._cond.notify_all()
+
+    def _divergence_error(self):
+        return RuntimeError(
+            "group_barrier was not called by all work-items of the work-group."
+        )
+
+    def wait(self):
+        """Blocks until all work-items of the work-group reach the barrier."""
+        with self._cond:
+            if self._error is None and self._num_finished > 0:
+                self._break(self._divergence_error())
+            if self._error is not None:
+                raise self._error
+
+            generation = self._generation
+            self._num_waiting += 1
+            if self._num_waiting == self._num_work_items:
+                self._num_waiting = 0
+                self._generation += 1
+                self._cond.notify_all()
+                return
+
+            while generation == self._generation and self._error is None:
+                self._cond.wait()
+            if generation == self._generation:
+                raise self._error
+
+    def finish(self):
+        """Records that a work-item returned from the kernel function."""
+        with self._cond:
+            self._num_finished += 1
+            if self._num_waiting > 0 and self._error is None:
+                self._break(self._divergence_error())
+
+    def abort(self):
+        """Releases all waiting work-items after a work-item failed."""
+        with self._cond:
+            if self._error is None:
+                self._break(_WorkGroupAborted())
+
+
 def group_barrier(
     group: Group, fence_scope: MemoryScope = MemoryScope.WORK_GROUP
-):
+):  # pylint: disable=unused-argument
     """Performs a barrier operation across all work-items in a work-group.
 
     The function is equivalent to the ``sycl::group_barrier`` function. It
@@ -27,8 +96,11 @@ def group_barrier(
     fences as if provided by an explicit atomic operation on an atomic object.
 
     .. important::
-        The function is not implemented yet for pure CPython execution and is
-        only supported in JIT compiled mode of execution.
+        In pure CPython execution the function is only supported inside a
+        kernel launched over an :class:`NdRange` using
+        :func:`numba_dpex.kernel_api.call_kernel`, where the work-items of a
+        work-group are executed as cooperating threads. The ``fence_scope`` is
+        ignored as every memory access is visible to all threads.
 
     Args:
         group (Group): Indicates the work-group inside which the barrier is to
@@ -36,8 +108,15 @@ def group_barrier(
         fence_scope (MemoryScope) (optional): scope of any memory
             consistency operations that are performed by the barrier.
     Raises:
-        NotImplementedError: When the function is called directly from Python.
+        NotImplementedError: When the function is called outside of a kernel
+            launched over an NdRange.
+        RuntimeError: When some work-items of the work-group returned from
+            the kernel without calling the barrier.
     """
-
-    # TODO: A pure Python simulation of a group_barrier will be added later.
-    raise NotImplementedError
+    # pylint: disable=protected-access
+    if group._barrier is None:
+        raise NotImplementedError(
+            "group_barrier can only be called from a kernel launched over an "
+            "NdRange."
+        )
+    group._barrier.wait()
@@ -21,18 +21,22 @@ class Group:
     a work-item belongs.
     """
 
-    def __init__(
+    def __init__(  # pylint: disable=too-many-arguments
         self,
         global_range: Range,
         local_range: Range,
         group_range: Range,
         index: list,
+        barrier=None,
     ):
         self._global_range = global_range
         self._local_range = local_range
         self._group_range = group_range
         self._index = index
         self._leader = False
+        # The barrier shared by all work-items of the work-group that is used
+        # to simulate group_barrier in pure Python execution.
+        self._barrier = barrier
 
     def get_group_id(self, dim):
         """Returns a specific coordinate of the multi-dimensional index of a group.
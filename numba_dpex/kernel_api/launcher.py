@@ -5,10 +5,18 @@
 """Implementation of mock kernel launcher functions
 """
 
+import numbers
+import os
+import threading
+import warnings
+from concurrent.futures import ThreadPoolExecutor
 from inspect import signature
 from itertools import product
 from typing import Union
 
+import numpy
+
+from .barrier import _WorkGroupAborted, _WorkGroupBarrier
 from .index_space_ids import Group, Item, NdItem
 from .local_accessor import LocalAccessor, _LocalAccessorMock
 from .ranges import NdRange, Range
@@ -53,8 +61,149 @@ def _range_kernel_launcher(kernel_fn, index_range, *kernel_args):
         kernel_fn(it, *kernel_args)
 
 
+# Records if the current thread is tracing a kernel with vectorized work-item
+# ids, so that operations that cannot be vectorized can refuse to execute.
+_vectorized_execution = threading.local()
+
+
+def _in_vectorized_execution():
+    """Returns True if a range kernel is being executed in vectorized mode by
+    the current thread.
+    """
+    return getattr(_vectorized_execution, "active", False)
+
+
+def _vectorized_range_kernel_launcher(kernel_fn, index_range, *kernel_args):
+    """Executes a function that mocks a range kernel once for all work-items.
+
+    The kernel is called a single time with an Item whose ids are NumPy
+    arrays holding the indices of every work-item of the range. Array
+    accesses in the kernel thereby become vectorized NumPy operations over
+    the whole range. Kernels using constructs that cannot be vectorized,
+    *e.g.*, branching on a work-item id or atomic operations, raise an
+    exception when traced this way. The arrays passed to the kernel are then
+    restored and the kernel is executed once per work-item using
+    :func:`_range_kernel_launcher`.
+
+    Args:
+        kernel_fn : A callable function object
+        index_range (numba_dpex.Range): An instance of a Range object
+
+    Raises:
+        ValueError: If the number of passed in kernel arguments is not the
+        number of function parameters subtracted by one. The first kernel
+        argument is expected to be an Item object.
+    """
+    if len(signature(kernel_fn).parameters) - len(kernel_args) != 1:
+        raise ValueError(
+            "Required number of kernel function arguments do not "
+            "match provided number of kernel args"
+        )
+
+    # Only NumPy arrays can be restored if the vectorized execution fails.
+    # A range of a single work-item gains nothing from vectorization and its
+    # one element arrays would silently behave as scalars in conditions.
+    if index_range.size() < 2 or not all(
+        isinstance(karg, (numpy.ndarray, numbers.Number))
+        for karg in kernel_args
+    ):
+        _range_kernel_launcher(kernel_fn, index_range, *kernel_args)
+        return
+
+    snapshots = [
+        (karg, karg.copy())
+        for karg in kernel_args
+        if isinstance(karg, numpy.ndarray) and karg.flags.writeable
+    ]
+    ids = numpy.indices(tuple(index_range), dtype=numpy.intp).reshape(
+        index_range.ndim, -1
+    )
+    it = Item(extent=index_range, index=list(ids))
+
+    _vectorized_execution.active = True
+    try:
+        kernel_fn(it, *kernel_args)
+    except Exception as exc:  # pylint: disable=broad-exception-caught
+        _vectorized_execution.active = False
+        for karg, snapshot in snapshots:
+            numpy.copyto(karg, snapshot)
+        warnings.warn(
+            f"The kernel {getattr(kernel_fn, '__name__', kernel_fn)} could "
+            "not be executed in vectorized mode and falls back to executing "
+            f"every work-item separately: {exc!r}",
+            RuntimeWarning,
+        )
+        _range_kernel_launcher(kernel_fn, index_range, *kernel_args)
+    finally:
+        _vectorized_execution.active = False
+
+
+def _execute_work_group(
+    kernel_fn, index_range, group_range, group_index, kernel_args
+):
+    """Executes all work-items of a single work-group of an NdRange kernel.
+
+    Every work-item runs in a separate thread so that work-items can
+    synchronize using :func:`numba_dpex.kernel_api.group_barrier`. Each
+    work-group gets its own copy of the local memory backing every
+    ``LocalAccessor`` argument.
+    """
+    local_range_sets = [range(lr) for lr in index_range.local_range]
+    local_index_tuples = list(product(*local_range_sets))
+
+    group_kernel_args = [
+        _LocalAccessorMock(karg) if isinstance(karg, LocalAccessor) else karg
+        for karg in kernel_args
+    ]
+    barrier = _WorkGroupBarrier(len(local_index_tuples))
+    errors = []
+
+    def _work_item(local_index):
+        global_id = [
+            gidx_val * index_range.local_range[dim] + local_index[dim]
+            for dim, gidx_val in enumerate(group_index)
+        ]
+        nd_item = NdItem(
+            global_item=Item(extent=index_range.global_range, index=global_id),
+            local_item=Item(extent=index_range.local_range, index=local_index),
+            group=Group(
+                index_range.global_range,
+                index_range.local_range,
+                group_range,
+                group_index,
+                barrier,
+            ),
+        )
+        try:
+            kernel_fn(nd_item, *group_kernel_args)
+        except _WorkGroupAborted:
+            pass
+        except BaseException as exc:  # pylint: disable=broad-exception-caught
+            errors.append(exc)
+            barrier.abort()
+        else:
+            barrier.finish()
+
+    threads = [
+        threading.Thread(target=_work_item, args=(local_index,))
+        for local_index in local_index_tuples
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    if errors:
+        raise errors[0]
+
+
 def _ndrange_kernel_launcher(kernel_fn, index_range, *kernel_args):
-    """Executes a function that mocks a range kernel.
+    """Executes a function that mocks a nd-range kernel.
+
+    The work-items of every work-group are executed as cooperating threads
+    that can synchronize using
+    :func:`numba_dpex.kernel_api.group_barrier`. Independent work-groups are
+    executed concurrently using a thread pool.
 
     Args:
         kernel_fn : A callable function object
@@ -65,55 +214,45 @@ def _ndrange_kernel_launcher(kernel_fn, index_range, *kernel_args):
         number of function parameters subtracted by one. The first kernel
         argument is expected to be an Item object.
     """
+    if len(signature(kernel_fn).parameters) - len(kernel_args) != 1:
+        raise ValueError(
+            "Required number of kernel function arguments do not "
+            "match provided number of kernel args"
+        )
+
     group_range = tuple(
         gr // lr
         for gr, lr in zip(index_range.global_range, index_range.local_range)
     )
-    local_range_sets = [range(ir) for ir in index_range.local_range]
     group_range_sets = [range(gr) for gr in group_range]
-    local_index_tuples = list(product(*local_range_sets))
     group_index_tuples = list(product(*group_range_sets))
 
-    modified_kernel_args = []
-    for karg in kernel_args:
-        if isinstance(karg, LocalAccessor):
-            karg = _LocalAccessorMock(karg)
-        modified_kernel_args.append(karg)
-
-    # Loop over the groups (parallel loop)
-    for gidx in group_index_tuples:
-        # loop over work items in the group (parallel loop)
-        for lidx in local_index_tuples:
-            global_id = []
-            # to calculate global indices
-            for dim, gidx_val in enumerate(gidx):
-                global_id.append(
-                    gidx_val * index_range.local_range[dim] + lidx[dim]
-                )
-            if len(signature(kernel_fn).parameters) - len(kernel_args) != 1:
-                raise ValueError(
-                    "Required number of kernel function arguments do not "
-                    "match provided number of kernel args"
-                )
-
-            kernel_fn(
-                NdItem(
-                    global_item=Item(
-                        extent=index_range.global_range, index=global_id
-                    ),
-                    local_item=Item(extent=index_range.local_range, index=lidx),
-                    group=Group(
-                        index_range.global_range,
-                        index_range.local_range,
-                        group_range,
-                        gidx,
-                    ),
-                ),
-                *modified_kernel_args,
+    # Every work-group already runs one thread per work-item, so the number
+    # of work-groups executed at the same time is kept small.
+    with ThreadPoolExecutor(
+        max_workers=max(1, min(len(group_index_tuples), os.cpu_count() or 1))
+    ) as executor:
+        futures = [
+            executor.submit(
+                _execute_work_group,
+                kernel_fn,
+                index_range,
+                group_range,
+                gidx,
+                kernel_args,
             )
+            for gidx in group_index_tuples
+        ]
+        for future in futures:
+            future.result()
 
 
-def call_kernel(kernel_fn, index_range: Union[Range, NdRange], *kernel_args):
+def call_kernel(
+    kernel_fn,
+    index_range: Union[Range, NdRange],
+    *kernel_args,
+    vectorize: bool = False,
+):
     """Mocks the launching of a kernel function over either a Range or NdRange.
 
     .. important::
@@ -128,6 +267,11 @@ def call_kernel(kernel_fn, index_range: Union[Range, NdRange], *kernel_args):
         index_range (Range|NdRange): An instance of a Range or an NdRange object
         kernel_args (List): The expanded list of actual arguments with which to
             launch the kernel execution.
+        vectorize (bool, optional): If True, a Range kernel is executed once
+            for the whole range using NumPy arrays of work-item ids instead of
+            once per work-item. Kernels whose body cannot be vectorized fall
+            back to the per work-item execution with a ``RuntimeWarning``.
+            The option has no effect for NdRange kernels. Defaults to False.
 
     Raises:
         ValueError: If the first positional argument is not callable.
@@ -139,7 +283,12 @@ def call_kernel(kernel_fn, index_range: Union[Range, NdRange], *kernel_args):
             "Expected the first positional argument to be a function object"
         )
     if isinstance(index_range, Range):
-        _range_kernel_launcher(kernel_fn, index_range, *kernel_args)
+        if vectorize:
+            _vectorized_range_kernel_launcher(
+                kernel_fn, index_range, *kernel_args
+            )
+        else:
+            _range_kernel_launcher(kernel_fn, index_range, *kernel_args)
     elif isinstance(index_range, NdRange):
         _ndrange_kernel_launcher(kernel_fn, index_range, *kernel_args)
     else:
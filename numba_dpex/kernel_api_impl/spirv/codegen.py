@@ -9,6 +9,7 @@ import warnings
 
 from llvmlite import binding as ll
 from llvmlite import ir as llvmir
+from numba.core import event as ev
 from numba.core import utils
 from numba.core.codegen import CPUCodegen, CPUCodeLibrary
 
@@ -58,6 +59,12 @@ class SPIRVCodeLibrary(CPUCodeLibrary):
             self._inline_threshold = value
 
     def _optimize_final_module(self):
+        with ev.trigger_event(
+            "numba_dpex:llvm_optimize", data={"name": f"optimize {self.name}"}
+        ):
+            self._run_final_module_passes()
+
+    def _run_final_module_passes(self):
         # Run some lightweight optimization to simplify the module.
         pmb = ll.PassManagerBuilder()
 
@@ -103,6 +110,25 @@ class SPIRVCodeLibrary(CPUCodeLibrary):
         """Return the final SPIR-V module after it has been finalized."""
         return self._final_module
 
+    @classmethod
+    def _unserialize(cls, codegen, state):
+        """Recreates a finalized library from the state returned by
+        :meth:`serialize_using_bitcode`.
+
+        A SPIR-V library is never added to an execution engine, so unlike the
+        parent class the final module is only parsed back and the library
+        marked as finalized.
+        """
+        name, kind, data = state
+        if kind != "bitcode":
+            raise ValueError(
+                f"Unsupported serialization kind {kind} for a SPIR-V library"
+            )
+        library = codegen.create_library(name)
+        library._final_module = ll.parse_bitcode(data)
+        library._finalized = True
+        return library
+
 
 class JITSPIRVCodegen(CPUCodegen):
     """
@@ -5,10 +5,11 @@
 """Implements a new numba dispatcher class and a compiler class to compile and
 call numba_dpex.kernel decorated function.
 """
+import concurrent.futures
 import hashlib
 from collections import namedtuple
 from contextlib import ExitStack
-from typing import List, Tuple
+from typing import List, NamedTuple, Tuple
 
 import numba.core.event as ev
 from llvmlite.binding.value import ValueRef
@@ -27,6 +28,8 @@ from numba.core.types import void
 from numba.core.typing.typeof import Purpose, typeof
 
 from numba_dpex.core import config
+from numba_dpex.core.aot import kernel_archive_registry
+from numba_dpex.core.caching import SPIRVKernelCache
 from numba_dpex.core.descriptor import dpex_kernel_target
 from numba_dpex.core.exceptions import (
     ExecutionQueueInferenceError,
@@ -37,6 +40,7 @@ from numba_dpex.core.exceptions import (
 from numba_dpex.core.pipelines import kernel_compiler
 from numba_dpex.core.types import USMNdArray
 from numba_dpex.core.utils import call_kernel_builder as kl
+from numba_dpex.initialize import initialize
 from numba_dpex.kernel_api_impl.spirv import spirv_generator
 from numba_dpex.kernel_api_impl.spirv.codegen import SPIRVCodeLibrary
 from numba_dpex.kernel_api_impl.spirv.target import (
@@ -51,6 +55,26 @@ _SPIRVKernelCompileResult = namedtuple(
 )
 
 
+class _UntranslatedKernelModule(NamedTuple):
+    """The LLVM module of a kernel that is not translated to SPIR-V yet."""
+
+    kernel_name: str
+    spirv_module: spirv_generator.Module
+
+    def translate(self, function=None, signature=None) -> kl.SPIRVKernelModule:
+        """Translates the LLVM module to SPIR-V using ``llvm-spirv``.
+
+        The translation does not access the target context, so it can run
+        without holding the global compiler lock. The ``function`` and
+        ``signature`` identify the kernel in the ``numba_dpex:llvm_spirv``
+        event.
+        """
+        return kl.SPIRVKernelModule(
+            kernel_name=self.kernel_name,
+            kernel_bitcode=self.spirv_module.finalize(function, signature),
+        )
+
+
 class _SPIRVKernelCompiler(_FunctionCompiler):
     """A special compiler class used to compile numba_dpex.kernel decorated
     functions.
@@ -154,12 +178,12 @@ class _SPIRVKernelCompiler(_FunctionCompiler):
         self.check_sig_types(py_func_name, args, None)
         self.check_queue_equivalence_of_args(py_func_name, args)
 
-    def _compile_to_spirv(
+    def _compile_to_llvm(
         self,
         kernel_library: SPIRVCodeLibrary,
         kernel_fndesc: PythonFunctionDescriptor,
         kernel_targetctx: SPIRVTargetContext,
-    ):
+    ) -> _UntranslatedKernelModule:
         kernel_func: ValueRef = kernel_library.get_function(
             kernel_fndesc.llvm_func_name
         )
@@ -184,25 +208,27 @@ class _SPIRVKernelCompiler(_FunctionCompiler):
 
         if config.DUMP_KERNEL_LLVM:
             self._dump_kernel(kernel_fndesc, kernel_library)
-        # Compiled the LLVM IR to SPIR-V
-        kernel_spirv_module = spirv_generator.llvm_to_spirv(
-            kernel_targetctx,
-            kernel_library.final_module,
-            kernel_library.final_module.as_bitcode(),
-        )
-        return kl.SPIRVKernelModule(
-            kernel_name=kernel_fn.name, kernel_bitcode=kernel_spirv_module
+
+        return _UntranslatedKernelModule(
+            kernel_name=kernel_fn.name,
+            spirv_module=spirv_generator.Module(
+                kernel_targetctx,
+                kernel_library.final_module,
+                kernel_library.final_module.as_bitcode(),
+            ),
         )
 
-    def compile(self, args, return_type) -> _SPIRVKernelCompileResult:
-        status, kcres = self._compile_cached(args, return_type)
+    def compile(
+        self, args, return_type, translate=True
+    ) -> _SPIRVKernelCompileResult:
+        status, kcres = self._compile_cached(args, return_type, translate)
         if status:
             return kcres
 
         raise kcres
 
     def _compile_cached(
-        self, args, return_type: types.Type
+        self, args, return_type: types.Type, translate=True
     ) -> Tuple[bool, _SPIRVKernelCompileResult]:
         """Compiles the kernel function to bitcode and generates a host-callable
         wrapper to submit the kernel to a SYCL queue.
@@ -230,6 +256,10 @@ class _SPIRVKernelCompiler(_FunctionCompiler):
             return_type (types.Type): The numba-inferred type of the returned
             value from the kernel. Should always be types.NoneType.
 
+            translate (bool): If False, the kernel_device_ir_module of the
+            result of a kernel is an _UntranslatedKernelModule to be
+            translated to SPIR-V by the caller.
+
         Returns:
             CompileResult: A CompileResult object storing the LLVM library for
             the host-callable wrapper function.
@@ -248,11 +278,13 @@ class _SPIRVKernelCompiler(_FunctionCompiler):
                 self.targetoptions["_compilation_mode"]
                 == CompilationMode.KERNEL
             ):
-                kernel_device_ir_module: kl.SPIRVKernelModule = (
-                    self._compile_to_spirv(
-                        cres.library, cres.fndesc, cres.target_context
-                    )
+                kernel_device_ir_module = self._compile_to_llvm(
+                    cres.library, cres.fndesc, cres.target_context
                 )
+                if translate:
+                    kernel_device_ir_module = (
+                        kernel_device_ir_module.translate()
+                    )
             else:
                 kernel_device_ir_module = None
 
@@ -317,10 +349,15 @@ class SPIRVKernelDispatcher(Dispatcher):
         if local_vars_to_numba_types is None:
             local_vars_to_numba_types = {}
 
+        # Load the registries before the target contexts are created.
+        initialize()
+
         targetoptions["nopython"] = True
         targetoptions["experimental"] = True
 
         self._kernel_name = pyfunc.__name__
+        # The futures of the signatures compiled in the background.
+        self._pending_compiles = {}
 
         super().__init__(
             py_func=pyfunc,
@@ -362,11 +399,151 @@ class SPIRVKernelDispatcher(Dispatcher):
         args = tuple(cres.signature.args)
         self.overloads[args] = cres
 
+    def enable_caching(self):
+        """Enables saving the SPIR-V binary of every compiled kernel
+        specialization into an on-disk cache and reusing it across processes.
+        """
+        self._cache = SPIRVKernelCache(
+            self.py_func, self.targetdescr, self.targetoptions
+        )
+
+    def _add_pending_compile(self, args, future):
+        """Registers the future of a background compilation of a signature.
+
+        The future is removed once the compilation is complete.
+        """
+        self._pending_compiles[args] = future
+
+        def _remove(done_future):
+            if self._pending_compiles.get(args) is done_future:
+                del self._pending_compiles[args]
+
+        future.add_done_callback(_remove)
+
+    def wait_for_background_compilation(self):
+        """Blocks until all the signatures of the kernel that are compiled in
+        the background are compiled.
+
+        The errors of failed compilations are raised by their futures and not
+        by this method.
+        """
+        if self._pending_compiles:
+            concurrent.futures.wait(list(self._pending_compiles.values()))
+
+    def _wait_for_pending_compile(self, sig):
+        """Blocks until the background compilation of a signature, if any, is
+        complete.
+
+        A thread that holds the global compiler lock cannot wait, as the
+        background compilation needs the lock to complete, and compiles the
+        signature again.
+        """
+        if not self._pending_compiles:
+            return
+        if global_compiler_lock.is_locked():
+            return
+
+        args, _ = sigutils.normalize_signature(sig)
+        future = self._pending_compiles.get(tuple(args))
+        if future is not None:
+            concurrent.futures.wait((future,))
+
+    def _load_archived_overload(self, args):
+        """Returns a compile result holding the SPIR-V module of the signature
+        found in a loaded kernel archive, or None.
+
+        The function is neither typed nor lowered, so the result only has the
+        fields needed to launch the kernel.
+        """
+        if self.targetoptions["_compilation_mode"] != CompilationMode.KERNEL:
+            return None
+
+        kernel_module = kernel_archive_registry.lookup(
+            self.py_func, self.targetoptions, args
+        )
+        if kernel_module is None:
+            return None
+
+        kcres_attrs = dict.fromkeys(_SPIRVKernelCompileResult._fields)
+        kcres_attrs.update(
+            typing_context=self.typingctx,
+            target_context=self.targetctx,
+            signature=types.void(*args),
+            objectmode=False,
+            lifted=(),
+            reload_init=[],
+            referenced_envs=(),
+            kernel_device_ir_module=kernel_module,
+        )
+        return _SPIRVKernelCompileResult(**kcres_attrs)
+
     def compile(self, sig) -> any:
         disp = self._get_dispatcher_for_current_target()
         if disp is not self:
             return disp.compile(sig)
 
+        self._wait_for_pending_compile(sig)
+
+        return self._compile_under_lock(sig, translate=True).entry_point
+
+    def _compile_with_deferred_translation(self, args):
+        """Compiles a signature like :meth:`compile`, but translates the LLVM
+        module of a newly compiled kernel to SPIR-V without holding the global
+        compiler lock.
+
+        The kernel is typed and lowered under the lock. ``llvm-spirv`` runs
+        once the lock is released, and the overload is added under the lock
+        again. Used by the worker threads of the background compiler, which do
+        not hold the lock when calling this method.
+
+        Returns: The compile result of the signature.
+        """
+        disp = self._get_dispatcher_for_current_target()
+        if disp is not self:
+            # pylint: disable=protected-access
+            return disp._compile_with_deferred_translation(args)
+
+        args, return_type = sigutils.normalize_signature(args)
+        kcres = self._compile_under_lock(args, translate=False)
+        kernel_module = kcres.kernel_device_ir_module
+        if not isinstance(kernel_module, _UntranslatedKernelModule):
+            return kcres
+
+        kcres = kcres._replace(
+            kernel_device_ir_module=kernel_module.translate(
+                function=self.py_func.__qualname__,
+                signature="(" + ", ".join(str(ty) for ty in args) + ")",
+            )
+        )
+
+        with global_compiler_lock:
+            # Another thread may have compiled the signature in the meantime.
+            existing = self.overloads.get(tuple(args))
+            if existing is not None:
+                return existing
+            self._add_compiled_overload(kcres, args, return_type)
+
+        return kcres
+
+    def _add_compiled_overload(self, kcres, args, return_type):
+        """Adds the overload of a newly compiled signature and saves it to the
+        on-disk cache. Must be called with the global compiler lock held.
+        """
+        self.add_overload(kcres)
+
+        kcres.target_context.insert_user_function(
+            kcres.entry_point, kcres.fndesc, [kcres.library]
+        )
+        self._cache.save_overload((tuple(args), return_type), kcres)
+
+    def _compile_under_lock(self, sig, translate):
+        """Compiles a signature with the global compiler lock held and returns
+        its compile result.
+
+        If ``translate`` is False and the signature is compiled anew, the
+        result holds an untranslated kernel module and the overload is not
+        added.
+        """
         with ExitStack() as scope:
             cres = None
 
@@ -407,11 +584,26 @@ class SPIRVKernelDispatcher(Dispatcher):
                 # Don't recompile if signature already exists
                 existing = self.overloads.get(tuple(args))
                 if existing is not None:
-                    return existing.entry_point
+                    return existing
+
+                # Use the SPIR-V module of a loaded kernel archive
+                kcres = self._load_archived_overload(args)
+                if kcres is not None:
+                    self.add_overload(kcres)
+                    return kcres
+
+                # Try to load the compiled kernel from the on-disk cache
+                kcres = self._cache.load_overload(
+                    (tuple(args), return_type), self.targetctx
+                )
+                if kcres is not None:
+                    self._cache_hits[sig] += 1
+                    self.add_overload(kcres)
+                    kcres.target_context.insert_user_function(
+                        kcres.entry_point, kcres.fndesc, [kcres.library]
+                    )
+                    return kcres
 
-                # TODO: Enable caching
-                # Add code to enable on disk caching of a binary spirv kernel.
-                # Refer: https://github.com/IntelPython/numba-dpex/issues/1197
                 self._cache_misses[sig] += 1
                 with ev.trigger_event(
                     "numba_dpex:compile",
@@ -424,7 +616,7 @@ class SPIRVKernelDispatcher(Dispatcher):
                     try:
                         compiler: _SPIRVKernelCompiler = self._compiler
                         kcres: _SPIRVKernelCompileResult = compiler.compile(
-                            args, return_type
+                            args, return_type, translate
                         )
                         if (
                             self.targetoptions["_compilation_mode"]
@@ -444,16 +636,13 @@ class SPIRVKernelDispatcher(Dispatcher):
                             )[1]
 
                         raise err.bind_fold_arguments(folded)
-                    self.add_overload(kcres)
-
-                    kcres.target_context.insert_user_function(
-                        kcres.entry_point, kcres.fndesc, [kcres.library]
-                    )
 
-                # TODO: enable caching of kernel_module
-                # https://github.com/IntelPython/numba-dpex/issues/1197
+                    if not isinstance(
+                        kcres.kernel_device_ir_module, _UntranslatedKernelModule
+                    ):
+                        self._add_compiled_overload(kcres, args, return_type)
 
-                return kcres.entry_point
+                return kcres
 
     def __getitem__(self, args):
         """Square-bracket notation for configuring launch arguments is not
@@ -5,11 +5,20 @@
 """
 A wrapper to call dpcpp's llvm-spirv tool to generate a SPIR-V binary from
 a numba-dpex generated LLVM IR module.
+
+By default the LLVM bitcode is streamed to ``llvm-spirv`` through its standard
+input and the SPIR-V binary is read back from its standard output, so that no
+temporary files are needed. The original translation through temporary files
+is used as a fallback when the streaming translation fails and can also be
+selected using the ``NUMBA_DPEX_SPIRV_TRANSLATOR`` config flag.
 """
 
 import os
 import tempfile
-from subprocess import STDOUT, CalledProcessError, check_output
+import warnings
+from subprocess import PIPE, STDOUT, CalledProcessError, check_output, run
+
+from numba.core import event as ev
 
 from numba_dpex.core import config
 from numba_dpex.core.exceptions import InternalError
@@ -20,6 +29,20 @@ try:
 except ImportError as err:
     raise ImportError("Cannot import dpcpp-llvm-spirv package") from err
 
+# The default set of SPIR-V extensions enabled when translating a LLVM module.
+# The arguments are also part of the on-disk cache key of a compiled kernel.
+DEFAULT_LLVM_SPIRV_ARGS = (
+    "--spirv-ext=+SPV_EXT_shader_atomic_float_add",
+    "--spirv-ext=+SPV_EXT_shader_atomic_float_min_max",
+    "--spirv-ext=+SPV_INTEL_arbitrary_precision_integers",
+    "--spirv-ext=+SPV_INTEL_variable_length_array",
+)
+
+# Set to False once a streaming translation failed while the translation of
+# the same module through temporary files succeeded, i.e., the llvm-spirv
+# tool does not support reading from stdin or writing to stdout.
+_streaming_supported = True
+
 
 def run_cmd(args, error_message=None):
     """
@@ -39,6 +62,30 @@ def run_cmd(args, error_message=None):
         ) from cper
 
 
+def _translate_through_pipes(args, llvmbc, error_message):
+    """Runs ``llvm-spirv`` feeding the LLVM bitcode through stdin and returns
+    the SPIR-V binary written to stdout.
+    """
+    try:
+        result = run(
+            [*args, "-o", "-", "-"],
+            input=llvmbc,
+            stdout=PIPE,
+            stderr=PIPE,
+            check=True,
+        )
+    except CalledProcessError as cper:
+        raise InternalError(
+            f"{error_message}:\n\t"
+            + "\t".join(cper.stderr.decode("utf-8").splitlines(True))
+        ) from cper
+
+    if not result.stdout:
+        raise InternalError(f"{error_message}: {args[0]} wrote no output")
+
+    return result.stdout
+
+
 class Module:
     """
     Abstracts a SPIR-V binary module that is created by calling
@@ -52,7 +99,7 @@ class Module:
         return dls.get_llvm_spirv_path()
 
     def __init__(self, context, llvmir, llvmbc):
-        self._tmpdir = tempfile.mkdtemp()
+        self._tmpdir = None
         self._tempfiles = []
         self._finalized = False
         self.context = context
@@ -60,14 +107,29 @@ class Module:
         self._llvmir = llvmir
         self._llvmbc = llvmbc
 
+        # The arguments are taken from the target context when the module is
+        # created, so that finalize does not access the context and can run
+        # without holding the global compiler lock.
+        # TODO: find better approach to set SPIRV compiler arguments.
+        #  Workaround against caching intrinsic that sets this argument.
+        # https://github.com/IntelPython/numba-dpex/issues/1262
+        self._llvm_spirv_args = list(DEFAULT_LLVM_SPIRV_ARGS)
+        for key in list(context.extra_compile_options.keys()):
+            if key == LLVM_SPIRV_ARGS:
+                self._llvm_spirv_args = context.extra_compile_options[key]
+            del context.extra_compile_options[key]
+
     def __del__(self):
         # Remove all temporary files
         for afile in self._tempfiles:
             os.unlink(afile)
         # Remove directory
-        os.rmdir(self._tmpdir)
+        if self._tmpdir is not None:
+            os.rmdir(self._tmpdir)
 
     def _track_temp_file(self, name):
+        if self._tmpdir is None:
+            self._tmpdir = tempfile.mkdtemp()
         path = os.path.join(self._tmpdir, f"{len(self._tempfiles)}-{name}")
         self._tempfiles.append(path)
         return path
@@ -97,6 +159,51 @@ class Module:
             error_message="Error during lowering LLVM IR to SPIRV",
         )
 
+    def _generate_spirv_in_memory(self, llvm_spirv_args):
+        """
+        Generate a spirv module from llvm bitcode without any temporary files.
+
+        Args:
+            llvm_spirv_args: Args to be provided to llvm-spirv tool.
+
+        Returns:
+            The SPIR-V binary.
+        """
+        llvm_spirv_tool = self._llvm_spirv()
+
+        if config.DEBUG:
+            print(f"Use llvm-spirv: {llvm_spirv_tool}")
+
+        return _translate_through_pipes(
+            [llvm_spirv_tool, *llvm_spirv_args],
+            self._llvmbc,
+            error_message="Error during lowering LLVM IR to SPIRV",
+        )
+
+    def _generate_spirv_using_files(self, llvm_spirv_args):
+        """
+        Generate a spirv module from llvm bitcode using temporary files for the
+        input and the output of llvm-spirv.
+
+        Args:
+            llvm_spirv_args: Args to be provided to llvm-spirv tool.
+
+        Returns:
+            The SPIR-V binary.
+        """
+        if self._llvmfile is None:
+            self.load_llvm()
+
+        spirv_path = self._track_temp_file("generated-spirv")
+        self._generate_spirv(
+            llvm_spirv_args=llvm_spirv_args,
+            ipath=self._llvmfile,
+            opath=spirv_path,
+        )
+
+        with open(spirv_path, "rb") as fin:
+            return fin.read()
+
     def load_llvm(self):
         """
         Load LLVM with "SPIR-V friendly" SPIR 2.0 spec
@@ -108,29 +215,41 @@ class Module:
 
         self._llvmfile = llvm_path
 
-    def finalize(self):
+    def _translate(self, llvm_spirv_args):
+        """Translates the LLVM bitcode to SPIR-V using the translator selected
+        by ``config.SPIRV_TRANSLATOR``.
+
+        A failed streaming translation is retried using temporary files. If
+        the retry succeeds the streaming translation is disabled for the rest
+        of the process.
+        """
+        global _streaming_supported  # pylint: disable=global-statement
+
+        if config.SPIRV_TRANSLATOR != "pipe" or not _streaming_supported:
+            return self._generate_spirv_using_files(llvm_spirv_args)
+
+        try:
+            return self._generate_spirv_in_memory(llvm_spirv_args)
+        except (InternalError, OSError) as err:
+            spirv = self._generate_spirv_using_files(llvm_spirv_args)
+            _streaming_supported = False
+            warnings.warn(
+                "Translating LLVM IR to SPIR-V through pipes failed and the "
+                "translation through temporary files will be used instead: "
+                f"{err}"
+            )
+            return spirv
+
+    def finalize(self, function=None, signature=None):
         """
         Finalize module and return the SPIR-V code
+
+        The ``function`` and ``signature`` are added to the data of the
+        ``numba_dpex:llvm_spirv`` event, so that a translation that runs
+        outside of the compilation of the kernel can be attributed to it.
         """
         assert not self._finalized, "Module finalized already"
 
-        # Generate SPIR-V from "friendly" LLVM-based SPIR 2.0
-        spirv_path = self._track_temp_file("generated-spirv")
-
-        # TODO: find better approach to set SPIRV compiler arguments. Workaround
-        #  against caching intrinsic that sets this argument.
-        # https://github.com/IntelPython/numba-dpex/issues/1262
-        llvm_spirv_args = [
-            "--spirv-ext=+SPV_EXT_shader_atomic_float_add",
-            "--spirv-ext=+SPV_EXT_shader_atomic_float_min_max",
-            "--spirv-ext=+SPV_INTEL_arbitrary_precision_integers",
-            "--spirv-ext=+SPV_INTEL_variable_length_array",
-        ]
-        for key in list(self.context.extra_compile_options.keys()):
-            if key == LLVM_SPIRV_ARGS:
-                llvm_spirv_args = self.context.extra_compile_options[key]
-            del self.context.extra_compile_options[key]
-
         if config.SAVE_IR_FILES != 0:
             # Dump the llvmir and llvmbc in file
             with open("generated_llvm.ir", "w", encoding="utf-8") as f:
@@ -145,44 +264,25 @@ class Module:
             print("generated_llvm.bc")
             print("".center(80, "="))
 
-        self._generate_spirv(
-            llvm_spirv_args=llvm_spirv_args,
-            ipath=self._llvmfile,
-            opath=spirv_path,
-        )
+        with ev.trigger_event(
+            "numba_dpex:llvm_spirv",
+            data={
+                "name": f"llvm-spirv ({config.SPIRV_TRANSLATOR})",
+                "function": function,
+                "signature": signature,
+            },
+        ):
+            spirv = self._translate(self._llvm_spirv_args)
 
         if config.SAVE_IR_FILES != 0:
-            # Dump the llvmir and llvmbc in file
-            with open("generated_spirv.spir", "wb") as f1:
-                with open(spirv_path, "rb") as f2:
-                    spirv_content = f2.read()
-                    f1.write(spirv_content)
+            # Dump the generated SPIR-V in file
+            with open("generated_spirv.spir", "wb") as f:
+                f.write(spirv)
 
             print("Generated SPIRV".center(80, "-"))
             print("generated_spirv.spir")
             print("".center(80, "="))
 
-        # Read and return final SPIR-V
-        with open(spirv_path, "rb") as fin:
-            spirv = fin.read()
-
         self._finalized = True
 
         return spirv
-
-
-def llvm_to_spirv(context, llvmir, llvmbc):
-    """
-    Generate SPIR-V from LLVM Bitcode.
-
-    Args:
-        context: Numba target context.
-        llvmir: LLVM IR.
-        llvmbc: LLVM Bitcode.
-
-    Returns:
-        spirv: SPIR-V binary.
-    """
-    mod = Module(context, llvmir, llvmbc)
-    mod.load_llvm()
-    return mod.finalize()
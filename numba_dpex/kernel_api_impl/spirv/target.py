@@ -182,12 +182,62 @@ class SPIRVTargetContext(BaseContext):
         # Set SPIR kernel calling convention
         fn.calling_convention = CC_SPIR_KERNEL
 
+    def _has_contiguous_kernel_args(self, argtype):
+        """Returns True if an argument of the type is passed to a kernel as
+        only the data pointer and the shape of an array.
+        """
+        model = self.data_model_manager.lookup(argtype)
+        return getattr(model, "has_contiguous_kernel_args", False)
+
+    def _kernel_argument_types(self, argtype):
+        """Returns the LLVM types of the kernel arguments that an argument of
+        the type is flattened into.
+        """
+        llargtys = list(self.get_arg_packer((argtype,)).argument_types)
+        if self._has_contiguous_kernel_args(argtype):
+            # The data pointer is followed by the shape and is preceded only
+            # by scalar members.
+            model = self.data_model_manager.lookup(argtype)
+            data_pos = model.get_field_position("data")
+            shape_end = data_pos + 1 + argtype.ndim
+            return llargtys[data_pos:shape_end]
+        return llargtys
+
+    def _unpack_contiguous_array_args(self, builder, argtype, args):
+        """Rebuilds the flattened members of a C- or F-contiguous array from
+        its data pointer and its shape.
+
+        The nitems and itemsize members and the strides in bytes are
+        computed from the shape, so the device compiler can fold them.
+        """
+        intp_t = self.get_value_type(nb_types.intp)
+        data, shape = args[0], list(args[1:])
+        itemsize = llvmir.Constant(
+            intp_t, self.get_abi_sizeof(self.get_data_type(argtype.dtype))
+        )
+
+        nitems = llvmir.Constant(intp_t, 1)
+        for extent in shape:
+            nitems = builder.mul(nitems, extent)
+
+        strides = [None] * argtype.ndim
+        dims = range(argtype.ndim)
+        if argtype.layout == "C":
+            dims = reversed(dims)
+        stride = itemsize
+        for dim in dims:
+            strides[dim] = stride
+            stride = builder.mul(stride, shape[dim])
+
+        return [nitems, itemsize, data] + shape + strides
+
     def _generate_spir_kernel_wrapper(self, func, argtypes):
         module = func.module
         arginfo = self.get_arg_packer(argtypes)
-        wrapperfnty = llvmir.FunctionType(
-            llvmir.VoidType(), arginfo.argument_types
-        )
+        wrapper_argtys = []
+        for argtype in argtypes:
+            wrapper_argtys.extend(self._kernel_argument_types(argtype))
+        wrapperfnty = llvmir.FunctionType(llvmir.VoidType(), wrapper_argtys)
         wrapper_module = self._internal_codegen.create_empty_spirv_module(
             "dpex.kernel.wrapper"
         )
@@ -202,7 +252,22 @@ class SPIRVTargetContext(BaseContext):
         wrapper = llvmir.Function(wrapper_module, wrapperfnty, name=wrappername)
         builder = llvmir.IRBuilder(wrapper.append_basic_block("entry"))
 
-        callargs = arginfo.from_arguments(builder, wrapper.args)
+        # Contiguous arrays are passed without the members that follow from
+        # their shape. Rebuild the arguments of every member before unpacking
+        # them into the values passed to the kernel function.
+        wrapper_args = iter(wrapper.args)
+        flattened_args = []
+        for argtype in argtypes:
+            args = [
+                next(wrapper_args) for _ in self._kernel_argument_types(argtype)
+            ]
+            if self._has_contiguous_kernel_args(argtype):
+                args = self._unpack_contiguous_array_args(
+                    builder, argtype, args
+                )
+            flattened_args.extend(args)
+
+        callargs = arginfo.from_arguments(builder, flattened_args)
 
         # XXX handle error status
         self.call_conv.call_function(
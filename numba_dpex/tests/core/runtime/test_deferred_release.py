@@ -0,0 +1,59 @@
+# SPDX-FileCopyrightText: 2024 Intel Corporation
+#
+# SPDX-License-Identifier: Apache-2.0
+
+import dpnp
+import pytest
+
+import numba_dpex as dpex
+from numba_dpex.core import config
+from numba_dpex.core.runtime import deferred_release
+from numba_dpex.kernel_api import Item, Range
+
+
+@dpex.kernel
+def add_one(item: Item, a):
+    i = item.get_id(0)
+    a[i] += 1
+
+
+@pytest.fixture
+def deferred_releases():
+    if not config.DEFERRED_MEMINFO_RELEASE:
+        pytest.skip("The deferred meminfo release is disabled.")
+    deferred_release.release_deferred_meminfos(wait=True)
+    yield
+    deferred_release.release_deferred_meminfos(wait=True)
+
+
+def test_async_launches_do_not_submit_host_tasks(deferred_releases):
+    a = dpnp.zeros(100, dtype=dpnp.int64)
+    # Compiles the launch function.
+    dpex.call_kernel_async(add_one, Range(100), (), a)[1].wait()
+
+    host_tasks = deferred_release.deferred_release_info().host_tasks
+    event = None
+    for _ in range(10):
+        deps = () if event is None else (event,)
+        _, event = dpex.call_kernel_async(add_one, Range(100), deps, a)
+    event.wait()
+
+    info = deferred_release.deferred_release_info()
+    assert info.host_tasks == host_tasks
+    assert 0 < info.pending <= 11
+
+    assert deferred_release.release_deferred_meminfos() == info.pending
+    assert deferred_release.deferred_release_info().pending == 0
+    assert dpnp.all(a == 11)
+
+
+def test_arguments_are_kept_alive(deferred_releases):
+    a = dpnp.zeros(100, dtype=dpnp.int64)
+    b = a[10:20]
+    host_event, event = dpex.call_kernel_async(add_one, Range(10), (), b)
+    del b
+
+    event.wait()
+    host_event.wait()
+    assert deferred_release.release_deferred_meminfos(wait=True) == 1
+    assert dpnp.sum(a) == 10
@@ -0,0 +1,210 @@
+# SPDX-FileCopyrightText: 2024 Intel Corporation
+#
+# SPDX-License-Identifier: Apache-2.0
+
+import threading
+
+import dpnp
+import pytest
+
+import numba_dpex as dpex
+from numba_dpex.core import config
+from numba_dpex.core.runtime import kernel_cache
+from numba_dpex.kernel_api import Item, Range
+
+
+def make_add_kernel(value):
+    """Returns a new kernel, so that its launches start with an empty call
+    site slot."""
+
+    @dpex.kernel
+    def add(item: Item, a):
+        i = item.get_id(0)
+        a[i] += value
+
+    return add
+
+
+@pytest.fixture
+def empty_cache():
+    old_capacity = kernel_cache.kernel_cache_info().capacity
+    kernel_cache.purge_kernel_cache()
+    kernel_cache.reset_kernel_cache_stats()
+    yield
+    kernel_cache.set_kernel_cache_capacity(old_capacity)
+
+
+def test_hits_and_misses(empty_cache, monkeypatch):
+    monkeypatch.setattr(config, "KERNEL_CALL_SITE_CACHE", 0)
+    add_one = make_add_kernel(1)
+    a = dpnp.zeros(10)
+    dpex.call_kernel(add_one, Range(10), a)
+    dpex.call_kernel(add_one, Range(10), a)
+
+    info = kernel_cache.kernel_cache_info()
+    assert info.size == 1
+    assert info.misses == 1
+    assert info.hits == 1
+    assert info.evictions == 0
+    assert info.call_site_hits == 0
+
+
+def test_call_site_hits(empty_cache):
+    add_one = make_add_kernel(1)
+    a = dpnp.zeros(10)
+    dpex.call_kernel(add_one, Range(10), a)
+    dpex.call_kernel(add_one, Range(10), a)
+    dpex.call_kernel(add_one, Range(10), a)
+
+    info = kernel_cache.kernel_cache_info()
+    assert info.size == 1
+    assert info.misses == 1
+    assert info.hits == 0
+    assert info.call_site_hits == 2
+
+    assert dpnp.all(a == 3)
+
+
+def test_lru_eviction(empty_cache, monkeypatch):
+    monkeypatch.setattr(config, "KERNEL_CALL_SITE_CACHE", 0)
+    add_one = make_add_kernel(1)
+    add_two = make_add_kernel(2)
+    add_three = make_add_kernel(3)
+    kernel_cache.set_kernel_cache_capacity(2)
+    a = dpnp.zeros(10)
+
+    dpex.call_kernel(add_one, Range(10), a)
+    dpex.call_kernel(add_two, Range(10), a)
+    # add_one becomes the most recently used kernel
+    dpex.call_kernel(add_one, Range(10), a)
+    # evicts add_two
+    dpex.call_kernel(add_three, Range(10), a)
+
+    info = kernel_cache.kernel_cache_info()
+    assert info.size == 2
+    assert info.evictions == 1
+
+    dpex.call_kernel(add_one, Range(10), a)
+    assert kernel_cache.kernel_cache_info().hits == 2
+    dpex.call_kernel(add_two, Range(10), a)
+    assert kernel_cache.kernel_cache_info().misses == 4
+
+    assert dpnp.all(a == 9)
+
+
+def test_eviction_invalidates_call_sites(empty_cache):
+    add_one = make_add_kernel(1)
+    add_two = make_add_kernel(2)
+    add_three = make_add_kernel(3)
+    kernel_cache.set_kernel_cache_capacity(2)
+    a = dpnp.zeros(10)
+
+    dpex.call_kernel(add_one, Range(10), a)
+    dpex.call_kernel(add_two, Range(10), a)
+    # evicts add_one, so its call site looks up the cache again and rebuilds it
+    dpex.call_kernel(add_three, Range(10), a)
+    dpex.call_kernel(add_one, Range(10), a)
+
+    info = kernel_cache.kernel_cache_info()
+    assert info.size == 2
+    assert info.evictions == 2
+    assert info.misses == 4
+    assert info.call_site_hits == 0
+
+    # rebuilding add_one evicted add_two, so the call site is refreshed from
+    # the cache once more before it is used
+    dpex.call_kernel(add_one, Range(10), a)
+    dpex.call_kernel(add_one, Range(10), a)
+    info = kernel_cache.kernel_cache_info()
+    assert info.hits == 1
+    assert info.call_site_hits == 1
+
+    assert dpnp.all(a == 9)
+
+
+def test_purge_releases_call_site_kernels(empty_cache):
+    add_one = make_add_kernel(1)
+    a = dpnp.zeros(10)
+    dpex.call_kernel(add_one, Range(10), a)
+    dpex.call_kernel(add_one, Range(10), a)
+    assert kernel_cache.kernel_cache_info().call_site_hits == 1
+
+    assert kernel_cache.purge_kernel_cache() == 1
+    assert kernel_cache.kernel_cache_info().size == 0
+
+    dpex.call_kernel(add_one, Range(10), a)
+    info = kernel_cache.kernel_cache_info()
+    assert info.size == 1
+    assert info.misses == 2
+    assert info.call_site_hits == 1
+
+    assert dpnp.all(a == 3)
+
+
+def test_shrinking_capacity_evicts(empty_cache):
+    a = dpnp.zeros(10)
+    dpex.call_kernel(make_add_kernel(1), Range(10), a)
+    dpex.call_kernel(make_add_kernel(2), Range(10), a)
+
+    kernel_cache.set_kernel_cache_capacity(1)
+
+    info = kernel_cache.kernel_cache_info()
+    assert info.capacity == 1
+    assert info.size == 1
+    assert info.evictions == 1
+
+
+def test_purge_by_queue(empty_cache, monkeypatch):
+    monkeypatch.setattr(config, "KERNEL_CALL_SITE_CACHE", 0)
+    add_one = make_add_kernel(1)
+    add_two = make_add_kernel(2)
+    a = dpnp.zeros(10)
+    dpex.call_kernel(add_one, Range(10), a)
+    dpex.call_kernel(add_two, Range(10), a)
+
+    assert kernel_cache.purge_kernel_cache(device=a.sycl_device) == 2
+    assert kernel_cache.kernel_cache_info().size == 0
+
+    dpex.call_kernel(add_one, Range(10), a)
+    assert kernel_cache.purge_kernel_cache(a.sycl_queue) == 1
+
+
+def test_concurrent_builds(empty_cache):
+    """Tests that concurrent launches of two kernels from several threads
+    build every kernel once."""
+    kernels = [make_add_kernel(1), make_add_kernel(2)]
+    # Compiles the launch functions, so that the threads only build kernels.
+    for kernel in kernels:
+        dpex.call_kernel(kernel, Range(10), dpnp.zeros(10))
+    kernel_cache.purge_kernel_cache()
+    kernel_cache.reset_kernel_cache_stats()
+
+    arrays = [dpnp.zeros(10) for _ in range(4)]
+    barrier = threading.Barrier(len(arrays))
+
+    def launch(i):
+        barrier.wait()
+        dpex.call_kernel(kernels[i % 2], Range(10), arrays[i])
+
+    threads = [
+        threading.Thread(target=launch, args=(i,)) for i in range(len(arrays))
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    info = kernel_cache.kernel_cache_info()
+    assert info.size == 2
+    assert info.misses == 2
+    for i, a in enumerate(arrays):
+        assert dpnp.all(a == i % 2 + 1)
+
+
+def test_invalid_arguments():
+    with pytest.raises(ValueError):
+        kernel_cache.set_kernel_cache_capacity(-1)
+
+    a = dpnp.zeros(1)
+    with pytest.raises(ValueError):
+        kernel_cache.purge_kernel_cache(a.sycl_queue, device=a.sycl_device)
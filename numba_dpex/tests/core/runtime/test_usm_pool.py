@@ -0,0 +1,118 @@
+# SPDX-FileCopyrightText: 2024 Intel Corporation
+#
+# SPDX-License-Identifier: Apache-2.0
+
+import dpnp
+import pytest
+
+import numba_dpex as dpex
+from numba_dpex.core.runtime import usm_pool
+
+
+@dpex.dpjit
+def allocate(n):
+    return dpnp.empty(n, dtype=dpnp.float64, usm_type="device")
+
+
+@pytest.fixture
+def empty_pool():
+    old_info = usm_pool.usm_pool_info()
+    usm_pool.set_usm_pool_enabled(True)
+    # Compiles the function before the stats are reset.
+    allocate(1)
+    usm_pool.trim_usm_pool()
+    usm_pool.reset_usm_pool_stats()
+    yield
+    usm_pool.set_usm_pool_enabled(old_info.enabled)
+    usm_pool.set_usm_pool_limit(old_info.limit)
+    usm_pool.trim_usm_pool()
+
+
+def test_released_memory_is_reused(empty_pool):
+    a = allocate(1000)
+    info = usm_pool.usm_pool_info()
+    assert info.misses == 1
+    assert info.bytes_in_use == 8192
+    assert info.bytes_cached == 0
+
+    del a
+    info = usm_pool.usm_pool_info()
+    assert info.bytes_in_use == 0
+    assert info.bytes_cached == 8192
+
+    # 7200 bytes belong to the same size class as 8000 bytes.
+    b = allocate(900)
+    info = usm_pool.usm_pool_info()
+    assert info.hits == 1
+    assert info.misses == 1
+    assert info.bytes_in_use == 8192
+    assert info.bytes_cached == 0
+    assert info.peak_bytes == 8192
+
+    b[:] = 1
+    assert dpnp.all(b == 1)
+
+
+def test_different_size_classes(empty_pool):
+    a = allocate(1000)
+    del a
+    b = allocate(2000)
+
+    info = usm_pool.usm_pool_info()
+    assert info.hits == 0
+    assert info.misses == 2
+    assert info.bytes_in_use == 16384
+    assert info.bytes_cached == 8192
+    assert info.peak_bytes == 16384 + 8192
+
+    del b
+
+
+def test_limit(empty_pool):
+    usm_pool.set_usm_pool_limit(10000)
+    a = allocate(1000)
+    b = allocate(1000)
+    del a
+    del b
+
+    info = usm_pool.usm_pool_info()
+    assert info.bytes_in_use == 0
+    assert info.bytes_cached == 8192
+
+    usm_pool.set_usm_pool_limit(0)
+    assert usm_pool.usm_pool_info().bytes_cached == 0
+
+
+def test_disabled_pool(empty_pool):
+    usm_pool.set_usm_pool_enabled(False)
+    a = allocate(1000)
+
+    info = usm_pool.usm_pool_info()
+    assert not info.enabled
+    assert info.misses == 0
+    assert info.bytes_in_use == 0
+
+    del a
+    assert usm_pool.usm_pool_info().bytes_cached == 0
+
+
+def test_trim_by_queue(empty_pool):
+    a = allocate(1000)
+    queue = a.sycl_queue
+    del a
+
+    assert usm_pool.trim_usm_pool(device=queue.sycl_device) == 8192
+    assert usm_pool.usm_pool_info().bytes_cached == 0
+
+    a = allocate(1000)
+    del a
+    assert usm_pool.trim_usm_pool(queue) == 8192
+
+
+def test_invalid_arguments():
+    with pytest.raises(ValueError):
+        usm_pool.set_usm_pool_limit(-1)
+
+    a = dpnp.zeros(1)
+    with pytest.raises(ValueError):
+        usm_pool.trim_usm_pool(a.sycl_queue, device=a.sycl_device)
@@ -0,0 +1,59 @@
+# SPDX-FileCopyrightText: 2024 Intel Corporation
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Tests for the queue agnostic specialization mode of DpctlSyclQueue
+"""
+
+import dpctl
+import dpnp
+from numba import typeof
+
+import numba_dpex as dpex
+from numba_dpex.core import config
+from numba_dpex.kernel_api import Item, Range
+
+
+def add_one(item: Item, a):
+    i = item.get_id(0)
+    a[i] += 1
+
+
+def test_queue_types_differ_by_default(monkeypatch):
+    monkeypatch.setattr(config, "QUEUE_AGNOSTIC_SPECIALIZATION", 0)
+    device = dpctl.SyclDevice()
+
+    q1 = dpctl.SyclQueue(device)
+    q2 = dpctl.SyclQueue(device)
+
+    assert typeof(q1) != typeof(q2)
+
+
+def test_queue_types_are_equal_per_device(monkeypatch):
+    monkeypatch.setattr(config, "QUEUE_AGNOSTIC_SPECIALIZATION", 1)
+    device = dpctl.SyclDevice()
+
+    q1 = dpctl.SyclQueue(device)
+    q2 = dpctl.SyclQueue(device)
+
+    assert typeof(q1) == typeof(q2)
+    assert typeof(dpnp.zeros(10, sycl_queue=q1)) == typeof(
+        dpnp.zeros(10, sycl_queue=q2)
+    )
+
+
+def test_kernel_compiled_once_for_all_queues(monkeypatch):
+    monkeypatch.setattr(config, "QUEUE_AGNOSTIC_SPECIALIZATION", 1)
+    device = dpctl.SyclDevice()
+    kernel = dpex.kernel(add_one)
+
+    arrays = [
+        dpnp.zeros(10, sycl_queue=dpctl.SyclQueue(device)) for _ in range(3)
+    ]
+    for a in arrays:
+        dpex.call_kernel(kernel, Range(10), a)
+
+    assert len(kernel.overloads) == 1
+    for a in arrays:
+        assert dpnp.all(a == 1)
@@ -14,6 +14,7 @@ from numba_dpex.core.datamodel.models import (
     dpjit_data_model_manager,
 )
 from numba_dpex.core.types.dpnp_ndarray_type import DpnpNdArray, USMNdArray
+from numba_dpex.core.types.kernel_api.local_accessor import LocalAccessorType
 
 
 @pytest.fixture(
@@ -61,3 +62,32 @@ def test_flattened_member_count(nd_array):
     ap = cputargetctx.get_arg_packer(argty_tuple)
 
     assert num_flattened_args == len(ap._be_args)
+
+
+@pytest.mark.parametrize("layout", ["C", "F", "A"])
+def test_kernel_arg_count(layout):
+    """Test that contiguous arrays are passed to a kernel as only the data
+    pointer and the shape.
+    """
+    ndim = 2
+    arrty = USMNdArray(ndim=ndim, dtype=types.float32, layout=layout)
+    device_model = dpex_data_model_manager.lookup(arrty)
+
+    if layout == "A":
+        assert not device_model.has_contiguous_kernel_args
+        assert device_model.kernel_arg_count == 3 + 2 * ndim
+    else:
+        assert device_model.has_contiguous_kernel_args
+        assert device_model.kernel_arg_count == 1 + ndim
+    assert device_model.flattened_field_count == 3 + 2 * ndim
+
+
+def test_local_accessor_kernel_arg_count():
+    """Test that local accessors are passed to a kernel with all the members
+    of the data model.
+    """
+    slm_ty = LocalAccessorType(ndim=1, dtype=types.int64)
+    device_model = dpex_data_model_manager.lookup(slm_ty)
+
+    assert not device_model.has_contiguous_kernel_args
+    assert device_model.kernel_arg_count == 5
@@ -0,0 +1,90 @@
+# SPDX-FileCopyrightText: 2024 Intel Corporation
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""Tests for the asynchronous fill of the dpnp ndarray constructors."""
+
+import dpctl
+import dpnp
+import numpy
+import pytest
+from numba import prange
+
+from numba_dpex import dpjit
+
+
+def _skip_if_unsupported(dtype):
+    device = dpctl.SyclDevice()
+    if dtype in (numpy.float16,) and not device.has_aspect_fp16:
+        pytest.skip("The device does not support float16.")
+    if (
+        dtype in (numpy.float64, numpy.complex128)
+        and not device.has_aspect_fp64
+    ):
+        pytest.skip("The device does not support float64.")
+
+
+@pytest.mark.parametrize(
+    "dtype", [numpy.float16, numpy.complex64, numpy.complex128]
+)
+@pytest.mark.parametrize("fill_value", [3, -2.5, 1.5 - 2j])
+def test_dpnp_full_dtypes(dtype, fill_value):
+    """Test dpnp.full() with the dtypes filled with a converted pattern."""
+    _skip_if_unsupported(dtype)
+
+    if isinstance(fill_value, complex) and dtype == numpy.float16:
+        pytest.skip("A complex value cannot be cast to float16.")
+
+    @dpjit
+    def func(fill_value):
+        return dpnp.full(11, fill_value, dtype=dtype, usm_type="shared")
+
+    c = func(fill_value)
+    assert c.dtype == dtype
+    assert numpy.array_equal(c.asnumpy(), numpy.full(11, fill_value, dtype))
+
+
+@pytest.mark.parametrize(
+    "dtype", [numpy.float16, numpy.complex64, numpy.complex128]
+)
+def test_dpnp_zeros_ones_dtypes(dtype):
+    """Test dpnp.zeros() and dpnp.ones() with the dtypes filled with a
+    converted pattern."""
+    _skip_if_unsupported(dtype)
+
+    @dpjit
+    def func():
+        a = dpnp.zeros(11, dtype=dtype)
+        b = dpnp.ones(11, dtype=dtype)
+        return a, b
+
+    a, b = func()
+    assert numpy.array_equal(a.asnumpy(), numpy.zeros(11, dtype))
+    assert numpy.array_equal(b.asnumpy(), numpy.ones(11, dtype))
+
+
+def test_fill_before_prange():
+    """Test that a prange loop sees the values of an asynchronous fill."""
+
+    @dpjit
+    def func(n):
+        a = dpnp.zeros(n, dtype=dpnp.int64)
+        b = dpnp.full(n, 5, dtype=dpnp.int64)
+        for i in prange(n):
+            a[i] += b[i] + i
+        return a
+
+    n = 1000
+    a = func(n)
+    assert numpy.array_equal(a.asnumpy(), numpy.arange(n) + 5)
+
+
+def test_fill_before_host_access():
+    """Test that the host sees the values of an asynchronous fill."""
+
+    @dpjit
+    def func(n):
+        a = dpnp.ones(n, dtype=dpnp.int64, usm_type="shared")
+        return a[n - 1] + a[0]
+
+    assert func(1000) == 2
@@ -0,0 +1,72 @@
+# SPDX-FileCopyrightText: 2024 Intel Corporation
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""Tests dpjit functions whose parfor kernels are submitted asynchronously."""
+
+import dpnp
+import numba as nb
+import numpy
+import pytest
+
+import numba_dpex as dpex
+from numba_dpex.core import config
+
+
+def elementwise_stages(a, b, n):
+    c = a + b
+    for _ in range(n):
+        # Every iteration creates and releases temporary arrays
+        c = c * 2 - b
+        c = c + 1
+    return c
+
+
+def host_read_between_stages(a, b):
+    for i in nb.prange(a.shape[0]):
+        a[i] = i * 2
+    # Reads data written by the kernel on the host
+    first = a[1]
+    for i in nb.prange(b.shape[0]):
+        b[i] = a[i] + first
+
+
+def stages_and_reduction(a):
+    b = a + 1
+    c = b * b
+    s = 0
+    for i in nb.prange(c.shape[0]):
+        s += c[i]
+    return s
+
+
+@pytest.fixture(params=[0, 1])
+def async_submission(request, monkeypatch):
+    monkeypatch.setattr(config, "ASYNC_PARFOR_SUBMISSION", request.param)
+
+
+def test_elementwise_stages(async_submission):
+    a = dpnp.arange(1000, dtype=dpnp.float64)
+    b = dpnp.ones(1000, dtype=dpnp.float64)
+
+    c = dpex.dpjit(elementwise_stages)(a, b, 10)
+
+    expected = elementwise_stages(a.asnumpy(), b.asnumpy(), 10)
+    assert numpy.allclose(c.asnumpy(), expected)
+
+
+def test_host_read_between_stages(async_submission):
+    a = dpnp.zeros(100, dtype=dpnp.int64, usm_type="shared")
+    b = dpnp.zeros(100, dtype=dpnp.int64, usm_type="shared")
+
+    dpex.dpjit(host_read_between_stages)(a, b)
+
+    assert numpy.array_equal(b.asnumpy(), numpy.arange(100) * 2 + 2)
+
+
+def test_stages_and_reduction(async_submission):
+    a = dpnp.arange(100, dtype=dpnp.int64)
+
+    s = dpex.dpjit(stages_and_reduction)(a)
+
+    assert s == stages_and_reduction(a.asnumpy())
@@ -0,0 +1,99 @@
+# SPDX-FileCopyrightText: 2024 Intel Corporation
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""Tests the reuse of the kernels generated for structurally identical parfor
+nodes."""
+
+import os
+
+import dpnp
+import numba as nb
+import pytest
+from numba.core import config as numba_config
+
+import numba_dpex as dpex
+from numba_dpex.core import config
+from numba_dpex.core.parfors.parfor_kernel_cache import parfor_kernel_cache
+
+
+def axpy(a, b):
+    for i in nb.prange(a.shape[0]):
+        b[i] = 2 * a[i] + b[i]
+
+
+def axpy_renamed(x, y):
+    for j in nb.prange(x.shape[0]):
+        y[j] = 2 * x[j] + y[j]
+
+
+def axmy(a, b):
+    for i in nb.prange(a.shape[0]):
+        b[i] = 2 * a[i] - b[i]
+
+
+@pytest.fixture
+def kernel_cache(monkeypatch):
+    monkeypatch.setattr(config, "PARFOR_KERNEL_CACHE", 1)
+    parfor_kernel_cache.clear()
+    yield parfor_kernel_cache
+    parfor_kernel_cache.clear()
+
+
+def _run(func):
+    a = dpnp.ones(100, dtype=dpnp.float32)
+    b = dpnp.ones(100, dtype=dpnp.float32, sycl_queue=a.sycl_queue)
+    dpex.dpjit(func)(a, b)
+    return b
+
+
+def test_identical_parfors_share_a_kernel(kernel_cache):
+    assert dpnp.all(_run(axpy) == 3)
+    assert kernel_cache.misses == 1
+    assert len(kernel_cache) == 1
+
+    # The loop body only differs in the names of the variables.
+    assert dpnp.all(_run(axpy_renamed) == 3)
+    assert kernel_cache.hits == 1
+    assert len(kernel_cache) == 1
+
+    assert dpnp.all(_run(axmy) == 1)
+    assert kernel_cache.misses == 2
+    assert len(kernel_cache) == 2
+
+
+def test_parameter_types_are_part_of_the_key(kernel_cache):
+    jitted = dpex.dpjit(axpy)
+    a = dpnp.ones(100, dtype=dpnp.float32)
+    jitted(a, dpnp.ones(100, dtype=dpnp.float32, sycl_queue=a.sycl_queue))
+    jitted(a, dpnp.ones(100, dtype=dpnp.float64, sycl_queue=a.sycl_queue))
+
+    assert kernel_cache.hits == 0
+    assert len(kernel_cache) == 2
+
+
+def test_disabled_cache(monkeypatch, kernel_cache):
+    monkeypatch.setattr(config, "PARFOR_KERNEL_CACHE", 0)
+
+    _run(axpy)
+    _run(axpy_renamed)
+
+    assert kernel_cache.hits == 0
+    assert len(kernel_cache) == 0
+
+
+def test_kernels_are_reused_across_processes(monkeypatch, tmp_path):
+    monkeypatch.setattr(config, "PARFOR_KERNEL_CACHE", 2)
+    monkeypatch.setattr(numba_config, "CACHE_DIR", str(tmp_path))
+    parfor_kernel_cache.clear()
+
+    _run(axpy)
+    cache_dir = tmp_path / "numba_dpex_parfor_kernels"
+    assert len(os.listdir(cache_dir)) == 1
+
+    # Forgetting the kernels kept in memory is what a new process sees.
+    parfor_kernel_cache.clear()
+    assert dpnp.all(_run(axpy_renamed) == 3)
+    assert parfor_kernel_cache.hits == 1
+
+    parfor_kernel_cache.clear()
@@ -0,0 +1,150 @@
+# SPDX-FileCopyrightText: 2024 Intel Corporation
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""Tests the work-group sizes and the strategies used to combine the partial
+results of the kernels generated for parfor reductions.
+"""
+
+import dpctl
+import dpnp
+import numba as nb
+import numpy
+import pytest
+
+import numba_dpex as dpex
+from numba_dpex.core import config
+from numba_dpex.core.parfors.work_group_size import (
+    get_parfor_reduction_work_group_range,
+    get_parfor_reduction_work_group_size,
+)
+
+
+def sum_reduction(a):
+    s = a.dtype.type(0)
+    for i in nb.prange(a.shape[0]):
+        s += a[i]
+    return s
+
+
+def prod_reduction(a):
+    p = a.dtype.type(1)
+    for i in nb.prange(a.shape[0]):
+        p *= a[i]
+    return p
+
+
+def sum_and_prod_reduction(a):
+    s = a.dtype.type(0)
+    p = a.dtype.type(1)
+    for i in nb.prange(a.shape[0]):
+        s += a[i]
+        p *= a[i]
+    return s, p
+
+
+def sum_reduction_nd(a):
+    s = a.dtype.type(0)
+    for idx in nb.pndindex(a.shape):
+        s += a[idx]
+    return s
+
+
+def sum_and_prod_reduction_nd(a):
+    s = a.dtype.type(0)
+    p = a.dtype.type(1)
+    for idx in nb.pndindex(a.shape):
+        s += a[idx]
+        p *= a[idx]
+    return s, p
+
+
+@pytest.fixture(params=["tree", "atomic"])
+def strategy(request, monkeypatch):
+    monkeypatch.setattr(config, "PARFOR_REDUCTION_STRATEGY", request.param)
+
+
+@pytest.fixture(params=[0, 1, 8, 100])
+def work_group_size(request, monkeypatch):
+    monkeypatch.setattr(
+        config, "PARFOR_REDUCTION_WORK_GROUP_SIZE", request.param
+    )
+
+
+@pytest.mark.parametrize("n", [1, 7, 256, 1000, 100003])
+@pytest.mark.parametrize("dtype", [dpnp.int32, dpnp.int64, dpnp.float32])
+def test_sum_reduction(strategy, work_group_size, n, dtype):
+    a = dpnp.ones(n, dtype=dtype)
+
+    s = dpex.dpjit(sum_reduction)(a)
+
+    assert s == n
+
+
+@pytest.mark.parametrize("n", [1, 7, 1000])
+def test_prod_reduction(strategy, work_group_size, n):
+    a = dpnp.full(n, 2, dtype=dpnp.int64)
+    a[3:] = 1
+
+    p = dpex.dpjit(prod_reduction)(a)
+
+    assert p == 2 ** min(n, 3)
+
+
+def test_multiple_reduction_variables(strategy, work_group_size):
+    a = dpnp.arange(1, 21, dtype=dpnp.float64)
+
+    s, p = dpex.dpjit(sum_and_prod_reduction)(a)
+
+    expected_s, expected_p = sum_and_prod_reduction(a.asnumpy())
+    assert numpy.isclose(s, expected_s)
+    assert numpy.isclose(p, expected_p)
+
+
+@pytest.mark.parametrize(
+    "shape", [(1, 1), (3, 1000), (33, 65), (512, 512), (5, 7, 37)]
+)
+def test_sum_reduction_nd(strategy, work_group_size, shape):
+    a = dpnp.ones(shape, dtype=dpnp.int64)
+
+    s = dpex.dpjit(sum_reduction_nd)(a)
+
+    assert s == numpy.prod(shape)
+
+
+@pytest.mark.parametrize("shape", [(1, 1, 1), (5, 7, 37), (16, 16, 16)])
+def test_multiple_reduction_variables_nd(strategy, work_group_size, shape):
+    a = dpnp.ones(shape, dtype=dpnp.float64)
+    a[0, 0, 0] = 2
+
+    s, p = dpex.dpjit(sum_and_prod_reduction_nd)(a)
+
+    assert s == numpy.prod(shape) + 1
+    assert p == 2
+
+
+def test_reduction_work_group_size_respects_device_limits(monkeypatch):
+    device = dpctl.SyclDevice()
+
+    for size in [0, 3, 64, 100, 2**20]:
+        monkeypatch.setattr(config, "PARFOR_REDUCTION_WORK_GROUP_SIZE", size)
+        wg_size = get_parfor_reduction_work_group_size(device.filter_string)
+
+        assert wg_size <= device.max_work_group_size
+        assert wg_size & (wg_size - 1) == 0
+
+
+def test_reduction_work_group_range_respects_device_limits():
+    device = dpctl.SyclDevice()
+
+    for ndim in range(1, 4):
+        wg_range = get_parfor_reduction_work_group_range(
+            device.filter_string, ndim
+        )
+        max_sizes = getattr(device, f"max_work_item_sizes{ndim}d")
+        wg_size = numpy.prod(wg_range)
+
+        assert len(wg_range) == ndim
+        assert wg_size <= device.max_work_group_size
+        assert wg_size & (wg_size - 1) == 0
+        assert all(ext <= max_ext for ext, max_ext in zip(wg_range, max_sizes))
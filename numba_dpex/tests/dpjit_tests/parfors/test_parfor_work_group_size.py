@@ -0,0 +1,83 @@
+# SPDX-FileCopyrightText: 2024 Intel Corporation
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""Tests the nd-range submission of the kernels generated for parfor nodes."""
+
+import dpctl
+import dpnp
+import numba as nb
+import numpy
+import pytest
+
+import numba_dpex as dpex
+from numba_dpex.core import config
+from numba_dpex.core.parfors.work_group_size import (
+    get_parfor_work_group_range,
+    get_preferred_sub_group_size,
+)
+
+
+def add_one_1d(a):
+    for i in nb.prange(a.shape[0]):
+        a[i] += 1
+
+
+def add_one_2d(a):
+    for i in nb.prange(a.shape[0]):
+        for j in nb.prange(a.shape[1]):
+            a[i, j] += 1
+
+
+def add_one_3d(a):
+    for i in nb.prange(a.shape[0]):
+        for j in nb.prange(a.shape[1]):
+            for k in nb.prange(a.shape[2]):
+                a[i, j, k] += 1
+
+
+@pytest.fixture(params=[-1, 0, 7, 64])
+def work_group_size(request, monkeypatch):
+    monkeypatch.setattr(config, "PARFOR_WORK_GROUP_SIZE", request.param)
+
+
+@pytest.mark.parametrize(
+    "func, shape",
+    [
+        (add_one_1d, (1,)),
+        (add_one_1d, (1000,)),
+        (add_one_1d, (1024,)),
+        (add_one_2d, (3, 1000)),
+        (add_one_2d, (33, 65)),
+        (add_one_3d, (5, 7, 37)),
+    ],
+)
+def test_parfor_ranges_not_multiple_of_work_group(work_group_size, func, shape):
+    a = dpnp.zeros(shape, dtype=dpnp.int64)
+
+    dpex.dpjit(func)(a)
+
+    assert numpy.all(a.asnumpy() == 1)
+
+
+def test_work_group_range_respects_device_limits(monkeypatch):
+    monkeypatch.setattr(config, "PARFOR_WORK_GROUP_SIZE", 0)
+    device = dpctl.SyclDevice()
+    sub_group_size = get_preferred_sub_group_size(device)
+
+    for ndim in range(1, 4):
+        wg_range = get_parfor_work_group_range(device.filter_string, ndim)
+        max_sizes = getattr(device, f"max_work_item_sizes{ndim}d")
+
+        assert len(wg_range) == ndim
+        assert numpy.prod(wg_range) <= device.max_work_group_size
+        assert all(ext <= max_ext for ext, max_ext in zip(wg_range, max_sizes))
+        if device.max_work_group_size >= sub_group_size:
+            assert numpy.prod(wg_range) % sub_group_size == 0
+
+
+def test_negative_work_group_size_selects_range_kernels(monkeypatch):
+    monkeypatch.setattr(config, "PARFOR_WORK_GROUP_SIZE", -1)
+    device = dpctl.SyclDevice()
+
+    assert get_parfor_work_group_range(device.filter_string, 1) is None
@@ -0,0 +1,49 @@
+# SPDX-FileCopyrightText: 2024 Intel Corporation
+#
+# SPDX-License-Identifier: Apache-2.0
+
+import dpnp
+import numba as nb
+import numpy
+import pytest
+from numba.core import config as numba_config
+
+import numba_dpex as dpex
+
+
+def prange_add(a, b):
+    c = dpnp.empty_like(a)
+    for i in nb.prange(a.shape[0]):
+        c[i] = a[i] + b[i]
+    return c
+
+
+@pytest.fixture
+def cache_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(numba_config, "CACHE_DIR", str(tmp_path))
+    return tmp_path
+
+
+def test_dpjit_is_loaded_from_cache(cache_dir):
+    """Tests that a dpjit function with an offloaded parfor is restored from
+    the on-disk cache by a new dispatcher and still computes correct results.
+    """
+    a = dpnp.ones(10, dtype=dpnp.float32)
+    b = dpnp.ones_like(a)
+
+    fn = dpex.dpjit(cache=True)(prange_add)
+    fn(a, b)
+    assert sum(fn.stats.cache_misses.values()) == 1
+    assert any(cache_dir.rglob("*.nbi"))
+
+    fn2 = dpex.dpjit(cache=True)(prange_add)
+    c = fn2(a, b)
+
+    assert sum(fn2.stats.cache_hits.values()) == 1
+    assert sum(fn2.stats.cache_misses.values()) == 0
+    assert numpy.all(dpnp.asnumpy(c) == 2)
+
+    # The restored overload is registered under the current argument types
+    # and no further lookup of the cache is needed.
+    fn2(a, b)
+    assert sum(fn2.stats.cache_hits.values()) == 1
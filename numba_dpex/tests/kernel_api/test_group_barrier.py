@@ -0,0 +1,93 @@
+# SPDX-FileCopyrightText: 2024 Intel Corporation
+#
+# SPDX-License-Identifier: Apache-2.0
+
+import numpy
+import pytest
+
+from numba_dpex import kernel_api as kapi
+
+
+def _sum_reduction_kernel(nd_item: kapi.NdItem, a, partial_sums, slm):
+    local_id = nd_item.get_local_id(0)
+    global_id = nd_item.get_global_id(0)
+    group = nd_item.get_group()
+
+    slm[local_id] = a[global_id]
+
+    stride = nd_item.get_local_range(0) // 2
+    while stride > 0:
+        kapi.group_barrier(group)
+        if local_id < stride:
+            slm[local_id] += slm[local_id + stride]
+        stride >>= 1
+
+    if local_id == 0:
+        partial_sums[group.get_group_id(0)] = slm[0]
+
+
+def _atomic_count_kernel(nd_item: kapi.NdItem, a):
+    kapi.AtomicRef(a, 0).fetch_add(1)
+
+
+def _divergent_barrier_kernel(nd_item: kapi.NdItem, a):
+    if nd_item.get_local_id(0) == 0:
+        return
+    kapi.group_barrier(nd_item.get_group())
+
+
+def _raising_kernel(nd_item: kapi.NdItem, a):
+    if nd_item.get_local_id(0) == 1:
+        raise KeyError("work-item failure")
+    kapi.group_barrier(nd_item.get_group())
+
+
+def test_tree_reduction_with_group_barrier():
+    """Each work-group reduces its part of the array in local memory, which
+    requires working barriers and a separate local memory per work-group."""
+    N, wg_size = 1024, 64
+    a = numpy.arange(N, dtype=numpy.float64)
+    partial_sums = numpy.zeros(N // wg_size)
+    slm = kapi.LocalAccessor(wg_size, dtype=a.dtype)
+
+    kapi.call_kernel(
+        _sum_reduction_kernel,
+        kapi.NdRange((N,), (wg_size,)),
+        a,
+        partial_sums,
+        slm,
+    )
+
+    expected = a.reshape(N // wg_size, wg_size).sum(axis=1)
+    assert numpy.array_equal(partial_sums, expected)
+
+
+def test_atomic_ref_is_atomic_across_work_items():
+    a = numpy.zeros(1, dtype=numpy.int64)
+
+    kapi.call_kernel(_atomic_count_kernel, kapi.NdRange((512,), (64,)), a)
+
+    assert a[0] == 512
+
+
+def test_divergent_group_barrier_raises():
+    a = numpy.zeros(1)
+
+    with pytest.raises(RuntimeError):
+        kapi.call_kernel(_divergent_barrier_kernel, kapi.NdRange((8,), (4,)), a)
+
+
+def test_work_item_exception_is_propagated():
+    a = numpy.zeros(1)
+
+    with pytest.raises(KeyError):
+        kapi.call_kernel(_raising_kernel, kapi.NdRange((8,), (4,)), a)
+
+
+def test_group_barrier_outside_nd_range_kernel_raises():
+    def _range_kernel(item: kapi.Item, a):
+        group = kapi.Group(kapi.Range(1), kapi.Range(1), kapi.Range(1), [0])
+        kapi.group_barrier(group)
+
+    with pytest.raises(NotImplementedError):
+        kapi.call_kernel(_range_kernel, kapi.Range(1), numpy.zeros(1))
@@ -2,7 +2,10 @@
 #
 # SPDX-License-Identifier: Apache-2.0
 
+import warnings
+
 import numpy
+import pytest
 
 from numba_dpex import kernel_api as kapi
 
@@ -50,3 +53,54 @@ def test_range_kernel_call3D():
     kapi.call_kernel(vecadd, kapi.Range(5, 5, 5), a, b, c)
 
     assert numpy.allclose(c, a + b)
+
+
+def test_vectorized_range_kernel_call():
+    def saxpy(item: kapi.Item, alpha, a, b, c):
+        idx = item.get_id(0)
+        jdx = item.get_id(1)
+        c[idx, jdx] = alpha * a[idx, jdx] + b[idx, jdx] + item.get_linear_id()
+
+    a = numpy.arange(1000.0).reshape(10, 100)
+    b = numpy.ones((10, 100))
+    c = numpy.empty((10, 100))
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        kapi.call_kernel(
+            saxpy, kapi.Range(10, 100), 2.0, a, b, c, vectorize=True
+        )
+
+    assert numpy.allclose(c, 2.0 * a + b + numpy.arange(1000).reshape(10, 100))
+
+
+def test_vectorized_range_kernel_fallback():
+    def clamp_and_count(item: kapi.Item, a, count):
+        idx = item.get_id(0)
+        a[idx] += 1
+        if a[idx] > 5:
+            a[idx] = 5
+            kapi.AtomicRef(count, 0).fetch_add(1)
+
+    a = numpy.arange(10)
+    count = numpy.zeros(1, dtype=numpy.int64)
+
+    with pytest.warns(RuntimeWarning):
+        kapi.call_kernel(
+            clamp_and_count, kapi.Range(10), a, count, vectorize=True
+        )
+
+    assert numpy.array_equal(a, numpy.minimum(numpy.arange(10) + 1, 5))
+    assert count[0] == 5
+
+
+def test_vectorized_range_kernel_atomics_fall_back():
+    def count(item: kapi.Item, a):
+        kapi.AtomicRef(a, 0).fetch_add(1)
+
+    a = numpy.zeros(1, dtype=numpy.int64)
+
+    with pytest.warns(RuntimeWarning):
+        kapi.call_kernel(count, kapi.Range(100), a, vectorize=True)
+
+    assert a[0] == 100
@@ -0,0 +1,89 @@
+# SPDX-FileCopyrightText: 2024 Intel Corporation
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""Tests for the compilation of kernel signatures on worker threads."""
+
+import dpctl
+import dpnp
+import pytest
+from numba import typeof
+from numba.core.compiler_lock import global_compiler_lock
+
+import numba_dpex as dpex
+from numba_dpex import float32, int64, usm_ndarray
+from numba_dpex.core.types.kernel_api.index_space_ids import ItemType
+from numba_dpex.kernel_api import Item, Range
+from numba_dpex.kernel_api_impl.spirv import spirv_generator
+
+itemty = ItemType(ndim=1)
+i64arrty = usm_ndarray(1, "C", int64)
+f32arrty = usm_ndarray(1, "C", float32)
+
+
+def vecadd(item: Item, a, b, c):
+    i = item.get_id(0)
+    c[i] = a[i] + b[i]
+
+
+def test_compile_signatures_in_the_background():
+    kernel = dpex.kernel(vecadd)
+    queue = dpctl.SyclQueue()
+
+    with dpex.BackgroundKernelCompiler(max_workers=2) as compiler:
+        futures = compiler.submit_many(
+            [
+                (kernel, (itemty, i64arrty, i64arrty, i64arrty)),
+                (kernel, (itemty, f32arrty, f32arrty, f32arrty)),
+            ],
+            queue=queue,
+        )
+        results = [future.result() for future in futures]
+
+    assert all(kcres.kernel_device_ir_module for kcres in results)
+    assert len(kernel.overloads) == 2
+    assert not kernel._pending_compiles
+
+
+def test_launch_waits_for_the_background_compilation():
+    kernel = dpex.kernel(vecadd)
+    a = dpnp.ones(10, dtype=dpnp.int64)
+    b = dpnp.ones(10, dtype=dpnp.int64, sycl_queue=a.sycl_queue)
+    c = dpnp.zeros(10, dtype=dpnp.int64, sycl_queue=a.sycl_queue)
+
+    sig = (itemty, typeof(a), typeof(b), typeof(c))
+    future = dpex.compile_kernel_async(kernel, sig)
+    dpex.call_kernel(kernel, Range(10), a, b, c)
+
+    assert future.result() is kernel.overloads[sig]
+    assert len(kernel.overloads) == 1
+    assert dpnp.all(c == 2)
+
+
+def test_translation_runs_without_the_compiler_lock(monkeypatch):
+    kernel = dpex.kernel(vecadd)
+    locked = []
+    translate = spirv_generator.Module._translate
+
+    def _translate(self, llvm_spirv_args):
+        locked.append(global_compiler_lock.is_locked())
+        return translate(self, llvm_spirv_args)
+
+    monkeypatch.setattr(spirv_generator.Module, "_translate", _translate)
+
+    dpex.compile_kernel_async(
+        kernel, (itemty, i64arrty, i64arrty, i64arrty)
+    ).result()
+
+    assert locked == [False]
+
+
+def test_failed_compilation():
+    kernel = dpex.kernel(vecadd)
+
+    future = dpex.compile_kernel_async(kernel, (itemty, i64arrty))
+
+    with pytest.raises(Exception):
+        future.result()
+    with pytest.raises(TypeError):
+        dpex.compile_kernel_async(vecadd, (itemty, i64arrty))
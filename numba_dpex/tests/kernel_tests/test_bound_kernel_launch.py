@@ -0,0 +1,141 @@
+# SPDX-FileCopyrightText: 2024 Intel Corporation
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""Tests for the kernel launch objects created by bind_kernel."""
+
+import dpctl
+import dpnp
+import numpy
+import pytest
+
+import numba_dpex as dpex
+from numba_dpex.kernel_api import (
+    Item,
+    LocalAccessor,
+    NdItem,
+    NdRange,
+    Range,
+    group_barrier,
+)
+
+
+@dpex.kernel
+def add_value(item: Item, a, value):
+    i = item.get_id(0)
+    a[i] += value
+
+
+@dpex.kernel
+def add_complex(item: Item, a, value):
+    i = item.get_id(0)
+    a[i] += value
+
+
+@dpex.kernel
+def reverse_in_group(nditem: NdItem, a, slm):
+    i = nditem.get_global_id(0)
+    j = nditem.get_local_id(0)
+    n = nditem.get_local_range(0)
+    slm[j] = a[i]
+    group_barrier(nditem.get_group())
+    a[i] = slm[n - 1 - j]
+
+
+def test_repeated_launches():
+    a = dpnp.zeros(100, dtype=dpnp.int64)
+    launch = dpex.bind_kernel(add_value, Range(100), a, 2)
+
+    for _ in range(5):
+        launch()
+
+    assert launch.queue == a.sycl_queue
+    assert dpnp.all(a == 10)
+
+
+def test_set_arg():
+    a = dpnp.zeros(100, dtype=dpnp.int64)
+    b = dpnp.zeros(100, dtype=dpnp.int64, sycl_queue=a.sycl_queue)
+    launch = dpex.bind_kernel(add_value, Range(100), a, 1)
+
+    launch()
+    launch.set_arg(1, 5)
+    launch()
+    launch.set_arg(0, b)
+    launch()
+
+    assert launch.args == (b, 5)
+    assert dpnp.all(a == 6)
+    assert dpnp.all(b == 5)
+
+
+def test_set_arg_strided_view():
+    a = dpnp.zeros(20, dtype=dpnp.int64)
+    launch = dpex.bind_kernel(add_value, Range(10), a[::2], 1)
+
+    launch()
+    launch.set_arg(0, a[1::2])
+    launch()
+
+    assert numpy.array_equal(a.asnumpy(), numpy.ones(20, dtype=numpy.int64))
+
+
+def test_complex_argument():
+    a = dpnp.zeros(10, dtype=dpnp.complex64)
+    launch = dpex.bind_kernel(
+        add_complex, Range(10), a, numpy.complex64(1 + 2j)
+    )
+
+    launch()
+    launch.set_arg(1, numpy.complex64(3 - 1j))
+    launch()
+
+    assert dpnp.all(a == 4 + 1j)
+
+
+def test_local_accessor():
+    a = dpnp.arange(64, dtype=dpnp.int64)
+    slm = LocalAccessor(16, dtype=numpy.int64)
+    launch = dpex.bind_kernel(reverse_in_group, NdRange((64,), (16,)), a, slm)
+
+    launch()
+    expected = numpy.arange(64).reshape(4, 16)[:, ::-1].reshape(64)
+    assert numpy.array_equal(a.asnumpy(), expected)
+
+    launch()
+    assert numpy.array_equal(a.asnumpy(), numpy.arange(64))
+
+
+def test_submit_async():
+    a = dpnp.zeros(100, dtype=dpnp.int64)
+    launch = dpex.bind_kernel(add_value, Range(100), a, 1)
+
+    _, event = launch.submit_async()
+    host_event, event = launch.submit_async([event])
+    host_event.wait()
+    event.wait()
+
+    assert isinstance(event, dpctl.SyclEvent)
+    assert dpnp.all(a == 2)
+
+
+def test_invalid_set_arg():
+    a = dpnp.zeros(100, dtype=dpnp.int64)
+    launch = dpex.bind_kernel(add_value, Range(100), a, 1)
+
+    with pytest.raises(TypeError):
+        launch.set_arg(1, 1.5)
+    with pytest.raises(TypeError):
+        launch.set_arg(0, dpnp.zeros(100, dtype=dpnp.float32))
+
+    b = dpnp.zeros(100, dtype=dpnp.int64, sycl_queue=dpctl.SyclQueue())
+    with pytest.raises((TypeError, ValueError)):
+        launch.set_arg(0, b)
+
+
+def test_range_with_local_accessor():
+    a = dpnp.zeros(16, dtype=dpnp.int64)
+    slm = LocalAccessor(16, dtype=numpy.int64)
+
+    with pytest.raises(TypeError):
+        dpex.bind_kernel(reverse_in_group, Range(16), a, slm)
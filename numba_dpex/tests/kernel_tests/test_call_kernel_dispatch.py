@@ -0,0 +1,82 @@
+# SPDX-FileCopyrightText: 2024 Intel Corporation
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""Tests for the fast path of call_kernel calls from CPython."""
+
+import dpctl
+import dpnp
+
+import numba_dpex as dpex
+from numba_dpex.core import config
+from numba_dpex.core.kernel_launcher import _arg_fingerprint
+from numba_dpex.kernel_api import Item, Range
+
+
+def add_value(item: Item, a, value):
+    i = item.get_id(0)
+    a[i] += value
+
+
+def test_repeated_launches_use_the_fast_path():
+    kernel = dpex.kernel(add_value)
+    a = dpnp.zeros(10, dtype=dpnp.int64)
+
+    for _ in range(3):
+        dpex.call_kernel(kernel, Range(10), a, 2)
+
+    assert len(kernel.overloads) == 1
+    assert dpnp.all(a == 6)
+
+    fingerprints = [
+        fingerprint
+        for fingerprint in dpex.call_kernel._launch_entry_points
+        if fingerprint[1][0] is kernel
+    ]
+    assert len(fingerprints) == 1
+
+
+def test_argument_types_select_the_overload():
+    kernel = dpex.kernel(add_value)
+    a = dpnp.zeros(10)
+    b = dpnp.zeros(20)
+
+    dpex.call_kernel(kernel, Range(10), a, 1)
+    dpex.call_kernel(kernel, Range(10), a, 1.5)
+    # A strided view has a different layout.
+    dpex.call_kernel(kernel, Range(10), b[::2], 1)
+    dpex.call_kernel(kernel, Range(10), a, 1)
+
+    assert len(kernel.overloads) == 3
+    assert dpnp.all(a == 3.5)
+    assert dpnp.all(b[::2] == 1)
+    assert dpnp.all(b[1::2] == 0)
+
+
+def test_queue_is_part_of_the_fingerprint(monkeypatch):
+    monkeypatch.setattr(config, "QUEUE_AGNOSTIC_SPECIALIZATION", 0)
+    kernel = dpex.kernel(add_value)
+    device = dpctl.SyclDevice()
+    a = dpnp.zeros(10, sycl_queue=dpctl.SyclQueue(device))
+    b = dpnp.zeros(10, sycl_queue=dpctl.SyclQueue(device))
+
+    dpex.call_kernel(kernel, Range(10), a, 1)
+    dpex.call_kernel(kernel, Range(10), b, 1)
+    dpex.call_kernel(kernel, Range(10), a, 1)
+
+    assert len(kernel.overloads) == 2
+    assert dpnp.all(a == 2)
+    assert dpnp.all(b == 1)
+
+
+def test_arg_fingerprint():
+    a = dpnp.zeros((4, 4))
+
+    assert _arg_fingerprint(a) == _arg_fingerprint(dpnp.ones((2, 2)))
+    assert _arg_fingerprint(a) != _arg_fingerprint(a.T)
+    assert _arg_fingerprint(a) != _arg_fingerprint(a[::2, ::2])
+    assert _arg_fingerprint(1) != _arg_fingerprint(True)
+    assert _arg_fingerprint(2**64) is None
+    assert _arg_fingerprint("string") is None
+    assert _arg_fingerprint((1, "string")) is None
+    assert _arg_fingerprint([]) is None
@@ -0,0 +1,84 @@
+# SPDX-FileCopyrightText: 2024 Intel Corporation
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""Tests for the per-stage compile profiler."""
+
+import json
+
+from numba.core import event as ev
+
+import numba_dpex as dpex
+from numba_dpex import int64, usm_ndarray
+from numba_dpex.core.compile_profiler import CompileProfiler
+from numba_dpex.core.types.kernel_api.index_space_ids import ItemType
+from numba_dpex.kernel_api import Item
+
+i64arrty = usm_ndarray(1, "C", int64)
+
+
+def vecadd(item: Item, a, b, c):
+    i = item.get_id(0)
+    c[i] = a[i] + b[i]
+
+
+def test_kernel_compilation_stages(tmp_path):
+    """Tests that the stages of a kernel compilation are attributed to the
+    kernel and its signature."""
+    kernel = dpex.kernel(vecadd)
+
+    with CompileProfiler() as profiler:
+        kernel.compile((ItemType(ndim=1), i64arrty, i64arrty, i64arrty))
+
+    times = profiler.stage_times()
+    assert len(times) == 1
+    (function, _), stages = next(iter(times.items()))
+    assert function == "vecadd"
+    for stage in (
+        "compile",
+        "typing",
+        "lowering",
+        "llvm_optimize",
+        "llvm_spirv",
+    ):
+        assert stage in stages
+    assert all(time >= 0 for time in stages.values())
+
+    assert "vecadd" in profiler.summary()
+
+    path = tmp_path / "trace.json"
+    profiler.export_chrome_trace(path)
+    trace = json.loads(path.read_text())
+    assert trace["traceEvents"]
+    assert {event["ph"] for event in trace["traceEvents"]} == {"X"}
+    assert {event["cat"] for event in trace["traceEvents"]} >= set(stages)
+
+
+def test_stopped_profiler_records_nothing():
+    kernel = dpex.kernel(vecadd)
+    profiler = CompileProfiler()
+    profiler.start()
+    profiler.stop()
+
+    kernel.compile((ItemType(ndim=1), i64arrty, i64arrty, i64arrty))
+    assert profiler.spans == []
+
+
+def test_restarted_profiler_drops_open_spans():
+    """Tests that the spans left open when a profiler is stopped do not
+    absorb the spans recorded after it is restarted."""
+    kernel = dpex.kernel(vecadd)
+    profiler = CompileProfiler()
+
+    profiler.start()
+    ev.start_event("numba_dpex:llvm_optimize", data={"name": "stale"})
+    profiler.stop()
+    ev.end_event("numba_dpex:llvm_optimize", data={"name": "stale"})
+
+    with profiler:
+        # Ends an event that started before the profiler was started.
+        ev.end_event("numba_dpex:llvm_spirv")
+        kernel.compile((ItemType(ndim=1), i64arrty, i64arrty, i64arrty))
+
+    assert "stale" not in {span.name for span in profiler.spans}
+    assert [function for function, _ in profiler.stage_times()] == ["vecadd"]
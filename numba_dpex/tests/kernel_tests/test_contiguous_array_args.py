@@ -0,0 +1,59 @@
+# SPDX-FileCopyrightText: 2024 Intel Corporation
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""Tests for the kernel arguments of C- and F-contiguous arrays, which are
+passed as only their data pointer and their shape."""
+
+import dpnp
+import numpy
+import pytest
+
+import numba_dpex as dpex
+from numba_dpex.kernel_api import Item, Range
+
+
+@dpex.kernel
+def add_index(item: Item, a, b):
+    i = item.get_id(0)
+    j = item.get_id(1)
+    b[i, j] = a[i, j] + 10 * i + j + a.size
+
+
+def _expected(a_np):
+    rows, cols = numpy.indices(a_np.shape)
+    return a_np + 10 * rows + cols + a_np.size
+
+
+@pytest.mark.parametrize("order", ["C", "F"])
+def test_contiguous_arrays(order):
+    a_np = numpy.arange(24, dtype=numpy.int64).reshape(4, 6).copy(order=order)
+    a = dpnp.asarray(a_np)
+    b = dpnp.zeros_like(a)
+
+    dpex.call_kernel(add_index, Range(4, 6), a, b)
+
+    assert numpy.array_equal(b.asnumpy(), _expected(a_np))
+
+
+def test_mixed_layouts():
+    a_np = numpy.arange(48, dtype=numpy.int64).reshape(8, 6)
+    a = dpnp.asarray(a_np)
+    b = dpnp.zeros((4, 6), dtype=dpnp.int64, sycl_queue=a.sycl_queue)
+
+    # The strided view is passed with all its members and the C-contiguous
+    # output as only its data pointer and its shape.
+    dpex.call_kernel(add_index, Range(4, 6), a[::2], b)
+
+    assert numpy.array_equal(b.asnumpy(), _expected(a_np[::2]))
+
+
+def test_bound_launch_with_contiguous_arrays():
+    a_np = numpy.arange(24, dtype=numpy.int64).reshape(4, 6, order="F")
+    a = dpnp.asarray(a_np)
+    b = dpnp.zeros_like(a)
+
+    launch = dpex.bind_kernel(add_index, Range(4, 6), a, b)
+    launch()
+
+    assert numpy.array_equal(b.asnumpy(), _expected(a_np))
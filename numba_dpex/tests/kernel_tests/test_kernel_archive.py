@@ -0,0 +1,163 @@
+# SPDX-FileCopyrightText: 2024 Intel Corporation
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""Tests for the ahead-of-time kernel archives."""
+
+import json
+import zipfile
+
+import dpnp
+import numpy
+import pytest
+from numba import typeof
+
+import numba_dpex as dpex
+from numba_dpex.core import aot
+from numba_dpex.core.types.kernel_api.index_space_ids import ItemType
+from numba_dpex.kernel_api import Item, Range
+
+
+def vecadd(item: Item, a, b, c):
+    i = item.get_id(0)
+    c[i] = a[i] + b[i]
+
+
+@pytest.fixture
+def registry():
+    aot.kernel_archive_registry.clear()
+    yield aot.kernel_archive_registry
+    aot.kernel_archive_registry.clear()
+
+
+def _arrays():
+    a = dpnp.ones(16, dtype=dpnp.int64)
+    return a, dpnp.ones_like(a), dpnp.zeros_like(a)
+
+
+def _signature(arrays):
+    return (ItemType(ndim=1),) + tuple(typeof(ary) for ary in arrays)
+
+
+def test_archived_kernel_is_not_compiled(tmp_path, registry):
+    """Tests that a kernel found in a loaded archive is launched without
+    compiling it."""
+    path = tmp_path / "kernels.zip"
+    arrays = _arrays()
+    sig = _signature(arrays)
+
+    num_kernels = dpex.build_kernel_archive(
+        path, [(dpex.kernel(vecadd), [sig])]
+    )
+    assert num_kernels == 1
+
+    assert dpex.load_kernel_archive(path) == 1
+    assert len(registry) == 1
+
+    kernel = dpex.kernel(vecadd)
+    dpex.call_kernel(kernel, Range(16), *arrays)
+
+    kcres = kernel.overloads[sig]
+    # An archived kernel has no LLVM library, as it was not lowered.
+    assert kcres.library is None
+    assert numpy.all(arrays[2].asnumpy() == 2)
+
+
+def test_archived_kernel_with_other_options_is_compiled(tmp_path, registry):
+    path = tmp_path / "kernels.zip"
+    sig = _signature(_arrays())
+
+    dpex.build_kernel_archive(path, [(dpex.kernel(vecadd), sig)])
+    dpex.load_kernel_archive(path)
+
+    kernel = dpex.kernel(debug=True)(vecadd)
+    kernel.compile(sig)
+    assert kernel.overloads[sig].library is not None
+
+
+def test_archived_kernel_for_other_device_is_compiled(tmp_path, registry):
+    """Tests that a kernel archived for a device with other aspects is not
+    used."""
+    path = tmp_path / "kernels.zip"
+    sig = _signature(_arrays())
+    dpex.build_kernel_archive(path, [(dpex.kernel(vecadd), sig)])
+
+    # Rewrite the archive as if it was built for a device with other aspects.
+    with zipfile.ZipFile(path) as archive:
+        manifest = json.loads(archive.read("manifest.json"))
+        blobs = {
+            entry["blob"]: archive.read(entry["blob"])
+            for entry in manifest["kernels"]
+        }
+    for entry in manifest["kernels"]:
+        entry["device_aspects"] = {
+            aspect: not value
+            for aspect, value in entry["device_aspects"].items()
+        }
+    with zipfile.ZipFile(path, "w") as archive:
+        archive.writestr("manifest.json", json.dumps(manifest))
+        for blob_name, bitcode in blobs.items():
+            archive.writestr(blob_name, bitcode)
+
+    assert dpex.load_kernel_archive(path) == 1
+
+    kernel = dpex.kernel(vecadd)
+    assert registry.lookup(kernel.py_func, kernel.targetoptions, sig) is None
+    kernel.compile(sig)
+    assert kernel.overloads[sig].library is not None
+
+
+_KERNEL_MODULE = """
+import numba_dpex as dpex
+from numba_dpex import DpnpNdArray, int64
+from numba_dpex.core.types.kernel_api.index_space_ids import ItemType
+
+i64arrty = DpnpNdArray(ndim=1, dtype=int64, layout="C")
+
+
+@dpex.kernel((ItemType(ndim=1), i64arrty, i64arrty))
+def scale(item, a, b):
+    i = item.get_id(0)
+    b[i] = 2 * a[i]
+
+
+@dpex.kernel
+def unspecialized(item, a):
+    a[item.get_id(0)] = 0
+"""
+
+
+def test_module_kernels_are_archived(tmp_path, monkeypatch, registry):
+    """Tests that the command line tool archives the specialized kernels of a
+    module."""
+    (tmp_path / "aot_kernels.py").write_text(_KERNEL_MODULE)
+    monkeypatch.syspath_prepend(str(tmp_path))
+    path = tmp_path / "kernels.zip"
+
+    kernels = aot.find_module_kernels("aot_kernels")
+    assert [kernel.py_func.__name__ for kernel in kernels] == [
+        "scale",
+        "unspecialized",
+    ]
+    assert aot.main(["-o", str(path), "aot_kernels"]) == 0
+
+    with zipfile.ZipFile(path) as archive:
+        manifest = json.loads(archive.read("manifest.json"))
+    assert [entry["qualname"] for entry in manifest["kernels"]] == ["scale"]
+
+
+def test_incompatible_archive_is_rejected(tmp_path, registry):
+    path = tmp_path / "kernels.zip"
+    dpex.build_kernel_archive(
+        path, [(dpex.kernel(vecadd), _signature(_arrays()))]
+    )
+
+    with zipfile.ZipFile(path) as archive:
+        manifest = json.loads(archive.read("manifest.json"))
+    manifest["kernel_args_abi_version"] = -1
+    with zipfile.ZipFile(path, "w") as archive:
+        archive.writestr("manifest.json", json.dumps(manifest))
+
+    with pytest.raises(ValueError):
+        dpex.load_kernel_archive(path)
+    assert len(registry) == 0
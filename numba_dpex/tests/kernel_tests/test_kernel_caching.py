@@ -0,0 +1,63 @@
+# SPDX-FileCopyrightText: 2024 Intel Corporation
+#
+# SPDX-License-Identifier: Apache-2.0
+
+import dpnp
+import numpy
+import pytest
+from numba.core import config as numba_config
+
+import numba_dpex as dpex
+from numba_dpex.kernel_api import Item, Range
+
+
+def vecadd(item: Item, a, b, c):
+    i = item.get_id(0)
+    c[i] = a[i] + b[i]
+
+
+@pytest.fixture
+def cache_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(numba_config, "CACHE_DIR", str(tmp_path))
+    return tmp_path
+
+
+def _launch(kernel, dtype):
+    a = dpnp.ones(16, dtype=dtype)
+    b = dpnp.ones_like(a)
+    c = dpnp.zeros_like(a)
+    dpex.call_kernel(kernel, Range(16), a, b, c)
+    return c
+
+
+def test_cache_is_populated(cache_dir):
+    """Tests that compiling a kernel with cache=True writes an index and a
+    data file into the cache directory."""
+    kernel = dpex.kernel(cache=True)(vecadd)
+    _launch(kernel, dpnp.float32)
+
+    assert sum(kernel.stats.cache_misses.values()) == 1
+    assert any(f.suffix == ".nbi" for f in cache_dir.rglob("*"))
+    assert any(f.suffix == ".nbc" for f in cache_dir.rglob("*"))
+
+
+def test_kernel_is_loaded_from_cache(cache_dir):
+    """Tests that a new dispatcher for the same function reuses the cached
+    SPIR-V instead of compiling the kernel again."""
+    kernel = dpex.kernel(cache=True)(vecadd)
+    _launch(kernel, dpnp.int64)
+
+    kernel2 = dpex.kernel(cache=True)(vecadd)
+    c = _launch(kernel2, dpnp.int64)
+
+    assert sum(kernel2.stats.cache_hits.values()) == 1
+    assert sum(kernel2.stats.cache_misses.values()) == 0
+    assert numpy.all(dpnp.asnumpy(c) == 2)
+
+
+def test_caching_disabled_by_default(cache_dir):
+    """Tests that no cache files are written without cache=True."""
+    kernel = dpex.kernel(vecadd)
+    _launch(kernel, dpnp.float32)
+
+    assert not any(cache_dir.rglob("*.nbi"))
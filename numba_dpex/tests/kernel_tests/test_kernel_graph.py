@@ -0,0 +1,82 @@
+# SPDX-FileCopyrightText: 2024 Intel Corporation
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""Tests for the kernel launch graph."""
+
+import dpctl
+import dpnp
+import numpy
+import pytest
+
+import numba_dpex as dpex
+from numba_dpex.kernel_api import Item, Range
+
+
+@dpex.kernel
+def add_one(item: Item, a):
+    i = item.get_id(0)
+    a[i] += 1
+
+
+@dpex.kernel
+def copy_twice(item: Item, a, b):
+    i = item.get_id(0)
+    b[i] = 2 * a[i]
+
+
+def test_dependencies_are_inferred():
+    a = dpnp.zeros(20, dtype=dpnp.int64)
+    b = dpnp.zeros(20, dtype=dpnp.int64, sycl_queue=a.sycl_queue)
+
+    graph = dpex.KernelGraph()
+    graph.add_kernel(add_one, Range(10), a[:10])
+    graph.add_kernel(add_one, Range(10), a[10:])
+    graph.add_kernel(add_one, Range(10), a[:10])
+    graph.add_kernel(copy_twice, Range(20), a, b, read_only=(0,))
+    graph.add_kernel(add_one, Range(10), b[::2])
+
+    assert graph.predecessors == ((), (), (0,), (0, 1, 2), (3,))
+
+    graph.submit().wait()
+
+    expected_a = numpy.array([2] * 10 + [1] * 10)
+    assert numpy.array_equal(a.asnumpy(), expected_a)
+    expected_b = 2 * expected_a
+    expected_b[::2] += 1
+    assert numpy.array_equal(b.asnumpy(), expected_b)
+
+
+def test_memcpy_and_repeated_submissions():
+    q = dpctl.SyclQueue()
+    host = dpnp.arange(10, dtype=dpnp.int64, usm_type="host", sycl_queue=q)
+    device = dpnp.empty((3, 10), dtype=dpnp.int64, sycl_queue=q)
+
+    graph = dpex.KernelGraph()
+    for i in range(3):
+        graph.add_memcpy(device[i], host)
+        graph.add_kernel(add_one, Range(10), device[i])
+    graph.add_memcpy(host, device[2])
+
+    assert graph.num_nodes == 7
+    assert graph.predecessors[:2] == ((), (0,))
+    # The last copy writes the source of the other copies.
+    assert graph.predecessors[6] == (0, 2, 4, 5)
+
+    event = graph.submit()
+    event = graph.submit([event])
+    event.wait()
+
+    assert numpy.array_equal(host.asnumpy(), numpy.arange(10) + 2)
+
+
+def test_invalid_graphs():
+    graph = dpex.KernelGraph()
+    with pytest.raises(ValueError):
+        graph.submit()
+
+    a = dpnp.zeros(10)
+    with pytest.raises(ValueError):
+        graph.add_memcpy(a, dpnp.zeros(5, sycl_queue=a.sycl_queue))
+    with pytest.raises(ValueError):
+        graph.add_memcpy(a[::2], dpnp.zeros(5, sycl_queue=a.sycl_queue))
@@ -0,0 +1,58 @@
+# SPDX-FileCopyrightText: 2024 Intel Corporation
+#
+# SPDX-License-Identifier: Apache-2.0
+
+import pytest
+
+import numba_dpex as dpex
+from numba_dpex import DpnpNdArray, int64
+from numba_dpex.core.types.kernel_api.index_space_ids import ItemType
+from numba_dpex.kernel_api import Item
+from numba_dpex.kernel_api_impl.spirv import spirv_generator
+
+i64arrty = DpnpNdArray(ndim=1, dtype=int64, layout="C")
+sig = (ItemType(ndim=1), i64arrty, i64arrty, i64arrty)
+
+
+def vecadd(item: Item, a, b, c):
+    i = item.get_id(0)
+    c[i] = a[i] + b[i]
+
+
+def _compile_to_spirv():
+    disp = dpex.kernel(sig)(vecadd)
+    (kcres,) = disp.overloads.values()
+    return kcres.kernel_device_ir_module.kernel_bitcode
+
+
+def test_pipe_and_file_translators_generate_same_spirv(monkeypatch):
+    """Tests that streaming the LLVM bitcode through pipes generates the same
+    SPIR-V binary as the translation through temporary files."""
+    monkeypatch.setattr(dpex.config, "SPIRV_TRANSLATOR", "file")
+    spirv_file = _compile_to_spirv()
+
+    monkeypatch.setattr(dpex.config, "SPIRV_TRANSLATOR", "pipe")
+    spirv_pipe = _compile_to_spirv()
+
+    assert spirv_generator._streaming_supported
+    assert spirv_pipe == spirv_file
+
+
+def test_fallback_to_file_translator(monkeypatch):
+    """Tests that a failed streaming translation is retried using temporary
+    files and that the streaming translation gets disabled."""
+
+    def _failing_translation(*args, **kwargs):
+        raise OSError("stdin not supported")
+
+    monkeypatch.setattr(dpex.config, "SPIRV_TRANSLATOR", "pipe")
+    monkeypatch.setattr(spirv_generator, "_streaming_supported", True)
+    monkeypatch.setattr(
+        spirv_generator, "_translate_through_pipes", _failing_translation
+    )
+
+    with pytest.warns(UserWarning, match="through pipes failed"):
+        spirv = _compile_to_spirv()
+
+    assert len(spirv) > 0
+    assert not spirv_generator._streaming_supported
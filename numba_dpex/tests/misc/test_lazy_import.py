@@ -0,0 +1,52 @@
+# SPDX-FileCopyrightText: 2024 Intel Corporation
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""Tests that importing numba_dpex does not load the compiler."""
+
+import subprocess
+import sys
+
+import pytest
+
+import numba_dpex as dpex
+from numba_dpex.core import decorators
+
+_CHECK_MODULES = """
+import sys
+
+import numba_dpex
+from numba_dpex import kernel_api
+
+heavy_modules = [
+    "numba_dpex.core.decorators",
+    "numba_dpex.core.dpjit_dispatcher",
+    "numba_dpex.core.kernel_launcher",
+    "numba_dpex.dpnp_iface.dpnpimpl",
+    "numba_dpex.kernel_api_impl.spirv.target",
+]
+print(",".join(name for name in heavy_modules if name in sys.modules))
+
+import numba_dpex.initialize as init
+
+assert not init._initialized
+numba_dpex.kernel(lambda item, a: None)
+assert init._initialized
+"""
+
+
+def test_import_does_not_load_the_compiler():
+    result = subprocess.run(
+        [sys.executable, "-c", _CHECK_MODULES],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    assert result.stdout.strip() == ""
+
+
+def test_lazy_attributes():
+    assert dpex.kernel is decorators.kernel
+    assert "call_kernel" in dir(dpex)
+    with pytest.raises(AttributeError):
+        dpex.not_an_attribute  # pylint: disable=pointless-statement